@@ -1,55 +1,22 @@
 import argparse
 import logging
 import math
+import os
 import random
 import sys
-from math import gcd
 from typing import Any, Dict, List, Tuple
 
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
 
-Point = Tuple[int, int, int]
-Vector = Tuple[int, int, int]
-
-
-def dot(u: Vector, v: Vector) -> int:
-    return u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
-
-
-def cross(u: Vector, v: Vector) -> Vector:
-    return (
-        u[1] * v[2] - u[2] * v[1],
-        u[2] * v[0] - u[0] * v[2],
-        u[0] * v[1] - u[1] * v[0],
-    )
-
-
-def add(u: Point, v: Vector) -> Point:
-    return u[0] + v[0], u[1] + v[1], u[2] + v[2]
+# Phép toán vector nguyên dùng chung (2025/base_template/oxyz_core.py)
+from oxyz_core import add, cross, dot, gcd_multiple, norm_sq, scale, simplify_vector, sub
 
 
-def sub(u: Point, v: Point) -> Vector:
-    return u[0] - v[0], u[1] - v[1], u[2] - v[2]
-
-
-def scale(v: Vector, k: int) -> Vector:
-    return v[0] * k, v[1] * k, v[2] * k
-
-
-def norm_sq(v: Vector) -> int:
-    return dot(v, v)
-
-
-def gcd_multiple(values: Tuple[int, ...]) -> int:
-    g = 0
-    for value in values:
-        if value != 0:
-            g = gcd(g, abs(value)) if g else abs(value)
-    return g or 1
-
-
-def simplify_vector(v: Vector) -> Vector:
-    g = gcd_multiple(v)
-    return v[0] // g, v[1] // g, v[2] // g
+Point = Tuple[int, int, int]
+Vector = Tuple[int, int, int]
 
 
 def format_point(p: Point) -> str:
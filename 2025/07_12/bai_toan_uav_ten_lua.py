@@ -7,6 +7,13 @@ from string import Template
 from typing import Any, Dict, List
 from fractions import Fraction
 
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+from kinematics import intercept_time
+
 # ==================== RANDOM TEXT VARIANTS ====================
 
 # Wording variants for the reference plane (mặt phẳng (Oxy)).
@@ -255,57 +262,12 @@ class UAVMissileQuestion:
         # d) Intercept time
         # Solve for t > time_launch:
         # dist(A, M(t)) = (v_missile / scale) * (t - time_launch)
-        # Let V_m_unit = v_missile / scale
-        # |M(t) - A|^2 = V_m_unit^2 * (t - t_L)^2
-        # M(t) - A = (M0x - Ax + ux*t, ...)
-        # Let D0 = M0 - A
-        # d0x = self.M0[0] - self.A[0] # Already calculated above
-        # d0y = self.M0[1] - self.A[1]
-        # d0z = self.M0[2] - self.A[2]
-        
-        # LHS = (d0x + ux*t)^2 + ... = (ux^2+...)*t^2 + 2*(d0x*ux+...)*t + (d0x^2+...)
-        # LHS = u_sq * t^2 + 2*(D0.u) * t + |D0|^2
-        
-        # dot_D0_u = d0x*ux + d0y*uy + d0z*uz # Already calculated
-        # len_D0_sq = d0x**2 + d0y**2 + d0z**2 # Already calculated
-        
+        # <=> (u_sq - V^2) t^2 + (2*dot + 2*V^2*t_L) t + (len_sq - V^2*t_L^2) = 0
         V_m_unit = self.v_missile / self.scale
-        
-        # RHS = V^2 * (t - t_L)^2 = V^2 * (t^2 - 2*t_L*t + t_L^2)
-        
-        # Equation: A*t^2 + B*t + C = 0
-        # LHS = u_sq * t^2 + 2*dot * t + len_sq
-        # RHS = V^2 * t^2 - 2*V^2*t_L * t + V^2*t_L^2
-        
-        # (u_sq - V^2) * t^2 + (2*dot + 2*V^2*t_L) * t + (len_sq - V^2*t_L^2) = 0
-        
-        qa = u_sq - V_m_unit**2
-        qb = 2 * dot_D0_u + 2 * V_m_unit**2 * self.time_launch
-        qc = len_D0_sq - V_m_unit**2 * self.time_launch**2
-        
-        t_intercept = -1
-        
-        if abs(qa) < 1e-9:
-            # Linear case: qb*t + qc = 0
-            if abs(qb) > 1e-9:
-                t_sol = -qc / qb
-                if t_sol > self.time_launch:
-                    t_intercept = t_sol
-        else:
-            # Quadratic case
-            delta = qb**2 - 4*qa*qc
-            
-            if delta >= 0:
-                t1 = (-qb - math.sqrt(delta)) / (2*qa)
-                t2 = (-qb + math.sqrt(delta)) / (2*qa)
-                # We need t > time_launch
-                candidates = []
-                if t1 > self.time_launch: candidates.append(t1)
-                if t2 > self.time_launch: candidates.append(t2)
-                
-                if candidates:
-                    t_intercept = min(candidates)
-        
+        t_intercept = intercept_time(self.M0, self.velocity, self.A, V_m_unit, self.time_launch)
+        if t_intercept is None:
+            t_intercept = -1
+
         intercept_point = None
         if t_intercept > 0:
             self.time_flight = t_intercept - self.time_launch
@@ -15,6 +15,8 @@ from typing import Union
 from math import gcd
 import sympy as sp
 
+from integral_cache import cached_integrate, cached_nsimplify, cached_simplify
+
 """
 Các hàm tiện ích LaTeX cho hệ thống sinh câu hỏi thể tích khối tròn xoay
 """
@@ -413,15 +415,15 @@ class HollowVolumeQuestion6(BaseVolumeQuestion):
     def calculate_answer(self) -> str:
         x = sp.Symbol('x')
         # V = π∫[1,e] (ln x)² dx
-        volume_expr = sp.pi * sp.integrate(sp.log(x)**2, (x, 1, sp.E))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate(sp.log(x)**2, (x, 1, sp.E))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"\\(V = {sp.latex(volume_simplified)}\\)"
     
     def generate_wrong_answers(self) -> List[str]:
         x = sp.Symbol('x')
         wrongs = [
-            f"\\(V = {sp.latex(sp.integrate(sp.log(x)**2, (x, 1, sp.E)))}\\)",  # Thiếu π
-            f"\\(V = {sp.latex(sp.pi * sp.integrate(sp.log(x), (x, 1, sp.E)))}\\)",  # Thiếu bình phương
+            f"\\(V = {sp.latex(cached_integrate(sp.log(x)**2, (x, 1, sp.E)))}\\)",  # Thiếu π
+            f"\\(V = {sp.latex(sp.pi * cached_integrate(sp.log(x), (x, 1, sp.E)))}\\)",  # Thiếu bình phương
             f"\\(V = {sp.latex(sp.pi * (sp.E - 1))}\\)",  # Sai công thức
         ]
         return wrongs[:3]
@@ -433,8 +435,8 @@ class HollowVolumeQuestion6(BaseVolumeQuestion):
     
     def generate_solution(self) -> str:
         x = sp.Symbol('x')
-        volume_expr = sp.pi * sp.integrate(sp.log(x)**2, (x, 1, sp.E))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate(sp.log(x)**2, (x, 1, sp.E))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"""
 Cho hình phẳng (D) giới hạn bởi đồ thị hàm số (phần gạch sọc).
 
@@ -492,8 +494,8 @@ class HollowVolumeQuestion8(BaseVolumeQuestion):
         x = sp.Symbol('x')
         # Giao điểm: x = √(ax-x²) => x² = ax-x² => 2x² = ax => x(2x-a)=0 => x=0 hoặc x=a/2
         # Miền: từ x=0 đến x=a/2
-        volume_expr = sp.pi * sp.integrate((a*x - x**2) - x**2, (x, 0, a/2))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate((a*x - x**2) - x**2, (x, 0, a/2))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"\\(V = {sp.latex(volume_simplified)}\\)"
     
     def generate_wrong_answers(self) -> List[str]:
@@ -501,9 +503,9 @@ class HollowVolumeQuestion8(BaseVolumeQuestion):
         a = params["a"]
         x = sp.Symbol('x')
         wrongs = [
-            f"\\(V = {sp.latex(sp.pi * sp.integrate(a*x - x**2, (x, 0, a/2)))}\\)",  # Quên trừ x²
-            f"\\(V = {sp.latex(sp.integrate((a*x - x**2) - x**2, (x, 0, a/2)))}\\)",  # Thiếu π
-            f"\\(V = {sp.latex(sp.pi * sp.integrate((a*x - x**2)**2 - x**2, (x, 0, a/2)))}\\)",  # Sai công thức
+            f"\\(V = {sp.latex(sp.pi * cached_integrate(a*x - x**2, (x, 0, a/2)))}\\)",  # Quên trừ x²
+            f"\\(V = {sp.latex(cached_integrate((a*x - x**2) - x**2, (x, 0, a/2)))}\\)",  # Thiếu π
+            f"\\(V = {sp.latex(sp.pi * cached_integrate((a*x - x**2)**2 - x**2, (x, 0, a/2)))}\\)",  # Sai công thức
         ]
         return wrongs[:3]
     
@@ -519,8 +521,8 @@ class HollowVolumeQuestion8(BaseVolumeQuestion):
         params = self.parameters
         a = params["a"]
         x = sp.Symbol('x')
-        volume_expr = sp.pi * sp.integrate((a*x - x**2) - x**2, (x, 0, a/2))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate((a*x - x**2) - x**2, (x, 0, a/2))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"""
 Cho hình phẳng (D) giới hạn bởi đường thẳng \\(y = x\\) và đường tròn \\(y = \\sqrt{{{a}x - x^2}}\\).
 
@@ -585,8 +587,8 @@ class HollowVolumeQuestion9(BaseVolumeQuestion):
         a = params["a"]
         x = sp.Symbol('x')
         # Giao điểm: ax-x² = x => x(a-x-1)=0 => x=0 hoặc x=a-1
-        volume_expr = sp.pi * sp.integrate((a*x - x**2)**2 - x**2, (x, 0, a-1))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate((a*x - x**2)**2 - x**2, (x, 0, a-1))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"\\(V = {sp.latex(volume_simplified)}\\)"
     
     def generate_wrong_answers(self) -> List[str]:
@@ -594,9 +596,9 @@ class HollowVolumeQuestion9(BaseVolumeQuestion):
         a = params["a"]
         x = sp.Symbol('x')
         wrongs = [
-            f"\\(V = {sp.latex(sp.pi * sp.integrate((a*x - x**2) - x, (x, 0, a-1)))}\\)",  # Quên bình phương
-            f"\\(V = {sp.latex(sp.integrate((a*x - x**2)**2 - x**2, (x, 0, a-1)))}\\)",  # Thiếu π
-            f"\\(V = {sp.latex(sp.pi * sp.integrate((a*x - x**2)**2, (x, 0, a-1)))}\\)",  # Quên trừ x²
+            f"\\(V = {sp.latex(sp.pi * cached_integrate((a*x - x**2) - x, (x, 0, a-1)))}\\)",  # Quên bình phương
+            f"\\(V = {sp.latex(cached_integrate((a*x - x**2)**2 - x**2, (x, 0, a-1)))}\\)",  # Thiếu π
+            f"\\(V = {sp.latex(sp.pi * cached_integrate((a*x - x**2)**2, (x, 0, a-1)))}\\)",  # Quên trừ x²
         ]
         return wrongs[:3]
     
@@ -612,8 +614,8 @@ class HollowVolumeQuestion9(BaseVolumeQuestion):
         params = self.parameters
         a = params["a"]
         x = sp.Symbol('x')
-        volume_expr = sp.pi * sp.integrate((a*x - x**2)**2 - x**2, (x, 0, a-1))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate((a*x - x**2)**2 - x**2, (x, 0, a-1))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         expanded = sp.expand((a*x - x**2)**2)
         return f"""
 Cho hình phẳng (D) giới hạn bởi parabol \\(y = {a}x - x^2\\) và đường thẳng \\(y = x\\).
@@ -664,8 +666,8 @@ class HollowVolumeQuestion11(BaseVolumeQuestion):
         x = sp.Symbol('x')
         # Giao điểm: a-x² = b => x² = a-b => x = ±√(a-b)
         sqrt_val = sp.sqrt(a - b)
-        volume_expr = sp.pi * sp.integrate((a - x**2)**2 - b**2, (x, -sqrt_val, sqrt_val))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate((a - x**2)**2 - b**2, (x, -sqrt_val, sqrt_val))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"\\(V = {sp.latex(volume_simplified)}\\)"
     
     def generate_wrong_answers(self) -> List[str]:
@@ -675,9 +677,9 @@ class HollowVolumeQuestion11(BaseVolumeQuestion):
         x = sp.Symbol('x')
         sqrt_val = sp.sqrt(a - b)
         wrongs = [
-            f"\\(V = {sp.latex(sp.pi * sp.integrate((a - x**2) - b, (x, -sqrt_val, sqrt_val)))}\\)",  # Quên bình phương
-            f"\\(V = {sp.latex(sp.integrate((a - x**2)**2 - b**2, (x, -sqrt_val, sqrt_val)))}\\)",  # Thiếu π
-            f"\\(V = {sp.latex(sp.pi * sp.integrate((a - x**2)**2, (x, -sqrt_val, sqrt_val)))}\\)",  # Quên trừ b²
+            f"\\(V = {sp.latex(sp.pi * cached_integrate((a - x**2) - b, (x, -sqrt_val, sqrt_val)))}\\)",  # Quên bình phương
+            f"\\(V = {sp.latex(cached_integrate((a - x**2)**2 - b**2, (x, -sqrt_val, sqrt_val)))}\\)",  # Thiếu π
+            f"\\(V = {sp.latex(sp.pi * cached_integrate((a - x**2)**2, (x, -sqrt_val, sqrt_val)))}\\)",  # Quên trừ b²
         ]
         return wrongs[:3]
     
@@ -696,8 +698,8 @@ class HollowVolumeQuestion11(BaseVolumeQuestion):
         b = params["b"]
         x = sp.Symbol('x')
         sqrt_val = sp.sqrt(a - b)
-        volume_expr = sp.pi * sp.integrate((a - x**2)**2 - b**2, (x, -sqrt_val, sqrt_val))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate((a - x**2)**2 - b**2, (x, -sqrt_val, sqrt_val))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"""
 Cho hình phẳng (D) giới hạn bởi parabol \\(y = {a} - x^2\\) và đường thẳng \\(y = {b}\\).
 
@@ -769,8 +771,8 @@ class HollowVolumeQuestion12(BaseVolumeQuestion):
             # Đảm bảo (b-x) >= 0 và x+a >= 0
             x2 = min(x2, b)
             x1 = max(x1, -a)
-        volume_expr = sp.pi * sp.integrate((b - x)**2 - (x + a), (x, x1, x2))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate((b - x)**2 - (x + a), (x, x1, x2))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"\\(V = {sp.latex(volume_simplified)}\\)"
     
     def generate_wrong_answers(self) -> List[str]:
@@ -789,9 +791,9 @@ class HollowVolumeQuestion12(BaseVolumeQuestion):
             x1 = min(real_sols)
             x2 = min(max(real_sols), b)
         wrongs = [
-            f"\\(V = {sp.latex(sp.pi * sp.integrate((b - x) - sp.sqrt(x + a), (x, x1, x2)))}\\)",  # Quên bình phương
-            f"\\(V = {sp.latex(sp.integrate((b - x)**2 - (x + a), (x, x1, x2)))}\\)",  # Thiếu π
-            f"\\(V = {sp.latex(sp.pi * sp.integrate((b - x)**2, (x, x1, x2)))}\\)",  # Quên trừ (x+a)
+            f"\\(V = {sp.latex(sp.pi * cached_integrate((b - x) - sp.sqrt(x + a), (x, x1, x2)))}\\)",  # Quên bình phương
+            f"\\(V = {sp.latex(cached_integrate((b - x)**2 - (x + a), (x, x1, x2)))}\\)",  # Thiếu π
+            f"\\(V = {sp.latex(sp.pi * cached_integrate((b - x)**2, (x, x1, x2)))}\\)",  # Quên trừ (x+a)
         ]
         return wrongs[:3]
     
@@ -819,8 +821,8 @@ class HollowVolumeQuestion12(BaseVolumeQuestion):
         else:
             x1 = min(real_sols)
             x2 = min(max(real_sols), b)
-        volume_expr = sp.pi * sp.integrate((b - x)**2 - (x + a), (x, x1, x2))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate((b - x)**2 - (x + a), (x, x1, x2))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"""
 Cho hình phẳng (D) giới hạn bởi \\(y = \\sqrt{{x + {a}}}\\) và \\(y = {b} - x\\).
 
@@ -879,9 +881,9 @@ class HollowVolumeQuestion13(BaseVolumeQuestion):
         # và từ x=1 đến x=(b-a)/c (y=1 và y=b-cx)
         # Chuyển cận thành phân số để tránh số thập phân
         upper_bound = sp.Rational(b - a, c)
-        volume_expr = sp.pi * (sp.integrate(1 - x**4, (x, 0, 1)) + 
-                               sp.integrate((b - c*x)**2 - 1, (x, 1, upper_bound)))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * (cached_integrate(1 - x**4, (x, 0, 1)) + 
+                               cached_integrate((b - c*x)**2 - 1, (x, 1, upper_bound)))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"\\(V = {sp.latex(volume_simplified)}\\)"
     
     def generate_wrong_answers(self) -> List[str]:
@@ -891,9 +893,9 @@ class HollowVolumeQuestion13(BaseVolumeQuestion):
         c = params["c"]
         x = sp.Symbol('x')
         wrongs = [
-            f"\\(V = {sp.latex(sp.pi * sp.integrate(1 - x**2, (x, 0, 1)))}\\)",  # Chỉ lấy phần đầu
-            f"\\(V = {sp.latex(sp.integrate(1 - x**4, (x, 0, 1)))}\\)",  # Thiếu π
-            f"\\(V = {sp.latex(sp.pi * sp.integrate(1, (x, 0, (b-a)/c)))}\\)",  # Sai công thức
+            f"\\(V = {sp.latex(sp.pi * cached_integrate(1 - x**2, (x, 0, 1)))}\\)",  # Chỉ lấy phần đầu
+            f"\\(V = {sp.latex(cached_integrate(1 - x**4, (x, 0, 1)))}\\)",  # Thiếu π
+            f"\\(V = {sp.latex(sp.pi * cached_integrate(1, (x, 0, (b-a)/c)))}\\)",  # Sai công thức
         ]
         return wrongs[:3]
     
@@ -913,9 +915,9 @@ class HollowVolumeQuestion13(BaseVolumeQuestion):
         b = params["b"]
         c = params["c"]
         x = sp.Symbol('x')
-        volume_expr = sp.pi * (sp.integrate(1 - x**4, (x, 0, 1)) + 
-                               sp.integrate((b - c*x)**2 - 1, (x, 1, (b-a)/c)))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * (cached_integrate(1 - x**4, (x, 0, 1)) + 
+                               cached_integrate((b - c*x)**2 - 1, (x, 1, (b-a)/c)))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"""
 Cho hình phẳng (D) (tam giác cong) giới hạn bởi \\(y = x^2\\), \\(y = {a}\\) và \\(y = {b} - {c}x\\).
 
@@ -965,8 +967,8 @@ class HollowVolumeQuestion15(BaseVolumeQuestion):
         a = params["a"]
         x = sp.Symbol('x')
         # Đơn giản hóa: miền từ x=0 đến x=2, giữa y=x+a và y=0
-        volume_expr = sp.pi * sp.integrate((x + a)**2, (x, 0, 2))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate((x + a)**2, (x, 0, 2))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"\\(V = {sp.latex(volume_simplified)}\\)"
     
     def generate_wrong_answers(self) -> List[str]:
@@ -974,9 +976,9 @@ class HollowVolumeQuestion15(BaseVolumeQuestion):
         a = params["a"]
         x = sp.Symbol('x')
         wrongs = [
-            f"\\(V = {sp.latex(sp.pi * sp.integrate(x + a, (x, 0, 2)))}\\)",  # Quên bình phương
-            f"\\(V = {sp.latex(sp.integrate((x + a)**2, (x, 0, 2)))}\\)",  # Thiếu π
-            f"\\(V = {sp.latex(sp.pi * sp.integrate((x + a)**2, (x, 0, 1)))}\\)",  # Sai cận
+            f"\\(V = {sp.latex(sp.pi * cached_integrate(x + a, (x, 0, 2)))}\\)",  # Quên bình phương
+            f"\\(V = {sp.latex(cached_integrate((x + a)**2, (x, 0, 2)))}\\)",  # Thiếu π
+            f"\\(V = {sp.latex(sp.pi * cached_integrate((x + a)**2, (x, 0, 1)))}\\)",  # Sai cận
         ]
         return wrongs[:3]
     
@@ -991,8 +993,8 @@ class HollowVolumeQuestion15(BaseVolumeQuestion):
         params = self.parameters
         a = params["a"]
         x = sp.Symbol('x')
-        volume_expr = sp.pi * sp.integrate((x + a)**2, (x, 0, 2))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate((x + a)**2, (x, 0, 2))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"""
 Cho hình phẳng (D) (tam giác cong) giới hạn bởi \\(y = x + {a}\\) và các đường khác.
 
@@ -1047,8 +1049,8 @@ class HollowVolumeQuestion16(BaseVolumeQuestion):
         else:
             x1 = max(min(real_sols), a)  # Đảm bảo x >= a (để √(x-a) xác định)
             x2 = min(max(real_sols), c, b)  # Đảm bảo x <= min(c, b)
-        volume_expr = sp.pi * sp.integrate((b - x)**2 - (x - a), (x, x1, x2))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate((b - x)**2 - (x - a), (x, x1, x2))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"\\(V = {sp.latex(volume_simplified)}\\)"
     
     def generate_wrong_answers(self) -> List[str]:
@@ -1068,9 +1070,9 @@ class HollowVolumeQuestion16(BaseVolumeQuestion):
             x1 = max(min(real_sols), a)
             x2 = min(max(real_sols), c, b)
         wrongs = [
-            f"\\(V = {sp.latex(sp.pi * sp.integrate((b - x) - sp.sqrt(x - a), (x, x1, x2)))}\\)",  # Quên bình phương
-            f"\\(V = {sp.latex(sp.integrate((b - x)**2 - (x - a), (x, x1, x2)))}\\)",  # Thiếu π
-            f"\\(V = {sp.latex(sp.pi * sp.integrate((b - x)**2, (x, x1, x2)))}\\)",  # Quên trừ (x-a)
+            f"\\(V = {sp.latex(sp.pi * cached_integrate((b - x) - sp.sqrt(x - a), (x, x1, x2)))}\\)",  # Quên bình phương
+            f"\\(V = {sp.latex(cached_integrate((b - x)**2 - (x - a), (x, x1, x2)))}\\)",  # Thiếu π
+            f"\\(V = {sp.latex(sp.pi * cached_integrate((b - x)**2, (x, x1, x2)))}\\)",  # Quên trừ (x-a)
         ]
         return wrongs[:3]
     
@@ -1100,8 +1102,8 @@ class HollowVolumeQuestion16(BaseVolumeQuestion):
         else:
             x1 = max(min(real_sols), a)
             x2 = min(max(real_sols), c, b)
-        volume_expr = sp.pi * sp.integrate((b - x)**2 - (x - a), (x, x1, x2))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate((b - x)**2 - (x - a), (x, x1, x2))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"""
 Cho hình phẳng (D) giới hạn bởi \\(y = \\sqrt{{x - {a}}}\\), \\(y = {b} - x\\) và \\(x = {c}\\).
 
@@ -0,0 +1,168 @@
+"""
+Bộ nhớ đệm cho tích phân và rút gọn sympy dùng chung cho các generator thể tích khối tròn xoay
+
+Khóa cache là dạng chuẩn (srepr) của biểu thức cùng với biến và cận tích phân, nên cùng một
+tích phân được tính lại ở đáp án đúng, đáp án nhiễu và lời giải chỉ tốn một lần sympy.
+Gồm hai tầng:
+- LRU trong bộ nhớ (giới hạn số phần tử)
+- Kho trên đĩa (sqlite, tùy chọn) để tái sử dụng giữa các lần chạy
+
+Bật kho trên đĩa bằng biến môi trường INTEGRAL_CACHE_DB=<đường dẫn file> hoặc gọi
+configure_integral_cache(disk_path=...).
+"""
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+import sympy as sp
+
+DEFAULT_MAX_ENTRIES = 4096
+DISK_PATH_ENV_VAR = "INTEGRAL_CACHE_DB"
+
+
+class IntegralCache:
+    """
+    Cache hai tầng (LRU bộ nhớ + sqlite tùy chọn) cho kết quả sympy
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, disk_path: Optional[str] = None):
+        """
+        Args:
+            max_entries: Số phần tử tối đa giữ trong bộ nhớ
+            disk_path: Đường dẫn file sqlite, None để chỉ dùng bộ nhớ
+        """
+        self.max_entries = max_entries
+        self.disk_path = disk_path
+        self._memory: "OrderedDict[str, sp.Expr]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.stats: Dict[str, int] = {'hits': 0, 'disk_hits': 0, 'misses': 0}
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> sp.Expr:
+        """
+        Trả về kết quả theo khóa, tính bằng compute() nếu chưa có trong cache
+
+        Args:
+            key: Khóa chuẩn của phép tính
+            compute: Hàm tính kết quả khi cache miss
+
+        Returns:
+            sp.Expr: Kết quả (biểu thức sympy, bất biến nên dùng chung được)
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats['hits'] += 1
+                return self._memory[key]
+
+        value = self._disk_get(key)
+        if value is not None:
+            self.stats['disk_hits'] += 1
+        else:
+            self.stats['misses'] += 1
+            value = sp.sympify(compute())
+            self._disk_put(key, value)
+
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Xóa cache trong bộ nhớ (không xóa kho trên đĩa)"""
+        with self._lock:
+            self._memory.clear()
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self.disk_path is None:
+            return None
+        if self._conn is None:
+            directory = os.path.dirname(os.path.abspath(self.disk_path))
+            os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.disk_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sympy_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _disk_get(self, key: str) -> Optional[sp.Expr]:
+        conn = self._connection()
+        if conn is None:
+            return None
+        with self._lock:
+            row = conn.execute("SELECT value FROM sympy_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return sp.sympify(row[0])
+
+    def _disk_put(self, key: str, value: sp.Expr) -> None:
+        conn = self._connection()
+        if conn is None:
+            return
+        with self._lock:
+            conn.execute(
+                "INSERT OR REPLACE INTO sympy_cache (key, value) VALUES (?, ?)",
+                (key, sp.srepr(value))
+            )
+            conn.commit()
+
+
+_default_cache = IntegralCache(disk_path=os.environ.get(DISK_PATH_ENV_VAR) or None)
+
+
+def configure_integral_cache(max_entries: int = DEFAULT_MAX_ENTRIES, disk_path: Optional[str] = None) -> IntegralCache:
+    """
+    Thay cache dùng chung bằng cache mới với cấu hình cho trước
+
+    Args:
+        max_entries: Số phần tử tối đa trong bộ nhớ
+        disk_path: Đường dẫn file sqlite (None = chỉ bộ nhớ)
+
+    Returns:
+        IntegralCache: Cache mới
+    """
+    global _default_cache
+    _default_cache = IntegralCache(max_entries=max_entries, disk_path=disk_path)
+    return _default_cache
+
+
+def get_integral_cache() -> IntegralCache:
+    """Trả về cache dùng chung hiện tại"""
+    return _default_cache
+
+
+def _canonical_key(operation: str, *parts: Any) -> str:
+    return operation + "|" + "|".join(sp.srepr(sp.sympify(part)) for part in parts)
+
+
+def cached_integrate(expr: Any, limits: Any) -> sp.Expr:
+    """
+    sp.integrate có cache
+
+    Args:
+        expr: Biểu thức cần lấy tích phân
+        limits: Biến (nguyên hàm) hoặc tuple (biến, cận dưới, cận trên)
+
+    Returns:
+        sp.Expr: Kết quả tích phân
+    """
+    limit_parts = tuple(limits) if isinstance(limits, tuple) else (limits,)
+    key = _canonical_key("integrate", expr, *limit_parts)
+    return _default_cache.get_or_compute(key, lambda: sp.integrate(expr, limits))
+
+
+def cached_simplify(expr: Any) -> sp.Expr:
+    """sp.simplify có cache"""
+    key = _canonical_key("simplify", expr)
+    return _default_cache.get_or_compute(key, lambda: sp.simplify(expr))
+
+
+def cached_nsimplify(expr: Any) -> sp.Expr:
+    """sp.nsimplify có cache"""
+    key = _canonical_key("nsimplify", expr)
+    return _default_cache.get_or_compute(key, lambda: sp.nsimplify(expr))
@@ -15,6 +15,8 @@ from typing import Union
 from math import gcd
 import sympy as sp
 
+from integral_cache import cached_integrate, cached_nsimplify, cached_simplify
+
 """
 Các hàm tiện ích LaTeX cho hệ thống sinh câu hỏi thể tích khối tròn xoay
 """
@@ -417,8 +419,8 @@ class SolidVolumeQuestion1(BaseVolumeQuestion):
         a = params["a"]
         x = sp.Symbol('x')
         integrand = a + sp.sin(x)
-        volume_expr = sp.pi * sp.integrate(integrand, (x, 0, sp.pi))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate(integrand, (x, 0, sp.pi))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"\\(V = {sp.latex(volume_simplified)}\\)"
     
     def generate_wrong_answers(self) -> List[str]:
@@ -445,8 +447,8 @@ class SolidVolumeQuestion1(BaseVolumeQuestion):
         params = self.parameters
         a = params["a"]
         x = sp.Symbol('x')
-        volume_expr = sp.pi * sp.integrate(a + sp.sin(x), (x, 0, sp.pi))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate(a + sp.sin(x), (x, 0, sp.pi))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"""
 Cho hình phẳng (D) giới hạn bởi \\(y = \\sqrt{{{a} + \\sin x}}\\), trục hoành, \\(x = 0\\) và \\(x = \\pi\\).
 
@@ -494,15 +496,15 @@ class SolidVolumeQuestion2(BaseVolumeQuestion):
         params = self.parameters or self.generate_parameters()
         k = params["k"]
         x = sp.Symbol('x')
-        volume_expr = sp.pi * sp.integrate(sp.exp(2*k*x), (x, 0, 1))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate(sp.exp(2*k*x), (x, 0, 1))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"\\(V = {sp.latex(volume_simplified)}\\)"
     
     def generate_wrong_answers(self) -> List[str]:
         params = self.parameters
         k = params["k"]
         x = sp.Symbol('x')
-        correct_val = sp.pi * sp.integrate(sp.exp(2*k*x), (x, 0, 1))
+        correct_val = sp.pi * cached_integrate(sp.exp(2*k*x), (x, 0, 1))
         wrongs = [
             f"\\(V = {sp.latex(sp.pi * (sp.exp(2*k) - 1) / k)}\\)",  # Thiếu /2
             f"\\(V = {sp.latex((sp.exp(2*k) - 1) / (2*k))}\\)",  # Thiếu π
@@ -523,8 +525,8 @@ class SolidVolumeQuestion2(BaseVolumeQuestion):
         params = self.parameters
         k = params["k"]
         x = sp.Symbol('x')
-        volume_expr = sp.pi * sp.integrate(sp.exp(2*k*x), (x, 0, 1))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate(sp.exp(2*k*x), (x, 0, 1))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"""
 Cho hình phẳng (D) giới hạn bởi \\(y = e^{{{k}x}}\\), trục hoành, \\(x = 0\\) và \\(x = 1\\).
 
@@ -574,8 +576,8 @@ class SolidVolumeQuestion3(BaseVolumeQuestion):
         params = self.parameters or self.generate_parameters()
         a = params["a"]
         x = sp.Symbol('x')
-        volume_expr = sp.pi * sp.integrate(x**2 + a, (x, 0, 1))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate(x**2 + a, (x, 0, 1))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"\\(V = {sp.latex(volume_simplified)}\\)"
     
     def generate_wrong_answers(self) -> List[str]:
@@ -601,8 +603,8 @@ class SolidVolumeQuestion3(BaseVolumeQuestion):
         params = self.parameters
         a = params["a"]
         x = sp.Symbol('x')
-        volume_expr = sp.pi * sp.integrate(x**2 + a, (x, 0, 1))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate(x**2 + a, (x, 0, 1))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"""
 Cho hình phẳng (D) giới hạn bởi \\(y = \\sqrt{{x^2 + {a}}}\\), trục hoành, \\(x = 0\\) và \\(x = 1\\).
 
@@ -648,19 +650,19 @@ class SolidVolumeQuestion4(BaseVolumeQuestion):
         params = self.parameters or self.generate_parameters()
         k = params["k"]
         x = sp.Symbol('x')
-        volume_expr = sp.pi * sp.integrate((x**2 - k*x)**2, (x, 0, 1))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate((x**2 - k*x)**2, (x, 0, 1))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"\\(V = {sp.latex(volume_simplified)}\\)"
     
     def generate_wrong_answers(self) -> List[str]:
         params = self.parameters
         k = params["k"]
         x = sp.Symbol('x')
-        correct_val = sp.pi * sp.integrate((x**2 - k*x)**2, (x, 0, 1))
+        correct_val = sp.pi * cached_integrate((x**2 - k*x)**2, (x, 0, 1))
         wrongs = [
-            f"\\(V = {sp.latex(sp.pi * sp.integrate(x**2 - k*x, (x, 0, 1)))}\\)",  # Quên bình phương
-            f"\\(V = {sp.latex(sp.integrate((x**2 - k*x)**2, (x, 0, 1)))}\\)",  # Thiếu π
-            f"\\(V = {sp.latex(sp.pi * sp.integrate((x**2 - k*x)**2, (x, 0, 2)))}\\)",  # Sai cận
+            f"\\(V = {sp.latex(sp.pi * cached_integrate(x**2 - k*x, (x, 0, 1)))}\\)",  # Quên bình phương
+            f"\\(V = {sp.latex(cached_integrate((x**2 - k*x)**2, (x, 0, 1)))}\\)",  # Thiếu π
+            f"\\(V = {sp.latex(sp.pi * cached_integrate((x**2 - k*x)**2, (x, 0, 2)))}\\)",  # Sai cận
         ]
         return wrongs[:3]
     
@@ -676,10 +678,10 @@ class SolidVolumeQuestion4(BaseVolumeQuestion):
         params = self.parameters
         k = params["k"]
         x = sp.Symbol('x')
-        volume_expr = sp.pi * sp.integrate((x**2 - k*x)**2, (x, 0, 1))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate((x**2 - k*x)**2, (x, 0, 1))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         expanded = sp.expand((x**2 - k*x)**2)
-        antiderivative = sp.integrate(expanded, x)
+        antiderivative = cached_integrate(expanded, x)
         return f"""
 Cho hình phẳng (D) giới hạn bởi \\(y = x^2 - {k}x\\), \\(y = 0\\), \\(x = 0\\) và \\(x = 1\\).
 
@@ -732,18 +734,18 @@ class SolidVolumeQuestion5(BaseVolumeQuestion):
         params = self.parameters or self.generate_parameters()
         b = params["b"]
         x = sp.Symbol('x')
-        volume_expr = sp.pi * sp.integrate(sp.log(x), (x, 1, b))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate(sp.log(x), (x, 1, b))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"\\(V = {sp.latex(volume_simplified)}\\)"
     
     def generate_wrong_answers(self) -> List[str]:
         params = self.parameters
         b = params["b"]
         x = sp.Symbol('x')
-        correct_val = sp.pi * sp.integrate(sp.log(x), (x, 1, b))
+        correct_val = sp.pi * cached_integrate(sp.log(x), (x, 1, b))
         wrongs = [
-            f"\\(V = {sp.latex(sp.integrate(sp.log(x), (x, 1, b)))}\\)",  # Thiếu π
-            f"\\(V = {sp.latex(sp.pi * sp.integrate(sp.log(x), (x, 0, b)))}\\)",  # Sai cận dưới
+            f"\\(V = {sp.latex(cached_integrate(sp.log(x), (x, 1, b)))}\\)",  # Thiếu π
+            f"\\(V = {sp.latex(sp.pi * cached_integrate(sp.log(x), (x, 0, b)))}\\)",  # Sai cận dưới
             f"\\(V = {sp.latex(sp.pi * b * sp.log(b))}\\)",  # Sai công thức
         ]
         return wrongs[:3]
@@ -761,8 +763,8 @@ class SolidVolumeQuestion5(BaseVolumeQuestion):
         params = self.parameters
         b = params["b"]
         x = sp.Symbol('x')
-        volume_expr = sp.pi * sp.integrate(sp.log(x), (x, 1, b))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate(sp.log(x), (x, 1, b))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"""
 Cho hình phẳng (D) giới hạn bởi \\(y = \\sqrt{{\\ln x}}\\), trục hoành và \\(x = {b}\\).
 
@@ -820,8 +822,8 @@ class SolidVolumeQuestion7(BaseVolumeQuestion):
         x = sp.Symbol('x')
         # Miền D: từ x=1 đến x=e^a, giới hạn bởi y=ln x (dưới) và y=a (trên)
         # Quay quanh Ox: V = π∫[1,e^a] (a² - (ln x)²) dx
-        volume_expr = sp.pi * sp.integrate(a**2 - sp.log(x)**2, (x, 1, sp.exp(a)))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate(a**2 - sp.log(x)**2, (x, 1, sp.exp(a)))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"\\(V = {sp.latex(volume_simplified)}\\)"
     
     def generate_wrong_answers(self) -> List[str]:
@@ -829,8 +831,8 @@ class SolidVolumeQuestion7(BaseVolumeQuestion):
         a = params["a"]
         x = sp.Symbol('x')
         wrongs = [
-            f"\\(V = {sp.latex(sp.pi * sp.integrate(sp.log(x)**2, (x, 1, sp.exp(a))))}\\)",  # Chỉ lấy phần dưới
-            f"\\(V = {sp.latex(sp.integrate(a**2 - sp.log(x)**2, (x, 1, sp.exp(a))))}\\)",  # Thiếu π
+            f"\\(V = {sp.latex(sp.pi * cached_integrate(sp.log(x)**2, (x, 1, sp.exp(a))))}\\)",  # Chỉ lấy phần dưới
+            f"\\(V = {sp.latex(cached_integrate(a**2 - sp.log(x)**2, (x, 1, sp.exp(a))))}\\)",  # Thiếu π
             f"\\(V = {sp.latex(sp.pi * a * sp.exp(a))}\\)",  # Sai công thức
         ]
         return wrongs[:3]
@@ -848,8 +850,8 @@ class SolidVolumeQuestion7(BaseVolumeQuestion):
         params = self.parameters
         a = params["a"]
         x = sp.Symbol('x')
-        volume_expr = sp.pi * sp.integrate(a**2 - sp.log(x)**2, (x, 1, sp.exp(a)))
-        volume_simplified = sp.nsimplify(sp.simplify(volume_expr))
+        volume_expr = sp.pi * cached_integrate(a**2 - sp.log(x)**2, (x, 1, sp.exp(a)))
+        volume_simplified = cached_nsimplify(cached_simplify(volume_expr))
         return f"""
 Cho hình phẳng (D) giới hạn bởi \\(y = {a}\\), \\(y = \\ln x\\), trục tung và trục hoành.
 
@@ -1,6 +1,11 @@
 import random
+from dataclasses import replace
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from distractor_engine import find_duplicates
+from generation_profiler import phase_timer
+from question_ir import KIND_MULTIPLE_CHOICE, QuestionRecord, render_choices
+from seed_stream import generator_key, seeded
 
 
 class BaseOptimizationQuestion(ABC):
@@ -13,6 +18,7 @@ class BaseOptimizationQuestion(ABC):
         self.correct_answer = None
         self.wrong_answers = []
         self.solution_steps = []
+        self.record = None
 
     @abstractmethod
     def generate_parameters(self) -> Dict[str, Any]:
@@ -74,7 +80,12 @@ class BaseOptimizationQuestion(ABC):
         """
         pass
 
-    def generate_question(self, question_number: int = 1, include_multiple_choice: bool = True):
+    def generate_question(
+        self,
+        question_number: int = 1,
+        include_multiple_choice: bool = True,
+        seed: Optional[int] = None
+    ):
         """
         Tạo câu hỏi
 
@@ -82,6 +93,9 @@ class BaseOptimizationQuestion(ABC):
             question_number (int): Số thứ tự câu hỏi (mặc định: 1)
             include_multiple_choice (bool): True để tạo câu hỏi trắc nghiệm A/B/C/D,
                                           False để chỉ tạo đề bài và lời giải
+            seed (int | None): Seed riêng cho câu hỏi (xem seed_stream.derive_question_seed).
+                               Nếu có, random được seed trước khi sinh và khôi phục sau đó,
+                               nên cùng seed luôn cho cùng một câu hỏi.
 
         Returns:
             str | tuple: 
@@ -92,49 +106,88 @@ class BaseOptimizationQuestion(ABC):
             ValueError: Khi include_multiple_choice=True và generate_wrong_answers() 
                        không trả về đúng 3 đáp án hoặc có đáp án trùng nhau
         """
+        with seeded(seed):
+            record = self.build_record(question_number, include_multiple_choice)
+        record.metadata["seed"] = seed
+        question_content = render_choices(record)
+        if include_multiple_choice:
+            return question_content
+        # Chỉ đề bài và lời giải, đáp án đi kèm (đáp án ở cuối tài liệu)
+        return question_content, self.correct_answer
+
+    def build_record(
+        self,
+        question_number: int = 1,
+        include_multiple_choice: bool = True
+    ) -> QuestionRecord:
+        """
+        Sinh câu hỏi dưới dạng QuestionRecord (xem question_ir), chưa gắn với định dạng xuất
+
+        Record cũng được giữ ở self.record để QuestionManager chuyển cho các bộ xuất
+        (JSON Lines, CSV đáp án, ex_test) mà không phải parse lại LaTeX.
+
+        Args:
+            question_number (int): Số thứ tự câu hỏi
+            include_multiple_choice (bool): True để sinh 4 phương án A/B/C/D đã trộn
+
+        Returns:
+            QuestionRecord: Câu trắc nghiệm, hoặc câu chỉ có đề, lời giải và đáp án
+
+        Raises:
+            ValueError: Khi generate_wrong_answers() không trả về đúng 3 đáp án
+                       hoặc có đáp án trùng nhau
+        """
         print(f"Đang tạo câu hỏi {question_number}")
-        
+
+        # Đo thời gian từng pha khi đang profile (xem generation_profiler)
+        phase = phase_timer(self)
+
         # Sinh tham số và tính toán chung
-        self.parameters = self.generate_parameters()
-        self.correct_answer = self.calculate_answer()
-        question_text = self.generate_question_text()
-        solution = self.generate_solution()
-        
-        # Tạo nội dung cơ bản
-        question_content = f"Câu {question_number}: {question_text}\n\n"
-        
+        with phase("generate_parameters"):
+            self.parameters = self.generate_parameters()
+        with phase("calculate_answer"):
+            self.correct_answer = self.calculate_answer()
+        with phase("generate_question_text"):
+            question_text = self.generate_question_text()
+        with phase("generate_solution"):
+            solution = self.generate_solution()
+
+        self.record = QuestionRecord(
+            number=question_number,
+            stem=question_text,
+            answer=str(self.correct_answer),
+            solution=solution,
+            metadata={"generator": generator_key(type(self))}
+        )
         if include_multiple_choice:
-            # Tạo câu hỏi trắc nghiệm với 4 đáp án A/B/C/D
+            self.record = self._with_choices(self.record, phase)
+        return self.record
+
+    def _with_choices(self, record: QuestionRecord, phase) -> QuestionRecord:
+        """Thêm 4 phương án A/B/C/D đã trộn vào record (kiểm tra số lượng và trùng lặp)"""
+        with phase("generate_wrong_answers"):
             self.wrong_answers = self.generate_wrong_answers()
 
-            # Kiểm soát số lượng đáp án sai
-            if len(self.wrong_answers) != 3:
-                raise ValueError(
-                    f"generate_wrong_answers() phải trả về đúng 3 đáp án sai, nhưng đã trả về {len(self.wrong_answers)} đáp án"
-                )
-
-            # Kiểm tra đáp án trùng nhau
-            all_answers = [self.correct_answer] + self.wrong_answers
-            if len(set(all_answers)) != 4:
-                duplicates = [ans for ans in all_answers if all_answers.count(ans) > 1]
-                raise ValueError(
-                    f"Có đáp án trùng nhau: {duplicates}. Tất cả 4 đáp án phải khác nhau."
-                )
-
-            # Trộn đáp án và tạo format trắc nghiệm
-            random.shuffle(all_answers)
-            correct_index = all_answers.index(self.correct_answer)
-
-            # Sử dụng môi trường choices của LaTeX
-            question_content += "\\begin{choices}\n"
-            for j, ans in enumerate(all_answers):
-                # Không đánh dấu * trong LaTeX, chỉ dùng cho kiểm tra nội bộ
-                question_content += f"  \\choice {ans}\\n"
-            question_content += "\\end{choices}\n\n"
-
-            question_content += f"Lời giải:\n\n{solution}\n\n"
-            return question_content
-        else:
-            # Chỉ tạo đề bài và lời giải (không có đáp án trắc nghiệm)
-            question_content += f"Lời giải:\n\n{solution}\n\n"
-            return question_content, self.correct_answer
+        # Kiểm soát số lượng đáp án sai
+        if len(self.wrong_answers) != 3:
+            raise ValueError(
+                f"generate_wrong_answers() phải trả về đúng 3 đáp án sai, nhưng đã trả về {len(self.wrong_answers)} đáp án"
+            )
+
+        # Kiểm tra đáp án trùng nhau
+        all_answers = [self.correct_answer] + self.wrong_answers
+        duplicates = find_duplicates(all_answers)
+        if duplicates:
+            raise ValueError(
+                f"Có đáp án trùng nhau: {duplicates}. Tất cả 4 đáp án phải khác nhau."
+            )
+
+        # Trộn đáp án; phương án đúng chỉ đánh dấu trong record, không đánh dấu * trong LaTeX
+        random.shuffle(all_answers)
+        correct_index = all_answers.index(self.correct_answer)
+        return replace(
+            record,
+            kind=KIND_MULTIPLE_CHOICE,
+            options=[str(ans) for ans in all_answers],
+            truth=[j == correct_index for j in range(len(all_answers))]
+        )
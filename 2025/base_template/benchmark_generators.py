@@ -0,0 +1,485 @@
+"""
+Benchmark generator - đo mọi generator câu hỏi trong 2025/* và 2026/*
+
+Tự tìm các class có generate_question_only / generate_full_question / generate_question và
+các hàm cùng tên cấp module. Mỗi module chạy trong một process riêng (thư mục làm
+việc tạm, không ghi file vào repo):
+- Thời gian import module
+- N lần sinh có seed (seed dẫn xuất từ master seed, tên generator, lần sinh): p50/p95/mean
+- Số lần thử hỏng (lần sinh ném exception thì thử seed kế tiếp, như QuestionManager)
+- Số lần gọi hàm random.* mỗi câu (p50/p95) - vòng lặp loại bỏ `while True` chậm đi sẽ
+  làm số này tăng vọt
+- Bộ nhớ cấp phát đỉnh của một lần sinh (tracemalloc) và RSS đỉnh của process
+
+Kết quả ghi ra JSON; so với baseline bằng --baseline, thoát mã 1 nếu có generator chậm đi
+quá ngưỡng hoặc trước chạy được nay lỗi.
+
+Ví dụ:
+  python3 benchmark_generators.py -n 20 -o bench.json
+  python3 benchmark_generators.py --filter 2026/15_03 -n 50
+  python3 benchmark_generators.py -o bench_new.json --baseline bench.json --tolerance 2
+"""
+import argparse
+import ast
+import contextlib
+import io
+import json
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from seed_stream import derive_seed, seed_global_generators
+
+RESULTS_VERSION = 1
+DEFAULT_ITERATIONS = 20
+DEFAULT_SEED = 2025
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_TIMEOUT = 10           # giây cho mỗi lần sinh
+DEFAULT_MODULE_TIMEOUT = 600   # giây cho cả một module
+DEFAULT_TOLERANCE = 2.0        # p95 mới > tolerance * p95 baseline là chậm đi
+MIN_REGRESSION_MS = 5.0        # bỏ qua chênh lệch tuyệt đối nhỏ hơn ngưỡng này
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+DEFAULT_ROOTS = ["2025", "2026"]
+SKIP_DIRS = {"__pycache__", ".venv", "venv", ".git"}
+SKIP_PREFIXES = ("benchmark_", "verify_", "test_")
+
+# Thứ tự ưu tiên phương thức sinh câu hỏi của một class
+ENTRY_METHODS = ("generate_question_only", "generate_full_question", "generate_question")
+QUESTION_NUMBER_PARAMS = {"question_number", "idx", "index", "number", "question_idx"}
+
+# Các hàm của module random được đếm số lần gọi
+COUNTED_RANDOM_FUNCTIONS = (
+    "random", "uniform", "randint", "randrange", "choice", "choices", "shuffle", "sample", "gauss"
+)
+
+
+# =============================
+# TÌM GENERATOR (không import)
+# =============================
+def _looks_like_generator_file(tree: ast.Module) -> bool:
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name in ENTRY_METHODS:
+            return True
+        if isinstance(node, ast.ClassDef):
+            if node.bases:
+                # Có thể kế thừa phương thức sinh từ class cha (BaseOptimizationQuestion, ...)
+                return True
+            for item in node.body:
+                if isinstance(item, ast.FunctionDef) and item.name in ENTRY_METHODS:
+                    return True
+    return False
+
+
+def discover_generator_files(roots: List[str], name_filter: Optional[str] = None) -> List[str]:
+    """
+    Tìm các file .py có thể chứa generator (lọc nhanh bằng AST, chưa import)
+
+    Args:
+        roots: Các thư mục gốc (tương đối với repo hoặc tuyệt đối)
+        name_filter: Chỉ giữ file có đường dẫn chứa chuỗi này
+
+    Returns:
+        List[str]: Đường dẫn tương đối với repo, đã sắp xếp
+    """
+    found = []
+    for root in roots:
+        root_path = root if os.path.isabs(root) else os.path.join(REPO_ROOT, root)
+        for directory, dirnames, filenames in os.walk(root_path):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            for filename in sorted(filenames):
+                if not filename.endswith(".py") or filename.startswith(SKIP_PREFIXES):
+                    continue
+                path = os.path.join(directory, filename)
+                relative = os.path.relpath(path, REPO_ROOT).replace(os.sep, "/")
+                if name_filter and name_filter not in relative:
+                    continue
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        tree = ast.parse(f.read(), filename=path)
+                except (SyntaxError, UnicodeDecodeError, OSError):
+                    continue
+                if _looks_like_generator_file(tree):
+                    found.append(relative)
+    return found
+
+
+# =============================
+# PROCESS CON: ĐO MỘT MODULE
+# =============================
+class _GenerationTimeout(Exception):
+    pass
+
+
+def _timeout_handler(signum, frame):
+    raise _GenerationTimeout()
+
+
+class _RandomCallCounter:
+    """Bọc các hàm random.* cấp module để đếm số lần gọi"""
+
+    def __init__(self):
+        self.calls = 0
+        self._originals: Dict[str, Callable] = {}
+
+    def install(self) -> None:
+        for name in COUNTED_RANDOM_FUNCTIONS:
+            original = getattr(random, name)
+            self._originals[name] = original
+
+            def counted(*args, _original=original, **kwargs):
+                self.calls += 1
+                return _original(*args, **kwargs)
+
+            setattr(random, name, counted)
+
+    def uninstall(self) -> None:
+        for name, original in self._originals.items():
+            setattr(random, name, original)
+
+
+def _call_entry(target: Any, method: Optional[str]) -> Any:
+    import inspect
+
+    if method is None:
+        func = target
+    else:
+        func = getattr(target(), method)
+    parameters = [
+        p for p in inspect.signature(func).parameters.values()
+        if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+    ]
+    # Chỉ truyền số thứ tự câu khi tham số đầu bắt buộc hoặc đúng là số thứ tự;
+    # tham số tùy chọn khác (seed=None, config=...) giữ mặc định để không cố định đề
+    if parameters and (parameters[0].default is parameters[0].empty
+                       or parameters[0].name in QUESTION_NUMBER_PARAMS):
+        return func(1)
+    return func()
+
+
+def _find_targets(module) -> List[Tuple[str, Any, Optional[str]]]:
+    import inspect
+
+    targets = []
+    for name, obj in sorted(vars(module).items()):
+        if getattr(obj, "__module__", None) != module.__name__:
+            continue
+        if inspect.isclass(obj):
+            if inspect.isabstract(obj):
+                continue
+            for method in ENTRY_METHODS:
+                if callable(getattr(obj, method, None)):
+                    targets.append((f"{name}.{method}", obj, method))
+                    break
+        elif inspect.isfunction(obj) and name in ENTRY_METHODS:
+            required = [
+                p for p in inspect.signature(obj).parameters.values()
+                if p.default is p.empty and p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+            ]
+            if len(required) <= 1:
+                targets.append((name, obj, None))
+    return targets
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def benchmark_target(target_name: str, target: Any, method: Optional[str], iterations: int,
+                     master_seed: int, max_retries: int, timeout: int) -> Dict[str, Any]:
+    """
+    Đo một generator (chạy trong process con)
+
+    Args:
+        target_name: Tên hiển thị (Class.method hoặc tên hàm)
+        target: Class hoặc hàm
+        method: Tên phương thức sinh (None nếu target là hàm)
+        iterations: Số câu cần sinh
+        master_seed: Master seed
+        max_retries: Số lần thử tối đa mỗi câu
+        timeout: Timeout mỗi lần sinh (giây)
+
+    Returns:
+        Dict: Số liệu của generator
+    """
+    timings_ms: List[float] = []
+    rng_calls: List[int] = []
+    retries = 0
+    failures = 0
+    last_error = None
+    counter = _RandomCallCounter()
+    use_alarm = hasattr(signal, "SIGALRM")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _timeout_handler)
+
+    sink = io.StringIO()
+    for index in range(1, iterations + 1):
+        for attempt in range(max_retries):
+            seed_global_generators(derive_seed(master_seed, target_name, index, attempt))
+            counter.calls = 0
+            counter.install()
+            start = time.perf_counter()
+            try:
+                if use_alarm:
+                    signal.alarm(timeout)
+                with contextlib.redirect_stdout(sink):
+                    _call_entry(target, method)
+                elapsed = (time.perf_counter() - start) * 1000
+                timings_ms.append(elapsed)
+                rng_calls.append(counter.calls)
+                break
+            except _GenerationTimeout:
+                last_error = f"timeout >{timeout}s"
+                retries += 1
+            except Exception as e:
+                last_error = f"{type(e).__name__}: {e}"[:200]
+                retries += 1
+            finally:
+                if use_alarm:
+                    signal.alarm(0)
+                counter.uninstall()
+                sink.seek(0)
+                sink.truncate()
+        else:
+            failures += 1
+
+    result: Dict[str, Any] = {
+        "target": target_name,
+        "ok": len(timings_ms),
+        "failures": failures,
+        "retries": retries,
+        "error": last_error if not timings_ms else None,
+    }
+    if timings_ms:
+        result.update({
+            "p50_ms": round(_percentile(timings_ms, 0.5), 3),
+            "p95_ms": round(_percentile(timings_ms, 0.95), 3),
+            "mean_ms": round(statistics.mean(timings_ms), 3),
+            "rng_calls_p50": _percentile(rng_calls, 0.5),
+            "rng_calls_p95": _percentile(rng_calls, 0.95),
+        })
+        # Đo bộ nhớ riêng một lần để tracemalloc không làm sai số liệu thời gian
+        seed_global_generators(derive_seed(master_seed, target_name, 0))
+        tracemalloc.start()
+        try:
+            with contextlib.redirect_stdout(sink):
+                _call_entry(target, method)
+            result["peak_alloc_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        except Exception:
+            result["peak_alloc_kb"] = None
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_module_worker(relative_path: str, iterations: int, master_seed: int,
+                      max_retries: int, timeout: int) -> Dict[str, Any]:
+    """
+    Import và đo mọi generator trong một module (gọi bên trong process con)
+
+    Args:
+        relative_path: Đường dẫn file tương đối với repo
+        iterations: Số câu mỗi generator
+        master_seed: Master seed
+        max_retries: Số lần thử mỗi câu
+        timeout: Timeout mỗi lần sinh (giây)
+
+    Returns:
+        Dict: {'module', 'import_ms', 'targets', 'peak_rss_mb', 'error'}
+    """
+    import importlib.util
+
+    path = os.path.join(REPO_ROOT, relative_path)
+    module_dir = os.path.dirname(path)
+    sys.path.insert(0, module_dir)
+    module_name = os.path.splitext(os.path.basename(path))[0]
+    report: Dict[str, Any] = {"module": relative_path, "targets": [], "error": None}
+
+    start = time.perf_counter()
+    try:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        with contextlib.redirect_stdout(io.StringIO()):
+            spec.loader.exec_module(module)
+    except BaseException as e:
+        report["error"] = f"import: {type(e).__name__}: {e}"[:200]
+        return report
+    report["import_ms"] = round((time.perf_counter() - start) * 1000, 2)
+
+    for target_name, target, method in _find_targets(module):
+        report["targets"].append(
+            benchmark_target(target_name, target, method, iterations, master_seed, max_retries, timeout)
+        )
+
+    try:
+        import resource
+        # ru_maxrss tính bằng KB trên Linux
+        report["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    except ImportError:
+        report["peak_rss_mb"] = None
+    return report
+
+
+# =============================
+# PROCESS CHA: ĐIỀU PHỐI & SO SÁNH
+# =============================
+def benchmark_module(relative_path: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """Chạy process con đo một module, trả về báo cáo (kể cả khi process con lỗi)"""
+    command = [
+        sys.executable, os.path.abspath(__file__), "--worker", relative_path,
+        "-n", str(args.iterations), "--seed", str(args.seed),
+        "--max-retries", str(args.max_retries), "--timeout", str(args.timeout),
+    ]
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory(prefix="bench_gen_") as workdir:
+        try:
+            completed = subprocess.run(
+                command, cwd=workdir, env=env, capture_output=True, text=True,
+                timeout=args.module_timeout
+            )
+        except subprocess.TimeoutExpired:
+            return {"module": relative_path, "targets": [], "error": f"module timeout >{args.module_timeout}s"}
+    for line in reversed(completed.stdout.strip().splitlines()):
+        if line.startswith("{"):
+            try:
+                return json.loads(line)
+            except json.JSONDecodeError:
+                break
+    stderr_tail = completed.stderr.strip().splitlines()[-1:] or ["không có output"]
+    return {"module": relative_path, "targets": [], "error": f"worker: {stderr_tail[0]}"[:200]}
+
+
+def compare_with_baseline(results: Dict[str, Any], baseline: Dict[str, Any],
+                          tolerance: float) -> List[str]:
+    """
+    So sánh kết quả với baseline
+
+    Args:
+        results: Kết quả lần chạy hiện tại
+        baseline: Kết quả đã lưu
+        tolerance: Hệ số chậm đi cho phép của p95 (và số lần gọi random p95)
+
+    Returns:
+        List[str]: Mô tả các trường hợp chậm đi / hỏng
+    """
+    def index(data):
+        table = {}
+        for module in data.get("modules", []):
+            for target in module.get("targets", []):
+                table[(module["module"], target["target"])] = target
+        return table
+
+    old, new = index(baseline), index(results)
+    regressions = []
+    for key, before in old.items():
+        after = new.get(key)
+        name = f"{key[0]}::{key[1]}"
+        if after is None:
+            continue
+        if before.get("ok") and not after.get("ok"):
+            regressions.append(f"{name}: trước chạy được, nay lỗi ({after.get('error')})")
+            continue
+        if not before.get("ok") or not after.get("ok"):
+            continue
+        old_p95, new_p95 = before["p95_ms"], after["p95_ms"]
+        if new_p95 > old_p95 * tolerance and new_p95 - old_p95 > MIN_REGRESSION_MS:
+            regressions.append(f"{name}: p95 {old_p95} ms -> {new_p95} ms")
+        old_calls, new_calls = before.get("rng_calls_p95"), after.get("rng_calls_p95")
+        if old_calls and new_calls and new_calls > old_calls * tolerance:
+            regressions.append(f"{name}: số lần gọi random p95 {old_calls} -> {new_calls}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark tất cả generator câu hỏi")
+    parser.add_argument('roots', nargs='*', default=DEFAULT_ROOTS,
+                        help=f'Thư mục cần quét, tương đối với repo (mặc định: {" ".join(DEFAULT_ROOTS)})')
+    parser.add_argument('-n', '--iterations', type=int, default=DEFAULT_ITERATIONS,
+                        help=f'Số câu sinh cho mỗi generator (mặc định: {DEFAULT_ITERATIONS})')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help=f'Master seed (mặc định: {DEFAULT_SEED})')
+    parser.add_argument('--filter', help='Chỉ đo file có đường dẫn chứa chuỗi này')
+    parser.add_argument('--max-retries', type=int, default=DEFAULT_MAX_RETRIES,
+                        help=f'Số lần thử mỗi câu (mặc định: {DEFAULT_MAX_RETRIES})')
+    parser.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT,
+                        help=f'Timeout mỗi lần sinh (giây, mặc định: {DEFAULT_TIMEOUT})')
+    parser.add_argument('--module-timeout', type=int, default=DEFAULT_MODULE_TIMEOUT,
+                        help=f'Timeout cho cả một module (giây, mặc định: {DEFAULT_MODULE_TIMEOUT})')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Số module đo song song (mặc định: 1 để số liệu ổn định)')
+    parser.add_argument('-o', '--output', help='Ghi kết quả JSON ra file')
+    parser.add_argument('--baseline', help='File JSON kết quả cũ để so sánh')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Hệ số chậm đi cho phép so với baseline (mặc định: {DEFAULT_TOLERANCE})')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.iterations < 1 or args.max_retries < 1 or args.jobs < 1:
+        parser.error("--iterations, --max-retries và --jobs phải >= 1")
+
+    if args.worker:
+        report = run_module_worker(args.worker, args.iterations, args.seed, args.max_retries, args.timeout)
+        print(json.dumps(report, ensure_ascii=False))
+        return
+
+    files = discover_generator_files(args.roots, args.filter)
+    print(f"📋 Tìm thấy {len(files)} file có thể chứa generator")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        modules = list(executor.map(lambda path: benchmark_module(path, args), files))
+
+    target_count = 0
+    for module in modules:
+        if module.get("error"):
+            print(f"⚠️  {module['module']}: {module['error']}")
+            continue
+        for target in module["targets"]:
+            target_count += 1
+            if target["ok"]:
+                print(f"✅ {module['module']}::{target['target']}: p50 {target['p50_ms']} ms, "
+                      f"p95 {target['p95_ms']} ms, thử hỏng {target['retries']}, "
+                      f"random p95 {target['rng_calls_p95']} lần")
+            else:
+                print(f"❌ {module['module']}::{target['target']}: {target['error']}")
+
+    results = {
+        "version": RESULTS_VERSION,
+        "python": sys.version.split()[0],
+        "iterations": args.iterations,
+        "seed": args.seed,
+        "seconds": round(time.perf_counter() - start, 2),
+        "modules": modules,
+    }
+    print(f"📋 {target_count} generator trong {len(modules)} file, {results['seconds']}s")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"✅ Đã ghi {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} generator chậm đi hoặc hỏng so với baseline:")
+            for line in regressions:
+                print(f"   - {line}")
+            sys.exit(1)
+        print("✅ Không có generator nào chậm đi so với baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark thời gian import - phát hiện khi một module nhẹ vô tình kéo theo thư viện nặng
+
+Mỗi lần đo chạy trong một process Python mới (cache import trống), lấy trung vị của nhiều
+lần chạy và so với ngân sách. Thoát với mã 1 nếu vượt ngân sách hoặc nếu module đã import
+một thư viện bị cấm (mặc định: sympy, scipy) - dùng được trong CI.
+
+Ví dụ:
+  python3 benchmark_import_time.py                         # latex_utils, ngân sách mặc định
+  python3 benchmark_import_time.py latex_utils --budget-ms 80 --runs 9
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+DEFAULT_MODULES = ["latex_utils"]
+DEFAULT_BUDGET_MS = 150.0
+DEFAULT_RUNS = 5
+DEFAULT_FORBIDDEN = ["sympy", "scipy"]
+
+# Script chạy trong process con: đo import và liệt kê các module nặng đã bị kéo theo
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+__import__({module!r})
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed_ms, "loaded": [m for m in {forbidden!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module: str, runs: int, forbidden: List[str], cwd: str) -> Dict:
+    """
+    Đo thời gian import một module trong các process mới
+
+    Args:
+        module: Tên module cần import
+        runs: Số lần đo
+        forbidden: Các module không được phép bị import theo
+        cwd: Thư mục chạy (để import được các module cùng thư mục)
+
+    Returns:
+        Dict: {'module', 'median_ms', 'min_ms', 'max_ms', 'loaded_forbidden'}
+    """
+    timings = []
+    loaded = set()
+    probe = _PROBE.format(module=module, forbidden=forbidden)
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", probe],
+            cwd=cwd, capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result["ms"])
+        loaded.update(result["loaded"])
+    return {
+        'module': module,
+        'median_ms': round(statistics.median(timings), 2),
+        'min_ms': round(min(timings), 2),
+        'max_ms': round(max(timings), 2),
+        'loaded_forbidden': sorted(loaded),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark thời gian import module")
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES,
+                        help=f'Các module cần đo (mặc định: {" ".join(DEFAULT_MODULES)})')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'Ngân sách thời gian import (ms, mặc định: {DEFAULT_BUDGET_MS})')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS,
+                        help=f'Số lần đo mỗi module (mặc định: {DEFAULT_RUNS})')
+    parser.add_argument('--forbid', nargs='*', default=DEFAULT_FORBIDDEN,
+                        help=f'Module không được import theo (mặc định: {" ".join(DEFAULT_FORBIDDEN)})')
+    parser.add_argument('--json', action='store_true', help='In kết quả dạng JSON')
+    args = parser.parse_args()
+
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    results = [measure_import(m, args.runs, args.forbid, cwd) for m in args.modules]
+
+    failed = False
+    for r in results:
+        over_budget = r['median_ms'] > args.budget_ms
+        r['status'] = 'fail' if over_budget or r['loaded_forbidden'] else 'ok'
+        failed = failed or r['status'] == 'fail'
+
+    if args.json:
+        print(json.dumps({'budget_ms': args.budget_ms, 'results': results}, ensure_ascii=False, indent=2))
+    else:
+        for r in results:
+            mark = "✅" if r['status'] == 'ok' else "❌"
+            print(f"{mark} import {r['module']}: {r['median_ms']} ms (min {r['min_ms']}, max {r['max_ms']}, "
+                  f"ngân sách {args.budget_ms} ms)")
+            if r['loaded_forbidden']:
+                print(f"   ⚠️  đã import theo: {', '.join(r['loaded_forbidden'])}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Distractor Engine - Sinh đáp án sai (distractor) có giới hạn số bước
+
+Nhiều generator tự viết vòng lặp kiểu `while len(wrong_answers) < 3: ...` với nhánh dự phòng:
+vòng lặp có thể quay lâu khi không gian đáp án nhỏ, nhánh dự phòng có thể thêm đáp án trùng,
+và mỗi nơi kiểm tra trùng một kiểu (list.count, `not in list`...). Module này gom lại:
+- Mistake model: hàm (correct, rng) -> iterable các ứng viên sai, mô tả một kiểu nhầm lẫn
+  (cộng/trừ lệch, nhân sai hệ số, đổi đầu mút khoảng, giá trị cố định, bốc ngẫu nhiên...)
+- DistractorEngine.generate duyệt các model theo thứ tự ưu tiên trong MỘT lượt, chống trùng
+  bằng set (theo khóa chuẩn hóa của kiểu giá trị và theo chuỗi hiển thị), tổng số ứng viên
+  được xét không quá max_steps nên luôn dừng; thiếu đáp án thì báo ValueError (để QuestionManager
+  sinh lại câu hỏi) thay vì thêm đáp án trùng
+
+Kiểu giá trị (DistractorKind):
+- NUMBER: int/float/Fraction (float làm tròn NUMBER_SIGNIFICANT_DIGITS chữ số có nghĩa khi so trùng)
+- INTERVAL: cặp (đầu, cuối)
+- EXPRESSION: chuỗi LaTeX (bỏ khoảng trắng, \\left/\\right, \\dfrac/\\tfrac coi như \\frac)
+"""
+import random
+import re
+from enum import Enum
+from fractions import Fraction
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Sequence
+
+DEFAULT_DISTRACTOR_COUNT = 3
+DEFAULT_MAX_STEPS = 200
+NUMBER_SIGNIFICANT_DIGITS = 9
+
+# (correct, rng) -> các ứng viên sai
+MistakeModel = Callable[[Any, random.Random], Iterable[Any]]
+
+_LATEX_SPACING = re.compile(r"\\left|\\right|\\[,;:!]|\s+")
+_LATEX_FRAC = re.compile(r"\\[dt]frac")
+
+
+class DistractorKind(Enum):
+    """Kiểu giá trị của đáp án (quyết định cách so trùng)"""
+    NUMBER = "number"
+    INTERVAL = "interval"
+    EXPRESSION = "expression"
+
+
+def distractor_key(value: Any, kind: DistractorKind) -> Hashable:
+    """
+    Khóa chuẩn hóa để so trùng hai đáp án cùng kiểu
+
+    Args:
+        value: Giá trị đáp án
+        kind: Kiểu giá trị
+
+    Returns:
+        Hashable: Hai đáp án trùng nhau khi và chỉ khi có cùng khóa
+    """
+    if kind == DistractorKind.NUMBER:
+        return _number_key(value)
+    if kind == DistractorKind.INTERVAL:
+        if isinstance(value, str):
+            return _expression_key(value)
+        return tuple(_number_key(endpoint) for endpoint in value)
+    return _expression_key(str(value))
+
+
+def _number_key(value: Any) -> Hashable:
+    if isinstance(value, bool) or not isinstance(value, (int, float, Fraction)):
+        return _expression_key(str(value))
+    if isinstance(value, float):
+        if value != value or value in (float("inf"), float("-inf")):
+            return value
+        value = Fraction(float(f"{value:.{NUMBER_SIGNIFICANT_DIGITS}g}"))
+    return Fraction(value)
+
+
+def _expression_key(text: str) -> str:
+    return _LATEX_FRAC.sub(r"\\frac", _LATEX_SPACING.sub("", text))
+
+
+def find_duplicates(values: Sequence[Any], key: Optional[Callable[[Any], Hashable]] = None) -> List[Any]:
+    """
+    Các giá trị xuất hiện nhiều lần (một lượt, dùng set)
+
+    Args:
+        values: Dãy giá trị
+        key: Hàm lấy khóa so trùng (mặc định chính giá trị)
+
+    Returns:
+        List[Any]: Mỗi giá trị trùng một lần, theo thứ tự lần lặp lại đầu tiên
+    """
+    seen = set()
+    reported = set()
+    duplicates = []
+    for value in values:
+        k = key(value) if key else value
+        if k in seen and k not in reported:
+            reported.add(k)
+            duplicates.append(value)
+        seen.add(k)
+    return duplicates
+
+
+# =============================
+# MISTAKE MODEL
+# =============================
+def shifted(*deltas: Any) -> MistakeModel:
+    """Đáp án đúng cộng một độ lệch (thứ tự ngẫu nhiên)"""
+    def model(correct, rng):
+        for delta in rng.sample(deltas, len(deltas)):
+            yield correct + delta
+    return model
+
+
+def scaled(*factors: Any) -> MistakeModel:
+    """Đáp án đúng nhân một hệ số (thứ tự ngẫu nhiên)"""
+    def model(correct, rng):
+        for factor in rng.sample(factors, len(factors)):
+            yield correct * factor
+    return model
+
+
+def constants(*values: Any) -> MistakeModel:
+    """Các giá trị cố định theo đúng thứ tự (ví dụ lỗi quen thuộc, đáp án dự phòng)"""
+    def model(correct, rng):
+        return values
+    return model
+
+
+def choices(*values: Any) -> MistakeModel:
+    """Các giá trị cố định theo thứ tự ngẫu nhiên"""
+    def model(correct, rng):
+        return rng.sample(values, len(values))
+    return model
+
+
+def draws(draw: Callable[[random.Random], Any], limit: int = DEFAULT_MAX_STEPS) -> MistakeModel:
+    """
+    Bốc ngẫu nhiên tối đa limit ứng viên (thay cho vòng while bốc đến khi đủ)
+
+    Args:
+        draw: Hàm rng -> một ứng viên (None = bỏ qua lần bốc này)
+        limit: Số lần bốc tối đa
+    """
+    def model(correct, rng):
+        for _ in range(limit):
+            candidate = draw(rng)
+            if candidate is not None:
+                yield candidate
+    return model
+
+
+# =============================
+# ENGINE
+# =============================
+class DistractorEngine:
+    """
+    Chọn các đáp án sai khác nhau từ danh sách mistake model
+
+    Dùng:
+        engine = DistractorEngine(DistractorKind.NUMBER, accept=lambda v: v > 0)
+        wrong = engine.generate(42, [shifted(5, -5, 10), scaled(2, Fraction(1, 2))])
+    """
+
+    def __init__(
+        self,
+        kind: DistractorKind = DistractorKind.NUMBER,
+        render: Callable[[Any], str] = str,
+        accept: Optional[Callable[[Any], bool]] = None,
+        max_steps: int = DEFAULT_MAX_STEPS
+    ):
+        """
+        Args:
+            kind: Kiểu giá trị của đáp án
+            render: Hàm chuyển giá trị thành chuỗi hiển thị
+            accept: Điều kiện một ứng viên hợp lệ (ví dụ khoảng phải có đầu < cuối)
+            max_steps: Tổng số ứng viên tối đa được xét trong một lần generate
+
+        Raises:
+            ValueError: Khi max_steps không hợp lệ
+        """
+        if max_steps < 1:
+            raise ValueError("max_steps phải lớn hơn 0")
+        self.kind = kind
+        self.render = render
+        self.accept = accept
+        self.max_steps = max_steps
+
+    def generate(
+        self,
+        correct: Any,
+        mistakes: Sequence[MistakeModel],
+        count: int = DEFAULT_DISTRACTOR_COUNT,
+        rng: Optional[random.Random] = None,
+        exclude: Iterable[Any] = ()
+    ) -> List[str]:
+        """
+        Sinh count đáp án sai khác nhau, khác đáp án đúng
+
+        Args:
+            correct: Đáp án đúng (cùng kiểu với ứng viên)
+            mistakes: Các mistake model theo thứ tự ưu tiên (model dự phòng đặt cuối)
+            count: Số đáp án sai cần
+            rng: Nguồn ngẫu nhiên (mặc định module random, đã được seed theo câu hỏi)
+            exclude: Các giá trị/chuỗi khác không được trùng (ví dụ đáp án đúng đã format)
+
+        Returns:
+            List[str]: count chuỗi đáp án sai
+
+        Raises:
+            ValueError: Khi xét hết max_steps ứng viên mà vẫn không đủ count đáp án
+        """
+        rng = rng or random
+        seen_keys = {distractor_key(correct, self.kind)}
+        seen_text = {_expression_key(self.render(correct))}
+        for value in exclude:
+            seen_keys.add(distractor_key(value, self.kind))
+            seen_text.add(_expression_key(value if isinstance(value, str) else self.render(value)))
+
+        result: List[str] = []
+        steps = 0
+        for model in mistakes:
+            for candidate in model(correct, rng):
+                steps += 1
+                if steps > self.max_steps:
+                    break
+                key = distractor_key(candidate, self.kind)
+                if key in seen_keys or (self.accept is not None and not self.accept(candidate)):
+                    continue
+                text = self.render(candidate)
+                text_key = _expression_key(text)
+                if text_key in seen_text:
+                    continue
+                seen_keys.add(key)
+                seen_text.add(text_key)
+                result.append(text)
+                if len(result) == count:
+                    return result
+            if steps > self.max_steps:
+                break
+
+        raise ValueError(
+            f"Chỉ sinh được {len(result)}/{count} đáp án sai khác nhau sau {min(steps, self.max_steps)} ứng viên"
+        )
+
+    def pick(self, correct: Any, mistakes: Sequence[MistakeModel], rng: Optional[random.Random] = None) -> str:
+        """Một đáp án sai (cho mệnh đề đúng/sai)"""
+        return self.generate(correct, mistakes, count=1, rng=rng)[0]
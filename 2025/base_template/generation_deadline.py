@@ -0,0 +1,134 @@
+"""
+Generation Deadline - Hạn chót (deadline) kiểu hợp tác cho việc sinh câu hỏi
+
+QuestionManager trước đây chỉ giới hạn thời gian bằng SIGALRM: chỉ chạy được trên main thread
+(không dùng được trong thread pool, web service, notebook, asyncio executor) và chỉ chính xác
+đến giây. Module này cho một deadline gắn với ngữ cảnh đang chạy (contextvars, nên mỗi thread /
+task asyncio có deadline riêng):
+- deadline_scope(0.25): mở một deadline 250ms; lồng nhau thì deadline trong không vượt quá ngoài
+- check_deadline(): các vòng lặp loại bỏ (`while True`, `for attempt in range(max_attempts)`)
+  gọi ở mỗi vòng, raise DeadlineExceeded khi hết giờ hoặc bị hủy; không có deadline thì không
+  làm gì (chỉ một lần đọc ContextVar)
+- attempts(n): thay cho range(n) trong vòng lặp thử lại, tự kiểm tra deadline mỗi lần
+- Deadline.cancel(): hủy từ thread khác (ví dụ request web bị ngắt)
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class DeadlineExceeded(Exception):
+    """Hết thời gian (hoặc bị hủy) khi đang sinh câu hỏi"""
+    pass
+
+
+class Deadline:
+    """
+    Mốc thời gian (time.monotonic) mà quá đó công việc phải dừng
+
+    Deadline con (parent khác None) hết hạn không muộn hơn deadline cha và bị hủy theo cha.
+    """
+    __slots__ = ("expires_at", "parent", "_cancelled")
+
+    def __init__(self, seconds: Optional[float] = None, parent: Optional["Deadline"] = None):
+        """
+        Args:
+            seconds: Thời gian cho phép (giây, nhận số thực); None = không giới hạn
+            parent: Deadline bao ngoài
+        """
+        expires_at = time.monotonic() + seconds if seconds is not None else None
+        if parent is not None and parent.expires_at is not None:
+            expires_at = parent.expires_at if expires_at is None else min(expires_at, parent.expires_at)
+        self.expires_at = expires_at
+        self.parent = parent
+        self._cancelled = False
+
+    def remaining(self) -> Optional[float]:
+        """Số giây còn lại (có thể âm), None nếu không giới hạn"""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.monotonic()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled or (self.parent is not None and self.parent.cancelled)
+
+    def cancel(self) -> None:
+        """Hủy (gọi được từ thread khác); lần check tiếp theo sẽ raise"""
+        self._cancelled = True
+
+    def expired(self) -> bool:
+        """Đã hết giờ hoặc bị hủy"""
+        if self.cancelled:
+            return True
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def check(self) -> None:
+        """
+        Raises:
+            DeadlineExceeded: Khi đã hết giờ hoặc bị hủy
+        """
+        if self.cancelled:
+            raise DeadlineExceeded("Đã hủy sinh câu hỏi")
+        if self.expires_at is not None and time.monotonic() >= self.expires_at:
+            raise DeadlineExceeded("Quá thời gian sinh câu hỏi")
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("question_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Deadline của ngữ cảnh hiện tại (None nếu không có)"""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[Deadline]:
+    """
+    Chạy một khối code với deadline
+
+    Args:
+        seconds: Thời gian cho phép (giây); None = không giới hạn thêm (vẫn theo deadline ngoài)
+
+    Yields:
+        Deadline: Deadline của khối (có thể cancel())
+    """
+    deadline = Deadline(seconds, parent=_current.get())
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def check_deadline() -> None:
+    """
+    Điểm kiểm tra trong vòng lặp sinh câu hỏi
+
+    Raises:
+        DeadlineExceeded: Khi deadline hiện tại đã hết giờ hoặc bị hủy
+    """
+    deadline = _current.get()
+    if deadline is not None:
+        deadline.check()
+
+
+def attempts(max_attempts: int) -> Iterator[int]:
+    """
+    Như range(max_attempts) nhưng kiểm tra deadline trước mỗi lần thử
+
+    Args:
+        max_attempts: Số lần thử tối đa
+
+    Yields:
+        int: Lần thử (0-based)
+
+    Raises:
+        DeadlineExceeded: Khi hết giờ giữa chừng
+    """
+    deadline = _current.get()
+    for attempt in range(max_attempts):
+        if deadline is not None:
+            deadline.check()
+        yield attempt
@@ -0,0 +1,295 @@
+"""
+Generation Profiler - Đo thời gian từng pha sinh câu hỏi theo từng generator
+
+Batch chậm nhưng không biết thời gian nằm ở generate_parameters, calculate_answer,
+generate_wrong_answers, generate_question_text hay generate_solution. Profiler ghi lại:
+- Span: (generator, pha, thời điểm bắt đầu, wall time, CPU time, pid, thread) cho mỗi pha;
+  QuestionManager mở span "generate_question" bao quanh mỗi lần thử, các pha của
+  BaseOptimizationQuestion lồng bên trong
+- Bộ đếm theo generator: số câu sinh được, retry, timeout, câu trùng bị loại
+
+Xuất ra:
+- JSON tổng hợp (export_json): số lần, tổng/trung bình/max wall, tổng CPU theo (generator, pha)
+- Chrome trace (export_chrome_trace): mở bằng chrome://tracing, Perfetto hoặc speedscope
+  (xem dạng flame graph); span lồng nhau theo thời gian trên cùng pid/tid
+
+Khi không bật profiler, phase_timer() trả về hàm luôn cho NO_SPAN (một context manager rỗng
+dùng chung): khoảng 1-2 micro giây mỗi câu hỏi, không đáng kể so với thời gian sinh câu (mili giây).
+"""
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
+
+from seed_stream import generator_key
+
+PROFILE_VERSION = 1
+QUESTION_SPAN = "generate_question"
+REGISTRY_MODULE_PREFIX = "generators."
+
+# Context manager rỗng dùng chung khi không profile
+NO_SPAN = nullcontext()
+
+# Profiler của span đang mở (các pha bên trong tự ghi vào đó); ContextVar nên mỗi thread
+# (executor="thread") có span riêng, không ghi nhầm vào profiler của thread khác
+_active: ContextVar[Optional["GenerationProfiler"]] = ContextVar("generation_profiler", default=None)
+
+# (generator, pha, bắt đầu ns, wall ns, cpu ns, pid, tid, lỗi)
+SpanRecord = Tuple[str, str, int, int, int, int, int, Optional[str]]
+
+
+def active_profiler() -> Optional["GenerationProfiler"]:
+    """
+    Profiler đang hoạt động (có span đang mở), None nếu không profile
+
+    Returns:
+        Optional[GenerationProfiler]: Profiler hoặc None
+    """
+    return _active.get()
+
+
+def phase_timer(owner: Any) -> Callable[[str], ContextManager]:
+    """
+    Hàm tạo span cho các pha của owner: phase_timer(self)("calculate_answer")
+
+    Args:
+        owner: Đối tượng/class câu hỏi
+
+    Returns:
+        Callable[[str], ContextManager]: Tên pha -> span của profiler đang hoạt động,
+            hoặc luôn trả về NO_SPAN khi không profile
+    """
+    profiler = _active.get()
+    if profiler is None:
+        return _no_span
+    generator = _generator_name(owner)
+    return lambda phase: _Span(profiler, generator, phase)
+
+
+def _no_span(phase: str) -> ContextManager:
+    return NO_SPAN
+
+
+def display_name(generator: str) -> str:
+    """Tên generator để hiển thị (bỏ tiền tố "generators." của module nạp từ manifest)"""
+    return generator[len(REGISTRY_MODULE_PREFIX):] if generator.startswith(REGISTRY_MODULE_PREFIX) else generator
+
+
+def _generator_name(generator: Any) -> str:
+    if isinstance(generator, str):
+        return generator
+    # Đối tượng câu hỏi -> class; LazyQuestionType tự có __module__/__qualname__
+    if not hasattr(generator, "__qualname__"):
+        generator = type(generator)
+    return generator_key(generator)
+
+
+class _Span:
+    """Context manager đo một pha; trong lúc mở, profiler của nó là profiler hoạt động"""
+    __slots__ = ("profiler", "generator", "phase", "token", "wall_start", "cpu_start")
+
+    def __init__(self, profiler: "GenerationProfiler", generator: str, phase: str):
+        self.profiler = profiler
+        self.generator = generator
+        self.phase = phase
+
+    def __enter__(self) -> "_Span":
+        self.token = _active.set(self.profiler)
+        self.cpu_start = time.process_time_ns()
+        self.wall_start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        wall = time.perf_counter_ns() - self.wall_start
+        cpu = time.process_time_ns() - self.cpu_start
+        _active.reset(self.token)
+        self.profiler.spans.append((
+            self.generator, self.phase, self.wall_start, wall, cpu,
+            self.profiler.pid, threading.get_native_id(),
+            exc_type.__name__ if exc_type is not None else None
+        ))
+        return False
+
+
+class GenerationProfiler:
+    """
+    Thu thập span và bộ đếm khi sinh câu hỏi
+
+    Dùng:
+        profiler = GenerationProfiler()
+        manager = QuestionManager(question_types, profiler=profiler)
+        manager.generate_questions(100, 2)
+        profiler.export_json("profile.json")
+        profiler.export_chrome_trace("trace.json")
+    """
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self.origin_ns = time.perf_counter_ns()
+        self.spans: List[SpanRecord] = []
+        self.counters: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def span(self, generator: Any, phase: str) -> _Span:
+        """
+        Context manager đo một pha
+
+        Args:
+            generator: Class/đối tượng câu hỏi hoặc tên generator
+            phase: Tên pha (thường là tên method)
+        """
+        return _Span(self, _generator_name(generator), phase)
+
+    def count(self, generator: Any, name: str, amount: int = 1) -> None:
+        """
+        Tăng bộ đếm của một generator (retry, timeout, câu trùng...)
+
+        Args:
+            generator: Class câu hỏi hoặc tên generator
+            name: Tên bộ đếm
+            amount: Giá trị cộng thêm
+        """
+        self.counters[_generator_name(generator)][name] += amount
+
+    # =============================
+    # GỬI QUA PROCESS
+    # =============================
+    def export_state(self) -> dict:
+        """Dữ liệu thô (picklable) để process con gửi về process cha"""
+        return {"spans": self.spans, "counters": {key: dict(value) for key, value in self.counters.items()}}
+
+    def merge_state(self, state: Optional[dict]) -> None:
+        """
+        Gộp dữ liệu từ export_state của profiler khác (ví dụ process con)
+
+        perf_counter dùng đồng hồ monotonic của hệ thống nên mốc thời gian của các process
+        so sánh được với nhau.
+
+        Args:
+            state: Kết quả export_state (None thì bỏ qua)
+        """
+        if not state:
+            return
+        self.spans.extend(state["spans"])
+        for generator, counters in state["counters"].items():
+            for name, amount in counters.items():
+                self.counters[generator][name] += amount
+
+    # =============================
+    # TỔNG HỢP / XUẤT
+    # =============================
+    def summary(self) -> dict:
+        """
+        Tổng hợp theo (generator, pha)
+
+        Returns:
+            dict: {'version', 'generators': {generator: {'phases': {...}, 'counters': {...}}}}
+        """
+        phases: Dict[str, Dict[str, dict]] = defaultdict(dict)
+        for generator, phase, _, wall, cpu, _, _, error in self.spans:
+            entry = phases[generator].get(phase)
+            if entry is None:
+                entry = phases[generator][phase] = {"count": 0, "errors": 0, "wall_ns": 0, "cpu_ns": 0, "max_wall_ns": 0}
+            entry["count"] += 1
+            entry["errors"] += error is not None
+            entry["wall_ns"] += wall
+            entry["cpu_ns"] += cpu
+            entry["max_wall_ns"] = max(entry["max_wall_ns"], wall)
+
+        generators = {}
+        for generator in sorted(set(phases) | set(self.counters)):
+            generators[generator] = {
+                "phases": {
+                    phase: {
+                        "count": entry["count"],
+                        "errors": entry["errors"],
+                        "wall_s": entry["wall_ns"] / 1e9,
+                        "cpu_s": entry["cpu_ns"] / 1e9,
+                        "mean_wall_ms": entry["wall_ns"] / entry["count"] / 1e6,
+                        "max_wall_ms": entry["max_wall_ns"] / 1e6,
+                    }
+                    for phase, entry in phases.get(generator, {}).items()
+                },
+                "counters": dict(self.counters.get(generator, {})),
+            }
+        return {"version": PROFILE_VERSION, "generators": generators}
+
+    def export_json(self, path: str) -> None:
+        """
+        Ghi tổng hợp ra file JSON
+
+        Args:
+            path: File kết quả
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+
+    def chrome_trace(self) -> dict:
+        """
+        Span dạng Chrome Trace Event Format (sự kiện "X", đơn vị micro giây)
+
+        Returns:
+            dict: {'traceEvents': [...], 'displayTimeUnit': 'ms'}
+        """
+        origin = min([self.origin_ns] + [span[2] for span in self.spans])
+        events = []
+        for pid in sorted({span[5] for span in self.spans}):
+            name = "main_runner" if pid == self.pid else f"worker {pid}"
+            events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": name}})
+        for generator, phase, start, wall, cpu, pid, tid, error in self.spans:
+            args = {"generator": generator, "cpu_ms": cpu / 1e6}
+            if error is not None:
+                args["error"] = error
+            events.append({
+                "name": phase if phase != QUESTION_SPAN else display_name(generator),
+                "cat": phase,
+                "ph": "X",
+                "ts": (start - origin) / 1e3,
+                "dur": wall / 1e3,
+                "pid": pid,
+                "tid": tid,
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> None:
+        """
+        Ghi Chrome trace (chrome://tracing, https://ui.perfetto.dev, speedscope)
+
+        Args:
+            path: File kết quả
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f, ensure_ascii=False)
+
+    def format_summary(self, limit: int = 10) -> List[str]:
+        """
+        Các dòng tóm tắt: những (generator, pha) tốn nhiều wall time nhất
+
+        Args:
+            limit: Số dòng tối đa
+
+        Returns:
+            List[str]: Các dòng để in
+        """
+        generators = self.summary()["generators"]
+        rows = []
+        for generator, data in generators.items():
+            short_name = display_name(generator)
+            for phase, entry in data["phases"].items():
+                rows.append((entry["wall_s"], short_name, phase, entry))
+        rows.sort(key=lambda row: row[0], reverse=True)
+        lines = [
+            f"   - {name}.{phase}: {entry['wall_s']:.3f}s wall, {entry['cpu_s']:.3f}s CPU, "
+            f"{entry['count']} lần, TB {entry['mean_wall_ms']:.2f}ms"
+            for _, name, phase, entry in rows[:limit]
+        ]
+        for generator, data in generators.items():
+            counters = {name: value for name, value in data["counters"].items() if name != "generated" and value}
+            if counters:
+                details = ", ".join(f"{name}={value}" for name, value in sorted(counters.items()))
+                lines.append(f"   - {display_name(generator)}: {details}")
+        return lines
@@ -0,0 +1,427 @@
+"""
+Generator Registry - Danh mục (manifest) mọi generator trong 2025/* và 2026/*, import lười
+
+Quét các thư mục theo ngày một lần bằng AST (không import) và ghi manifest JSON gồm điểm vào,
+chủ đề và tag của từng generator. Những lần sau chỉ đọc manifest và quét lại file đã đổi
+(so mtime/size). Module của một generator chỉ được import khi câu hỏi loại đó thực sự được
+bốc, nên đề trộn từ hàng trăm generator khởi động trong vài mili giây thay vì import sympy/scipy
+của những module không dùng tới.
+
+LazyQuestionType dùng thay cho class câu hỏi trong QuestionManager:
+- Có __name__/__module__/__qualname__ ổn định (seed_stream.derive_question_seed dùng được)
+- Pickle được (chỉ chứa thông tin manifest) nên chạy được với workers > 1
+- Gọi lazy_type() trả về đối tượng có generate_question(question_number, include_multiple_choice, seed)
+  như BaseOptimizationQuestion, kể cả với generator kiểu 2026 (generate_question_only)
+
+Ví dụ:
+  python3 generator_registry.py                 # quét (nếu cần) và liệt kê
+  python3 generator_registry.py --tag 2026 --tag volume
+  python3 generator_registry.py --rescan
+"""
+import argparse
+import ast
+import importlib.util
+import json
+import os
+import re
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from seed_stream import seeded
+
+MANIFEST_VERSION = 1
+MANIFEST_ENV_VAR = "GENERATOR_MANIFEST"
+DEFAULT_MANIFEST_NAME = ".generator_manifest.json"
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+DEFAULT_ROOTS = ["2025", "2026"]
+SKIP_DIRS = {"__pycache__", ".venv", "venv", ".git", "test_tex"}
+SKIP_PREFIXES = ("benchmark_", "verify_", "test_")
+
+# Thứ tự ưu tiên điểm vào của một class; hàm cấp module chỉ nhận generate_question
+ENTRY_METHODS = ("generate_question_only", "generate_full_question", "generate_question")
+FUNCTION_ENTRY = "generate_question"
+BASE_CLASS_NAME = "BaseOptimizationQuestion"
+QUESTION_NUMBER_PARAMS = {"question_number", "idx", "index", "number", "question_idx"}
+HEAVY_MODULES = ("sympy", "scipy", "numpy", "matplotlib")
+
+# Từ trong tên file không dùng làm tag
+_TAG_STOPWORDS = {"questions", "question", "cau", "py", "vi", "du", "va", "ham", "so", "the", "of"}
+_FOLDER_PATTERN = re.compile(r'^\d{2}_\d{2}$')
+
+
+# =============================
+# QUÉT (AST, không import)
+# =============================
+def _first_line(docstring: Optional[str]) -> Optional[str]:
+    if not docstring:
+        return None
+    for line in docstring.strip().splitlines():
+        line = line.strip()
+        if line:
+            return line
+    return None
+
+
+def _accepts_question_number(function: ast.FunctionDef, is_method: bool) -> bool:
+    arguments = function.args.args[1:] if is_method else function.args.args
+    if not arguments:
+        return False
+    first = arguments[0]
+    required = len(arguments) - len(function.args.defaults)
+    return required > 0 or first.arg in QUESTION_NUMBER_PARAMS
+
+
+def _is_abstract_class(node: ast.ClassDef, base_names: set) -> bool:
+    # Class cơ sở (kế thừa ABC hoặc có @abstractmethod) không sinh câu hỏi trực tiếp
+    if "ABC" in base_names:
+        return True
+    for item in node.body:
+        if isinstance(item, ast.FunctionDef):
+            for decorator in item.decorator_list:
+                if getattr(decorator, "id", getattr(decorator, "attr", None)) == "abstractmethod":
+                    return True
+    return False
+
+
+def _heavy_imports(tree: ast.Module) -> List[str]:
+    found = set()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            root = name.split(".")[0]
+            if root in HEAVY_MODULES:
+                found.add(root)
+    return sorted(found)
+
+
+def _path_tags(relative_path: str, heavy: List[str]) -> List[str]:
+    parts = relative_path.split("/")
+    tags = [parts[0]]
+    for folder in parts[1:-1]:
+        tags.append(f"{parts[0]}/{folder}" if _FOLDER_PATTERN.match(folder) else folder)
+    stem = os.path.splitext(parts[-1])[0].lower()
+    for token in re.split(r'[^a-z0-9]+', stem):
+        if len(token) > 1 and not token.isdigit() and token not in _TAG_STOPWORDS:
+            tags.append(token)
+    if "tf" in tags or "true" in tags:
+        tags.append("true_false")
+    tags.extend(f"uses:{name}" for name in heavy)
+    # Giữ thứ tự, bỏ trùng
+    return list(dict.fromkeys(tags))
+
+
+def scan_file(path: str) -> List[Dict[str, Any]]:
+    """
+    Tìm các generator trong một file bằng AST
+
+    Args:
+        path: Đường dẫn tuyệt đối tới file .py
+
+    Returns:
+        List[Dict]: Các mục manifest (rỗng nếu file không có generator hoặc lỗi cú pháp)
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (SyntaxError, UnicodeDecodeError, OSError, ValueError):
+        return []
+
+    relative = os.path.relpath(path, REPO_ROOT).replace(os.sep, "/")
+    module_topic = _first_line(ast.get_docstring(tree))
+    heavy = _heavy_imports(tree)
+    tags = _path_tags(relative, heavy)
+    entries = []
+
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            methods = {item.name: item for item in node.body if isinstance(item, ast.FunctionDef)}
+            base_names = {getattr(base, "id", getattr(base, "attr", None)) for base in node.bases}
+            if _is_abstract_class(node, base_names):
+                continue
+            if BASE_CLASS_NAME in base_names:
+                entry, compatible = "generate_question", True
+            else:
+                entry = next((name for name in ENTRY_METHODS if name in methods), None)
+                compatible = False
+            if entry is None:
+                continue
+            takes_number = compatible or (entry in methods and _accepts_question_number(methods[entry], True))
+            entries.append({
+                "key": f"{relative}::{node.name}",
+                "path": relative,
+                "qualname": node.name,
+                "kind": "class",
+                "entry": entry,
+                "base_compatible": compatible,
+                "takes_number": takes_number,
+                "topic": _first_line(ast.get_docstring(node)) or module_topic or node.name,
+                "tags": tags,
+            })
+        elif isinstance(node, ast.FunctionDef) and node.name == FUNCTION_ENTRY:
+            required = len(node.args.args) - len(node.args.defaults)
+            if required > 1:
+                continue
+            entries.append({
+                "key": f"{relative}::{node.name}",
+                "path": relative,
+                "qualname": node.name,
+                "kind": "function",
+                "entry": node.name,
+                "base_compatible": False,
+                "takes_number": _accepts_question_number(node, False),
+                "topic": _first_line(ast.get_docstring(node)) or module_topic or os.path.basename(relative),
+                "tags": tags,
+            })
+    return entries
+
+
+def _iter_python_files(roots: List[str]):
+    for root in roots:
+        root_path = root if os.path.isabs(root) else os.path.join(REPO_ROOT, root)
+        for directory, dirnames, filenames in os.walk(root_path):
+            dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+            for filename in sorted(filenames):
+                if filename.endswith(".py") and not filename.startswith(SKIP_PREFIXES):
+                    yield os.path.join(directory, filename)
+
+
+def default_manifest_path() -> str:
+    """Đường dẫn manifest: biến môi trường GENERATOR_MANIFEST hoặc .generator_manifest.json ở gốc repo"""
+    return os.environ.get(MANIFEST_ENV_VAR) or os.path.join(REPO_ROOT, DEFAULT_MANIFEST_NAME)
+
+
+def build_manifest(
+    roots: Optional[List[str]] = None,
+    manifest_path: Optional[str] = None,
+    rescan: bool = False
+) -> Dict[str, Any]:
+    """
+    Đọc manifest đã lưu và quét lại những file mới/đã đổi (hoặc quét toàn bộ nếu rescan)
+
+    Args:
+        roots: Các thư mục cần quét (mặc định 2025, 2026)
+        manifest_path: File manifest (mặc định default_manifest_path())
+        rescan: True để bỏ qua manifest cũ
+
+    Returns:
+        Dict: {'version', 'roots', 'files': {path: {'mtime', 'size', 'entries'}}}
+    """
+    roots = roots or DEFAULT_ROOTS
+    manifest_path = manifest_path or default_manifest_path()
+
+    previous: Dict[str, Any] = {}
+    if not rescan and os.path.exists(manifest_path):
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION and data.get("roots") == roots:
+                previous = data.get("files", {})
+        except (OSError, ValueError):
+            previous = {}
+
+    files: Dict[str, Any] = {}
+    changed = False
+    for path in _iter_python_files(roots):
+        relative = os.path.relpath(path, REPO_ROOT).replace(os.sep, "/")
+        stat = os.stat(path)
+        cached = previous.get(relative)
+        if cached and cached["mtime"] == stat.st_mtime and cached["size"] == stat.st_size:
+            files[relative] = cached
+            continue
+        files[relative] = {"mtime": stat.st_mtime, "size": stat.st_size, "entries": scan_file(path)}
+        changed = True
+
+    manifest = {"version": MANIFEST_VERSION, "roots": roots, "files": files}
+    if changed or set(files) != set(previous):
+        temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(temp_path, manifest_path)
+    return manifest
+
+
+# =============================
+# IMPORT LƯỜI
+# =============================
+_module_lock = threading.Lock()
+
+
+def _module_name(relative_path: str) -> str:
+    # Nhiều thư mục có file trùng tên (cau_1.py, ...) nên tên module gồm cả đường dẫn
+    return "generators." + re.sub(r'[^0-9a-zA-Z_]', '_', os.path.splitext(relative_path)[0])
+
+
+def load_module(relative_path: str):
+    """
+    Import module generator theo đường dẫn (một lần, có cache trong sys.modules)
+
+    Args:
+        relative_path: Đường dẫn tương đối với repo
+
+    Returns:
+        module: Module đã import
+    """
+    name = _module_name(relative_path)
+    with _module_lock:
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+        path = os.path.join(REPO_ROOT, relative_path)
+        module_dir = os.path.dirname(path)
+        # Module có thể import file cùng thư mục (ví dụ các file trong base_template)
+        if module_dir not in sys.path:
+            sys.path.append(module_dir)
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+        return module
+
+
+def _normalize_result(result: Any, include_multiple_choice: bool):
+    # Generator kiểu 2026 trả về (nội dung, đáp án); nội dung đã gồm đáp án và lời giải
+    if isinstance(result, tuple) and len(result) >= 2:
+        content, answer = str(result[0]), str(result[1])
+    elif isinstance(result, dict):
+        content = str(result.get("content") or result.get("question") or result)
+        answer = str(result.get("answer", ""))
+    else:
+        content, answer = str(result), ""
+    return content if include_multiple_choice else (content, answer)
+
+
+class _GeneratorAdapter:
+    """Bọc một generator bất kỳ thành giao diện generate_question của BaseOptimizationQuestion"""
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.spec = spec
+
+    def generate_question(self, question_number: int = 1, include_multiple_choice: bool = True,
+                          seed: Optional[int] = None):
+        module = load_module(self.spec["path"])
+        target = getattr(module, self.spec["qualname"])
+        with seeded(seed):
+            if self.spec["kind"] == "class":
+                func = getattr(target(), self.spec["entry"])
+            else:
+                func = target
+            result = func(question_number) if self.spec["takes_number"] else func()
+        return _normalize_result(result, include_multiple_choice)
+
+
+class LazyQuestionType:
+    """
+    Đại diện cho một generator trong manifest; chỉ import module khi được gọi
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        """
+        Args:
+            spec: Một mục trong manifest (kết quả scan_file)
+        """
+        self.spec = spec
+        self.__name__ = spec["qualname"]
+        self.__qualname__ = spec["qualname"]
+        self.__module__ = _module_name(spec["path"])
+
+    @property
+    def key(self) -> str:
+        return self.spec["key"]
+
+    @property
+    def loaded(self) -> bool:
+        return _module_name(self.spec["path"]) in sys.modules
+
+    def resolve(self):
+        """Import module và trả về class/hàm thật"""
+        return getattr(load_module(self.spec["path"]), self.spec["qualname"])
+
+    def __call__(self):
+        if self.spec["base_compatible"]:
+            return self.resolve()()
+        return _GeneratorAdapter(self.spec)
+
+    def __repr__(self) -> str:
+        return f"LazyQuestionType({self.key!r})"
+
+
+def select_entries(manifest: Dict[str, Any], tags: Optional[List[str]] = None,
+                   topic: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Lọc các mục manifest
+
+    Args:
+        manifest: Manifest từ build_manifest
+        tags: Mục phải có đủ tất cả các tag này
+        topic: Chuỗi con (không phân biệt hoa thường) trong chủ đề hoặc đường dẫn
+
+    Returns:
+        List[Dict]: Các mục thỏa điều kiện, sắp theo key
+    """
+    selected = []
+    for data in manifest["files"].values():
+        for entry in data["entries"]:
+            if tags and not all(tag in entry["tags"] for tag in tags):
+                continue
+            if topic:
+                haystack = (entry["topic"] + " " + entry["path"]).lower()
+                if topic.lower() not in haystack:
+                    continue
+            selected.append(entry)
+    return sorted(selected, key=lambda e: e["key"])
+
+
+def load_lazy_types(tags: Optional[List[str]] = None, topic: Optional[str] = None,
+                    manifest_path: Optional[str] = None, rescan: bool = False) -> List[LazyQuestionType]:
+    """
+    Hàm tiện ích: các loại câu hỏi lười từ manifest, dùng trực tiếp cho QuestionManager
+
+    Args:
+        tags: Lọc theo tag (ví dụ ['2026', 'volume'])
+        topic: Lọc theo chủ đề/đường dẫn
+        manifest_path: File manifest
+        rescan: Quét lại toàn bộ
+
+    Returns:
+        List[LazyQuestionType]: Danh sách loại câu hỏi
+    """
+    manifest = build_manifest(manifest_path=manifest_path, rescan=rescan)
+    return [LazyQuestionType(entry) for entry in select_entries(manifest, tags, topic)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Quét và liệt kê các generator câu hỏi")
+    parser.add_argument('--tag', action='append', default=[], help='Lọc theo tag (lặp lại được)')
+    parser.add_argument('--topic', help='Lọc theo chủ đề hoặc đường dẫn')
+    parser.add_argument('--rescan', action='store_true', help='Bỏ manifest cũ, quét lại toàn bộ')
+    parser.add_argument('--json', action='store_true', help='In danh sách dạng JSON')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest = build_manifest(rescan=args.rescan)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    entries = select_entries(manifest, args.tag, args.topic)
+
+    if args.json:
+        print(json.dumps(entries, ensure_ascii=False, indent=2))
+        return
+    for entry in entries:
+        print(f"  {entry['key']}  [{', '.join(entry['tags'])}]")
+        print(f"      {entry['topic']}")
+    print(f"📚 {len(entries)} generator (manifest: {default_manifest_path()}, {elapsed_ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ import sympy as sp
 from typing import Dict, Any, List
 from base_optimization_question import BaseOptimizationQuestion
 from latex_utils import format_number_clean, clean_and_optimize_latex
-from scipy.optimize import minimize_scalar
+from kinematics import closest_approach
 
 class KhoangCachHaiVatChuyenDongQuestion(BaseOptimizationQuestion):
     """
@@ -42,41 +42,31 @@ class KhoangCachHaiVatChuyenDongQuestion(BaseOptimizationQuestion):
         distance_CD_prime = AA_prime
         coefficient_Mx = v_M * AB / distance_B_prime_A
         coefficient_Mz = v_M * AA_prime / distance_B_prime_A
-        def position_M(t):
-            x = AB - coefficient_Mx * t
-            y = 0
-            z = AA_prime - coefficient_Mz * t
-            return (x, y, z)
-        def position_N(t):
-            x = 0
-            y = BC_numeric
-            z = v_N * t
-            return (x, y, z)
-        def distance_function(t):
-            pos_M = position_M(t)
-            pos_N = position_N(t)
-            dx = pos_M[0] - pos_N[0]
-            dy = pos_M[1] - pos_N[1]
-            dz = pos_M[2] - pos_N[2]
-            return math.sqrt(dx ** 2 + dy ** 2 + dz ** 2)
+        # M(t) = (AB, 0, AA') + t·(-coefficient_Mx, 0, -coefficient_Mz), N(t) = (0, BC, 0) + t·(0, 0, v_N)
         t_max_M = distance_B_prime_A / v_M
         t_max_N = distance_CD_prime / v_N
         t_max = min(t_max_M, t_max_N)
-        result = minimize_scalar(distance_function, bounds=(0, t_max), method='bounded')
+        t_optimal, d_min_sq = closest_approach(
+            (AB, 0, AA_prime), (-coefficient_Mx, 0, -coefficient_Mz),
+            (0, BC_numeric, 0), (0, 0, v_N),
+            t_max=t_max
+        )
+        d_min = math.sqrt(d_min_sq)
         self._solution_cache = {
             'AB': AB, 'AC': AC, 'AA_prime': AA_prime, 'v_M': v_M, 'v_N': v_N,
             'BC': BC, 'BC_numeric': BC_numeric, 'distance_B_prime_A': distance_B_prime_A,
             'coefficient_Mx': coefficient_Mx, 'coefficient_Mz': coefficient_Mz,
-            't_optimal': result.x, 'd_min': result.fun
+            't_optimal': t_optimal, 'd_min': d_min
         }
-        return format_number_clean(round(float(result.fun), 1), precision=1)
+        return format_number_clean(round(d_min, 1), precision=1)
 
     def generate_wrong_answers(self) -> List[str]:
-        # Sinh đáp án sai hợp lý quanh đáp án đúng
-        correct_str = self.correct_answer
-        if correct_str is None:
-            correct_str = self.calculate_answer()
-        correct = float(str(correct_str).replace(',', '.'))
+        # Sinh đáp án sai hợp lý quanh đáp án đúng (lấy số từ cache, không đọc lại chuỗi LaTeX như 24{.}7)
+        cache = getattr(self, '_solution_cache', None)
+        if cache is None:
+            self.calculate_answer()
+            cache = self._solution_cache
+        correct = round(cache['d_min'], 1)
         wrongs = set()
         tries = 0
         while len(wrongs) < 3 and tries < 20:
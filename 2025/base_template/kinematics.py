@@ -0,0 +1,263 @@
+"""
+Kinematics - Bài toán chuyển động thẳng đều giải bằng công thức đóng
+
+Các generator chuyển động (hai vật trong hình hộp, UAV - tên lửa, radar...) trước đây tìm khoảng
+cách nhỏ nhất bằng scipy.optimize.minimize_scalar trên một closure Python: chậm, kéo scipy vào
+vòng sinh câu hỏi và kết quả chỉ đúng đến sai số của bộ tối ưu. Với chuyển động thẳng đều
+P(t) = p + v·t, mọi đại lượng cần tìm đều là nghiệm của phương trình bậc nhất/bậc hai theo t:
+- closest_approach: |Δp + Δv·t|² là tam thức bậc hai, cực tiểu tại t* = -(Δp·Δv)/|Δv|²
+  (kẹp vào đoạn thời gian cho phép)
+- intercept_time: vật đuổi xuất phát từ origin lúc launch_time với tốc độ speed, gặp mục tiêu khi
+  |p + v·t - origin| = speed·(t - launch_time)
+- sphere_entry_time: lần đầu điểm chuyển động nằm trong mặt cầu (tâm, bán kính²)
+
+Số nguyên/Fraction cho kết quả chính xác kiểu Fraction (căn bậc hai chỉ chuyển sang float khi
+biệt thức không phải bình phương hữu tỉ); float cho kết quả float. Các hàm batch_* nhận mảng
+NumPy (n, 3) và giải n quỹ đạo trong một lần gọi (NaN khi không có nghiệm).
+"""
+import math
+from fractions import Fraction
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+Number = Union[int, float, Fraction]
+
+
+def _dot(u: Sequence[Number], v: Sequence[Number]) -> Number:
+    return u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
+
+
+def _div(a: Number, b: Number) -> Number:
+    """Phép chia giữ kiểu chính xác: int/int -> Fraction"""
+    if isinstance(a, int) and isinstance(b, int):
+        return Fraction(a, b)
+    return a / b
+
+
+def _sqrt(value: Number) -> Number:
+    """Căn bậc hai, chính xác (Fraction) khi value là bình phương hữu tỉ"""
+    if isinstance(value, (int, Fraction)):
+        value = Fraction(value)
+        num_root = math.isqrt(value.numerator)
+        den_root = math.isqrt(value.denominator)
+        if num_root * num_root == value.numerator and den_root * den_root == value.denominator:
+            return Fraction(num_root, den_root)
+    return math.sqrt(value)
+
+
+def quadratic_roots(a: Number, b: Number, c: Number) -> List[Number]:
+    """
+    Nghiệm thực của a·t² + b·t + c = 0 (a = 0 thì giải bậc nhất)
+
+    Args:
+        a, b, c: Hệ số
+
+    Returns:
+        List[Number]: Các nghiệm tăng dần (rỗng nếu vô nghiệm hoặc vô số nghiệm)
+    """
+    if a == 0:
+        return [] if b == 0 else [_div(-c, b)]
+    delta = b * b - 4 * a * c
+    if delta < 0:
+        return []
+    root = _sqrt(delta)
+    roots = [_div(-b - root, 2 * a), _div(-b + root, 2 * a)]
+    return sorted(set(roots))
+
+
+def relative_motion(
+    p1: Sequence[Number], v1: Sequence[Number], p2: Sequence[Number], v2: Sequence[Number]
+) -> Tuple[Tuple[Number, ...], Tuple[Number, ...]]:
+    """
+    Chuyển động của vật 1 nhìn từ vật 2: Δp = p1 - p2, Δv = v1 - v2
+
+    Returns:
+        Tuple: (Δp, Δv)
+    """
+    return tuple(a - b for a, b in zip(p1, p2)), tuple(a - b for a, b in zip(v1, v2))
+
+
+def closest_approach(
+    p1: Sequence[Number],
+    v1: Sequence[Number],
+    p2: Sequence[Number],
+    v2: Sequence[Number],
+    t_min: Number = 0,
+    t_max: Optional[Number] = None
+) -> Tuple[Number, Number]:
+    """
+    Thời điểm và bình phương khoảng cách nhỏ nhất giữa P1(t) = p1 + v1·t và P2(t) = p2 + v2·t
+
+    Args:
+        p1, v1: Vị trí ban đầu và vận tốc vật 1
+        p2, v2: Vị trí ban đầu và vận tốc vật 2
+        t_min: Thời điểm sớm nhất được xét
+        t_max: Thời điểm muộn nhất được xét (None = không giới hạn)
+
+    Returns:
+        Tuple[Number, Number]: (t*, |P1(t*) - P2(t*)|²); hai vật đứng yên tương đối thì t* = t_min
+    """
+    dp, dv = relative_motion(p1, v1, p2, v2)
+    a = _dot(dv, dv)
+    b = _dot(dp, dv)
+    t = t_min if a == 0 else max(t_min, _div(-b, a))
+    if t_max is not None:
+        t = min(t, t_max)
+    gap = tuple(d + w * t for d, w in zip(dp, dv))
+    return t, _dot(gap, gap)
+
+
+def intercept_time(
+    target_p: Sequence[Number],
+    target_v: Sequence[Number],
+    origin: Sequence[Number],
+    speed: Number,
+    launch_time: Number = 0
+) -> Optional[Number]:
+    """
+    Thời điểm sớm nhất vật đuổi (xuất phát từ origin lúc launch_time, tốc độ speed, bay thẳng)
+    gặp mục tiêu chuyển động thẳng đều target_p + target_v·t
+
+    Args:
+        target_p, target_v: Vị trí lúc t = 0 và vận tốc của mục tiêu
+        origin: Điểm xuất phát của vật đuổi
+        speed: Tốc độ vật đuổi
+        launch_time: Thời điểm xuất phát
+
+    Returns:
+        Optional[Number]: Thời điểm gặp t > launch_time, None nếu không đuổi kịp
+    """
+    d = tuple(a - b for a, b in zip(target_p, origin))
+    speed_sq = speed * speed
+    # |d + u·t|² = speed²·(t - launch_time)²
+    a = _dot(target_v, target_v) - speed_sq
+    b = 2 * _dot(d, target_v) + 2 * speed_sq * launch_time
+    c = _dot(d, d) - speed_sq * launch_time * launch_time
+    for t in quadratic_roots(a, b, c):
+        if t > launch_time:
+            return t
+    return None
+
+
+def sphere_entry_time(
+    p: Sequence[Number],
+    v: Sequence[Number],
+    center: Sequence[Number],
+    radius_sq: Number,
+    t_min: Number = 0
+) -> Optional[Number]:
+    """
+    Thời điểm đầu tiên (t >= t_min) điểm p + v·t nằm trong mặt cầu (center, radius²)
+
+    Args:
+        p, v: Vị trí ban đầu và vận tốc
+        center: Tâm mặt cầu
+        radius_sq: Bình phương bán kính
+        t_min: Thời điểm bắt đầu xét
+
+    Returns:
+        Optional[Number]: t_min nếu lúc đó đã ở trong, thời điểm chạm mặt cầu nếu đi vào sau,
+            None nếu không bao giờ vào
+    """
+    d = tuple(a - b for a, b in zip(p, center))
+    a = _dot(v, v)
+    b = 2 * _dot(d, v)
+    c = _dot(d, d) - radius_sq
+    if a * t_min * t_min + b * t_min + c <= 0:
+        return t_min
+    roots = quadratic_roots(a, b, c)
+    if roots and roots[0] >= t_min:
+        return roots[0]
+    return None
+
+
+# =============================
+# BATCH (NumPy)
+# =============================
+def batch_closest_approach(
+    p1: np.ndarray,
+    v1: np.ndarray,
+    p2: np.ndarray,
+    v2: np.ndarray,
+    t_min: Union[float, np.ndarray] = 0.0,
+    t_max: Union[None, float, np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    closest_approach cho n cặp quỹ đạo (mảng (n, 3); t_min/t_max là số hoặc mảng (n,))
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (t*, khoảng cách² nhỏ nhất), mỗi mảng (n,)
+    """
+    dp = np.asarray(p1, dtype=float) - np.asarray(p2, dtype=float)
+    dv = np.asarray(v1, dtype=float) - np.asarray(v2, dtype=float)
+    a = (dv * dv).sum(axis=-1)
+    b = (dp * dv).sum(axis=-1)
+    moving = a > 0
+    t = np.where(moving, -b / np.where(moving, a, 1.0), t_min)
+    t = np.maximum(t, t_min)
+    if t_max is not None:
+        t = np.minimum(t, t_max)
+    gap = dp + dv * t[..., np.newaxis]
+    return t, (gap * gap).sum(axis=-1)
+
+
+def _batch_quadratic_roots(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Hai nghiệm (nhỏ, lớn) của a·t² + b·t + c = 0 theo từng phần tử, NaN khi không có"""
+    linear = a == 0
+    safe_a = np.where(linear, 1.0, a)
+    delta = b * b - 4 * a * c
+    root = np.sqrt(np.where(delta >= 0, delta, np.nan))
+    t1 = (-b - root) / (2 * safe_a)
+    t2 = (-b + root) / (2 * safe_a)
+    low, high = np.minimum(t1, t2), np.maximum(t1, t2)
+    linear_root = np.where(b != 0, -c / np.where(b != 0, b, 1.0), np.nan)
+    return np.where(linear, linear_root, low), np.where(linear, linear_root, high)
+
+
+def batch_intercept_time(
+    target_p: np.ndarray,
+    target_v: np.ndarray,
+    origin: np.ndarray,
+    speed: Union[float, np.ndarray],
+    launch_time: Union[float, np.ndarray] = 0.0
+) -> np.ndarray:
+    """
+    intercept_time cho n mục tiêu (mảng (n, 3); speed/launch_time là số hoặc mảng (n,))
+
+    Returns:
+        np.ndarray: Thời điểm gặp (n,), NaN khi không đuổi kịp
+    """
+    target_v = np.asarray(target_v, dtype=float)
+    d = np.asarray(target_p, dtype=float) - np.asarray(origin, dtype=float)
+    speed_sq = np.asarray(speed, dtype=float) ** 2
+    launch_time = np.asarray(launch_time, dtype=float)
+    a = (target_v * target_v).sum(axis=-1) - speed_sq
+    b = 2 * (d * target_v).sum(axis=-1) + 2 * speed_sq * launch_time
+    c = (d * d).sum(axis=-1) - speed_sq * launch_time * launch_time
+    low, high = _batch_quadratic_roots(a, b, c)
+    return np.where(low > launch_time, low, np.where(high > launch_time, high, np.nan))
+
+
+def batch_sphere_entry_time(
+    p: np.ndarray,
+    v: np.ndarray,
+    center: np.ndarray,
+    radius_sq: Union[float, np.ndarray],
+    t_min: Union[float, np.ndarray] = 0.0
+) -> np.ndarray:
+    """
+    sphere_entry_time cho n quỹ đạo (mảng (n, 3); radius_sq/t_min là số hoặc mảng (n,))
+
+    Returns:
+        np.ndarray: Thời điểm vào mặt cầu (n,), NaN khi không bao giờ vào
+    """
+    v = np.asarray(v, dtype=float)
+    d = np.asarray(p, dtype=float) - np.asarray(center, dtype=float)
+    t_min = np.asarray(t_min, dtype=float)
+    a = (v * v).sum(axis=-1)
+    b = 2 * (d * v).sum(axis=-1)
+    c = (d * d).sum(axis=-1) - radius_sq
+    inside = a * t_min * t_min + b * t_min + c <= 0
+    low, _ = _batch_quadratic_roots(a, b, c)
+    return np.where(inside, t_min, np.where(low >= t_min, low, np.nan))
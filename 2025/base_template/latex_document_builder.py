@@ -14,8 +14,8 @@ class OutputFormat(Enum):
 class LaTeXTemplate:
     """Quản lý template LaTeX"""
     
-    # Template cơ bản
-    DOCUMENT_HEADER = r"""\documentclass[a4paper,12pt]{{article}}
+    # Phần khai báo package (dùng chung cho tài liệu liền khối và từng đơn vị khi biên dịch tách)
+    DOCUMENT_PREAMBLE = r"""\documentclass[a4paper,12pt]{{article}}
 \usepackage{{amsmath}}
 \usepackage{{amsfonts}}
 \usepackage{{amssymb}}
@@ -28,7 +28,10 @@ class LaTeXTemplate:
 \usepackage{{tkz-tab}}
 \usepackage{{tkz-euclide}}
 \usetikzlibrary{{calc,decorations.pathmorphing,decorations.pathreplacing}}
-\begin{{document}}
+"""
+
+    # Template cơ bản
+    DOCUMENT_HEADER = DOCUMENT_PREAMBLE + r"""\begin{{document}}
 \title{{{title}}}
 \author{{{author}}}
 \maketitle
@@ -46,6 +49,11 @@ class LaTeXTemplate:
         """Tạo header LaTeX với title và author"""
         return LaTeXTemplate.DOCUMENT_HEADER.format(title=title, author=author)
 
+    @staticmethod
+    def create_preamble() -> str:
+        """Tạo phần khai báo package (chưa có \\begin{document})"""
+        return LaTeXTemplate.DOCUMENT_PREAMBLE.format()
+
 
 class LaTeXDocumentBuilder:
     """
@@ -0,0 +1,330 @@
+"""
+LaTeX Lint - Kiểm tra tĩnh câu hỏi LaTeX vừa sinh, không cần chạy xelatex
+
+Một câu hỏi lỗi (thiếu ngoặc, % chưa escape, thiếu \\loigiai, \\choiceTFt không đủ 4 mệnh đề,
+placeholder {x1} quên format) chỉ lộ ra khi biên dịch cả tài liệu, mất hàng chục giây. Module
+này quét một lượt tuyến tính (chỉ dừng ở các token \\lệnh, {, }, $, %, xuống dòng) và báo:
+- Ngoặc nhọn không khớp, \\begin/\\end không khớp, $...$ chưa đóng hoặc có dòng trống bên trong
+- % ngay sau chữ số (50% nuốt phần còn lại của dòng) hoặc % trong công thức
+- Cấu trúc ex_test/Azota: mỗi \\begin{ex} có \\loigiai, \\choiceTFt đủ 4 mệnh đề, \\choice có
+  4 phương án và đúng một \\True, \\shortans không rỗng
+- Môi trường choices cổ điển có đúng 4 \\choice
+- Placeholder của str.format/f-string còn sót ({x1}, {ctx['intro']}, {value:.2f})
+- Lệnh viết sai (latex_utils.check_latex_command_spelling)
+
+QuestionManager(lint=True) chạy lint_question trên từng câu ngay khi sinh xong; câu lỗi bị
+bỏ và sinh lại như một lần retry. Kiểm tra file đã có:
+    python3 latex_lint.py de_thi.tex
+"""
+import re
+import sys
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from latex_utils import check_latex_command_spelling
+
+TF_STATEMENTS = 4
+CHOICE_COUNT = 4
+
+# Mã lỗi
+UNBALANCED_BRACE = "unbalanced_brace"
+UNMATCHED_ENVIRONMENT = "unmatched_environment"
+UNCLOSED_MATH = "unclosed_math"
+BLANK_LINE_IN_MATH = "blank_line_in_math"
+UNESCAPED_PERCENT = "unescaped_percent"
+PERCENT_IN_MATH = "percent_in_math"
+MISSING_SOLUTION = "missing_loigiai"
+TF_STATEMENT_COUNT = "tf_statement_count"
+CHOICE_OPTION_COUNT = "choice_option_count"
+CHOICE_TRUE_COUNT = "choice_true_count"
+EMPTY_SHORT_ANSWER = "empty_shortans"
+FORMAT_PLACEHOLDER = "format_placeholder"
+MISSPELLED_COMMAND = "misspelled_command"
+
+# Token cần xử lý; mọi ký tự khác được bỏ qua trong một lần finditer
+_TOKEN = re.compile(r"\\(?:[A-Za-z]+|.)|[{}$%\n]", re.DOTALL)
+_ENV_NAME = re.compile(r"\s*\{([^{}]*)\}")
+_BLANK_LINE = re.compile(r"[ \t]*\n")
+_GROUP_START = re.compile(r"\s*\{")
+# Tham số tùy chọn [...] đứng trước các nhóm: \choiceTFt[t], \choice[2], \shortans[oly]
+_OPTIONAL_ARG = re.compile(r"\s*\[[^\]]*\]")
+_PLACEHOLDERS = (
+    # {ctx['intro']}, {v["P_A"]}, {self.value}: f-string/format có truy cập phần tử hoặc self
+    re.compile(r"\{(?:[A-Za-z_][A-Za-z0-9_]*(?:\[(?:'[^'{}]*'|\"[^\"{}]*\"|\d+)\])+|self(?:\.[A-Za-z_][A-Za-z0-9_]*)+)\}"),
+    # {value:.2f}, {x:,}, {n:>3}: format spec không rỗng
+    re.compile(r"\{[A-Za-z_][A-Za-z0-9_]*:[<>=^+\- #0,._]*\d*(?:\.\d+)?[bcdeEfFgGnosxX%]?(?<!:)\}"),
+    # {x1}, {sol_a}: tên biến đứng riêng sau khoảng trắng/dấu câu (nhóm LaTeX thật đứng sau lệnh, ^, _)
+    re.compile(r"(?:(?<=[\s(=,;:])|^)\{[A-Za-z]+(?:_[A-Za-z0-9_]+|\d+)\}", re.MULTILINE),
+)
+_MATH_MODES = {"$": "$", "$$": "$$", "\\(": "\\)", "\\[": "\\]"}
+
+
+class LintIssue(NamedTuple):
+    """Một lỗi tìm thấy: dòng (1-based, None nếu không xác định), mã lỗi, mô tả"""
+    line: Optional[int]
+    code: str
+    message: str
+
+    def __str__(self) -> str:
+        where = f"dòng {self.line}: " if self.line is not None else ""
+        return f"{where}{self.message} [{self.code}]"
+
+
+def _skip_group(text: str, start: int) -> int:
+    """Vị trí ngay sau nhóm {...} bắt đầu tại start (bỏ qua \\{ \\}), -1 nếu không đóng"""
+    depth = 0
+    i = start
+    end = len(text)
+    while i < end:
+        char = text[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return -1
+
+
+def _groups_after(text: str, position: int) -> Tuple[List[str], int]:
+    """Các nhóm {...} liên tiếp sau position (cho phép khoảng trắng/xuống dòng xen giữa, bỏ qua
+    một tham số tùy chọn [...] đứng đầu)"""
+    groups = []
+    optional = _OPTIONAL_ARG.match(text, position)
+    if optional is not None:
+        position = optional.end()
+    while True:
+        match = _GROUP_START.match(text, position)
+        if match is None:
+            return groups, position
+        group_end = _skip_group(text, match.end() - 1)
+        if group_end < 0:
+            return groups, position
+        groups.append(text[match.end():group_end - 1])
+        position = group_end
+
+
+class _Scanner:
+    """Trạng thái một lượt quét (ngoặc, môi trường, chế độ toán, câu ex đang mở)"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.issues: List[LintIssue] = []
+        self.line = 1
+        self.braces: List[int] = []
+        self.environments: List[Tuple[str, int]] = []
+        self.math: Optional[Tuple[str, int]] = None
+        self.skip_until = 0
+        # Câu \begin{ex} đang mở: (dòng bắt đầu, đã có \loigiai)
+        self.exercise: Optional[List[Any]] = None
+        self.choices_count = 0
+
+    def report(self, code: str, message: str, line: Optional[int] = None) -> None:
+        self.issues.append(LintIssue(self.line if line is None else line, code, message))
+
+    def advance_to(self, position: int, start: int) -> None:
+        """Đếm dòng của đoạn bị nhảy qua (tên môi trường, nhóm phương án)"""
+        self.line += self.text.count("\n", start, position)
+        self.skip_until = position
+
+    def run(self) -> List[LintIssue]:
+        text = self.text
+        for token in _TOKEN.finditer(text):
+            start = token.start()
+            if start < self.skip_until:
+                continue
+            value = token.group()
+            if value == "\n":
+                self.newline(token.end())
+            elif value == "{":
+                self.braces.append(self.line)
+            elif value == "}":
+                if self.braces:
+                    self.braces.pop()
+                else:
+                    self.report(UNBALANCED_BRACE, "Dấu } không có { tương ứng")
+            elif value == "%":
+                self.percent(start)
+            elif value == "$":
+                self.dollar(start)
+            elif value[0] == "\\":
+                self.command(value, token.end())
+        self.finish()
+        return self.issues
+
+    def newline(self, position: int) -> None:
+        self.line += 1
+        if self.math is not None and self.math[0] == "$" and _BLANK_LINE.match(self.text, position):
+            self.report(BLANK_LINE_IN_MATH, "Dòng trống bên trong $...$ (thiếu $ đóng)", self.math[1])
+            self.math = None
+
+    def percent(self, start: int) -> None:
+        if self.math is not None:
+            self.report(PERCENT_IN_MATH, "Dấu % trong công thức biến phần còn lại của dòng thành chú thích (dùng \\%)")
+        elif start > 0 and self.text[start - 1].isdigit():
+            self.report(UNESCAPED_PERCENT, "Dấu % sau chữ số chưa escape (dùng \\%)")
+        end = self.text.find("\n", start)
+        self.skip_until = len(self.text) if end < 0 else end
+
+    def dollar(self, start: int) -> None:
+        delimiter = "$$" if self.text.startswith("$$", start) else "$"
+        if delimiter == "$$":
+            self.skip_until = start + 2
+        if self.math is None:
+            self.math = (delimiter, self.line)
+        elif self.math[0] == delimiter:
+            self.math = None
+        else:
+            self.report(UNCLOSED_MATH, f"Gặp {delimiter} khi công thức mở bằng {self.math[0]} chưa đóng", self.math[1])
+            self.math = None
+
+    def command(self, value: str, end: int) -> None:
+        if value in ("\\(", "\\["):
+            if self.math is not None:
+                self.report(UNCLOSED_MATH, f"Gặp {value} khi công thức mở bằng {self.math[0]} chưa đóng", self.math[1])
+            self.math = (value, self.line)
+        elif value in ("\\)", "\\]"):
+            if self.math is None or _MATH_MODES[self.math[0]] != value:
+                self.report(UNCLOSED_MATH, f"{value} không có công thức mở tương ứng")
+            self.math = None
+        elif value in ("\\begin", "\\end"):
+            self.environment(value, end)
+        elif value == "\\loigiai":
+            if self.exercise is not None:
+                self.exercise[1] = True
+        elif value == "\\choiceTFt":
+            self.statements(end)
+        elif value == "\\choice":
+            self.choice(end)
+        elif value == "\\shortans":
+            groups, _ = _groups_after(self.text, end)
+            if not groups or not groups[0].strip():
+                self.report(EMPTY_SHORT_ANSWER, "\\shortans không có đáp án")
+
+    def environment(self, value: str, end: int) -> None:
+        match = _ENV_NAME.match(self.text, end)
+        if match is None:
+            self.report(UNMATCHED_ENVIRONMENT, f"{value} thiếu tên môi trường")
+            return
+        name = match.group(1).strip()
+        self.advance_to(match.end(), end)
+        if value == "\\begin":
+            self.environments.append((name, self.line))
+            if name == "ex":
+                self.exercise = [self.line, False]
+            elif name == "choices":
+                self.choices_count = 0
+            return
+        if not self.environments or self.environments[-1][0] != name:
+            opened = f" (đang mở {self.environments[-1][0]})" if self.environments else ""
+            self.report(UNMATCHED_ENVIRONMENT, f"\\end{{{name}}} không khớp{opened}")
+            return
+        self.environments.pop()
+        if name == "ex" and self.exercise is not None:
+            if not self.exercise[1]:
+                self.report(MISSING_SOLUTION, "Câu \\begin{ex} không có \\loigiai", self.exercise[0])
+            self.exercise = None
+        elif name == "choices" and self.choices_count != CHOICE_COUNT:
+            self.report(CHOICE_OPTION_COUNT, f"Môi trường choices có {self.choices_count} \\choice, cần {CHOICE_COUNT}")
+
+    def statements(self, end: int) -> None:
+        groups, group_end = _groups_after(self.text, end)
+        if len(groups) != TF_STATEMENTS:
+            self.report(TF_STATEMENT_COUNT, f"\\choiceTFt có {len(groups)} mệnh đề, cần {TF_STATEMENTS}")
+        self.check_groups(groups, group_end, end)
+
+    def choice(self, end: int) -> None:
+        if self.environments and self.environments[-1][0] == "choices":
+            # Format cổ điển: "\choice nội dung" trong môi trường choices
+            self.choices_count += 1
+            return
+        groups, group_end = _groups_after(self.text, end)
+        if len(groups) != CHOICE_COUNT:
+            self.report(CHOICE_OPTION_COUNT, f"\\choice có {len(groups)} phương án, cần {CHOICE_COUNT}")
+        correct = sum(group.lstrip().startswith("\\True") for group in groups)
+        if groups and correct != 1:
+            self.report(CHOICE_TRUE_COUNT, f"\\choice có {correct} phương án \\True, cần đúng 1")
+        self.check_groups(groups, group_end, end)
+
+    def check_groups(self, groups: List[str], group_end: int, start: int) -> None:
+        """Quét nội dung các phương án/mệnh đề (công thức, % bên trong) rồi nhảy qua"""
+        line = self.line
+        for group in groups:
+            for issue in _Scanner(group).run():
+                self.issues.append(issue._replace(line=line + issue.line - 1))
+        self.advance_to(group_end, start)
+
+    def finish(self) -> None:
+        for line in self.braces:
+            self.report(UNBALANCED_BRACE, "Dấu { chưa đóng", line)
+        for name, line in self.environments:
+            self.report(UNMATCHED_ENVIRONMENT, f"\\begin{{{name}}} chưa có \\end{{{name}}}", line)
+        if self.math is not None:
+            self.report(UNCLOSED_MATH, f"Công thức mở bằng {self.math[0]} chưa đóng", self.math[1])
+
+
+def _line_of(text: str, position: int) -> int:
+    return text.count("\n", 0, position) + 1
+
+
+def lint_latex(text: str) -> List[LintIssue]:
+    """
+    Kiểm tra tĩnh một đoạn LaTeX (một câu hỏi hoặc cả tài liệu)
+
+    Args:
+        text: Nội dung LaTeX
+
+    Returns:
+        List[LintIssue]: Các lỗi theo thứ tự tìm thấy (rỗng nếu không có lỗi)
+    """
+    issues = _Scanner(text).run()
+    for pattern in _PLACEHOLDERS:
+        for match in pattern.finditer(text):
+            issues.append(LintIssue(
+                _line_of(text, match.start()), FORMAT_PLACEHOLDER,
+                f"Placeholder {match.group()} chưa được format"
+            ))
+    for message in check_latex_command_spelling(text):
+        issues.append(LintIssue(None, MISSPELLED_COMMAND, message))
+    return issues
+
+
+def lint_question(result: Any) -> List[LintIssue]:
+    """
+    Kiểm tra kết quả generate_question: str (format 1) hoặc (nội dung, đáp án) (format 2)
+
+    Args:
+        result: Kết quả generate_question
+
+    Returns:
+        List[LintIssue]: Lỗi của nội dung rồi của đáp án
+    """
+    if isinstance(result, tuple):
+        return [issue for part in result for issue in lint_latex(str(part))]
+    return lint_latex(str(result))
+
+
+def main(paths: List[str]) -> int:
+    """Kiểm tra các file .tex, in lỗi; trả về 1 nếu có lỗi"""
+    failed = False
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            issues = lint_latex(f.read())
+        if issues:
+            failed = True
+            print(f"❌ {path}: {len(issues)} lỗi")
+            for issue in issues:
+                print(f"   - {issue}")
+        else:
+            print(f"✅ {path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Dùng: python3 latex_lint.py file.tex [file2.tex ...]")
+        sys.exit(2)
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,186 @@
+"""
+LaTeX Pipeline Engine - Bản biên dịch sẵn của format_latex_pipeline_manual
+
+format_latex_pipeline_manual gọi lần lượt khoảng 20 hàm, mỗi hàm tự chạy re.sub với pattern
+dạng chuỗi. Engine này giữ nguyên thứ tự và ngữ nghĩa từng bước nhưng:
+- Biên dịch toàn bộ pattern một lần khi import (bảng REWRITE_STEPS)
+- Mỗi bước có điều kiện chặn rẻ (kiểm tra chuỗi con bằng `in`, chạy ở tốc độ C):
+  bước nào chắc chắn không khớp thì bỏ qua, không quét chuỗi bằng regex
+- Ghi nhớ kết quả (LRU) cho các chuỗi lặp lại trong batch
+
+Kết quả phải giống hệt format_latex_pipeline_manual; kiểm tra bằng verify_latex_pipeline_engine.py.
+Khi sửa một hàm trong pipeline thủ công, phải sửa bước tương ứng ở đây.
+"""
+import re
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+
+CACHE_SIZE = 8192
+
+
+def _sub(pattern: str, repl) -> Callable[[str], str]:
+    compiled = re.compile(pattern)
+    return lambda text: compiled.sub(repl, text)
+
+
+def _replace(old: str, new: str) -> Callable[[str], str]:
+    return lambda text: text.replace(old, new)
+
+
+def _strip(text: str) -> str:
+    return text.strip()
+
+
+def _empty_to_zero(text: str) -> str:
+    if not text or text.isspace():
+        return "0"
+    return text
+
+
+def _percent_replacer(match):
+    # Giống hệt percent_replacer trong latex_utils.format_percent_money
+    val = float(match.group(1))
+    if val < 1:
+        return str(val * 100).rstrip('0').rstrip('.') + '\\\\%'
+    return match.group(0)
+
+
+_LEADING_PLUS = re.compile(r'^\+\s*')
+
+
+def _remove_leading_plus(text: str) -> str:
+    # remove_leading_plus: strip rồi bỏ dấu + ở đầu
+    text = text.strip()
+    if text.startswith('+'):
+        text = _LEADING_PLUS.sub('', text)
+    return text
+
+
+# Mỗi bước: (các chuỗi con - bước chỉ chạy nếu có ít nhất một chuỗi con xuất hiện; None = luôn chạy, hàm biến đổi)
+# Chuỗi con phải là điều kiện cần để pattern khớp, nếu không kết quả sẽ khác pipeline thủ công.
+Step = Tuple[Optional[Tuple[str, ...]], Callable[[str], str]]
+
+REWRITE_STEPS: List[Step] = [
+    # Nhóm 1: normalize_decimal_numbers, format_zero_coefficients
+    (('.',), _sub(r'\b(\d+)\.0+\b', r'\1')),
+    (('0',), _sub(r'\b0\s*[a-zA-Z]+(?:\^\{?\d+\}?)?', '')),
+    (('0',), _sub(r'[+\-]\s*0\s*[a-zA-Z]+(?:\^\{?\d+\}?)?', '')),
+
+    # Nhóm 2: fix_consecutive_signs, remove_leading_plus, simplify_signs
+    (('+',), _sub(r'\+\s*\+', '+')),
+    (('-',), _sub(r'-\s*-', '+')),
+    (('+',), _sub(r'\+\s*-', '-')),
+    (('-',), _sub(r'-\s*\+', '-')),
+    (None, _remove_leading_plus),
+    (('+',), _sub(r'\+\s*-', '-')),
+    (('-',), _sub(r'-\s*-', '+')),
+    (('+',), _sub(r'\+\s*\+', '+')),
+    (('+',), _sub(r'^\+\s*', '')),
+
+    # Nhóm 3: optimize_latex_fractions
+    (('\\frac',), _replace('\\frac', '\\dfrac')),
+    (('frac',), _sub(r'\\d?frac\{([^}]+)\}\{1\}', r'\1')),
+    (('frac',), _sub(r'\\d?frac\{0\}\{[^}]+\}', '0')),
+
+    # Nhóm 5: remove_redundant_parentheses, auto_parentheses_for_fractions
+    (('(',), _sub(r'\(([+-]?\d+(?:\.\d+)?)\)', r'\1')),
+    (('(',), _sub(r'\(([a-zA-Z])\)', r'\1')),
+    (('frac',), _sub(r'\(\s*(\\d?frac\{[^}]+\}\{[^}]+\})\s*\)', r'\\left(\1\\right)')),
+
+    # Nhóm 6: format_powers_clean, standardize_function_notation
+    (('^',), _sub(r'([a-zA-Z])\^\{?1\}?(?![0-9])', r'\1')),
+    (('^',), _sub(r'([a-zA-Z])\^\{?0\}?', '1')),
+    (('=',), _sub(r'([a-zA-Z]+\([^)]+\))\s*=\s*', r'\1 = ')),
+
+    # Nhóm 7: format_logic_symbols, format_set_notation, format_interval_notation_clean
+    ((r'\band\b',), _sub(r'\\band\\b', r'\\\\land')),
+    ((r'\bor\b',), _sub(r'\\bor\\b', r'\\\\lor')),
+    (('\\',), _sub(r'\\{([^|]+)\\|([^}]+)\\}', r'\\\\{\\1 \\\\mid \\2\\\\}')),
+    ((',', ';'), _sub(r'([\[\(])\s*([^,;]+)[,;]\s*([^\]\)]+)([\]\)])', r'\1\2; \3\4')),
+
+    # Nhóm 8: standardize_latex_symbols, format_multiplication_symbols, clean_whitespace_latex
+    (('<=',), _replace('<=', '\\\\leq')),
+    (('>=',), _replace('>=', '\\\\geq')),
+    (('!=',), _replace('!=', '\\\\neq')),
+    (('->',), _replace('->', '\\\\to')),
+    (('...',), _replace('...', '\\\\dots')),
+    (('\\',), _sub(r'(\\d+|[a-zA-Z])\\s*\\*\\s*(\\d+|[a-zA-Z])', r'\\1 \\\\cdot \\2')),
+    (None, _strip),
+    ((r'\s',), _sub(r'\\s+', ' ')),
+
+    # Nhóm 9: unify_fraction_notation, handle_empty_expressions, format_percent_money
+    (('\\\\frac',), _replace('\\\\frac', '\\\\dfrac')),
+    (None, _empty_to_zero),
+    (('%',), _sub(r'(\\d*\\.?\\d+)\\\\%', _percent_replacer)),
+    (('đồng', 'VND'), _sub(r'1\\.000\\.000 ?(đồng|VND)', '1 triệu đồng')),
+
+    # Nhóm 10: fix_latex_syntax_errors
+    (('frc',), _sub(r'\\\\frc\\b', r'\\\\frac')),
+    (('\\',), _sub(r'\\^([a-zA-Z0-9])', r'^{\\1}')),
+    ((r'\_',), _sub(r'\\_([a-zA-Z0-9])', r'_{\\1}')),
+]
+
+# Làm sạch cuối cùng: clean_latex_expression
+FINAL_STEPS: List[Step] = [
+    (('+ -',), _replace("+ -", "- ")),
+    (('+-',), _replace("+-", "-")),
+    (None, _strip),
+    (None, _sub(r'\s+', ' ')),
+    (('+ 0',), _sub(r'\+ 0(?:\s|$)', '')),
+    (('- 0',), _sub(r'- 0(?:\s|$)', '')),
+    (('+ ',), _sub(r'^\+ ', '')),
+    (('1.0',), _sub(r'\b1\.0+\b', '1')),
+    (('0.0',), _sub(r'\b0\.0+\b', '0')),
+    (('1x',), _sub(r'\b1x\b', 'x')),
+    (('1',), _sub(r'\b1([a-zA-Z])\b', r'\1')),
+    (('- 1x',), _sub(r'- 1x\b', '- x')),
+    (('- 1',), _sub(r'- 1([a-zA-Z])\b', r'- \1')),
+    (None, _strip),
+    (None, _sub(r'\s+', ' ')),
+]
+
+
+def _apply_steps(text: str, steps: List[Step]) -> str:
+    for guards, transform in steps:
+        if guards is None:
+            text = transform(text)
+            continue
+        for guard in guards:
+            if guard in text:
+                text = transform(text)
+                break
+    return text
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _run_pipeline(expression: str) -> str:
+    text = _apply_steps(expression.strip(), REWRITE_STEPS)
+    # clean_latex_expression
+    if not text:
+        return "0"
+    text = _apply_steps(text, FINAL_STEPS)
+    if not text or text.isspace():
+        return "0"
+    return text
+
+
+def format_latex_pipeline_compiled(expression: str) -> str:
+    """
+    Phiên bản biên dịch sẵn (có cache) của format_latex_pipeline_manual
+
+    Args:
+        expression: Biểu thức LaTeX cần làm sạch
+
+    Returns:
+        str: Biểu thức đã làm sạch, giống hệt format_latex_pipeline_manual(expression)
+    """
+    if not expression:
+        return "0"
+    if isinstance(expression, str):
+        return _run_pipeline(expression)
+    return _run_pipeline.__wrapped__(expression)
+
+
+def clear_pipeline_cache() -> None:
+    """Xóa cache kết quả của engine"""
+    _run_pipeline.cache_clear()
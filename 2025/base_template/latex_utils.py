@@ -12,14 +12,50 @@ NHÓM 7: Khoảng, tập hợp, logic (format_interval_*, format_set_*, format_l
 NHÓM 8: Biểu thức LaTeX tổng quát (standardize_latex_symbols, clean_whitespace)
 NHÓM 9: Trường hợp đặc biệt (format_decimal_to_fraction, unify_notation)
 NHÓM 10: Kiểm tra và sửa lỗi LaTeX (validate_latex, fix_latex_syntax)
+
+sympy chỉ được import khi gọi các hàm sympy_* lần đầu (import sympy mất vài giây),
+nên pipeline mặc định format_latex_pipeline(use_sympy=False) không phải trả chi phí đó.
 """
+import importlib
 import math
 import re
 from fractions import Fraction
 from typing import Union, List, Tuple
-import sympy
-from sympy import simplify, sympify, latex as sympy_latex, collect, expand, factor
-from sympy.parsing.latex import parse_latex
+from latex_pipeline_engine import format_latex_pipeline_compiled
+from radicals import sqrt_fraction_latex, sqrt_latex
+
+
+# ==========================================
+# LAZY SYMPY BACKEND
+# ==========================================
+
+# Tên cũ được export ở module level -> (module, thuộc tính); None = chính module
+_LAZY_SYMPY_ATTRS = {
+    'sympy': ('sympy', None),
+    'simplify': ('sympy', 'simplify'),
+    'sympify': ('sympy', 'sympify'),
+    'sympy_latex': ('sympy', 'latex'),
+    'collect': ('sympy', 'collect'),
+    'expand': ('sympy', 'expand'),
+    'factor': ('sympy', 'factor'),
+    'parse_latex': ('sympy.parsing.latex', 'parse_latex'),
+}
+
+
+def _load_sympy_attr(name: str):
+    """Import sympy (lần đầu) và trả về đối tượng tương ứng với tên export cũ."""
+    module_name, attr = _LAZY_SYMPY_ATTRS[name]
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value  # Các lần truy cập sau không đi qua __getattr__ nữa
+    return value
+
+
+def __getattr__(name: str):
+    # Giữ tương thích với code cũ dùng latex_utils.sympy, latex_utils.parse_latex, ...
+    if name in _LAZY_SYMPY_ATTRS:
+        return _load_sympy_attr(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ██████████████████████████████████████████████████████████████████████████████████
@@ -222,7 +258,7 @@ def format_scientific(num: float, precision: int = 3) -> str:
 def format_sqrt(number: Union[int, float]) -> str:
     """
     Định dạng căn bậc hai thành LaTeX với tối ưu hóa hiển thị.
-    Tự động rút gọn thành dạng a√b nếu có thể.
+    Tự động rút gọn thành dạng a√b nếu có thể (tra bảng sàng của radicals).
     
     Args:
         number: Số dưới dấu căn
@@ -230,6 +266,9 @@ def format_sqrt(number: Union[int, float]) -> str:
     Returns:
         str: Chuỗi LaTeX của căn bậc hai đã tối ưu
         
+    Raises:
+        ValueError: Khi number âm
+        
     Examples:
         >>> format_sqrt(4)
         '2'
@@ -238,40 +277,18 @@ def format_sqrt(number: Union[int, float]) -> str:
         >>> format_sqrt(8)
         '2\\sqrt{2}'
     """
-    if number == int(number) and int(number) >= 0:
-        sqrt_val = math.sqrt(number)
-        if sqrt_val == int(sqrt_val):
-            return f"{int(sqrt_val)}"
-        else:
-            # Kiểm tra xem có thể viết dưới dạng a*sqrt(b) không
-            for a in range(1, int(sqrt_val) + 1):
-                b = number / (a * a)
-                if abs(b - round(b)) < 1e-10 and b > 0:
-                    b_int = int(round(b))
-                    if b_int == 1:
-                        return f"{a}"
-                    else:
-                        return f"{a}\\sqrt{{{b_int}}}"
-            # Nếu không thể viết dưới dạng a*sqrt(b), trả về sqrt(number)
-            return f"\\sqrt{{{int(number)}}}"
-    else:
-        # Với số thực, thử tìm dạng a*sqrt(b)
-        sqrt_val = math.sqrt(number)
-        for a in range(1, int(sqrt_val) + 1):
-            b = number / (a * a)
-            if abs(b - round(b)) < 1e-10 and b > 0:
-                b_int = int(round(b))
-                if b_int == 1:
-                    return f"{a}"
-                else:
-                    return f"{a}\\sqrt{{{b_int}}}"
-        # Nếu không thể, trả về sqrt(number) với số làm tròn
-        return f"\\sqrt{{{format_number_clean(number)}}}"
-
-
-def format_sqrt_improved(number: Union[int, float]) -> str:
-    """
-    Phiên bản cải tiến của format_sqrt với xử lý đặc biệt cho các trường hợp phức tạp.
+    if number < 0:
+        raise ValueError(f"Không lấy căn bậc hai của số âm: {number}")
+    if number == int(number):
+        return sqrt_latex(int(number))
+    # Số thực không nguyên: giữ nguyên dưới dấu căn
+    return f"\\sqrt{{{format_number_clean(number)}}}"
+
+
+def format_sqrt_improved(number: Union[int, float, Fraction]) -> str:
+    """
+    Phiên bản cải tiến của format_sqrt: nhận thêm số hữu tỉ (Fraction hoặc số thực có dạng p/q
+    mẫu nhỏ) và khử căn ở mẫu.
     
     Args:
         number: Số dưới dấu căn
@@ -282,38 +299,14 @@ def format_sqrt_improved(number: Union[int, float]) -> str:
     Examples:
         >>> format_sqrt_improved(18)
         '3\\sqrt{2}'
-        >>> format_sqrt_improved(50)
-        '5\\sqrt{2}'
+        >>> format_sqrt_improved(Fraction(1, 2))
+        '\\dfrac{\\sqrt{2}}{2}'
     """
-    if number == int(number) and int(number) >= 0:
-        sqrt_val = math.sqrt(number)
-        if sqrt_val == int(sqrt_val):
-            return f"{int(sqrt_val)}"
-        else:
-            # Kiểm tra xem có thể viết dưới dạng a*sqrt(b) không
-            for a in range(1, int(sqrt_val) + 1):
-                b = number / (a * a)
-                if abs(b - round(b)) < 1e-10 and b > 0:
-                    b_int = int(round(b))
-                    if b_int == 1:
-                        return f"{a}"
-                    else:
-                        return f"{a}\\sqrt{{{b_int}}}"
-            # Nếu không thể viết dưới dạng a*sqrt(b), trả về sqrt(number)
-            return f"\\sqrt{{{int(number)}}}"
-    else:
-        # Với số thực, thử tìm dạng a*sqrt(b)
-        sqrt_val = math.sqrt(number)
-        for a in range(1, int(sqrt_val) + 1):
-            b = number / (a * a)
-            if abs(b - round(b)) < 1e-10 and b > 0:
-                b_int = int(round(b))
-                if b_int == 1:
-                    return f"{a}"
-                else:
-                    return f"{a}\\sqrt{{{b_int}}}"
-        # Nếu không thể, trả về sqrt(number) với số làm tròn
-        return f"\\sqrt{{{format_number_clean(number)}}}"
+    if number >= 0:
+        value = Fraction(number).limit_denominator(1000)
+        if value == number or abs(float(value) - number) < 1e-10:
+            return sqrt_fraction_latex(value)
+    return format_sqrt(number)
 
 
 def format_dimension(value: float, unit: str = "mét") -> str:
@@ -1051,7 +1044,7 @@ def format_set_notation(expression: str) -> str:
 
 def format_interval_notation_clean(expression: str) -> str:
     """Chuẩn hóa ký hiệu khoảng: [a, b] hoặc (a, b) -> [a; b] hoặc (a; b)"""
-    expression = re.sub(r'([\\[\\(])\\s*([^,;]+)[,;]\\s*([^\\]\\)]+)([\\]\\)])', r'\\1\\2; \\3\\4', expression)
+    expression = re.sub(r'([\[\(])\s*([^,;]+)[,;]\s*([^\]\)]+)([\]\)])', r'\1\2; \3\4', expression)
     return expression
 
 
@@ -1177,6 +1170,14 @@ def fix_latex_syntax_errors(expression: str) -> str:
     
     return expression
 
+# (regex lệnh viết sai, lệnh đúng); \inf là toán tử infimum hợp lệ nên không nằm trong danh sách
+COMMON_COMMAND_MISSPELLINGS = [
+    (r'\\frc(?![A-Za-z])', r'\frac'),
+    (r'\\dfarc(?![A-Za-z])', r'\dfrac'),
+    (r'\\sqt(?![A-Za-z])', r'\sqrt'),
+]
+
+
 def check_latex_command_spelling(expression: str) -> List[str]:
     """
     Kiểm tra chính tả các lệnh LaTeX và trả về danh sách lỗi.
@@ -1189,18 +1190,13 @@ def check_latex_command_spelling(expression: str) -> List[str]:
         
     Examples:
         >>> check_latex_command_spelling("\\frc{1}{2} + \\sqt{4}")
-        ["Found '\\\\frc\\\\b', should be '\\\\frac'", "Found '\\\\sqt\\\\b', should be '\\\\sqrt'"]
+        ["Found '\\frc', should be '\\frac'", "Found '\\sqt', should be '\\sqrt'"]
     """
-    common_errors = [
-        (r'\\\\frc\\b', '\\\\frac'),
-        (r'\\\\sqt\\b', '\\\\sqrt'),
-        (r'\\\\inf\\b', '\\\\infty'),
-    ]
-    
     errors_found = []
-    for error_pattern, correct in common_errors:
-        if re.search(error_pattern, expression):
-            errors_found.append(f"Found '{error_pattern}', should be '{correct}'")
+    for error_pattern, correct in COMMON_COMMAND_MISSPELLINGS:
+        match = re.search(error_pattern, expression)
+        if match:
+            errors_found.append(f"Found '{match.group(0)}', should be '{correct}'")
     
     return errors_found
 
@@ -1215,57 +1211,69 @@ def check_latex_command_spelling(expression: str) -> List[str]:
 
 def sympy_simplify_latex(expr_latex: str) -> str:
     """Sử dụng sympy để rút gọn biểu thức LaTeX (phân số, đa thức, căn, ...)"""
+    parse_latex = _load_sympy_attr('parse_latex')
+    sympy = _load_sympy_attr('sympy')
     try:
         expr = parse_latex(expr_latex)
-        simplified = simplify(expr)
-        return sympy_latex(simplified)
+        simplified = sympy.simplify(expr)
+        return sympy.latex(simplified)
     except Exception:
         return expr_latex
 
 def sympy_collect_terms(expr_latex: str, var: str = 'x') -> str:
     """Thu gọn các hạng tử đồng dạng bằng sympy"""
+    parse_latex = _load_sympy_attr('parse_latex')
+    sympy = _load_sympy_attr('sympy')
     try:
         expr = parse_latex(expr_latex)
-        collected = collect(expr, sympy.Symbol(var))
-        return sympy_latex(collected)
+        collected = sympy.collect(expr, sympy.Symbol(var))
+        return sympy.latex(collected)
     except Exception:
         return expr_latex
 
 def sympy_decimal_to_fraction(expr_latex: str) -> str:
     """Chuyển số thập phân thành phân số bằng sympy"""
+    parse_latex = _load_sympy_attr('parse_latex')
+    sympy = _load_sympy_attr('sympy')
     try:
         expr = parse_latex(expr_latex)
         if expr is not None and hasattr(expr, 'is_Float') and expr.is_Float:
             frac = sympy.Rational(expr).limit_denominator(100)
-            return sympy_latex(frac)
-        return sympy_latex(expr)
+            return sympy.latex(frac)
+        return sympy.latex(expr)
     except Exception:
         return expr_latex
 
 def sympy_sort_polynomial(expr_latex: str, var: str = 'x') -> str:
     """Sắp xếp đa thức theo bậc giảm dần bằng sympy"""
+    parse_latex = _load_sympy_attr('parse_latex')
+    sympy = _load_sympy_attr('sympy')
     try:
         expr = parse_latex(expr_latex)
-        expanded = expand(expr)
-        return sympy_latex(expanded)
+        expanded = sympy.expand(expr)
+        return sympy.latex(expanded)
     except Exception:
         return expr_latex
 
 def sympy_check_equiv(expr1_latex: str, expr2_latex: str) -> bool:
     """Kiểm tra hai biểu thức LaTeX có tương đương toán học không"""
+    parse_latex = _load_sympy_attr('parse_latex')
+    sympy = _load_sympy_attr('sympy')
     try:
-        e1 = simplify(parse_latex(expr1_latex))
-        e2 = simplify(parse_latex(expr2_latex))
+        e1 = sympy.simplify(parse_latex(expr1_latex))
+        e2 = sympy.simplify(parse_latex(expr2_latex))
         return sympy.simplify(e1 - e2) == 0
     except Exception:
         return False
 
 def sympy_clean_latex(expr_latex: str) -> str:
     """Chuẩn hóa, làm sạch và tối ưu biểu thức LaTeX bằng sympy"""
+    parse_latex = _load_sympy_attr('parse_latex')
+    sympy = _load_sympy_attr('sympy')
     try:
         expr = parse_latex(expr_latex)
-        expr = simplify(expr)
-        return sympy_latex(expr)
+        expr = sympy.simplify(expr)
+        return sympy.latex(expr)
     except Exception:
         return expr_latex
 
@@ -1402,6 +1410,7 @@ def format_latex_pipeline(expression: str, use_sympy: bool = False) -> str:
     Args:
         expression: Biểu thức LaTeX cần xử lý
         use_sympy: True để ưu tiên sympy, False để dùng các hàm thủ công
+                   (chạy qua engine biên dịch sẵn, kết quả giống format_latex_pipeline_manual)
         
     Returns:
         str: Biểu thức LaTeX đã được làm sạch và tối ưu
@@ -1415,4 +1424,4 @@ def format_latex_pipeline(expression: str, use_sympy: bool = False) -> str:
     if use_sympy:
         return format_latex_pipeline_sympy(expression)
     else:
-        return format_latex_pipeline_manual(expression)
+        return format_latex_pipeline_compiled(expression)
@@ -1,20 +1,40 @@
 # Imports for new architecture
+import os
+import sys
+
+# latex_compile_service nằm ở 2025/src (một bản duy nhất, dùng chung với xe_go/phuong_trinh_mat_phang)
+SRC_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
 from question_type_loader import QuestionTypeLoader
 from question_manager import QuestionManager  
 from latex_document_builder import LaTeXDocumentBuilder, OutputFormat
 from latex_document_builder import LaTeXDocumentBuilder, OutputFormat
 from question_manager import QuestionManager
 from question_type_loader import QuestionTypeLoader
+from latex_compile_service import LatexCompileService, create_engine, print_compile_result
+from seed_stream import resolve_master_seed, SEED_BITS
+from question_fingerprint_index import FingerprintIndex
+from generation_profiler import GenerationProfiler
+from streaming_document_writer import DEFAULT_CHECKPOINT_EVERY, StreamingDocumentWriter
+from split_document_builder import build_split_document
+from tikz_figure_registry import MODE_EXTERNAL, MODE_INLINE, externalize_document, figures_mode_from_env
+from question_ir import QuestionRecord, RecordExporter
 import argparse
 import logging
+import random
 import sys
-from typing import List, Tuple, Union, Any
+from typing import Callable, List, Tuple, Union, Any, Optional
 
 # Hằng số cấu hình mặc định
 DEFAULT_NUM_QUESTIONS = 3  # Số câu hỏi mặc định
 DEFAULT_FORMAT = 1         # 1: đáp án sau từng câu, 2: đáp án ở cuối
 DEFAULT_FILENAME = "optimization_questions.tex"  # Tên file xuất ra mặc định
 DEFAULT_TITLE = "Câu hỏi Tối ưu hóa"             # Tiêu đề mặc định
+DEFAULT_WORKERS = 1        # Số process sinh câu hỏi (1 = tuần tự)
+DEFAULT_COMPILE_JOBS = 4   # Số process xelatex khi biên dịch tách
+DEFAULT_ENGINE = "xelatex"
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -31,6 +51,18 @@ Ví dụ sử dụng:
   python3 main_runner.py 5                  # Tạo 5 câu hỏi, format 1
   python3 main_runner.py 5 2                # Tạo 5 câu hỏi, format 2
   python3 main_runner.py -n 10 -f 2 -o test.tex  # Tùy chỉnh đầy đủ
+  python3 main_runner.py 5000 2 --workers 8      # Sinh song song với 8 process
+  python3 main_runner.py 100 1 --seed 42         # Tái lập đúng bộ đề (hoặc OPT_SEED=42)
+  python3 main_runner.py 2000 2 --split -j 8     # Biên dịch tách từng câu rồi ghép PDF
+  python3 main_runner.py 40 2 --registry --tag 2026 --tag volume  # Trộn đề từ mọi generator có tag
+  python3 main_runner.py 200 1 --figures external  # Mỗi hình TikZ biên dịch một lần, chèn bằng \includegraphics
+  python3 main_runner.py 5000 2 --stream -w 8      # Ghi từng câu ngay khi sinh xong, có checkpoint
+  python3 main_runner.py 5000 2 --stream --resume -w 8  # Chạy tiếp lần --stream bị ngắt
+  python3 main_runner.py 500 2 --unique                # Không có hai câu trùng tham số
+  python3 main_runner.py 500 2 --fingerprints de.fp    # Không trùng cả với các bộ đề trước dùng chung de.fp
+  python3 main_runner.py 500 2 --profile p.json --trace t.json  # Đo thời gian từng pha của từng generator
+  python3 main_runner.py 500 2 --lint                  # Câu lỗi LaTeX (ngoặc, %, thiếu \\loigiai...) bị sinh lại trước khi biên dịch
+  python3 main_runner.py 40 1 --jsonl de.jsonl --answer-key dap_an.csv --ex-test de_azota.tex  # Xuất thêm từ cùng bộ câu
         """
     )
     
@@ -86,6 +118,139 @@ Ví dụ sử dụng:
         help='Hiển thị thông tin chi tiết'
     )
     
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f'Số process sinh câu hỏi song song (mặc định: {DEFAULT_WORKERS})'
+    )
+    
+    parser.add_argument(
+        '-s', '--seed',
+        type=int,
+        default=None,
+        help='Master seed để tái lập bộ đề (mặc định: biến môi trường OPT_SEED, nếu có)'
+    )
+    
+    parser.add_argument(
+        '--registry',
+        action='store_true',
+        help='Lấy generator từ manifest của cả 2025/ và 2026/ (import lười) thay cho mapping mặc định'
+    )
+    
+    parser.add_argument(
+        '--tag',
+        action='append',
+        default=[],
+        help='Với --registry: chỉ lấy generator có tag này (lặp lại được, ví dụ --tag 2026 --tag volume)'
+    )
+    
+    parser.add_argument(
+        '--split',
+        action='store_true',
+        help='Biên dịch tách: mỗi câu một file .tex, biên dịch song song có cache rồi ghép PDF'
+    )
+    
+    parser.add_argument(
+        '-j', '--compile-jobs',
+        type=int,
+        default=DEFAULT_COMPILE_JOBS,
+        help=f'Số process TeX khi biên dịch tách (mặc định: {DEFAULT_COMPILE_JOBS})'
+    )
+    
+    parser.add_argument(
+        '--engine',
+        type=str,
+        default=DEFAULT_ENGINE,
+        help=f"Engine TeX khi biên dịch tách/biên dịch hình, 'fake' để giả lập (mặc định: {DEFAULT_ENGINE})"
+    )
+    
+    parser.add_argument(
+        '--figures',
+        choices=[MODE_INLINE, MODE_EXTERNAL],
+        default=figures_mode_from_env(),
+        help='Hình TikZ: inline (giữ nguyên) hoặc external (biên dịch mỗi hình một lần, '
+             'chèn bằng \\includegraphics). Mặc định theo biến môi trường TIKZ_FIGURES, nếu không có thì inline'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Ghi từng câu vào file ngay khi sinh xong (đáp án format 2 ghi tạm ra file spill), '
+             'lưu checkpoint sau mỗi câu'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Với --stream: chạy tiếp từ checkpoint của lần trước (cùng file output, số câu, format, seed)'
+    )
+    
+    parser.add_argument(
+        '--unique',
+        action='store_true',
+        help='Loại câu trùng tham số trong bộ đề (bốc lại câu trùng)'
+    )
+    
+    parser.add_argument(
+        '--fingerprints',
+        type=str,
+        default=None,
+        help='File chỉ mục fingerprint dùng chung giữa các lần chạy (bật --unique); '
+             'câu đã có trong file bị bốc lại, câu mới được ghi thêm vào file'
+    )
+    
+    parser.add_argument(
+        '--checkpoint-every',
+        type=int,
+        default=DEFAULT_CHECKPOINT_EVERY,
+        help=f'Với --stream: ghi checkpoint sau mỗi bao nhiêu câu (mặc định: {DEFAULT_CHECKPOINT_EVERY}; '
+             'tăng lên khi generator rất nhanh để giảm fsync)'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        type=str,
+        default=None,
+        help='Đo wall/CPU time từng pha (generate_parameters, calculate_answer...) theo generator, '
+             'kèm số lần retry/trùng; ghi tổng hợp JSON ra file này'
+    )
+    
+    parser.add_argument(
+        '--trace',
+        type=str,
+        default=None,
+        help='Ghi Chrome trace của các pha ra file này (mở bằng chrome://tracing, Perfetto hoặc speedscope)'
+    )
+    
+    parser.add_argument(
+        '--lint',
+        action='store_true',
+        help='Kiểm tra tĩnh LaTeX từng câu ngay khi sinh (ngoặc, %%, \\loigiai, số mệnh đề/phương án, '
+             'placeholder chưa format); câu lỗi bị sinh lại thay vì lọt vào bước biên dịch'
+    )
+    
+    parser.add_argument(
+        '--jsonl',
+        type=str,
+        default=None,
+        help='Ghi từng câu dạng JSON Lines (đề, phương án, cờ đúng/sai, lời giải, metadata) ra file này'
+    )
+    
+    parser.add_argument(
+        '--answer-key',
+        type=str,
+        default=None,
+        help='Ghi bảng đáp án CSV (số câu, loại, đáp án, generator, seed) ra file này'
+    )
+    
+    parser.add_argument(
+        '--ex-test',
+        type=str,
+        default=None,
+        help='Ghi thêm cùng bộ câu theo format Azota ex_test (\\choice/\\choiceTFt, \\loigiai) ra file này'
+    )
+    
     args = parser.parse_args()
     
     # Override positional args with named args if provided
@@ -97,11 +262,42 @@ Ví dụ sử dụng:
     # Validate
     if args.num_questions <= 0:
         parser.error("Số câu hỏi phải lớn hơn 0")
+    if args.workers <= 0:
+        parser.error("Số workers phải lớn hơn 0")
+    if args.compile_jobs <= 0:
+        parser.error("Số compile jobs phải lớn hơn 0")
+    if args.checkpoint_every <= 0:
+        parser.error("Số câu giữa hai checkpoint phải lớn hơn 0")
+    if args.resume and not args.stream:
+        parser.error("--resume chỉ dùng cùng --stream")
+    if args.fingerprints is not None:
+        args.unique = True
+    if args.resume and args.unique:
+        parser.error("--resume chưa hỗ trợ --unique/--fingerprints")
+    if args.stream and args.split:
+        parser.error("--stream không dùng cùng --split")
+    if args.stream and args.figures == MODE_EXTERNAL:
+        parser.error("--stream chỉ hỗ trợ --figures inline")
+    if args.resume and (args.jsonl or args.answer_key or args.ex_test):
+        parser.error("--resume chưa hỗ trợ --jsonl/--answer-key/--ex-test")
+    
+    args.seed = resolve_master_seed(args.seed)
         
     return args
 
 
-def generate_questions(num_questions: int, output_format: int, verbose: bool = False) -> List[Any]:
+def generate_questions(
+    num_questions: int,
+    output_format: int,
+    verbose: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    seed: Optional[int] = None,
+    registry_tags: Optional[List[str]] = None,
+    dedup_index: Optional[FingerprintIndex] = None,
+    profiler: Optional[GenerationProfiler] = None,
+    record_sink: Optional[Callable[[QuestionRecord], None]] = None,
+    lint: bool = False
+) -> List[Any]:
     """
     Sinh danh sách câu hỏi tối ưu hóa theo định dạng mong muốn.
     
@@ -109,19 +305,185 @@ def generate_questions(num_questions: int, output_format: int, verbose: bool = F
         num_questions: Số lượng câu hỏi cần sinh
         output_format: 1 - đáp án sau từng câu, 2 - đáp án ở cuối
         verbose: In chi tiết quá trình sinh câu hỏi
+        workers: Số process sinh song song
+        seed: Master seed (None = không cố định)
+        registry_tags: Nếu khác None, lấy generator từ manifest (lọc theo các tag này,
+                       danh sách rỗng = mọi generator) thay cho mapping mặc định
+        dedup_index: Chỉ mục fingerprint để loại câu trùng (None = không kiểm tra)
+        profiler: Profiler đo thời gian từng pha (None = không đo)
+        record_sink: Hàm nhận QuestionRecord của từng câu (None = không xuất)
+        lint: Kiểm tra tĩnh LaTeX từng câu, câu lỗi bị sinh lại
     Trả về:
         Danh sách câu hỏi (dạng string hoặc tuple tuỳ format)
     """
+    manager = create_question_manager(
+        verbose, workers, seed, registry_tags, dedup_index, profiler, record_sink, lint
+    )
+    return manager.generate_questions(num_questions, output_format, verbose)
+
+
+def create_question_manager(
+    verbose: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    seed: Optional[int] = None,
+    registry_tags: Optional[List[str]] = None,
+    dedup_index: Optional[FingerprintIndex] = None,
+    profiler: Optional[GenerationProfiler] = None,
+    record_sink: Optional[Callable[[QuestionRecord], None]] = None,
+    lint: bool = False
+) -> QuestionManager:
+    """
+    Load các loại câu hỏi và tạo QuestionManager.
+    
+    Tham số: như generate_questions
+    Trả về:
+        QuestionManager đã cấu hình
+    """
     # Load question types
     loader = QuestionTypeLoader(silent=not verbose)
-    question_types = loader.load_available_types()
+    if registry_tags is None:
+        question_types = loader.load_available_types()
+    else:
+        question_types = loader.load_registry_types(tags=registry_tags)
     
-    # Create manager và sinh câu hỏi
-    manager = QuestionManager(question_types=question_types)
-    return manager.generate_questions(num_questions, output_format, verbose)
+    return QuestionManager(
+        question_types=question_types, workers=workers, master_seed=seed, dedup_index=dedup_index,
+        profiler=profiler, record_sink=record_sink, lint=lint
+    )
+
+
+def create_dedup_index(args: argparse.Namespace) -> Optional[FingerprintIndex]:
+    """
+    Tạo chỉ mục chống trùng theo --unique/--fingerprints.
+    
+    Tham số:
+        args: Tham số dòng lệnh đã parse
+    Trả về:
+        FingerprintIndex hoặc None nếu không bật chống trùng
+    """
+    if not args.unique:
+        return None
+    return FingerprintIndex(args.fingerprints)
+
+
+def create_profiler(args: argparse.Namespace) -> Optional[GenerationProfiler]:
+    """
+    Tạo profiler khi có --profile/--trace.
+    
+    Tham số:
+        args: Tham số dòng lệnh đã parse
+    Trả về:
+        GenerationProfiler hoặc None nếu không đo
+    """
+    if args.profile is None and args.trace is None:
+        return None
+    return GenerationProfiler()
+
+
+def report_profile(profiler: Optional[GenerationProfiler], args: argparse.Namespace) -> None:
+    """
+    In tóm tắt và ghi file --profile/--trace.
+    
+    Tham số:
+        profiler: Profiler đã dùng khi sinh (None thì bỏ qua)
+        args: Tham số dòng lệnh đã parse
+    """
+    if profiler is None:
+        return
+    print("📊 Thời gian theo pha (nhiều nhất trước):")
+    for line in profiler.format_summary():
+        print(line)
+    if args.profile is not None:
+        profiler.export_json(args.profile)
+        print(f"📋 Đã ghi profile: {args.profile}")
+    if args.trace is not None:
+        profiler.export_chrome_trace(args.trace)
+        print(f"📋 Đã ghi trace: {args.trace}")
+
+
+def create_record_exporter(args: argparse.Namespace) -> Optional[RecordExporter]:
+    """
+    Tạo bộ xuất record khi có --jsonl/--answer-key/--ex-test.
+    
+    Tham số:
+        args: Tham số dòng lệnh đã parse
+    Trả về:
+        RecordExporter hoặc None nếu không xuất gì thêm
+    """
+    if args.jsonl is None and args.answer_key is None and args.ex_test is None:
+        return None
+    return RecordExporter(args.jsonl, args.answer_key, args.ex_test)
+
+
+def report_records(exporter: Optional[RecordExporter], generated: int) -> None:
+    """
+    Đóng bộ xuất record và in các file đã ghi.
+    
+    Tham số:
+        exporter: Bộ xuất đã dùng khi sinh (None thì bỏ qua)
+        generated: Số câu đã sinh
+    """
+    if exporter is None:
+        return
+    exporter.close()
+    print(f"📋 Đã xuất {exporter.written} câu: {', '.join(exporter.paths)}")
+    if exporter.written < generated:
+        print(f"⚠️  {generated - exporter.written} câu do generator không tạo QuestionRecord nên không được xuất")
 
 
-def create_latex_file(questions_data: List, filename: str, title: str, output_format: int) -> None:
+def stream_latex_file(
+    args: argparse.Namespace,
+    profiler: Optional[GenerationProfiler] = None,
+    record_sink: Optional[Callable[[QuestionRecord], None]] = None
+) -> int:
+    """
+    Chế độ --stream: ghi từng câu vào file ngay khi sinh xong, checkpoint để chạy tiếp.
+    
+    Không có seed thì chọn ngẫu nhiên một master seed và lưu vào checkpoint, nhờ đó
+    --resume sinh tiếp đúng bộ đề cũ.
+    
+    Tham số:
+        args: Tham số dòng lệnh đã parse
+        profiler: Profiler đo thời gian từng pha (None = không đo)
+        record_sink: Hàm nhận QuestionRecord của từng câu (None = không xuất)
+    Trả về:
+        Số câu hỏi đã ghi
+    """
+    output_format_enum = OutputFormat.IMMEDIATE_ANSWERS if args.format == 1 else OutputFormat.ANSWERS_AT_END
+    writer = StreamingDocumentWriter(
+        args.output, args.title, output_format_enum, checkpoint_every=args.checkpoint_every
+    )
+    
+    seed = args.seed
+    if seed is None:
+        saved = writer.load_checkpoint() if args.resume else None
+        seed = saved.master_seed if saved is not None else random.getrandbits(SEED_BITS)
+    
+    with writer:
+        start = writer.open(args.num_questions, seed, resume=args.resume)
+        if writer.resumed:
+            print(f"📋 Chạy tiếp từ câu {start}/{args.num_questions} (đã ghi {writer.state.written} câu)")
+        
+        if start <= args.num_questions:
+            manager = create_question_manager(
+                args.verbose, args.workers, seed, args.tag if args.registry else None, create_dedup_index(args),
+                profiler, record_sink, args.lint
+            )
+            writer.write_all(manager.iter_questions(args.num_questions, args.format, args.verbose, start))
+        
+        if writer.state.failed > 0:
+            print(f"⚠️  Có {writer.state.failed} câu hỏi không tạo được")
+        return writer.finish()
+
+
+def create_latex_file(
+    questions_data: List,
+    filename: str,
+    title: str,
+    output_format: int,
+    figures: str = MODE_INLINE,
+    service: Optional[LatexCompileService] = None
+) -> None:
     """
     Tạo file LaTeX chứa danh sách câu hỏi đã sinh.
     
@@ -130,12 +492,15 @@ def create_latex_file(questions_data: List, filename: str, title: str, output_fo
         filename: Tên file xuất ra
         title: Tiêu đề tài liệu
         output_format: Định dạng đáp án
+        figures: Chế độ hình TikZ (inline/external)
+        service: Service biên dịch hình khi figures=external
     """
     try:
         latex_builder = LaTeXDocumentBuilder()
         output_format_enum = OutputFormat.IMMEDIATE_ANSWERS if output_format == 1 else OutputFormat.ANSWERS_AT_END
         
         latex_content = latex_builder.build_document(questions_data, title, output_format_enum)
+        latex_content = externalize_document(latex_content, filename, figures, service)
         
         with open(filename, "w", encoding="utf-8") as f:
             f.write(latex_content)
@@ -144,6 +509,30 @@ def create_latex_file(questions_data: List, filename: str, title: str, output_fo
         raise IOError(f"Không thể ghi file {filename}: {e}")
 
 
+def compile_split(questions_data: List, args: argparse.Namespace) -> None:
+    """
+    Chế độ --split: ghi từng câu thành file riêng, biên dịch song song rồi ghép PDF.
+    
+    Tham số:
+        questions_data: Danh sách câu hỏi
+        args: Tham số dòng lệnh đã parse
+    """
+    service = LatexCompileService(create_engine(args.engine), workers=args.compile_jobs)
+    result = build_split_document(questions_data, args.output, args.title, args.format, service, args.figures)
+    
+    if result.failed_units:
+        for unit_result in result.failed_units:
+            print_compile_result(unit_result)
+        print(f"❌ {len(result.failed_units)} đơn vị biên dịch lỗi, chưa ghép PDF")
+        sys.exit(1)
+    
+    print(f"📋 {len(result.unit_paths)} đơn vị, biên dịch lại {result.recompiled_units}, "
+          f"dùng cache {len(result.unit_paths) - result.recompiled_units}")
+    print_compile_result(result.book_result)
+    if not result.success:
+        sys.exit(1)
+
+
 def main() -> None:
     """
     Hàm main: điều phối toàn bộ quá trình sinh câu hỏi tối ưu hóa và xuất ra file LaTeX.
@@ -156,19 +545,47 @@ def main() -> None:
         if args.verbose:
             logging.basicConfig(level=logging.INFO)
             
+        profiler = create_profiler(args)
+        exporter = create_record_exporter(args)
+        record_sink = exporter.add if exporter is not None else None
+        
+        if args.stream:
+            written = stream_latex_file(args, profiler, record_sink)
+            report_profile(profiler, args)
+            report_records(exporter, written)
+            print(f"✅ Đã tạo thành công {args.output} với {written} câu hỏi")
+            print(f"📄 Biên dịch bằng: xelatex {args.output}")
+            return
+        
         # Generate questions
         questions_data = generate_questions(
             args.num_questions, 
             args.format, 
-            args.verbose
+            args.verbose,
+            args.workers,
+            args.seed,
+            args.tag if args.registry else None,
+            create_dedup_index(args),
+            profiler,
+            record_sink,
+            args.lint
         )
+        report_profile(profiler, args)
+        report_records(exporter, len(questions_data))
         
         if not questions_data:
             print("❌ Lỗi: Không tạo được câu hỏi nào")
             sys.exit(1)
             
+        if args.split:
+            compile_split(questions_data, args)
+            return
+        
         # Create LaTeX file
-        create_latex_file(questions_data, args.output, args.title, args.format)
+        create_latex_file(
+            questions_data, args.output, args.title, args.format,
+            args.figures, LatexCompileService(create_engine(args.engine), workers=args.compile_jobs)
+        )
         
         # Success messages
         print(f"✅ Đã tạo thành công {args.output} với {len(questions_data)} câu hỏi")
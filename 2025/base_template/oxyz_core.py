@@ -0,0 +1,341 @@
+"""
+Oxyz Core - Lõi vector 3D nguyên/hữu tỉ dùng chung cho các generator hình học không gian
+
+Trước đây mỗi generator Oxyz tự viết lại dot/cross/sub/norm_sq/simplify_vector trên tuple và
+dò tham số bằng vòng lặp từng điểm. Module này gom lại:
+- Hàm trên tuple (dot, cross, add, sub, scale, norm_sq, dist_sq...): nhận mọi dãy 3 phần tử,
+  trả về tuple, giữ nguyên kiểu số (int/Fraction) nên tính toán chính xác
+- Vec3: điểm/vector có __slots__ (nhẹ, không có __dict__), dùng được như tuple (unpack, index)
+- Chuẩn hóa có cache: simplify_vector, canonical_direction, normalize_plane
+- Hình học hữu tỉ chính xác: giao đường thẳng - mặt phẳng, hình chiếu, điểm đối xứng
+- Phiên bản batch (NumPy int64) của các phép toán và vị trí tương đối mặt phẳng/đường thẳng/
+  mặt cầu: thử hàng nghìn cấu hình trong một lần gọi thay vì lặp từng điểm
+"""
+from fractions import Fraction
+from functools import lru_cache, reduce
+from math import gcd
+from typing import Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+Number = Union[int, Fraction]
+Point = Tuple[Number, Number, Number]
+Vector = Tuple[Number, Number, Number]
+
+# Quan hệ vị trí (giá trị trả về của các hàm *_relation)
+INTERSECTS = -1   # cắt (điểm nằm trong mặt cầu)
+TANGENT = 0       # tiếp xúc (điểm nằm trên mặt cầu)
+SEPARATE = 1      # không cắt (điểm nằm ngoài mặt cầu)
+LINE_CROSSES_PLANE = 0
+LINE_PARALLEL_PLANE = 1
+LINE_IN_PLANE = 2
+
+
+# =============================
+# TUPLE
+# =============================
+def dot(u: Sequence[Number], v: Sequence[Number]) -> Number:
+    return u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
+
+
+def cross(u: Sequence[Number], v: Sequence[Number]) -> Vector:
+    return (
+        u[1] * v[2] - u[2] * v[1],
+        u[2] * v[0] - u[0] * v[2],
+        u[0] * v[1] - u[1] * v[0],
+    )
+
+
+def add(u: Sequence[Number], v: Sequence[Number]) -> Point:
+    return u[0] + v[0], u[1] + v[1], u[2] + v[2]
+
+
+def sub(u: Sequence[Number], v: Sequence[Number]) -> Vector:
+    return u[0] - v[0], u[1] - v[1], u[2] - v[2]
+
+
+def scale(v: Sequence[Number], k: Number) -> Vector:
+    return v[0] * k, v[1] * k, v[2] * k
+
+
+def norm_sq(v: Sequence[Number]) -> Number:
+    return v[0] * v[0] + v[1] * v[1] + v[2] * v[2]
+
+
+def dist_sq(a: Sequence[Number], b: Sequence[Number]) -> Number:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+def gcd_multiple(values: Sequence[int]) -> int:
+    """ƯCLN của các số khác 0 (1 nếu tất cả bằng 0)"""
+    return reduce(gcd, (abs(value) for value in values), 0) or 1
+
+
+@lru_cache(maxsize=4096)
+def _simplify_vector_cached(v: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    g = gcd_multiple(v)
+    return v[0] // g, v[1] // g, v[2] // g
+
+
+def simplify_vector(v: Sequence[int]) -> Tuple[int, int, int]:
+    """Chia vector nguyên cho ƯCLN các thành phần (giữ hướng)"""
+    return _simplify_vector_cached(tuple(v))
+
+
+@lru_cache(maxsize=4096)
+def _canonical_direction_cached(v: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    x, y, z = _simplify_vector_cached(v)
+    first = x or y or z
+    return (-x, -y, -z) if first < 0 else (x, y, z)
+
+
+def canonical_direction(v: Sequence[int]) -> Tuple[int, int, int]:
+    """Vector chỉ phương đại diện: tối giản, thành phần khác 0 đầu tiên dương (u và -2u như nhau)"""
+    return _canonical_direction_cached(tuple(v))
+
+
+@lru_cache(maxsize=4096)
+def normalize_plane(a: int, b: int, c: int, d: int) -> Tuple[int, int, int, int]:
+    """Phương trình mặt phẳng ax + by + cz + d = 0 tối giản, hệ số khác 0 đầu tiên dương"""
+    g = gcd_multiple((a, b, c, d))
+    a, b, c, d = a // g, b // g, c // g, d // g
+    first = a or b or c
+    return (-a, -b, -c, -d) if first < 0 else (a, b, c, d)
+
+
+# =============================
+# HỮU TỈ CHÍNH XÁC
+# =============================
+def to_fractions(v: Sequence[Number]) -> Tuple[Fraction, Fraction, Fraction]:
+    return Fraction(v[0]), Fraction(v[1]), Fraction(v[2])
+
+
+def plane_value(normal: Sequence[Number], d: Number, p: Sequence[Number]) -> Number:
+    """a·x + b·y + c·z + d tại điểm p (0 khi p thuộc mặt phẳng)"""
+    return dot(normal, p) + d
+
+
+def distance_sq_point_plane(p: Sequence[Number], normal: Sequence[Number], d: Number) -> Fraction:
+    """Bình phương khoảng cách từ p đến mặt phẳng (chính xác)"""
+    value = plane_value(normal, d, p)
+    return Fraction(value * value) / norm_sq(normal)
+
+
+def distance_sq_point_line(p: Sequence[Number], base: Sequence[Number], direction: Sequence[Number]) -> Fraction:
+    """Bình phương khoảng cách từ p đến đường thẳng qua base, chỉ phương direction"""
+    return Fraction(norm_sq(cross(sub(p, base), direction))) / norm_sq(direction)
+
+
+def project_point_to_plane(p: Sequence[Number], normal: Sequence[Number], d: Number) -> Tuple[Fraction, ...]:
+    """Hình chiếu vuông góc của p lên mặt phẳng"""
+    t = Fraction(plane_value(normal, d, p)) / norm_sq(normal)
+    return tuple(Fraction(p[i]) - t * normal[i] for i in range(3))
+
+
+def reflect_point_plane(p: Sequence[Number], normal: Sequence[Number], d: Number) -> Tuple[Fraction, ...]:
+    """Điểm đối xứng của p qua mặt phẳng"""
+    t = 2 * Fraction(plane_value(normal, d, p)) / norm_sq(normal)
+    return tuple(Fraction(p[i]) - t * normal[i] for i in range(3))
+
+
+def line_plane_intersection(
+    base: Sequence[Number], direction: Sequence[Number], normal: Sequence[Number], d: Number
+) -> Optional[Tuple[Fraction, ...]]:
+    """Giao điểm đường thẳng (base + t·direction) với mặt phẳng; None nếu song song hoặc nằm trong"""
+    denominator = dot(normal, direction)
+    if denominator == 0:
+        return None
+    t = -Fraction(plane_value(normal, d, base)) / denominator
+    return tuple(Fraction(base[i]) + t * direction[i] for i in range(3))
+
+
+def _sign(value) -> int:
+    return (value > 0) - (value < 0)
+
+
+def plane_sphere_relation(normal: Sequence[Number], d: Number, center: Sequence[Number], r_sq: Number) -> int:
+    """INTERSECTS / TANGENT / SEPARATE - so sánh d(I, P)² với R² không khai căn"""
+    value = plane_value(normal, d, center)
+    return _sign(value * value - r_sq * norm_sq(normal))
+
+
+def point_sphere_relation(p: Sequence[Number], center: Sequence[Number], r_sq: Number) -> int:
+    """INTERSECTS (trong) / TANGENT (trên) / SEPARATE (ngoài) mặt cầu"""
+    return _sign(dist_sq(p, center) - r_sq)
+
+
+def line_sphere_relation(
+    base: Sequence[Number], direction: Sequence[Number], center: Sequence[Number], r_sq: Number
+) -> int:
+    """INTERSECTS / TANGENT / SEPARATE của đường thẳng với mặt cầu"""
+    return _sign(norm_sq(cross(sub(center, base), direction)) - r_sq * norm_sq(direction))
+
+
+def line_plane_relation(
+    base: Sequence[Number], direction: Sequence[Number], normal: Sequence[Number], d: Number
+) -> int:
+    """LINE_CROSSES_PLANE / LINE_PARALLEL_PLANE / LINE_IN_PLANE"""
+    if dot(normal, direction) != 0:
+        return LINE_CROSSES_PLANE
+    return LINE_IN_PLANE if plane_value(normal, d, base) == 0 else LINE_PARALLEL_PLANE
+
+
+# =============================
+# VEC3
+# =============================
+class Vec3:
+    """
+    Điểm/vector 3D có __slots__. Thành phần giữ nguyên kiểu (int, Fraction...) nên phép toán chính
+    xác; dùng được ở mọi chỗ nhận tuple (v[0], x, y, z = v, hàm dot/cross ở trên).
+    Phép toán trả về cùng lớp với toán hạng trái (lớp con dùng được luôn).
+    """
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x: Number, y: Number, z: Number):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @classmethod
+    def of(cls, v: Sequence[Number]) -> "Vec3":
+        return cls(v[0], v[1], v[2])
+
+    def __iter__(self) -> Iterator[Number]:
+        yield self.x
+        yield self.y
+        yield self.z
+
+    def __len__(self) -> int:
+        return 3
+
+    def __getitem__(self, index: int) -> Number:
+        return (self.x, self.y, self.z)[index]
+
+    def as_tuple(self) -> Tuple[Number, Number, Number]:
+        return self.x, self.y, self.z
+
+    def __eq__(self, other) -> bool:
+        try:
+            return self.as_tuple() == tuple(other)
+        except TypeError:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.as_tuple())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.x!r}, {self.y!r}, {self.z!r})"
+
+    def __add__(self, other: Sequence[Number]) -> "Vec3":
+        return self.__class__(self.x + other[0], self.y + other[1], self.z + other[2])
+
+    def __sub__(self, other: Sequence[Number]) -> "Vec3":
+        return self.__class__(self.x - other[0], self.y - other[1], self.z - other[2])
+
+    def __neg__(self) -> "Vec3":
+        return self.__class__(-self.x, -self.y, -self.z)
+
+    def __mul__(self, k: Number) -> "Vec3":
+        return self.__class__(self.x * k, self.y * k, self.z * k)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, k: Number) -> "Vec3":
+        # Chia chính xác: số nguyên thành Fraction
+        k = Fraction(k)
+        return self.__class__(self.x / k, self.y / k, self.z / k)
+
+    def dot(self, other: Sequence[Number]) -> Number:
+        return dot(self, other)
+
+    def cross(self, other: Sequence[Number]) -> "Vec3":
+        return self.__class__(*cross(self, other))
+
+    def norm_sq(self) -> Number:
+        return norm_sq(self)
+
+    def is_zero(self) -> bool:
+        return self.x == 0 and self.y == 0 and self.z == 0
+
+    def simplified(self) -> "Vec3":
+        """Vector nguyên chia cho ƯCLN (chỉ dùng với thành phần nguyên)"""
+        return self.__class__(*simplify_vector(self.as_tuple()))
+
+
+# =============================
+# BATCH (NUMPY)
+# =============================
+# Mảng điểm/vector có shape (N, 3), số nguyên int64 (hệ số nhỏ nên không tràn số);
+# tham số đơn lẻ (một mặt phẳng, một tâm...) được broadcast với cả batch.
+
+def integer_grid(low: int, high: int) -> np.ndarray:
+    """Mọi điểm nguyên trong [low, high]^3, mảng (N, 3)"""
+    axis = np.arange(low, high + 1, dtype=np.int64)
+    return np.stack(np.meshgrid(axis, axis, axis, indexing="ij"), axis=-1).reshape(-1, 3)
+
+
+def primitive_directions(bound: int) -> np.ndarray:
+    """Mọi vector chỉ phương đại diện (như canonical_direction) với thành phần trong [-bound, bound]"""
+    grid = integer_grid(-bound, bound)
+    g = np.gcd.reduce(np.abs(grid), axis=1)
+    first = np.where(grid[:, 0] != 0, grid[:, 0], np.where(grid[:, 1] != 0, grid[:, 1], grid[:, 2]))
+    return grid[(g == 1) & (first > 0)]
+
+
+def batch_dot(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    return (np.asarray(u) * np.asarray(v)).sum(axis=-1)
+
+
+def batch_cross(u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    u, v = np.asarray(u), np.asarray(v)
+    return np.stack((
+        u[..., 1] * v[..., 2] - u[..., 2] * v[..., 1],
+        u[..., 2] * v[..., 0] - u[..., 0] * v[..., 2],
+        u[..., 0] * v[..., 1] - u[..., 1] * v[..., 0],
+    ), axis=-1)
+
+
+def batch_norm_sq(v: np.ndarray) -> np.ndarray:
+    return batch_dot(v, v)
+
+
+def batch_plane_value(normal: np.ndarray, d: np.ndarray, p: np.ndarray) -> np.ndarray:
+    return batch_dot(normal, p) + np.asarray(d)
+
+
+def batch_points_on_plane(p: np.ndarray, normal: np.ndarray, d: np.ndarray) -> np.ndarray:
+    return batch_plane_value(normal, d, p) == 0
+
+
+def batch_plane_sphere_relation(
+    normal: np.ndarray, d: np.ndarray, center: np.ndarray, r_sq: np.ndarray
+) -> np.ndarray:
+    """Như plane_sphere_relation cho cả batch: mảng -1/0/1"""
+    value = batch_plane_value(normal, d, center)
+    return np.sign(value * value - np.asarray(r_sq) * batch_norm_sq(normal))
+
+
+def batch_point_sphere_relation(p: np.ndarray, center: np.ndarray, r_sq: np.ndarray) -> np.ndarray:
+    return np.sign(batch_norm_sq(np.asarray(p) - np.asarray(center)) - np.asarray(r_sq))
+
+
+def batch_line_sphere_relation(
+    base: np.ndarray, direction: np.ndarray, center: np.ndarray, r_sq: np.ndarray
+) -> np.ndarray:
+    moment = batch_cross(np.asarray(center) - np.asarray(base), direction)
+    return np.sign(batch_norm_sq(moment) - np.asarray(r_sq) * batch_norm_sq(direction))
+
+
+def batch_line_plane_relation(
+    base: np.ndarray, direction: np.ndarray, normal: np.ndarray, d: np.ndarray
+) -> np.ndarray:
+    """Như line_plane_relation cho cả batch"""
+    parallel = batch_dot(normal, direction) == 0
+    inside = batch_plane_value(normal, d, base) == 0
+    return np.where(parallel, np.where(inside, LINE_IN_PLANE, LINE_PARALLEL_PLANE), LINE_CROSSES_PLANE)
+
+
+def batch_is_perfect_square(values: np.ndarray) -> np.ndarray:
+    values = np.asarray(values)
+    roots = np.sqrt(np.maximum(values, 0)).round().astype(np.int64)
+    return (values >= 0) & (roots * roots == values)
@@ -0,0 +1,557 @@
+"""
+Preset Miner - Dò tìm offline các bộ tham số "đẹp" cho generator dùng bảng preset viết tay
+
+Một số generator chỉ bốc ngẫu nhiên từ vài chục bộ tham số đã kiểm tra bằng tay:
+- PARAM_SETS trong 2026/20_04/cau_1.py (vận tốc, t_H, t_1, t_2, d^2 đều nguyên)
+- A_PARAMS/B_PARAMS trong 2026/22_05/khao_sat_do_thi_ham_bac_3.py
+- ALL_PRESETS trong 2026/16_01/bai_toan_game_3d.py
+
+Miner duyệt toàn bộ không gian tham số nguyên bằng NumPy (vector hóa theo lưới), lọc theo
+đúng các điều kiện "đáp án đẹp" mà lời giải của generator giả định, rồi ghi bảng nén
+<tên generator>_presets.json.gz cạnh generator. Generator đọc bảng này lúc import qua
+preset_tables.load_preset_table (chỉ cần gzip/json) và quay về danh sách viết tay nếu không có
+file, nên lúc sinh đề không tốn chi phí dò.
+
+Mỗi miner kiểm tra lại chính các preset viết tay bằng cùng predicate: nếu một preset cũ bị
+loại thì predicate đang chặt hơn giả định của lời giải và cần xem lại.
+
+Ví dụ:
+  python3 preset_miner.py                  # dò và ghi mọi bảng
+  python3 preset_miner.py cau_1 --limit 8000
+  python3 preset_miner.py --check          # chỉ kiểm tra preset viết tay, không ghi file
+"""
+import argparse
+import ast
+import gzip
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from oxyz_core import (
+    SEPARATE,
+    batch_cross,
+    batch_dot,
+    batch_is_perfect_square,
+    batch_plane_sphere_relation,
+    integer_grid,
+    primitive_directions,
+)
+from preset_tables import TABLE_VERSION, table_path
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+DEFAULT_LIMIT = 5000
+DEFAULT_SEED = 2026
+
+# Số nguyên tố mà simplify_sqrt của bai_toan_game_3d.py không xử lý (nó chỉ thử tới 13)
+_UNHANDLED_PRIMES = np.array([17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97],
+                             dtype=np.int64)
+
+
+# =============================
+# TIỆN ÍCH NUMPY
+# =============================
+def _integer_sqrt(values: np.ndarray) -> np.ndarray:
+    return np.sqrt(np.maximum(values, 0)).round().astype(np.int64)
+
+
+def _fully_simplifiable(values: np.ndarray) -> np.ndarray:
+    """True nếu phần chính phương của values chỉ gồm các số nguyên tố <= 13"""
+    ok = np.ones(values.shape, dtype=bool)
+    for p in _UNHANDLED_PRIMES:
+        ok &= values % (p * p) != 0
+    return ok
+
+
+# =============================
+# 2026/20_04/cau_1.py
+# =============================
+CAU_1_COORD_MAX = 16      # |tọa độ A|
+CAU_1_B_MAX = 24          # |tọa độ B|
+CAU_1_V_MAX = 5           # |thành phần vận tốc|
+CAU_1_T_MAX = 10          # tổng thời gian (giờ)
+CAU_1_R_MAX = 20          # bán kính vùng kiểm soát
+CAU_1_COLUMNS = ["Ax", "Ay", "Az", "Bx", "By", "Bz", "t_total", "R"]
+
+
+def cau_1_mask(rows: np.ndarray) -> np.ndarray:
+    """
+    Predicate "đáp án đẹp" của cau_1: vận tốc nguyên, t_H nguyên, (R^2 - d^2)/v^2 là số chính
+    phương dương, vật vào vùng kiểm soát sau ít nhất 1 giờ và ra trước khi tới B
+
+    Args:
+        rows: Mảng (N, 8) theo CAU_1_COLUMNS
+
+    Returns:
+        np.ndarray: Mảng bool (N,)
+    """
+    A, B, t, R = rows[:, 0:3], rows[:, 3:6], rows[:, 6], rows[:, 7]
+    AB = B - A
+    ok = (t > 0) & (AB % np.maximum(t, 1)[:, None] == 0).all(axis=1)
+    v = AB // np.maximum(t, 1)[:, None]
+    v_sq = batch_dot(v, v)
+    ok &= v_sq > 0
+    v_sq = np.maximum(v_sq, 1)
+    a_dot_v = batch_dot(A, v)
+    ok &= a_dot_v % v_sq == 0
+    t_H = -a_dot_v // v_sq
+    H = A + v * t_H[:, None]
+    d_sq = batch_dot(H, H)
+    remainder = R * R - d_sq
+    ok &= (d_sq > 0) & (remainder > 0) & (remainder % v_sq == 0)
+    delta_sq = remainder // v_sq
+    ok &= batch_is_perfect_square(delta_sq)
+    delta = _integer_sqrt(delta_sq)
+    ok &= (t_H - delta >= 1) & (t_H + delta <= t)
+    return ok
+
+
+def mine_cau_1() -> Dict[str, np.ndarray]:
+    """Dò PARAM_SETS: duyệt theo vận tốc v, vector hóa theo A và t_delta, suy ra R"""
+    A = integer_grid(-CAU_1_COORD_MAX, CAU_1_COORD_MAX)
+    deltas = np.arange(1, CAU_1_T_MAX // 2 + 1, dtype=np.int64)
+    velocities = integer_grid(-CAU_1_V_MAX, CAU_1_V_MAX)
+    velocities = velocities[(velocities != 0).any(axis=1)]
+    found = []
+
+    for v in velocities:
+        v_sq = int(v @ v)
+        a_dot_v = A @ v
+        usable = a_dot_v % v_sq == 0
+        t_H = -a_dot_v // v_sq
+        usable &= (t_H >= 2) & (t_H < CAU_1_T_MAX)
+        if not usable.any():
+            continue
+        A_ok, t_H = A[usable], t_H[usable]
+        H = A_ok + np.outer(t_H, v)
+        d_sq = batch_dot(H, H)
+
+        # R^2 = d^2 + v^2 * t_delta^2 phải là số chính phương
+        R_sq = d_sq[:, None] + v_sq * deltas[None, :] ** 2
+        ok = (d_sq[:, None] > 0) & batch_is_perfect_square(R_sq)
+        ok &= (t_H[:, None] - deltas[None, :] >= 1) & (t_H[:, None] + deltas[None, :] <= CAU_1_T_MAX)
+        ok &= R_sq <= CAU_1_R_MAX ** 2
+        rows_idx, delta_idx = np.nonzero(ok)
+        if rows_idx.size == 0:
+            continue
+        R = _integer_sqrt(R_sq[rows_idx, delta_idx])
+        t2 = t_H[rows_idx] + deltas[delta_idx]
+
+        # Mọi tổng thời gian t_total >= t_2 cho một điểm B khác nhau
+        for t_total in range(2, CAU_1_T_MAX + 1):
+            pick = t2 <= t_total
+            if not pick.any():
+                continue
+            A_pick = A_ok[rows_idx[pick]]
+            B_pick = A_pick + v * t_total
+            inside = (np.abs(B_pick) <= CAU_1_B_MAX).all(axis=1)
+            count = int(inside.sum())
+            found.append(np.column_stack([
+                A_pick[inside], B_pick[inside],
+                np.full(count, t_total, dtype=np.int64), R[pick][inside]
+            ]))
+
+    rows = np.concatenate(found) if found else np.empty((0, len(CAU_1_COLUMNS)), dtype=np.int64)
+    return {"PARAM_SETS": rows[cau_1_mask(rows)]}
+
+
+def hand_cau_1(source: str) -> Dict[str, np.ndarray]:
+    presets = _literal_assignment(source, "PARAM_SETS")
+    return {"PARAM_SETS": np.array([[*A, *B, t, R] for A, B, t, R in presets], dtype=np.int64)}
+
+
+# =============================
+# 2026/22_05/khao_sat_do_thi_ham_bac_3.py
+# =============================
+BAC_3_X1_MAX = 4          # |x_1| (nghiệm kép của y = x^3 - 3x_1^2 x + 2x_1^3)
+BAC_3_M_MAX = 4           # hệ số m của T = m.a + n.b
+BAC_3_N_MAX = 8           # |n|
+BAC_3_T_MAX = 1000        # |T|
+BAC_3_A2_MAX = 2          # |a_2| của y = a_2 x^3 + b_2 x + c_2
+BAC_3_B2_MAX = 3
+BAC_3_C2_MAX = 3
+BAC_3_T0_MAX = 4
+BAC_3_D2_MAX = 150        # MN^2
+A_PARAMS_COLUMNS = ["x1", "m", "n", "T"]
+B_PARAMS_COLUMNS = ["a2", "b2", "c2", "t0", "d2"]
+
+
+def a_params_mask(rows: np.ndarray) -> np.ndarray:
+    """
+    Predicate mệnh đề a: M(-x_1/2; 27x_1^3/8) nên 8T = -4m.x_1 + 27n.x_1^3 phải chia hết cho 8
+
+    Args:
+        rows: Mảng (N, 4) theo A_PARAMS_COLUMNS
+
+    Returns:
+        np.ndarray: Mảng bool (N,)
+    """
+    x1, m, n, T = rows.T
+    eight_T = -4 * m * x1 + 27 * n * x1 ** 3
+    return (x1 != 0) & (m >= 1) & (n != 0) & (eight_T % 8 == 0) & (eight_T == 8 * T)
+
+
+def b_params_mask(rows: np.ndarray) -> np.ndarray:
+    """
+    Predicate mệnh đề b: g'(t) có mọi hệ số dương (a_2.b_2 > 0) nên g(t) = d^2 có nghiệm duy nhất t_0
+
+    Args:
+        rows: Mảng (N, 5) theo B_PARAMS_COLUMNS
+
+    Returns:
+        np.ndarray: Mảng bool (N,)
+    """
+    a2, b2, c2, t0, d2 = rows.T
+    g = a2 ** 2 * t0 ** 3 + 2 * a2 * b2 * t0 ** 2 + (b2 ** 2 + 1) * t0
+    return (a2 != 0) & (a2 * b2 > 0) & (t0 >= 1) & (g == d2)
+
+
+def mine_khao_sat_bac_3() -> Dict[str, np.ndarray]:
+    """Dò A_PARAMS/B_PARAMS trên lưới đầy đủ (không gian nhỏ, một lần meshgrid)"""
+    x1 = np.arange(-BAC_3_X1_MAX, BAC_3_X1_MAX + 1, dtype=np.int64)
+    m = np.arange(1, BAC_3_M_MAX + 1, dtype=np.int64)
+    n = np.arange(-BAC_3_N_MAX, BAC_3_N_MAX + 1, dtype=np.int64)
+    grid = np.stack(np.meshgrid(x1, m, n, indexing="ij"), axis=-1).reshape(-1, 3)
+    T = (-4 * grid[:, 1] * grid[:, 0] + 27 * grid[:, 2] * grid[:, 0] ** 3) // 8
+    a_rows = np.column_stack([grid, T])
+    a_rows = a_rows[a_params_mask(a_rows) & (np.abs(T) <= BAC_3_T_MAX) & (T != 0)]
+
+    a2 = np.arange(-BAC_3_A2_MAX, BAC_3_A2_MAX + 1, dtype=np.int64)
+    b2 = np.arange(-BAC_3_B2_MAX, BAC_3_B2_MAX + 1, dtype=np.int64)
+    c2 = np.arange(-BAC_3_C2_MAX, BAC_3_C2_MAX + 1, dtype=np.int64)
+    t0 = np.arange(1, BAC_3_T0_MAX + 1, dtype=np.int64)
+    grid = np.stack(np.meshgrid(a2, b2, c2, t0, indexing="ij"), axis=-1).reshape(-1, 4)
+    a, b, t = grid[:, 0], grid[:, 1], grid[:, 3]
+    d2 = a ** 2 * t ** 3 + 2 * a * b * t ** 2 + (b ** 2 + 1) * t
+    b_rows = np.column_stack([grid, d2])
+    b_rows = b_rows[b_params_mask(b_rows) & (d2 <= BAC_3_D2_MAX)]
+
+    return {"A_PARAMS": a_rows, "B_PARAMS": b_rows}
+
+
+def hand_khao_sat_bac_3(source: str) -> Dict[str, np.ndarray]:
+    return {
+        "A_PARAMS": np.array(_literal_assignment(source, "A_PARAMS"), dtype=np.int64),
+        "B_PARAMS": np.array(_literal_assignment(source, "B_PARAMS"), dtype=np.int64),
+    }
+
+
+# =============================
+# 2026/16_01/bai_toan_game_3d.py
+# =============================
+GAME_NORMAL_MAX = 4       # |thành phần pháp tuyến|
+GAME_DIRECTION_MAX = 2    # |thành phần vector bắn|
+GAME_CENTER_MAX = 2       # |tọa độ tâm mặt cầu|
+GAME_D_MAX = 12           # |hệ số tự do của (P)|
+GAME_RADII = (1, 2, 3)
+GAME_GAP_MAX = 5          # d(I, P) - R tối đa (khoảng cách ngắn nhất tới mục tiêu)
+GAME_COLUMNS = ["a", "b", "c", "d", "Ix", "Iy", "Iz", "R_sq", "ux", "uy", "uz"]
+
+
+def game_mask(rows: np.ndarray) -> np.ndarray:
+    """
+    Predicate của bài toán game 3D: người chơi ở giao điểm nguyên của (P) với Ox, R nguyên,
+    mặt cầu không cắt (P), tia bắn không song song (P)
+
+    Args:
+        rows: Mảng (N, 11) theo GAME_COLUMNS
+
+    Returns:
+        np.ndarray: Mảng bool (N,)
+    """
+    normal, d = rows[:, 0:3], rows[:, 3]
+    I, R_sq, u = rows[:, 4:7], rows[:, 7], rows[:, 8:11]
+    a = normal[:, 0]
+    ok = (a != 0) & (d % np.where(a == 0, 1, a) == 0)
+    ok &= batch_is_perfect_square(R_sq) & (R_sq > 0)
+    ok &= batch_plane_sphere_relation(normal, d, I, R_sq) == SEPARATE
+    dot_u_n = batch_dot(u, normal)
+    u_sq = batch_dot(u, u)
+    return ok & (dot_u_n != 0) & (u_sq > 0)
+
+
+def game_nice_mask(rows: np.ndarray) -> np.ndarray:
+    """
+    Điều kiện "đẹp" thêm khi dò (preset viết tay không bắt buộc thỏa): |n| nguyên để mọi đáp án
+    ở dạng căn thức, và simplify_sqrt của generator rút gọn được hết các căn
+
+    Args:
+        rows: Mảng (N, 11) theo GAME_COLUMNS
+
+    Returns:
+        np.ndarray: Mảng bool (N,)
+    """
+    normal, d, I, u = rows[:, 0:3], rows[:, 3], rows[:, 4:7], rows[:, 8:11]
+    a = np.where(normal[:, 0] == 0, 1, normal[:, 0])
+    n_sq, u_sq = batch_dot(normal, normal), batch_dot(u, u)
+    M0 = np.zeros_like(I)
+    M0[:, 0] = -d // a
+    cross = batch_cross(M0 - I, u)
+    ok = batch_is_perfect_square(n_sq)
+    ok &= _fully_simplifiable(batch_dot(cross, cross) * u_sq)
+    ok &= _fully_simplifiable(u_sq) & _fully_simplifiable(u_sq * n_sq)
+    return ok
+
+
+def mine_game_3d() -> Dict[str, np.ndarray]:
+    """Dò ALL_PRESETS: duyệt cặp (pháp tuyến, hướng bắn), vector hóa theo tâm, d và R"""
+    normals = primitive_directions(GAME_NORMAL_MAX)
+    normals = normals[(normals[:, 0] != 0) & batch_is_perfect_square(batch_dot(normals, normals))]
+    directions = primitive_directions(GAME_DIRECTION_MAX)
+    centers = integer_grid(-GAME_CENTER_MAX, GAME_CENTER_MAX)
+    radii = np.array(GAME_RADII, dtype=np.int64)
+    found = []
+
+    for normal in normals:
+        a = int(normal[0])
+        n_len = int(round(float(np.sqrt(normal @ normal))))
+        ds = np.arange(-GAME_D_MAX, GAME_D_MAX + 1, dtype=np.int64)
+        ds = ds[(ds % a == 0) & (ds != 0)]
+        # (tâm, d, R) thỏa R < d(I, P) <= R + GAME_GAP_MAX
+        numerator = (centers @ normal)[:, None] + ds[None, :]
+        gap = np.abs(numerator)[:, :, None] - n_len * radii[None, None, :]
+        c_idx, d_idx, r_idx = np.nonzero((gap > 0) & (gap <= GAME_GAP_MAX * n_len))
+        if c_idx.size == 0:
+            continue
+        base = np.column_stack([
+            np.broadcast_to(normal, (c_idx.size, 3)), ds[d_idx], centers[c_idx], radii[r_idx] ** 2
+        ])
+        for u in directions[directions @ normal != 0]:
+            rows = np.column_stack([base, np.broadcast_to(u, (base.shape[0], 3))])
+            found.append(rows[game_mask(rows) & game_nice_mask(rows)])
+
+    rows = np.concatenate(found) if found else np.empty((0, len(GAME_COLUMNS)), dtype=np.int64)
+    return {"ALL_PRESETS": rows}
+
+
+def hand_game_3d(source: str) -> Dict[str, np.ndarray]:
+    rows = []
+    for name in _literal_list_of_names(source, "ALL_PRESETS"):
+        preset = _literal_assignment(source, name)
+        rows.append([*preset["plane"], *preset["sphere_center"], preset["sphere_radius_sq"], *preset["direction"]])
+    return {"ALL_PRESETS": np.array(rows, dtype=np.int64)}
+
+
+# =============================
+# ĐỌC PRESET VIẾT TAY (không import generator)
+# =============================
+def _assignment_source(source: str, name: str) -> str:
+    # Generator có thể dùng cú pháp f-string của Python mới hơn bản đang chạy, nên không parse
+    # cả file mà chỉ cắt đúng vế phải của phép gán rồi literal_eval
+    marker = f"{name} = "
+    start = source.find("\n" + marker)
+    if start < 0:
+        start = source.find(marker)
+        if start < 0:
+            raise KeyError(name)
+    start = source.index(marker, start) + len(marker)
+    depth = 0
+    for end in range(start, len(source)):
+        char = source[end]
+        if char in "[({":
+            depth += 1
+        elif char in "])}":
+            depth -= 1
+            if depth == 0:
+                return source[start:end + 1]
+    raise ValueError(f"Không tìm thấy cuối phép gán {name}")
+
+
+def _literal_assignment(source: str, name: str):
+    return ast.literal_eval(_assignment_source(source, name))
+
+
+def _literal_list_of_names(source: str, name: str) -> List[str]:
+    return [element.id for element in ast.parse(_assignment_source(source, name), mode="eval").body.elts]
+
+
+# =============================
+# ĐĂNG KÝ MINER
+# =============================
+@dataclass
+class PresetMiner:
+    """Một generator có bảng preset cần dò"""
+    name: str
+    generator_path: str
+    columns: Dict[str, List[str]]
+    mine: Callable[[], Dict[str, np.ndarray]]
+    masks: Dict[str, Callable[[np.ndarray], np.ndarray]]
+    hand_presets: Callable[[str], Dict[str, np.ndarray]]
+
+    @property
+    def absolute_path(self) -> str:
+        return os.path.join(REPO_ROOT, self.generator_path)
+
+    @property
+    def table_path(self) -> str:
+        return table_path(self.absolute_path)
+
+
+MINERS: Dict[str, PresetMiner] = {
+    miner.name: miner for miner in (
+        PresetMiner(
+            name="cau_1",
+            generator_path="2026/20_04/cau_1.py",
+            columns={"PARAM_SETS": CAU_1_COLUMNS},
+            mine=mine_cau_1,
+            masks={"PARAM_SETS": cau_1_mask},
+            hand_presets=hand_cau_1,
+        ),
+        PresetMiner(
+            name="khao_sat_do_thi_ham_bac_3",
+            generator_path="2026/22_05/khao_sat_do_thi_ham_bac_3.py",
+            columns={"A_PARAMS": A_PARAMS_COLUMNS, "B_PARAMS": B_PARAMS_COLUMNS},
+            mine=mine_khao_sat_bac_3,
+            masks={"A_PARAMS": a_params_mask, "B_PARAMS": b_params_mask},
+            hand_presets=hand_khao_sat_bac_3,
+        ),
+        PresetMiner(
+            name="bai_toan_game_3d",
+            generator_path="2026/16_01/bai_toan_game_3d.py",
+            columns={"ALL_PRESETS": GAME_COLUMNS},
+            mine=mine_game_3d,
+            masks={"ALL_PRESETS": game_mask},
+            hand_presets=hand_game_3d,
+        ),
+    )
+}
+
+
+def check_hand_presets(miner: PresetMiner) -> Dict[str, np.ndarray]:
+    """
+    Áp dụng predicate của miner lên preset viết tay
+
+    Args:
+        miner: Miner cần kiểm tra
+
+    Returns:
+        Dict[str, np.ndarray]: Tên bảng -> các preset viết tay bị predicate loại
+    """
+    with open(miner.absolute_path, "r", encoding="utf-8") as f:
+        source = f.read()
+    rejected = {}
+    for table, rows in miner.hand_presets(source).items():
+        rejected[table] = rows[~miner.masks[table](rows)]
+    return rejected
+
+
+def sample_rows(rows: np.ndarray, limit: int, seed: int) -> np.ndarray:
+    """
+    Lấy tối đa limit dòng (tất định theo seed), giữ thứ tự gốc và bỏ dòng trùng
+
+    Args:
+        rows: Mảng (N, k)
+        limit: Số dòng tối đa (<= 0 = không giới hạn)
+        seed: Seed chọn mẫu
+
+    Returns:
+        np.ndarray: Mảng đã lấy mẫu
+    """
+    rows = np.unique(rows, axis=0)
+    if limit <= 0 or rows.shape[0] <= limit:
+        return rows
+    picked = np.random.default_rng(seed).choice(rows.shape[0], size=limit, replace=False)
+    return rows[np.sort(picked)]
+
+
+def write_table(path: str, generator_path: str, tables: Dict[str, np.ndarray],
+                columns: Dict[str, List[str]], total: Dict[str, int]) -> None:
+    """
+    Ghi bảng preset nén (gzip JSON, đọc được chỉ với thư viện chuẩn)
+
+    Args:
+        path: Đường dẫn file .json.gz
+        generator_path: Generator sở hữu bảng (đường dẫn tương đối từ gốc repo)
+        tables: Tên bảng -> mảng preset
+        columns: Tên bảng -> tên cột
+        total: Tên bảng -> số preset hợp lệ trước khi lấy mẫu
+    """
+    payload = {
+        "version": TABLE_VERSION,
+        "generator": generator_path,
+        "tables": {
+            name: {"columns": columns[name], "valid": total[name], "rows": rows.tolist()}
+            for name, rows in tables.items()
+        },
+    }
+    tmp_path = path + ".tmp"
+    # mtime=0 để cùng nội dung thì cùng bytes (không tạo diff git vô nghĩa)
+    with open(tmp_path, "wb") as raw:
+        with gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as f:
+            f.write(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+    os.replace(tmp_path, path)
+
+
+def run_miner(miner: PresetMiner, limit: int, seed: int, write: bool = True) -> Dict[str, int]:
+    """
+    Dò, kiểm tra lại và ghi bảng preset của một generator
+
+    Args:
+        miner: Miner cần chạy
+        limit: Số preset tối đa mỗi bảng
+        seed: Seed chọn mẫu
+        write: False để chỉ dò mà không ghi file
+
+    Returns:
+        Dict[str, int]: Tên bảng -> số preset hợp lệ tìm được
+
+    Raises:
+        AssertionError: Khi dòng dò được không thỏa predicate (lỗi trong phần vector hóa)
+    """
+    mined = miner.mine()
+    tables, total = {}, {}
+    for name, rows in mined.items():
+        assert miner.masks[name](rows).all(), f"{miner.name}.{name}: có dòng không thỏa predicate"
+        total[name] = int(np.unique(rows, axis=0).shape[0])
+        tables[name] = sample_rows(rows, limit, seed)
+    if write:
+        write_table(miner.table_path, miner.generator_path, tables, miner.columns, total)
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Dò offline bảng preset 'đáp án đẹp' cho các generator")
+    parser.add_argument('names', nargs='*', help=f"Miner cần chạy (mặc định: tất cả - {', '.join(MINERS)})")
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT,
+                        help=f'Số preset tối đa mỗi bảng, 0 = không giới hạn (mặc định: {DEFAULT_LIMIT})')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help=f'Seed chọn mẫu khi vượt --limit (mặc định: {DEFAULT_SEED})')
+    parser.add_argument('--check', action='store_true', help='Chỉ kiểm tra preset viết tay, không dò')
+    parser.add_argument('--dry-run', action='store_true', help='Dò nhưng không ghi file')
+    args = parser.parse_args()
+
+    unknown = [name for name in args.names if name not in MINERS]
+    if unknown:
+        parser.error(f"Miner không tồn tại: {', '.join(unknown)}")
+
+    failed = False
+    for name in args.names or list(MINERS):
+        miner = MINERS[name]
+        rejected = check_hand_presets(miner)
+        for table, rows in rejected.items():
+            if rows.size:
+                failed = True
+                print(f"⚠️  {name}.{table}: {rows.shape[0]} preset viết tay bị predicate loại:")
+                for row in rows:
+                    print(f"     {row.tolist()}")
+        if args.check:
+            if not any(rows.size for rows in rejected.values()):
+                print(f"✅ {name}: mọi preset viết tay thỏa predicate")
+            continue
+
+        start = time.perf_counter()
+        total = run_miner(miner, args.limit, args.seed, write=not args.dry_run)
+        elapsed = time.perf_counter() - start
+        summary = ", ".join(f"{table}: {count}" for table, count in total.items())
+        target = "" if args.dry_run else f" -> {os.path.relpath(miner.table_path, REPO_ROOT)}"
+        print(f"✅ {name}: {summary} preset hợp lệ ({elapsed:.1f}s){target}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Preset Tables - Đọc bảng preset do preset_miner.py dò
+
+preset_miner.py ghi <tên generator>_presets.json.gz cạnh generator; generator đọc bảng lúc import
+bằng load_preset_table. Module này chỉ dùng gzip/json (không NumPy) nên import nhanh, và là nơi
+duy nhất định nghĩa tên file cùng định dạng bảng cho cả miner lẫn generator.
+
+Thiếu file, file hỏng hoặc bảng rỗng thì trả về danh sách viết tay (fallback) của generator.
+"""
+import gzip
+import json
+import os
+from typing import Any, Callable, List, Optional
+
+TABLE_SUFFIX = "_presets.json.gz"
+TABLE_VERSION = 1
+
+
+def table_path(generator_file: str) -> str:
+    """
+    Đường dẫn bảng preset của một generator (cùng thư mục, cùng tên + TABLE_SUFFIX)
+
+    Args:
+        generator_file: Đường dẫn file .py của generator (thường là __file__)
+    """
+    return os.path.splitext(os.path.abspath(generator_file))[0] + TABLE_SUFFIX
+
+
+def load_preset_table(
+    generator_file: str,
+    name: str,
+    fallback: List[Any],
+    row_to_preset: Optional[Callable[[List[Any], int], Any]] = None
+) -> List[Any]:
+    """
+    Đọc một bảng preset đã dò; lỗi hoặc bảng rỗng thì dùng danh sách viết tay
+
+    Args:
+        generator_file: File .py của generator sở hữu bảng (thường là __file__)
+        name: Tên bảng trong file (ví dụ "PARAM_SETS")
+        fallback: Danh sách preset viết tay
+        row_to_preset: Đổi một dòng (list số) và chỉ số của nó thành preset;
+            mặc định đổi dòng thành tuple
+
+    Returns:
+        List[Any]: Danh sách preset
+    """
+    try:
+        with gzip.open(table_path(generator_file), "rt", encoding="utf-8") as f:
+            rows = json.load(f)["tables"][name]["rows"]
+    except (OSError, ValueError, KeyError):
+        return fallback
+    if row_to_preset is None:
+        presets = [tuple(row) for row in rows]
+    else:
+        presets = [row_to_preset(row, index) for index, row in enumerate(rows)]
+    return presets or fallback
@@ -0,0 +1,81 @@
+"""
+Quadrature - Tích phân vector hóa (NumPy) dùng chung cho các bài toán diện tích/thể tích
+
+- sqrt_arc_integral: ∫ √(R² - t²) dt có nguyên hàm đóng (mặt cắt/biên là cung tròn)
+- gauss_legendre: quy tắc Gauss–Legendre bậc cố định, nhiều panel, cho tích phân không có
+  công thức đóng; tính cả batch bộ tham số trong một lần gọi NumPy
+- max_relative_error: so sánh kết quả với tham chiếu (scipy quad) khi kiểm tra
+
+Các hàm nhận số thực hoặc mảng NumPy (cả batch bộ tham số cùng lúc). Công thức đóng riêng
+của từng bài nằm cạnh generator (ví dụ 2026/15_03/volume_quadrature.py).
+"""
+from functools import lru_cache
+from typing import Callable, Tuple
+
+import numpy as np
+
+GAUSS_ORDER = 32
+GAUSS_PANELS = 16
+
+
+def sqrt_arc_integral(t0, t1, R):
+    """
+    ∫_{t0}^{t1} √(max(0, R² - t²)) dt (phần ngoài [-R, R] đóng góp 0)
+
+    Nguyên hàm: G(t) = (t√(R² - t²) + R² arcsin(t/R)) / 2
+    """
+    R = np.asarray(R, dtype=float)
+    return _arc_antiderivative(np.clip(t1, -R, R), R) - _arc_antiderivative(np.clip(t0, -R, R), R)
+
+
+def _arc_antiderivative(t, R):
+    return 0.5 * (t * np.sqrt(np.maximum(R * R - t * t, 0.0)) + R * R * np.arcsin(t / R))
+
+
+@lru_cache(maxsize=None)
+def _gauss_nodes(order: int, panels: int) -> Tuple[np.ndarray, np.ndarray]:
+    # Nút/trọng số trên [0, 1] cho quy tắc ghép `panels` đoạn đều nhau
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+    starts = np.arange(panels) / panels
+    x = (starts[:, None] + (nodes[None, :] + 1) / (2 * panels)).ravel()
+    w = np.tile(weights / (2 * panels), panels)
+    return x, w
+
+
+def gauss_legendre(
+    integrand: Callable[..., np.ndarray],
+    a,
+    b,
+    *params,
+    order: int = GAUSS_ORDER,
+    panels: int = GAUSS_PANELS
+):
+    """
+    ∫_a^b integrand(x, *params) dx cho cả batch bằng Gauss–Legendre ghép bậc cố định
+
+    Args:
+        integrand: Hàm vector hóa f(x, *params); x có shape (batch, số nút),
+                   mỗi tham số có shape (batch, 1)
+        a, b: Cận (số thực hoặc mảng batch)
+        params: Tham số của hàm (số thực hoặc mảng batch)
+        order: Số nút mỗi panel
+        panels: Số đoạn chia đều [a, b]
+
+    Returns:
+        float hoặc np.ndarray: Giá trị tích phân
+    """
+    arrays = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a, b) + params))
+    scalar = arrays[0].ndim == 0
+    a, b, *params = (np.atleast_1d(v)[:, None] for v in arrays)
+    nodes, weights = _gauss_nodes(order, panels)
+    x = a + (b - a) * nodes[None, :]
+    values = integrand(x, *params) @ weights * (b - a)[:, 0]
+    return float(values[0]) if scalar else values
+
+
+def max_relative_error(values, reference) -> float:
+    """Sai số tương đối lớn nhất giữa hai mảng kết quả"""
+    values = np.asarray(values, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+    scale = np.maximum(np.abs(reference), 1.0)
+    return float(np.max(np.abs(values - reference) / scale)) if reference.size else 0.0
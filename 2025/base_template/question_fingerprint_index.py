@@ -0,0 +1,241 @@
+"""
+Question Fingerprint Index - Chỉ mục chống trùng câu hỏi giữa các batch
+
+Nhiều generator bốc tham số từ không gian nhỏ (bảng preset, số nguyên trong [-5, 5]...), nên
+bộ đề lớn dễ có câu trùng hoặc gần trùng. So sánh nội dung từng cặp câu là O(n²); thay vào đó
+mỗi câu được quy về một fingerprint:
+- Ưu tiên tham số của câu hỏi (question.parameters), chuẩn hóa thành JSON chính tắc:
+  khóa sắp xếp, tuple/list như nhau, float làm tròn FLOAT_SIGNIFICANT_DIGITS chữ số có nghĩa
+  (2.0 và 2, 0.30000000000000004 và 0.3 coi là một), Fraction/sympy/numpy quy về dạng chuỗi/list
+- Không có tham số thì dùng nội dung câu hỏi đã bỏ số thứ tự câu
+- Băm blake2b cùng khóa generator (module.QualName), nên hai loại câu khác nhau không đụng nhau
+
+FingerprintIndex giữ các fingerprint trong một set (kiểm tra O(1)). Nếu có đường dẫn file,
+fingerprint được ghi nối vào file (mỗi dòng một mã hex) để dùng lại cho các lần chạy sau.
+claim() khóa file (fcntl.flock) và đọc thêm các dòng do process khác vừa ghi trước khi kiểm tra,
+nên nhiều process (nhiều lần chạy main_runner song song, hoặc worker) dùng chung một file an toàn.
+"""
+import hashlib
+import json
+import os
+import re
+from fractions import Fraction
+from typing import Any, Iterable, Optional, Set
+
+try:
+    import fcntl
+except ImportError:  # Windows: không khóa file, chỉ an toàn khi một process ghi
+    fcntl = None
+
+from seed_stream import generator_key
+
+FLOAT_SIGNIFICANT_DIGITS = 9
+FINGERPRINT_BYTES = 16
+
+# "Câu 12:" / "%Câu 12" - số thứ tự câu không làm câu hỏi khác đi
+_QUESTION_NUMBER_PATTERN = re.compile(r"Câu\s+\d+")
+
+
+def canonical_value(value: Any) -> Any:
+    """
+    Chuẩn hóa một giá trị tham số thành dạng JSON chính tắc
+
+    Args:
+        value: Giá trị bất kỳ (số, chuỗi, list/tuple/dict/set, Fraction, numpy, sympy...)
+
+    Returns:
+        Any: Giá trị chỉ gồm None/bool/int/str/list/dict
+    """
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        if value != value or value in (float("inf"), float("-inf")):
+            return repr(value)
+        rounded = float(f"{value:.{FLOAT_SIGNIFICANT_DIGITS}g}")
+        return int(rounded) if rounded.is_integer() else rounded
+    if isinstance(value, Fraction):
+        return canonical_value(value.numerator) if value.denominator == 1 else f"{value.numerator}/{value.denominator}"
+    if isinstance(value, dict):
+        return {str(key): canonical_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonical_value(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        items = [canonical_value(item) for item in value]
+        return sorted(items, key=lambda item: json.dumps(item, sort_keys=True, ensure_ascii=False))
+    # numpy array/scalar
+    if hasattr(value, "tolist"):
+        return canonical_value(value.tolist())
+    # sympy và các kiểu khác: dạng chuỗi của chúng đã chính tắc
+    return str(value)
+
+
+def parameters_fingerprint(question_type: Any, parameters: Any) -> str:
+    """
+    Fingerprint của một câu hỏi theo tham số
+
+    Args:
+        question_type: Class câu hỏi (hoặc LazyQuestionType)
+        parameters: Tham số của câu hỏi (thường là question.parameters)
+
+    Returns:
+        str: Mã hex FINGERPRINT_BYTES byte
+    """
+    payload = json.dumps(canonical_value(parameters), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return _digest(generator_key(question_type), "params", payload)
+
+
+def content_fingerprint(question_type: Any, content: str) -> str:
+    """
+    Fingerprint của một câu hỏi theo nội dung (khi generator không có tham số)
+
+    Args:
+        question_type: Class câu hỏi
+        content: Nội dung LaTeX của câu hỏi
+
+    Returns:
+        str: Mã hex FINGERPRINT_BYTES byte
+    """
+    normalized = " ".join(_QUESTION_NUMBER_PATTERN.sub("Câu", content).split())
+    return _digest(generator_key(question_type), "content", normalized)
+
+
+def question_fingerprint(question_type: Any, question_instance: Any, result: Any) -> str:
+    """
+    Fingerprint của câu hỏi vừa sinh: theo tham số nếu có, nếu không theo nội dung
+
+    Args:
+        question_type: Class câu hỏi
+        question_instance: Đối tượng đã sinh câu hỏi (đọc thuộc tính parameters)
+        result: Kết quả generate_question (str hoặc tuple (content, answer))
+
+    Returns:
+        str: Mã hex
+    """
+    parameters = getattr(question_instance, "parameters", None)
+    if parameters:
+        return parameters_fingerprint(question_type, parameters)
+    content = result[0] if isinstance(result, tuple) else result
+    return content_fingerprint(question_type, str(content))
+
+
+def _digest(*parts: str) -> str:
+    material = "\x1f".join(parts)
+    return hashlib.blake2b(material.encode("utf-8"), digest_size=FINGERPRINT_BYTES).hexdigest()
+
+
+class FingerprintIndex:
+    """
+    Tập fingerprint đã dùng, có thể lưu ra file để chống trùng giữa các lần chạy
+
+    Dùng:
+        index = FingerprintIndex("de_thi.fingerprints")
+        if index.claim(fingerprint):
+            ...  # câu mới, đã được ghi nhận
+        else:
+            ...  # trùng, bốc lại
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: File lưu fingerprint (None = chỉ giữ trong bộ nhớ)
+        """
+        self.path = path
+        self._seen: Set[str] = set()
+        self._offset = 0
+        if path is not None:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            with self._locked() as f:
+                self._read_new(f)
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self._seen
+
+    def claim(self, fingerprint: str) -> bool:
+        """
+        Ghi nhận một fingerprint nếu chưa có
+
+        Args:
+            fingerprint: Mã hex của câu hỏi
+
+        Returns:
+            bool: True nếu là câu mới (đã ghi nhận), False nếu trùng
+        """
+        if fingerprint in self._seen:
+            return False
+        if self.path is None:
+            self._seen.add(fingerprint)
+            return True
+        with self._locked() as f:
+            # Process khác có thể vừa ghi thêm
+            self._read_new(f)
+            if fingerprint in self._seen:
+                return False
+            f.seek(0, os.SEEK_END)
+            f.write(f"{fingerprint}\n".encode("ascii"))
+            f.flush()
+            self._offset = f.tell()
+        self._seen.add(fingerprint)
+        return True
+
+    def update(self, fingerprints: Iterable[str]) -> int:
+        """
+        Ghi nhận nhiều fingerprint
+
+        Args:
+            fingerprints: Các mã hex
+
+        Returns:
+            int: Số fingerprint mới
+        """
+        return sum(1 for fingerprint in fingerprints if self.claim(fingerprint))
+
+    def _read_new(self, f) -> None:
+        f.seek(self._offset)
+        data = f.read()
+        # Chỉ nhận các dòng đã ghi trọn
+        complete = data[:data.rfind(b"\n") + 1]
+        self._seen.update(line.decode("ascii") for line in complete.split() if line)
+        self._offset += len(complete)
+
+    def _locked(self):
+        return _LockedFile(self.path)
+
+    def __getstate__(self) -> dict:
+        # Gửi sang process con chỉ đường dẫn; process con tự đọc lại file
+        state = self.__dict__.copy()
+        if self.path is not None:
+            state["_seen"] = set()
+            state["_offset"] = 0
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        if self.path is not None:
+            with self._locked() as f:
+                self._read_new(f)
+
+
+class _LockedFile:
+    """Mở file fingerprint ở chế độ đọc/ghi nhị phân và giữ khóa độc quyền trong khối with"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = None
+
+    def __enter__(self):
+        self.file = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+        return self.file
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        self.file.close()
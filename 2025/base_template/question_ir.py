@@ -0,0 +1,281 @@
+"""
+Question IR - Câu hỏi dạng dữ liệu có cấu trúc, một lần sinh nhiều cách xuất
+
+Các generator trả về chuỗi LaTeX đã ghép sẵn (\\begin{ex} ... \\loigiai{...} của ex_test,
+\\begin{choices} của BaseOptimizationQuestion, nhãn "*a)" của label_with_star...). Muốn lấy đáp
+án hay xuất JSON thì phải regex lại chính output của mình. Module này cho:
+- QuestionRecord: đề (stem), phương án/mệnh đề (options) kèm cờ đúng/sai (truth), đáp án, lời
+  giải, hình TikZ, metadata (generator, seed...); generator điền một lần
+- Renderer chạy thẳng từ record: render_ex_test (Azota ex_test: \\choice, \\choiceTFt, nhãn *a),
+  \\shortans), render_choices (format cổ điển "Câu n:" + \\begin{choices}), record_to_json (một
+  dòng JSON Lines), answer_key_row (một dòng CSV đáp án)
+- RecordExporter: ghi JSON Lines, CSV đáp án và file ex_test trong cùng một lượt, từng record
+  một (dùng được làm record_sink của QuestionManager khi sinh song song hoặc streaming)
+"""
+import csv
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, IO, Iterable, List, Optional
+
+IR_VERSION = 1
+
+# Loại câu hỏi
+KIND_MULTIPLE_CHOICE = "multiple_choice"  # Một phương án đúng (A/B/C/D)
+KIND_TRUE_FALSE = "true_false"            # Mỗi mệnh đề đúng hoặc sai
+KIND_SHORT_ANSWER = "short_answer"        # Trả lời ngắn (\shortans)
+KIND_ESSAY = "essay"                      # Chỉ đề và lời giải, đáp án đi kèm (format 2)
+KINDS = (KIND_MULTIPLE_CHOICE, KIND_TRUE_FALSE, KIND_SHORT_ANSWER, KIND_ESSAY)
+
+# Cách ghi mệnh đề đúng/sai trong ex_test
+TF_STYLE_CHOICE = "choiceTFt"  # \choiceTFt {* đúng} {sai}
+TF_STYLE_LABELS = "labels"     # đoạn "*a) đúng", "b) sai" (kiểu label_with_star)
+
+CHOICE_LETTERS = "ABCDEFGH"
+STATEMENT_LETTERS = "abcdefgh"
+TRUE_MARK = "Đ"
+FALSE_MARK = "S"
+ANSWER_KEY_HEADER = ("number", "kind", "answer", "generator", "seed")
+
+EX_TEST_HEADER = (
+    r"\documentclass[12pt,a4paper]{article}" "\n"
+    r"\usepackage{amsmath,amssymb}" "\n"
+    r"\usepackage[top=1.5cm, bottom=2cm, left=2cm, right=1.5cm]{geometry}" "\n"
+    r"\usepackage[solcolor]{ex_test}" "\n\n"
+    r"\begin{document}" "\n\n"
+)
+EX_TEST_FOOTER = "\n\n" r"\end{document}" "\n"
+
+
+@dataclass
+class QuestionRecord:
+    """
+    Một câu hỏi đã sinh, chưa gắn với định dạng xuất nào
+
+    options và truth cùng độ dài: với trắc nghiệm là các phương án theo thứ tự hiển thị (đúng
+    một cờ True), với đúng/sai là các mệnh đề a), b), ... (không kèm nhãn). Đề và lời giải là
+    LaTeX; hình TikZ nằm trong stem hoặc tách riêng trong figures (đặt sau đề khi xuất).
+    """
+    number: int
+    stem: str
+    kind: str = KIND_ESSAY
+    options: List[str] = field(default_factory=list)
+    truth: List[bool] = field(default_factory=list)
+    answer: str = ""
+    solution: str = ""
+    figures: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.kind not in KINDS:
+            raise ValueError(f"Loại câu hỏi không hợp lệ: {self.kind} (chỉ nhận {', '.join(KINDS)})")
+        if len(self.truth) != len(self.options):
+            raise ValueError(f"Có {len(self.options)} phương án nhưng {len(self.truth)} cờ đúng/sai")
+        if self.kind == KIND_MULTIPLE_CHOICE and sum(self.truth) != 1:
+            raise ValueError(f"Câu trắc nghiệm phải có đúng một phương án đúng, có {sum(self.truth)}")
+        if self.kind == KIND_TRUE_FALSE and not self.options:
+            raise ValueError("Câu đúng/sai phải có ít nhất một mệnh đề")
+
+    def answer_key(self) -> str:
+        """
+        Đáp án dạng ngắn: "B" (trắc nghiệm), "ĐSSĐ" (đúng/sai), còn lại là answer
+        """
+        if self.kind == KIND_MULTIPLE_CHOICE:
+            return CHOICE_LETTERS[self.truth.index(True)]
+        if self.kind == KIND_TRUE_FALSE:
+            return "".join(TRUE_MARK if flag else FALSE_MARK for flag in self.truth)
+        return self.answer
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dictionary (JSON được) kèm phiên bản IR và đáp án dạng ngắn"""
+        data = asdict(self)
+        data["answer_key"] = self.answer_key()
+        data["version"] = IR_VERSION
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuestionRecord":
+        """
+        Đọc lại record từ to_dict (bỏ qua các khóa dẫn xuất)
+
+        Args:
+            data: Kết quả to_dict hoặc một dòng JSON Lines đã parse
+        """
+        return cls(**{name: data[name] for name in cls.__dataclass_fields__ if name in data})
+
+
+# =============================
+# RENDERER
+# =============================
+def _figures_block(record: QuestionRecord) -> str:
+    return "".join(f"\n\n{figure}" for figure in record.figures)
+
+
+def render_ex_test(record: QuestionRecord, tf_style: str = TF_STYLE_CHOICE) -> str:
+    """
+    Câu hỏi theo format Azota ex_test (xem SAMPLE LATEX FILE/README.md)
+
+    Args:
+        record: Câu hỏi
+        tf_style: TF_STYLE_CHOICE (\\choiceTFt) hoặc TF_STYLE_LABELS (nhãn *a), b)...)
+
+    Returns:
+        str: Khối \\begin{ex}%Câu n ... \\end{ex} (không có dòng trống cuối)
+    """
+    body = record.stem.strip() + _figures_block(record)
+    separator = "\n"
+    if record.kind == KIND_MULTIPLE_CHOICE:
+        choices = "\n".join(
+            f"{{\\True {option}}}" if flag else f"{{{option}}}"
+            for option, flag in zip(record.options, record.truth)
+        )
+        body += f"\n\n\\choice\n{choices}"
+    elif record.kind == KIND_TRUE_FALSE and tf_style == TF_STYLE_LABELS:
+        body += "".join(
+            f"\n\n{'*' if flag else ''}{letter}) {statement}"
+            for letter, statement, flag in zip(STATEMENT_LETTERS, record.options, record.truth)
+        )
+        separator = "\n\n"
+    elif record.kind == KIND_TRUE_FALSE:
+        statements = "\n".join(
+            f"{{* {statement}}}" if flag else f"{{{statement}}}"
+            for statement, flag in zip(record.options, record.truth)
+        )
+        body += f"\n\n\\choiceTFt\n{statements}"
+    elif record.kind == KIND_SHORT_ANSWER:
+        body += f"\n\n\\shortans{{{record.answer}}}"
+    else:
+        separator = "\n\n"
+
+    solution = ""
+    if record.solution:
+        solution = f"{separator}\\loigiai{{\n{record.solution.strip()}\n}}"
+    return f"\\begin{{ex}}%Câu {record.number}\n{body}{solution}\n\\end{{ex}}"
+
+
+def render_choices(record: QuestionRecord) -> str:
+    """
+    Câu hỏi theo format cổ điển của BaseOptimizationQuestion ("Câu n:", \\begin{choices}, "Lời giải:")
+
+    Mệnh đề đúng/sai ghi thành các đoạn a), b)... không đánh dấu; đáp án không nằm trong nội dung
+    (format 2 lấy từ answer_key).
+
+    Args:
+        record: Câu hỏi
+
+    Returns:
+        str: Nội dung câu hỏi kết thúc bằng một dòng trống
+    """
+    content = f"Câu {record.number}: {record.stem}{_figures_block(record)}\n\n"
+    if record.kind == KIND_MULTIPLE_CHOICE:
+        content += "\\begin{choices}\n"
+        for option in record.options:
+            content += f"  \\choice {option}\n"
+        content += "\\end{choices}\n\n"
+    elif record.kind == KIND_TRUE_FALSE:
+        for letter, statement in zip(STATEMENT_LETTERS, record.options):
+            content += f"{letter}) {statement}\n\n"
+    content += f"Lời giải:\n\n{record.solution}\n\n"
+    return content
+
+
+def record_to_json(record: QuestionRecord) -> str:
+    """Một dòng JSON Lines (UTF-8, không escape tiếng Việt)"""
+    return json.dumps(record.to_dict(), ensure_ascii=False)
+
+
+def answer_key_row(record: QuestionRecord) -> List[Any]:
+    """Một dòng CSV đáp án theo ANSWER_KEY_HEADER"""
+    return [
+        record.number, record.kind, record.answer_key(),
+        record.metadata.get("generator", ""), record.metadata.get("seed", "")
+    ]
+
+
+def read_jsonl(path: str) -> Iterable[QuestionRecord]:
+    """
+    Đọc lại các record từ file JSON Lines
+
+    Args:
+        path: File do RecordExporter/record_to_json ghi
+
+    Yields:
+        QuestionRecord: Từng câu theo thứ tự trong file
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield QuestionRecord.from_dict(json.loads(line))
+
+
+# =============================
+# XUẤT NHIỀU ĐỊNH DẠNG MỘT LƯỢT
+# =============================
+class RecordExporter:
+    """
+    Ghi mỗi record ra các file đã chọn ngay khi nhận (không giữ cả batch trong bộ nhớ)
+
+    Dùng:
+        with RecordExporter(jsonl_path="de.jsonl", answer_key_path="dap_an.csv") as exporter:
+            for record in records:
+                exporter.add(record)
+    """
+
+    def __init__(
+        self,
+        jsonl_path: Optional[str] = None,
+        answer_key_path: Optional[str] = None,
+        ex_test_path: Optional[str] = None,
+        tf_style: str = TF_STYLE_CHOICE
+    ):
+        """
+        Args:
+            jsonl_path: File JSON Lines (None = không ghi)
+            answer_key_path: File CSV đáp án (None = không ghi)
+            ex_test_path: File LaTeX ex_test hoàn chỉnh (None = không ghi)
+            tf_style: Cách ghi mệnh đề đúng/sai trong file ex_test
+        """
+        self.paths = [path for path in (jsonl_path, answer_key_path, ex_test_path) if path is not None]
+        self.tf_style = tf_style
+        self.written = 0
+        self._jsonl: Optional[IO[str]] = open(jsonl_path, "w", encoding="utf-8") if jsonl_path else None
+        self._answer_key: Optional[IO[str]] = None
+        self._csv = None
+        if answer_key_path:
+            self._answer_key = open(answer_key_path, "w", encoding="utf-8", newline="")
+            self._csv = csv.writer(self._answer_key)
+            self._csv.writerow(ANSWER_KEY_HEADER)
+        self._ex_test: Optional[IO[str]] = None
+        if ex_test_path:
+            self._ex_test = open(ex_test_path, "w", encoding="utf-8")
+            self._ex_test.write(EX_TEST_HEADER)
+
+    def add(self, record: QuestionRecord) -> None:
+        """
+        Ghi một record ra mọi file đang mở
+
+        Args:
+            record: Câu hỏi đã sinh
+        """
+        if self._jsonl is not None:
+            self._jsonl.write(record_to_json(record) + "\n")
+        if self._csv is not None:
+            self._csv.writerow(answer_key_row(record))
+        if self._ex_test is not None:
+            self._ex_test.write(("\n\n" if self.written else "") + render_ex_test(record, self.tf_style))
+        self.written += 1
+
+    def close(self) -> None:
+        """Đóng các file (thêm \\end{document} cho file ex_test)"""
+        if self._ex_test is not None:
+            self._ex_test.write(EX_TEST_FOOTER)
+        for handle in (self._jsonl, self._answer_key, self._ex_test):
+            if handle is not None:
+                handle.close()
+        self._jsonl = self._answer_key = self._ex_test = self._csv = None
+
+    def __enter__(self) -> "RecordExporter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
@@ -3,12 +3,21 @@ Question Manager - Quản lý quá trình sinh câu hỏi với retry, timeout v
 """
 import random
 import signal
-from typing import List, Type, Union, Tuple, Any, Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Type, Union
 from question_type_loader import QuestionTypeLoader
+from seed_stream import derive_seed, derive_question_seed, generator_key
+from question_fingerprint_index import FingerprintIndex, question_fingerprint
+from generation_profiler import NO_SPAN, QUESTION_SPAN, GenerationProfiler
+from generation_deadline import DeadlineExceeded, deadline_scope
+from question_ir import QuestionRecord
+from latex_lint import lint_question
 
 
-class QuestionTimeoutError(Exception):
-    """Exception cho timeout khi sinh câu hỏi"""
+class QuestionTimeoutError(DeadlineExceeded):
+    """Exception cho timeout khi sinh câu hỏi (SIGALRM cắt generator không kiểm tra deadline)"""
     pass
 
 
@@ -21,20 +30,43 @@ class QuestionManager:
     """
     Manager class quản lý quá trình sinh câu hỏi với các tính năng:
     - Retry mechanism
-    - Timeout protection
+    - Timeout protection: deadline hợp tác (generation_deadline, chạy được trên mọi thread,
+      nhận số giây thực), cộng thêm SIGALRM khi chạy trên main thread để cắt các generator
+      không kiểm tra deadline
     - Error handling và reporting
     - Progress tracking
+    - Sinh song song bằng process pool (workers > 1), hoặc thread pool (executor="thread")
+      khi nhúng vào web service/notebook/asyncio
+    - Seed độc lập cho từng câu hỏi (master_seed) để kết quả tái lập được
+    - Chống trùng câu hỏi theo fingerprint tham số (dedup_index), bốc lại khi trùng
+    - Đo thời gian từng pha theo generator (profiler), cả khi sinh song song
+    - Chuyển QuestionRecord của từng câu (nếu generator có, xem question_ir) cho record_sink
+      theo đúng thứ tự số câu, để xuất JSON Lines/CSV đáp án mà không parse lại LaTeX
+    - Kiểm tra tĩnh LaTeX từng câu (lint, xem latex_lint): câu lỗi bị bỏ và sinh lại như một
+      lần retry, không lọt vào bước biên dịch
     """
     
     # Constants
     DEFAULT_MAX_RETRIES = 3
     DEFAULT_TIMEOUT_SECONDS = 30
+    DEFAULT_WORKERS = 1
+    DEFAULT_MAX_DUPLICATE_REDRAWS = 20
+    EXECUTOR_PROCESS = "process"
+    EXECUTOR_THREAD = "thread"
     
     def __init__(
         self, 
         question_types: Optional[List[Type]] = None,
         max_retries: int = DEFAULT_MAX_RETRIES,
-        timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS
+        timeout_seconds: Optional[float] = DEFAULT_TIMEOUT_SECONDS,
+        workers: int = DEFAULT_WORKERS,
+        master_seed: Optional[int] = None,
+        dedup_index: Optional[FingerprintIndex] = None,
+        max_duplicate_redraws: int = DEFAULT_MAX_DUPLICATE_REDRAWS,
+        profiler: Optional[GenerationProfiler] = None,
+        executor: str = EXECUTOR_PROCESS,
+        record_sink: Optional[Callable[[QuestionRecord], None]] = None,
+        lint: bool = False
     ):
         """
         Khởi tạo QuestionManager
@@ -42,18 +74,50 @@ class QuestionManager:
         Args:
             question_types: Danh sách các class câu hỏi khả dụng
             max_retries: Số lần thử lại tối đa khi sinh câu hỏi thất bại
-            timeout_seconds: Timeout (giây) cho mỗi lần sinh câu hỏi
+            timeout_seconds: Thời gian tối đa (giây, nhận số thực như 0.25) cho mỗi lần sinh câu hỏi;
+                             None hoặc 0 = không giới hạn
+            workers: Số process/thread sinh câu hỏi song song (1 = tuần tự)
+            master_seed: Seed gốc của batch. Nếu có, loại câu hỏi và tham số của câu thứ i
+                         chỉ phụ thuộc vào (master_seed, i), không phụ thuộc thứ tự sinh
+            dedup_index: Chỉ mục fingerprint; câu có fingerprint đã có bị loại và bốc lại.
+                         Câu được ghi nhận theo đúng thứ tự số câu (cả khi sinh song song)
+                         nên với master_seed kết quả vẫn tái lập được
+            max_duplicate_redraws: Số lần bốc lại tối đa khi trùng (không gian tham số cạn)
+            profiler: Ghi wall/CPU time từng pha và số lần retry/trùng theo generator
+                      (None = không đo, không tốn thêm chi phí)
+            executor: "process" (mặc định) hoặc "thread". Thread không song song CPU (GIL) nhưng
+                      không chặn thread gọi và không cần fork; các generator dùng chung
+                      random toàn cục nên với master_seed thứ tự bốc số giữa các thread
+                      không tái lập được như process
+            record_sink: Hàm nhận QuestionRecord của mỗi câu sinh thành công (theo thứ tự số câu,
+                         cả khi sinh song song); câu của generator không tạo record thì bỏ qua
+            lint: Kiểm tra tĩnh LaTeX (ngoặc, %, \\loigiai, số mệnh đề/phương án, placeholder
+                  chưa format...) mỗi câu vừa sinh; câu lỗi tính là một lần thử thất bại
         """
+        if workers < 1:
+            raise ValueError("Số workers phải lớn hơn hoặc bằng 1")
+        if executor not in (self.EXECUTOR_PROCESS, self.EXECUTOR_THREAD):
+            raise ValueError(f"executor chỉ có thể là '{self.EXECUTOR_PROCESS}' hoặc '{self.EXECUTOR_THREAD}'")
+            
         self.question_types = question_types or []
         self.max_retries = max_retries
         self.timeout_seconds = timeout_seconds
+        self.workers = workers
+        self.master_seed = master_seed
+        self.dedup_index = dedup_index
+        self.max_duplicate_redraws = max_duplicate_redraws
+        self.profiler = profiler
+        self.executor = executor
+        self.record_sink = record_sink
+        self.lint = lint
         self.failed_count = 0
-        self.stats = {
-            'total_generated': 0,
-            'total_failed': 0,
-            'retry_attempts': 0,
-            'timeout_errors': 0
-        }
+        # Trạng thái lần thử thành công gần nhất (process con gửi về process cha để chống trùng)
+        self._record_fingerprints = dedup_index is not None
+        self._last_fingerprint = None
+        self._last_attempt_state = (0, 0, 0, None)
+        self._collect_records = record_sink is not None
+        self._last_record = None
+        self.stats = self._empty_stats()
         
     def set_question_types(self, question_types: List[Type]) -> None:
         """
@@ -85,6 +149,49 @@ class QuestionManager:
             QuestionGenerationError: Khi không thể sinh được câu hỏi nào
             ValueError: Khi tham số không hợp lệ
         """
+        questions_data = []
+        for _, question_result in self.iter_questions(num_questions, output_format, verbose):
+            if question_result is not None:
+                questions_data.append(question_result)
+        
+        # Report final stats
+        if self.failed_count > 0:
+            print(f"⚠️  Có {self.failed_count} câu hỏi không tạo được")
+            
+        if verbose:
+            self._print_final_stats()
+            
+        if not questions_data:
+            raise QuestionGenerationError("Không thể tạo được câu hỏi nào")
+            
+        return questions_data
+    
+    def iter_questions(
+        self,
+        num_questions: int,
+        output_format: int,
+        verbose: bool = False,
+        start: int = 1
+    ) -> Iterator[Tuple[int, Union[str, Tuple[str, str], None]]]:
+        """
+        Sinh lần lượt từng câu hỏi, trả về ngay khi câu đó xong (theo đúng thứ tự số câu)
+        
+        Dùng cho ghi tài liệu kiểu streaming: không giữ cả batch trong bộ nhớ. Với master_seed,
+        câu thứ i giống hệt khi sinh cả batch nên chạy tiếp từ start > 1 cho cùng kết quả.
+        
+        Args:
+            num_questions: Tổng số câu hỏi của batch
+            output_format: 1 - đáp án sau từng câu, 2 - đáp án ở cuối
+            verbose: In chi tiết quá trình sinh câu hỏi
+            start: Số thứ tự câu bắt đầu (chạy tiếp từ checkpoint)
+            
+        Yields:
+            Tuple[int, Union[str, Tuple[str, str], None]]: (số câu, câu hỏi hoặc None nếu thất bại)
+            
+        Raises:
+            QuestionGenerationError: Khi không có loại câu hỏi nào
+            ValueError: Khi tham số không hợp lệ
+        """
         # Validate input
         if num_questions <= 0:
             raise ValueError("Số câu hỏi phải lớn hơn 0")
@@ -96,44 +203,188 @@ class QuestionManager:
             raise ValueError("Format chỉ có thể là 1 hoặc 2")
         
         # Reset stats
-        self.stats = {
-            'total_generated': 0,
-            'total_failed': 0,
-            'retry_attempts': 0,
-            'timeout_errors': 0
-        }
+        self.stats = self._empty_stats()
         self.failed_count = 0
         
-        questions_data = []
-        
         if verbose:
             print(f"📋 Có {len(self.question_types)} loại câu hỏi khả dụng")
+        
+        question_numbers = range(start, num_questions + 1)
+        if self.workers > 1 and len(question_numbers) > 1:
+            results = self._generate_parallel(question_numbers, output_format, verbose)
+        else:
+            results = (
+                (i, self._generate_single_question(i, output_format, verbose))
+                for i in question_numbers
+            )
             
-        for i in range(1, num_questions + 1):
-            question_result = self._generate_single_question(i, output_format, verbose)
+        for question_number, question_result in results:
             if question_result is not None:
-                questions_data.append(question_result)
                 self.stats['total_generated'] += 1
+                # _last_record là record của câu vừa nhận (results sinh lần lượt từng câu)
+                if self.record_sink is not None and self._last_record is not None:
+                    self.record_sink(self._last_record)
             else:
                 self.stats['total_failed'] += 1
+            yield question_number, question_result
+    
+    def _generate_parallel(
+        self,
+        question_numbers: range,
+        output_format: int,
+        verbose: bool
+    ) -> Iterator[Tuple[int, Union[str, Tuple[str, str], None]]]:
+        """
+        Sinh câu hỏi song song trên process pool (hoặc thread pool)
         
-        # Report final stats
-        if self.failed_count > 0:
-            print(f"⚠️  Có {self.failed_count} câu hỏi không tạo được")
+        Mỗi task gọi _generate_single_question trên một manager riêng (giữ nguyên retry
+        và deadline; process con chạy trên main thread nên có thêm SIGALRM). Kết quả trả về
+        theo đúng thứ tự số câu hỏi, ngay khi câu đó xong; stats của từng worker
+        được cộng dồn.
+        
+        Args:
+            question_numbers: Các số câu cần sinh
+            output_format: Format output
+            verbose: Verbose mode
             
+        Yields:
+            Tuple[int, Union[str, Tuple[str, str], None]]: (số câu, kết quả) theo thứ tự câu hỏi
+        """
+        num_questions = len(question_numbers)
+        workers = min(self.workers, num_questions)
+        # Gom nhiều câu vào một task để giảm chi phí pickle/IPC với batch lớn
+        chunksize = max(1, num_questions // (workers * 4))
+        
         if verbose:
-            self._print_final_stats()
+            print(f"🚀 Sinh song song với {workers} workers ({self.executor})")
+        
+        worker_args = (
+            (self.question_types, self.max_retries, self.timeout_seconds,
+             self.master_seed, question_number, output_format, verbose,
+             self.dedup_index is not None, self.profiler is not None, self._collect_records, self.lint)
+            for question_number in question_numbers
+        )
+        
+        if self.executor == self.EXECUTOR_THREAD:
+            pool = ThreadPoolExecutor(max_workers=workers)
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+        
+        with pool as executor:
+            # executor.map giữ nguyên thứ tự đầu vào
+            results = executor.map(_generate_question_in_worker, worker_args, chunksize=chunksize)
+            for question_number, (result, worker_stats, failed, fingerprint, attempt_state, profile, record) in zip(
+                question_numbers, results
+            ):
+                self._last_record = record
+                self._merge_stats(worker_stats)
+                self.failed_count += failed
+                if self.profiler is not None:
+                    self.profiler.merge_state(profile)
+                if result is not None and self.dedup_index is not None:
+                    result = self._claim_or_redraw(
+                        question_number, output_format, verbose, result, fingerprint, attempt_state
+                    )
+                yield question_number, result
+    
+    def _claim_or_redraw(
+        self,
+        question_number: int,
+        output_format: int,
+        verbose: bool,
+        result: Union[str, Tuple[str, str]],
+        fingerprint: str,
+        attempt_state: Tuple[int, int, int, Optional[str]]
+    ) -> Union[str, Tuple[str, str], None]:
+        """
+        Ghi nhận câu do worker sinh; nếu trùng thì bốc lại ngay trên process cha
+        
+        Bốc lại tiếp tục từ lần thử kế tiếp của worker nên kết quả giống hệt sinh tuần tự.
+        
+        Args:
+            question_number: Số thứ tự câu hỏi
+            output_format: Format output
+            verbose: Verbose mode
+            result: Câu hỏi worker đã sinh
+            fingerprint: Fingerprint của câu đó
+            attempt_state: (lần thử, số lần lỗi, số lần trùng, generator) của worker
             
-        if not questions_data:
-            raise QuestionGenerationError("Không thể tạo được câu hỏi nào")
+        Returns:
+            Union[str, Tuple[str, str], None]: Câu hỏi không trùng hoặc None nếu thất bại
+        """
+        if self.dedup_index.claim(fingerprint):
+            return result
+        attempt, errors, duplicates, generator = attempt_state
+        if not self._accept_duplicate_redraw(question_number, duplicates + 1, verbose, generator):
+            self.failed_count += 1
+            return None
+        return self._generate_single_question(
+            question_number, output_format, verbose, attempt + 1, errors, duplicates + 1
+        )
+    
+    def _accept_duplicate_redraw(
+        self,
+        question_number: int,
+        duplicates: int,
+        verbose: bool,
+        question_type: Any = None
+    ) -> bool:
+        """
+        Ghi nhận một lần trùng và cho biết còn được bốc lại hay không
+        
+        Args:
+            question_number: Số thứ tự câu hỏi
+            duplicates: Số lần trùng tính cả lần này
+            verbose: Verbose mode
+            question_type: Loại câu hỏi bị trùng (class hoặc generator key, cho profiler)
             
-        return questions_data
+        Returns:
+            bool: True nếu còn được bốc lại
+        """
+        self.stats['duplicates_rejected'] += 1
+        self._profile_count(question_type, 'duplicates_rejected')
+        if duplicates > self.max_duplicate_redraws:
+            print(f"❌ Câu hỏi {question_number} vẫn trùng sau {self.max_duplicate_redraws} lần bốc lại")
+            return False
+        if verbose:
+            print(f"⚠️  Câu hỏi {question_number} trùng câu đã có, bốc lại ({duplicates}/{self.max_duplicate_redraws})")
+        return True
+    
+    def _profile_count(self, question_type: Any, name: str) -> None:
+        """Tăng bộ đếm của profiler (nếu có) cho một loại câu hỏi"""
+        if self.profiler is not None and question_type is not None:
+            self.profiler.count(question_type, name)
+    
+    def _merge_stats(self, worker_stats: dict) -> None:
+        """
+        Cộng dồn stats từ một worker vào stats của manager
+        
+        Args:
+            worker_stats: Dictionary stats trả về từ worker
+        """
+        for key, value in worker_stats.items():
+            self.stats[key] = self.stats.get(key, 0) + value
+    
+    @staticmethod
+    def _empty_stats() -> dict:
+        """Trả về dictionary stats rỗng"""
+        return {
+            'total_generated': 0,
+            'total_failed': 0,
+            'retry_attempts': 0,
+            'timeout_errors': 0,
+            'duplicates_rejected': 0,
+            'lint_rejected': 0
+        }
     
     def _generate_single_question(
         self, 
         question_number: int, 
         output_format: int, 
-        verbose: bool
+        verbose: bool,
+        first_attempt: int = 0,
+        errors: int = 0,
+        duplicates: int = 0
     ) -> Union[str, Tuple[str, str], None]:
         """
         Sinh một câu hỏi duy nhất với retry mechanism
@@ -142,51 +393,121 @@ class QuestionManager:
             question_number: Số thứ tự câu hỏi
             output_format: Format output
             verbose: Verbose mode
+            first_attempt: Lần thử bắt đầu (dùng khi bốc lại câu trùng)
+            errors: Số lần lỗi đã có
+            duplicates: Số lần trùng đã có
             
         Returns:
             Union[str, Tuple[str, str], None]: Câu hỏi đã sinh hoặc None nếu thất bại
         """
-        for retry in range(self.max_retries):
+        attempt = first_attempt
+        profiler = self.profiler
+        self._last_record = None
+        while errors < self.max_retries:
+            question_type = None
             try:
-                # Setup timeout
-                signal.signal(signal.SIGALRM, self._timeout_handler)
-                signal.alarm(self.timeout_seconds)
-                
-                # Random chọn loại câu hỏi
-                question_type = random.choice(self.question_types)
-                question_instance = question_type()
-                
-                # Generate dựa trên format
-                if output_format == 1:
-                    result = question_instance.generate_question(question_number, include_multiple_choice=True)
-                else:
-                    result = question_instance.generate_question(question_number, include_multiple_choice=False)
+                # Deadline cho lần thử này: generator kiểm tra bằng check_deadline()/attempts();
+                # trên main thread có thêm SIGALRM cho generator không kiểm tra
+                with deadline_scope(self.timeout_seconds or None), self._hard_timeout():
+                    # Random chọn loại câu hỏi
+                    question_type, seed = self._pick_question_type(question_number, attempt)
+                    question_instance = question_type()
+                    generate_kwargs = {'seed': seed} if seed is not None else {}
+                    
+                    # Generate dựa trên format (các pha bên trong ghi vào profiler đang mở span)
+                    with profiler.span(question_type, QUESTION_SPAN) if profiler is not None else NO_SPAN:
+                        if output_format == 1:
+                            result = question_instance.generate_question(
+                                question_number, include_multiple_choice=True, **generate_kwargs
+                            )
+                        else:
+                            result = question_instance.generate_question(
+                                question_number, include_multiple_choice=False, **generate_kwargs
+                            )
                 
-                # Cancel timeout
-                signal.alarm(0)
-                
-                if verbose:
-                    print(f"✅ Đã tạo thành công câu hỏi {question_number} (loại: {question_type.__name__})")
-                
-                return result
-                
-            except QuestionTimeoutError:
-                signal.alarm(0)  # Cancel timeout
+            except DeadlineExceeded:
                 self.stats['timeout_errors'] += 1
+                self._profile_count(question_type, 'timeouts')
+                self._profile_count(question_type, 'retries')
                 error_msg = f"Timeout tạo câu hỏi {question_number}"
-                self._handle_retry_error(retry, question_number, error_msg, verbose)
+                self._handle_retry_error(errors, question_number, error_msg, verbose)
+                self.stats['retry_attempts'] += 1
+                errors += 1
+                attempt += 1
+                continue
                 
             except Exception as e:
-                signal.alarm(0)  # Cancel timeout
+                self._profile_count(question_type, 'retries')
                 error_msg = f"Lỗi tạo câu hỏi {question_number}: {e}"
-                self._handle_retry_error(retry, question_number, error_msg, verbose)
+                self._handle_retry_error(errors, question_number, error_msg, verbose)
+                self.stats['retry_attempts'] += 1
+                errors += 1
+                attempt += 1
+                continue
+            
+            # Lỗi LaTeX phát hiện tĩnh: bỏ câu trước khi ghi nhận fingerprint, thử lại với lần kế tiếp
+            if self.lint:
+                with profiler.span(question_type, "lint") if profiler is not None else NO_SPAN:
+                    issues = lint_question(result)
+                if issues:
+                    self.stats['lint_rejected'] += 1
+                    self._profile_count(question_type, 'lint_rejected')
+                    self._profile_count(question_type, 'retries')
+                    error_msg = f"Câu hỏi {question_number} lỗi LaTeX ({len(issues)} lỗi, đầu tiên: {issues[0]})"
+                    self._handle_retry_error(errors, question_number, error_msg, verbose)
+                    self.stats['retry_attempts'] += 1
+                    errors += 1
+                    attempt += 1
+                    continue
             
-            self.stats['retry_attempts'] += 1
+            fingerprint = None
+            if self._record_fingerprints:
+                fingerprint = question_fingerprint(question_type, question_instance, result)
+            
+            # Trùng câu đã có: bốc lại với lần thử kế tiếp
+            if self.dedup_index is not None and not self.dedup_index.claim(fingerprint):
+                duplicates += 1
+                if not self._accept_duplicate_redraw(question_number, duplicates, verbose, question_type):
+                    break
+                attempt += 1
+                continue
+            
+            if verbose:
+                print(f"✅ Đã tạo thành công câu hỏi {question_number} (loại: {question_type.__name__})")
+            
+            self._profile_count(question_type, 'generated')
+            self._last_fingerprint = fingerprint
+            self._last_attempt_state = (attempt, errors, duplicates, generator_key(question_type))
+            if self._collect_records:
+                self._last_record = getattr(question_instance, "record", None)
+            return result
         
         # Tất cả retry đều thất bại
         self.failed_count += 1
         return None
     
+    def _pick_question_type(self, question_number: int, retry: int) -> Tuple[Type, Optional[int]]:
+        """
+        Chọn loại câu hỏi và seed cho một lần thử
+        
+        Khi có master_seed, lựa chọn được dẫn xuất từ (master_seed, số câu, lần thử)
+        nên giống nhau giữa chạy tuần tự, chạy song song và chạy tiếp giữa chừng.
+        
+        Args:
+            question_number: Số thứ tự câu hỏi
+            retry: Lần thử hiện tại (0-based)
+            
+        Returns:
+            Tuple[Type, Optional[int]]: (class câu hỏi, seed hoặc None)
+        """
+        if self.master_seed is None:
+            return random.choice(self.question_types), None
+        
+        picker = random.Random(derive_seed(self.master_seed, "question_type", question_number, retry))
+        question_type = picker.choice(self.question_types)
+        seed = derive_question_seed(self.master_seed, question_type, question_number, retry)
+        return question_type, seed
+    
     def _handle_retry_error(
         self, 
         retry: int, 
@@ -210,6 +531,25 @@ class QuestionManager:
             # Chưa phải lần thử cuối, và đang ở verbose mode
             print(f"⚠️  {error_msg}, thử lại ({retry + 1}/{self.max_retries})")
     
+    @contextmanager
+    def _hard_timeout(self) -> Iterator[None]:
+        """
+        SIGALRM (setitimer, nhận số giây thực) cắt cả generator không kiểm tra deadline
+        
+        Chỉ bật khi có timeout và đang chạy trên main thread (signal không dùng được ở thread
+        khác); handler cũ được khôi phục sau đó.
+        """
+        if not self.timeout_seconds or not _can_use_alarm():
+            yield
+            return
+        previous_handler = signal.signal(signal.SIGALRM, self._timeout_handler)
+        signal.setitimer(signal.ITIMER_REAL, self.timeout_seconds)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+    
     def _timeout_handler(self, signum, frame):
         """
         Signal handler cho timeout
@@ -230,6 +570,8 @@ class QuestionManager:
         print(f"   - Tổng số thất bại: {self.stats['total_failed']}")
         print(f"   - Số lần retry: {self.stats['retry_attempts']}")
         print(f"   - Số lần timeout: {self.stats['timeout_errors']}")
+        print(f"   - Số câu trùng bị bốc lại: {self.stats['duplicates_rejected']}")
+        print(f"   - Số câu lỗi LaTeX bị sinh lại: {self.stats['lint_rejected']}")
     
     def get_stats(self) -> dict:
         """
@@ -241,6 +583,63 @@ class QuestionManager:
         return self.stats.copy()
 
 
+def _can_use_alarm() -> bool:
+    """SIGALRM/setitimer chỉ có trên Unix và chỉ đặt được từ main thread"""
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+def _init_worker() -> None:
+    """
+    Khởi tạo process con: seed lại random để các worker (fork từ cùng một
+    process cha) không sinh ra chuỗi câu hỏi giống hệt nhau
+    """
+    random.seed()
+
+
+def _generate_question_in_worker(
+    args: Tuple
+) -> Tuple[Any, dict, int, Optional[str], Tuple[int, int, int, Optional[str]], Optional[dict],
+           Optional[QuestionRecord]]:
+    """
+    Sinh một câu hỏi trong process con
+    
+    Process con không kiểm tra trùng: nó gửi fingerprint về để process cha ghi nhận theo
+    đúng thứ tự số câu.
+    
+    Args:
+        args: (question_types, max_retries, timeout_seconds, master_seed,
+               question_number, output_format, verbose, record_fingerprints, profile,
+               collect_records, lint)
+        
+    Returns:
+        Tuple: (kết quả câu hỏi hoặc None, stats retry/timeout, số câu thất bại,
+                fingerprint hoặc None, (lần thử, số lần lỗi, số lần trùng, generator),
+                dữ liệu profiler hoặc None, QuestionRecord hoặc None)
+    """
+    (question_types, max_retries, timeout_seconds, master_seed,
+     question_number, output_format, verbose, record_fingerprints, profile, collect_records, lint) = args
+    manager = QuestionManager(
+        question_types=question_types,
+        max_retries=max_retries,
+        timeout_seconds=timeout_seconds,
+        master_seed=master_seed,
+        profiler=GenerationProfiler() if profile else None,
+        lint=lint
+    )
+    manager._record_fingerprints = record_fingerprints
+    manager._collect_records = collect_records
+    result = manager._generate_single_question(question_number, output_format, verbose)
+    # total_generated/total_failed do process cha đếm
+    worker_stats = {
+        'retry_attempts': manager.stats['retry_attempts'],
+        'timeout_errors': manager.stats['timeout_errors'],
+        'lint_rejected': manager.stats['lint_rejected']
+    }
+    profile_state = manager.profiler.export_state() if manager.profiler is not None else None
+    return (result, worker_stats, manager.failed_count, manager._last_fingerprint,
+            manager._last_attempt_state, profile_state, manager._last_record)
+
+
 # Convenience function để dùng trực tiếp
 def generate_questions_with_manager(
     num_questions: int,
@@ -248,7 +647,14 @@ def generate_questions_with_manager(
     question_types: Optional[List[Type]] = None,
     verbose: bool = False,
     max_retries: int = QuestionManager.DEFAULT_MAX_RETRIES,
-    timeout_seconds: int = QuestionManager.DEFAULT_TIMEOUT_SECONDS
+    timeout_seconds: Optional[float] = QuestionManager.DEFAULT_TIMEOUT_SECONDS,
+    workers: int = QuestionManager.DEFAULT_WORKERS,
+    master_seed: Optional[int] = None,
+    dedup_index: Optional[FingerprintIndex] = None,
+    profiler: Optional[GenerationProfiler] = None,
+    executor: str = QuestionManager.EXECUTOR_PROCESS,
+    record_sink: Optional[Callable[[QuestionRecord], None]] = None,
+    lint: bool = False
 ) -> List[Union[str, Tuple[str, str]]]:
     """
     Hàm tiện ích để sinh câu hỏi sử dụng QuestionManager
@@ -259,7 +665,14 @@ def generate_questions_with_manager(
         question_types: Danh sách question types (nếu None sẽ auto-load)
         verbose: Verbose mode
         max_retries: Số lần retry tối đa
-        timeout_seconds: Timeout cho mỗi câu hỏi
+        timeout_seconds: Timeout cho mỗi câu hỏi (giây, nhận số thực)
+        workers: Số process/thread sinh song song
+        master_seed: Seed gốc để sinh lại đúng batch
+        dedup_index: Chỉ mục fingerprint để loại câu trùng
+        profiler: Profiler đo thời gian từng pha
+        executor: "process" hoặc "thread"
+        record_sink: Hàm nhận QuestionRecord của từng câu (ví dụ RecordExporter.add)
+        lint: Kiểm tra tĩnh LaTeX từng câu, câu lỗi bị sinh lại
         
     Returns:
         List[Union[str, Tuple[str, str]]]: Danh sách câu hỏi
@@ -271,7 +684,14 @@ def generate_questions_with_manager(
     manager = QuestionManager(
         question_types=question_types,
         max_retries=max_retries,
-        timeout_seconds=timeout_seconds
+        timeout_seconds=timeout_seconds,
+        workers=workers,
+        master_seed=master_seed,
+        dedup_index=dedup_index,
+        profiler=profiler,
+        executor=executor,
+        record_sink=record_sink,
+        lint=lint
     )
     
     return manager.generate_questions(num_questions, output_format, verbose)
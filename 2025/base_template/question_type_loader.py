@@ -67,6 +67,35 @@ class QuestionTypeLoader:
         
         return self.loaded_types.copy()
     
+    def load_registry_types(
+        self,
+        tags: Optional[List[str]] = None,
+        topic: Optional[str] = None,
+        rescan: bool = False
+    ) -> List[Any]:
+        """
+        Load các loại câu hỏi từ manifest của generator_registry (import lười)
+        
+        Module của từng generator chỉ được import khi câu hỏi loại đó được bốc.
+        
+        Args:
+            tags: Chỉ lấy generator có đủ các tag này (ví dụ ['2026', 'volume'])
+            topic: Lọc theo chủ đề hoặc đường dẫn
+            rescan: True để quét lại toàn bộ thay vì dùng manifest đã lưu
+        
+        Returns:
+            List[LazyQuestionType]: Danh sách loại câu hỏi, dùng được như class với QuestionManager
+        """
+        from generator_registry import load_lazy_types
+        
+        self.loaded_types = load_lazy_types(tags=tags, topic=topic, rescan=rescan)
+        self.failed_loads.clear()
+        
+        if not self.silent:
+            self._print_load_summary()
+        
+        return self.loaded_types.copy()
+    
     def get_loaded_types(self) -> List[Type]:
         """
         Trả về danh sách các types đã load
@@ -136,6 +165,12 @@ class QuestionTypeLoader:
         if not isinstance(question_class, type):
             raise ValueError(f"{class_name} không phải là một class")
         
+        # Class còn phương thức abstract thì không khởi tạo được
+        abstract_methods = getattr(question_class, '__abstractmethods__', None)
+        if abstract_methods:
+            missing = ", ".join(sorted(abstract_methods))
+            raise ValueError(f"{class_name} chưa cài đặt các phương thức: {missing}")
+        
         # Có thể thêm các validation khác như:
         # - Kiểm tra inherit từ BaseOptimizationQuestion
         # - Kiểm tra có các method required không
@@ -149,8 +184,11 @@ class QuestionTypeLoader:
             List[Tuple[str, str]]: Danh sách (module_name, class_name)
         """
         return [
-            ("force_equilibrium_three_legs", "CanBangLucBaChan"),
+            # force_equilibrium_three_legs chưa có class cụ thể (ForceEquilibriumQuestion vẫn
+            # trừu tượng: các phương thức đang viết ngoài class) nên chưa đưa vào
+            ("khoang_cach_hai_vat_chuyen_dong", "KhoangCachHaiVatChuyenDongQuestion"),
             # Có thể thêm modules khác ở đây trong tương lai
+            # (hoặc dùng load_registry_types để lấy mọi generator trong 2025/ và 2026/)
             # ("optimization_problem_2", "OptimizationProblem2"),
             # ("calculus_problems", "CalculusQuestion"),
         ]
@@ -0,0 +1,204 @@
+"""
+Radicals - Rút gọn và định dạng căn bậc hai dùng chung
+
+Mỗi generator tự viết một hàm rút gọn √n = a√b bằng vòng chia thử (có bản chỉ thử các số nguyên
+tố 2..13 nên bỏ sót 17², 19²...) và gọi nó cho mọi khoảng cách, độ dài vector, bán kính trong
+mỗi câu hỏi. Module này gom lại:
+- Bảng phần không chính phương (square-free part) dựng một lần bằng sàng NumPy cho mọi n <= giới
+  hạn sàng (mặc định DEFAULT_SIEVE_LIMIT, đổi bằng set_sieve_limit): split_sqrt(n) là một lần tra
+  bảng cộng một math.isqrt
+- Trên giới hạn sàng: chia thử đến căn bậc ba rồi kiểm tra phần còn lại có chính phương không,
+  kết quả nhớ bằng lru_cache
+- Định dạng LaTeX: sqrt_latex (√n), radical_latex (a√b/c đã rút gọn), sqrt_fraction_latex
+  (√(p/q) đã khử căn ở mẫu)
+"""
+import math
+from fractions import Fraction
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Union
+
+DEFAULT_SIEVE_LIMIT = 1 << 20
+LARGE_CACHE_SIZE = 4096
+FRAC_COMMAND = r"\dfrac"
+
+# _square_free[n] = phần không chính phương của n (n <= _sieve_limit); dựng khi dùng lần đầu
+_sieve_limit = DEFAULT_SIEVE_LIMIT
+_square_free: Optional[Any] = None
+
+
+def _build_table(limit: int) -> Any:
+    """Sàng phần không chính phương: với mỗi số nguyên tố p và mỗi p^(2k) <= limit, chia p² ở các bội của p^(2k)"""
+    # Import khi dựng bảng lần đầu: latex_utils import module này và phải import nhanh
+    # (xem benchmark_import_time.py)
+    import numpy as np
+
+    table = np.arange(limit + 1, dtype=np.int32 if limit < 2 ** 31 else np.int64)
+    root = math.isqrt(limit)
+    is_prime = np.ones(root + 1, dtype=bool)
+    is_prime[:2] = False
+    for p in range(2, math.isqrt(root) + 1):
+        if is_prime[p]:
+            is_prime[p * p::p] = False
+    for p in np.flatnonzero(is_prime).tolist():
+        square = p * p
+        power = square
+        while power <= limit:
+            table[power::power] //= square
+            power *= square
+    return table
+
+
+def set_sieve_limit(limit: int) -> None:
+    """
+    Đổi giới hạn sàng (bảng được dựng lại khi dùng lần sau)
+
+    Args:
+        limit: Số lớn nhất tra bảng trực tiếp (bảng tốn 4 byte mỗi số)
+
+    Raises:
+        ValueError: Khi limit không dương
+    """
+    global _sieve_limit, _square_free
+    if limit < 1:
+        raise ValueError("Giới hạn sàng phải lớn hơn 0")
+    _sieve_limit = limit
+    _square_free = None
+
+
+@lru_cache(maxsize=LARGE_CACHE_SIZE)
+def _square_free_large(n: int) -> int:
+    # Bỏ hết thừa số nguyên tố <= ∛n; phần còn lại có tối đa hai thừa số nguyên tố lớn hơn ∛n
+    # nên chỉ chứa bình phương khi chính nó là số chính phương
+    core = 1
+    rest = n
+    d = 2
+    while d * d * d <= rest:
+        if rest % d == 0:
+            exponent = 0
+            while rest % d == 0:
+                rest //= d
+                exponent += 1
+            if exponent % 2:
+                core *= d
+        d += 1 if d == 2 else 2
+    root = math.isqrt(rest)
+    return core if root * root == rest else core * rest
+
+
+def square_free_part(n: int) -> int:
+    """
+    Phần không chính phương b của n (n = a²·b)
+
+    Args:
+        n: Số nguyên dương
+
+    Returns:
+        int: b
+    """
+    global _square_free
+    if n <= _sieve_limit:
+        if _square_free is None:
+            _square_free = _build_table(_sieve_limit)
+        return int(_square_free[n])
+    return _square_free_large(n)
+
+
+def split_sqrt(n: int) -> Tuple[int, int]:
+    """
+    Rút gọn √n = a√b với b không chứa thừa số chính phương
+
+    Args:
+        n: Số nguyên không âm
+
+    Returns:
+        Tuple[int, int]: (a, b); n = 0 cho (0, 1)
+
+    Raises:
+        ValueError: Khi n âm
+    """
+    if n < 0:
+        raise ValueError(f"Không lấy căn bậc hai của số âm: {n}")
+    if n == 0:
+        return 0, 1
+    b = square_free_part(n)
+    return math.isqrt(n // b), b
+
+
+def split_sqrt_fraction(value: Union[int, Fraction]) -> Tuple[int, int, int]:
+    """
+    Rút gọn √(p/q) = a√b / c (khử căn ở mẫu: √(p/q) = √(p·q) / q)
+
+    Args:
+        value: Số hữu tỉ không âm
+
+    Returns:
+        Tuple[int, int, int]: (a, b, c) với b không chứa thừa số chính phương, gcd(a, c) = 1
+    """
+    value = Fraction(value)
+    a, b = split_sqrt(value.numerator * value.denominator)
+    c = value.denominator
+    g = math.gcd(a, c)
+    return a // g, b, c // g
+
+
+# =============================
+# LATEX
+# =============================
+def _coefficient_radical(a: int, b: int) -> str:
+    if b == 1:
+        return str(a)
+    if a == 1:
+        return rf"\sqrt{{{b}}}"
+    return rf"{a}\sqrt{{{b}}}"
+
+
+def sqrt_latex(n: int) -> str:
+    """
+    √n dạng LaTeX đã rút gọn: 12 -> 2\\sqrt{3}, 16 -> 4, 7 -> \\sqrt{7}
+
+    Args:
+        n: Số nguyên không âm
+    """
+    a, b = split_sqrt(n)
+    return _coefficient_radical(a, b)
+
+
+def radical_latex(coefficient: int, radicand: int, denominator: int = 1, frac: str = FRAC_COMMAND) -> str:
+    """
+    coefficient·√radicand / denominator dạng LaTeX đã rút gọn (dấu đặt trước phân số)
+
+    Args:
+        coefficient: Hệ số nguyên
+        radicand: Số dưới căn (không âm)
+        denominator: Mẫu số khác 0
+        frac: Lệnh phân số (\\dfrac, \\frac, \\tfrac)
+
+    Returns:
+        str: Ví dụ radical_latex(2, 8, 6) -> \\dfrac{2\\sqrt{2}}{3}
+    """
+    if coefficient == 0 or radicand == 0:
+        return "0"
+    a, b = split_sqrt(radicand)
+    numerator = coefficient * a
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    g = math.gcd(numerator, denominator)
+    numerator //= g
+    denominator //= g
+    sign = "-" if numerator < 0 else ""
+    top = _coefficient_radical(abs(numerator), b)
+    if denominator == 1:
+        return sign + top
+    return rf"{sign}{frac}{{{top}}}{{{denominator}}}"
+
+
+def sqrt_fraction_latex(value: Union[int, Fraction], frac: str = FRAC_COMMAND) -> str:
+    """
+    √value (value hữu tỉ không âm) dạng LaTeX: 8/9 -> \\dfrac{2\\sqrt{2}}{3}, 1/2 -> \\dfrac{\\sqrt{2}}{2}
+
+    Args:
+        value: Số hữu tỉ không âm
+        frac: Lệnh phân số
+    """
+    a, b, c = split_sqrt_fraction(value)
+    return radical_latex(a, b, c, frac)
@@ -0,0 +1,134 @@
+"""
+Seed Stream - Sinh seed độc lập cho từng câu hỏi
+
+Seed của mỗi câu hỏi được dẫn xuất từ (master seed, generator class, số thứ tự câu),
+nên kết quả của một câu không phụ thuộc vào các câu sinh trước nó. Nhờ vậy có thể
+chia batch lớn cho nhiều process/máy, hoặc chạy tiếp một batch bị dừng giữa chừng,
+mà vẫn cho ra kết quả giống hệt khi chạy tuần tự.
+"""
+import hashlib
+import os
+import random
+import sys
+from contextlib import contextmanager
+from typing import Iterator, Optional, Union
+
+# Biến môi trường dùng chung với các script cũ
+SEED_ENV_VAR = "OPT_SEED"
+
+# Seed dẫn xuất nằm trong [0, 2^32) để dùng được cho cả random và numpy
+SEED_BITS = 32
+
+
+def derive_seed(master_seed: int, *keys: Union[str, int]) -> int:
+    """
+    Dẫn xuất seed ổn định từ master seed và các khóa
+
+    Dùng blake2b thay cho hash() của Python vì hash() của str bị ngẫu nhiên hóa
+    theo từng process (PYTHONHASHSEED).
+
+    Args:
+        master_seed: Seed gốc của cả batch
+        *keys: Các khóa phân biệt (tên class, số câu, lần thử, ...)
+
+    Returns:
+        int: Seed trong khoảng [0, 2^32)
+    """
+    material = "\x1f".join(str(part) for part in (master_seed,) + keys)
+    digest = hashlib.blake2b(material.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") >> (64 - SEED_BITS)
+
+
+def generator_key(question_type: type) -> str:
+    """
+    Trả về khóa ổn định của một generator class (module.QualName)
+
+    Args:
+        question_type: Class câu hỏi
+
+    Returns:
+        str: Khóa dùng cho derive_question_seed
+    """
+    return f"{question_type.__module__}.{question_type.__qualname__}"
+
+
+def derive_question_seed(
+    master_seed: int,
+    question_type: Union[type, str],
+    question_number: int,
+    attempt: int = 0
+) -> int:
+    """
+    Seed cho một câu hỏi cụ thể
+
+    Args:
+        master_seed: Seed gốc của cả batch
+        question_type: Class câu hỏi (hoặc khóa dạng chuỗi)
+        question_number: Số thứ tự câu hỏi (1-based)
+        attempt: Lần thử (0 cho lần đầu, tăng dần khi retry)
+
+    Returns:
+        int: Seed riêng cho câu hỏi
+    """
+    key = question_type if isinstance(question_type, str) else generator_key(question_type)
+    if attempt:
+        return derive_seed(master_seed, key, question_number, attempt)
+    return derive_seed(master_seed, key, question_number)
+
+
+def resolve_master_seed(seed: Optional[int] = None) -> Optional[int]:
+    """
+    Xác định master seed: ưu tiên tham số truyền vào, sau đó đến biến môi trường OPT_SEED
+
+    Args:
+        seed: Seed từ dòng lệnh (nếu có)
+
+    Returns:
+        Optional[int]: Master seed hoặc None nếu không cố định seed
+    """
+    if seed is not None:
+        return seed
+    env_seed = os.environ.get(SEED_ENV_VAR)
+    if env_seed:
+        try:
+            return int(env_seed)
+        except ValueError:
+            return None
+    return None
+
+
+def seed_global_generators(seed: int) -> None:
+    """
+    Seed module random (và numpy.random nếu numpy đã được import)
+
+    Args:
+        seed: Seed cần đặt
+    """
+    random.seed(seed)
+    numpy = sys.modules.get("numpy")
+    if numpy is not None:
+        numpy.random.seed(seed)
+
+
+@contextmanager
+def seeded(seed: Optional[int]) -> Iterator[None]:
+    """
+    Context manager chạy một khối code với seed cố định, sau đó khôi phục trạng thái random
+
+    Args:
+        seed: Seed cần đặt, None để không thay đổi gì
+    """
+    if seed is None:
+        yield
+        return
+
+    numpy = sys.modules.get("numpy")
+    random_state = random.getstate()
+    numpy_state = numpy.random.get_state() if numpy is not None else None
+    seed_global_generators(seed)
+    try:
+        yield
+    finally:
+        random.setstate(random_state)
+        if numpy_state is not None:
+            numpy.random.set_state(numpy_state)
@@ -0,0 +1,255 @@
+"""
+Split Document Builder - Biên dịch tách từng câu hỏi rồi ghép PDF thành bộ đề
+
+Với bộ đề hàng nghìn câu, biên dịch một file .tex liền khối rất chậm và một câu lỗi buộc
+biên dịch lại toàn bộ. Chế độ tách:
+- Ghi mỗi câu hỏi thành một file .tex độc lập (<tên>_units/cau_0001.tex, ...), cùng trang
+  tiêu đề và phần đáp án (format 2) là các đơn vị riêng
+- Chỉ ghi lại file khi nội dung thay đổi; biên dịch song song qua latex_compile_service,
+  đơn vị không đổi lấy PDF từ cache (khóa theo hash nội dung)
+- Ghép các PDF bằng pdfpages vào file sách <tên>.tex; khóa cache của sách gồm hash các PDF
+  đơn vị nên sách chỉ ghép lại khi có câu thay đổi
+
+Mỗi câu bắt đầu ở trang mới. Đáp án được sinh từ cùng danh sách câu hỏi theo đúng thứ tự.
+"""
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+# latex_compile_service nằm ở 2025/src (một bản duy nhất, dùng chung với xe_go/phuong_trinh_mat_phang)
+SRC_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+from latex_compile_service import CompileResult, LatexCompileService
+from latex_document_builder import LaTeXDocumentBuilder, LaTeXTemplate, OutputFormat
+from tikz_figure_registry import DEFAULT_FIGURES_DIRNAME, MODE_INLINE, TikzFigureRegistry
+
+UNITS_DIR_SUFFIX = "_units"
+TITLE_UNIT = "tieu_de"
+ANSWER_KEY_UNIT = "dap_an"
+QUESTION_UNIT_PREFIX = "cau_"
+MIN_NUMBER_WIDTH = 4
+
+BOOK_TEMPLATE = r"""\documentclass[a4paper]{{article}}
+\usepackage{{pdfpages}}
+\begin{{document}}
+{pages}
+\end{{document}}
+"""
+
+
+@dataclass
+class SplitBuildResult:
+    """Kết quả build chế độ tách"""
+    book_tex: str
+    unit_paths: List[str]
+    unit_results: List[CompileResult] = field(default_factory=list)
+    book_result: Optional[CompileResult] = None
+
+    @property
+    def success(self) -> bool:
+        return self.book_result is not None and self.book_result.success
+
+    @property
+    def failed_units(self) -> List[CompileResult]:
+        return [r for r in self.unit_results if not r.success]
+
+    @property
+    def recompiled_units(self) -> int:
+        return sum(1 for r in self.unit_results if r.success and not r.cached)
+
+
+def _write_if_changed(path: str, content: str) -> bool:
+    """Ghi file nếu nội dung khác; trả về True nếu đã ghi"""
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
+
+
+class SplitDocumentBuilder:
+    """
+    Tạo bộ đề bằng cách biên dịch từng câu thành PDF riêng rồi ghép lại
+    """
+
+    def __init__(
+        self,
+        template: Optional[LaTeXTemplate] = None,
+        service: Optional[LatexCompileService] = None,
+        figures: str = MODE_INLINE
+    ):
+        """
+        Args:
+            template: Template LaTeX (mặc định LaTeXTemplate), dùng chung preamble với bản liền khối
+            service: Service biên dịch (mặc định LatexCompileService với xelatex)
+            figures: Chế độ hình TikZ; 'external' thì hình trùng nhau giữa các câu chỉ biên dịch một lần
+        """
+        self.template = template or LaTeXTemplate()
+        self.service = service or LatexCompileService()
+        self.figures = figures
+
+    def _unit_document(self, body: str) -> str:
+        return (self.template.create_preamble()
+                + "\\begin{document}\n\\pagestyle{empty}\n\n"
+                + body
+                + self.template.DOCUMENT_FOOTER + "\n")
+
+    def _title_body(self, title: str, author: str) -> str:
+        return f"\\title{{{title}}}\n\\author{{{author}}}\n\\maketitle\n\\thispagestyle{{empty}}\n"
+
+    def write_units(
+        self,
+        questions_data: List[Any],
+        title: str,
+        output_format: OutputFormat,
+        output_path: str,
+        author: str = "dev"
+    ) -> List[str]:
+        """
+        Ghi các file .tex đơn vị (trang tiêu đề, từng câu, đáp án) theo thứ tự trong sách
+
+        Args:
+            questions_data: Dữ liệu câu hỏi như LaTeXDocumentBuilder.build_document
+            title: Tiêu đề tài liệu
+            output_format: Định dạng output
+            output_path: Đường dẫn file .tex của sách
+            author: Tác giả
+
+        Returns:
+            List[str]: Đường dẫn các file đơn vị, theo thứ tự ghép
+
+        Raises:
+            ValueError: Khi dữ liệu đầu vào không hợp lệ
+        """
+        if not questions_data:
+            raise ValueError("Danh sách câu hỏi không được rỗng")
+        if not title.strip():
+            raise ValueError("Tiêu đề không được rỗng")
+
+        if output_format == OutputFormat.IMMEDIATE_ANSWERS:
+            if not all(isinstance(q, str) for q in questions_data):
+                raise ValueError("Với format IMMEDIATE_ANSWERS, tất cả items phải là string")
+            contents = list(questions_data)
+            answers = None
+        elif output_format == OutputFormat.ANSWERS_AT_END:
+            if not all(isinstance(q, tuple) and len(q) == 2 for q in questions_data):
+                raise ValueError("Với format ANSWERS_AT_END, tất cả items phải là tuple (content, answer)")
+            contents = [q[0] for q in questions_data]
+            answers = [q[1] for q in questions_data]
+        else:
+            raise ValueError(f"Format không hỗ trợ: {output_format}")
+
+        units_dir = os.path.splitext(os.path.abspath(output_path))[0] + UNITS_DIR_SUFFIX
+        os.makedirs(units_dir, exist_ok=True)
+        width = max(MIN_NUMBER_WIDTH, len(str(len(contents))))
+
+        units = [(TITLE_UNIT, self._title_body(title, author))]
+        for idx, content in enumerate(contents, 1):
+            units.append((f"{QUESTION_UNIT_PREFIX}{idx:0{width}d}", content))
+        if answers is not None:
+            key = self.template.ANSWER_SECTION_HEADER
+            for idx, answer in enumerate(answers, 1):
+                key += f"\n\\textbf{{Câu {idx}}}: {answer}"
+            units.append((ANSWER_KEY_UNIT, key))
+
+        documents = [self._unit_document(body) for _, body in units]
+        if self.figures != MODE_INLINE:
+            registry = TikzFigureRegistry(os.path.join(units_dir, DEFAULT_FIGURES_DIRNAME), self.service)
+            documents = registry.externalize_many(documents, units_dir)
+
+        unit_paths = []
+        for (name, _), document in zip(units, documents):
+            path = os.path.join(units_dir, name + ".tex")
+            _write_if_changed(path, document)
+            unit_paths.append(path)
+
+        # Bỏ các câu thừa từ lần build trước có nhiều câu hơn (hoặc khác độ rộng số thứ tự)
+        keep = set(name for name, _ in units)
+        for filename in os.listdir(units_dir):
+            stem = os.path.splitext(filename)[0]
+            stale_question = stem.startswith(QUESTION_UNIT_PREFIX) and stem not in keep
+            stale_key = stem == ANSWER_KEY_UNIT and answers is None
+            if stale_question or stale_key:
+                os.remove(os.path.join(units_dir, filename))
+
+        return unit_paths
+
+    def write_book(self, unit_paths: List[str], output_path: str) -> str:
+        """
+        Ghi file sách ghép các PDF đơn vị bằng \\includepdf
+
+        Args:
+            unit_paths: Các file .tex đơn vị theo thứ tự
+            output_path: Đường dẫn file .tex của sách
+
+        Returns:
+            str: Đường dẫn file sách
+        """
+        book_dir = os.path.dirname(os.path.abspath(output_path))
+        pages = "\n".join(
+            f"\\includepdf[pages=-]{{{os.path.relpath(os.path.splitext(p)[0] + '.pdf', book_dir)}}}"
+            for p in unit_paths
+        )
+        _write_if_changed(output_path, BOOK_TEMPLATE.format(pages=pages))
+        return output_path
+
+    def build(
+        self,
+        questions_data: List[Any],
+        title: str,
+        output_format: OutputFormat,
+        output_path: str,
+        author: str = "dev"
+    ) -> SplitBuildResult:
+        """
+        Ghi đơn vị, biên dịch song song, rồi ghép thành PDF sách
+
+        Args:
+            questions_data: Dữ liệu câu hỏi như LaTeXDocumentBuilder.build_document
+            title: Tiêu đề tài liệu
+            output_format: Định dạng output
+            output_path: Đường dẫn file .tex của sách
+            author: Tác giả
+
+        Returns:
+            SplitBuildResult: Kết quả từng đơn vị và của sách (book_result=None nếu có đơn vị lỗi)
+        """
+        unit_paths = self.write_units(questions_data, title, output_format, output_path, author)
+        result = SplitBuildResult(book_tex=output_path, unit_paths=unit_paths)
+        result.unit_results = self.service.compile_many(unit_paths)
+        if result.failed_units:
+            return result
+        self.write_book(unit_paths, output_path)
+        result.book_result = self.service.compile(output_path)
+        return result
+
+
+def build_split_document(
+    questions_data: List[Any],
+    output_path: str,
+    title: str,
+    output_format: int,
+    service: Optional[LatexCompileService] = None,
+    figures: str = MODE_INLINE
+) -> SplitBuildResult:
+    """
+    Hàm tiện ích cho main_runner: build chế độ tách với format dạng số (1 hoặc 2)
+
+    Args:
+        questions_data: Dữ liệu câu hỏi
+        output_path: Đường dẫn file .tex của sách
+        title: Tiêu đề tài liệu
+        output_format: 1 hoặc 2
+        service: Service biên dịch
+        figures: Chế độ hình TikZ (inline/external)
+
+    Returns:
+        SplitBuildResult: Kết quả build
+    """
+    builder = SplitDocumentBuilder(service=service, figures=figures)
+    return builder.build(questions_data, title, LaTeXDocumentBuilder.format_to_enum(output_format), output_path)
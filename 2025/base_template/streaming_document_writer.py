@@ -0,0 +1,302 @@
+"""
+Streaming Document Writer - Ghi tài liệu LaTeX từng câu một, có checkpoint để chạy tiếp
+
+LaTeXDocumentBuilder.build_document dựng cả file .tex trong bộ nhớ rồi mới ghi một lần: batch
+5000 câu lỗi ở câu 4999 là mất hết. Writer này:
+- Ghi header ngay khi mở, ghi mỗi câu hỏi ngay khi sinh xong (bộ nhớ không tăng theo số câu)
+- Với format 2, đáp án được ghi tạm vào file spill <tên>.tex.answers (mỗi dòng một JSON),
+  cuối cùng mới chép vào phần Đáp án
+- Sau mỗi câu (hoặc mỗi checkpoint_every câu) ghi checkpoint <tên>.tex.checkpoint.json gồm
+  câu tiếp theo cần sinh và độ dài đã ghi của file .tex/spill
+- Chạy tiếp (resume=True): cắt các file về đúng độ dài trong checkpoint (bỏ phần ghi dở) rồi
+  sinh tiếp từ câu tiếp theo
+
+File hoàn chỉnh giống hệt kết quả của build_document với cùng danh sách câu hỏi. Chạy tiếp chỉ
+cho cùng tài liệu khi có master seed (câu thứ i chỉ phụ thuộc (seed, i)), nên checkpoint lưu
+seed và từ chối chạy tiếp nếu tham số khác.
+"""
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Tuple
+
+from latex_document_builder import LaTeXTemplate, OutputFormat
+
+CHECKPOINT_SUFFIX = ".checkpoint.json"
+SPILL_SUFFIX = ".answers"
+CHECKPOINT_VERSION = 1
+DEFAULT_CHECKPOINT_EVERY = 1
+QUESTION_SEPARATOR = "\n\n"
+
+
+@dataclass
+class StreamCheckpoint:
+    """Trạng thái đã ghi bền vững của một lần chạy streaming"""
+    title: str
+    output_format: int
+    num_questions: int
+    master_seed: Optional[int]
+    author: str
+    next_question: int = 1
+    written: int = 0
+    failed: int = 0
+    tex_offset: int = 0
+    spill_offset: int = 0
+    version: int = CHECKPOINT_VERSION
+
+    def matches(self, other: "StreamCheckpoint") -> bool:
+        """Cùng tài liệu (bỏ qua tiến độ)"""
+        keys = ("title", "output_format", "num_questions", "master_seed", "author", "version")
+        return all(getattr(self, key) == getattr(other, key) for key in keys)
+
+
+class StreamingDocumentWriter:
+    """
+    Ghi tài liệu LaTeX kiểu streaming với checkpoint
+
+    Dùng:
+        writer = StreamingDocumentWriter("de.tex", "Đề", OutputFormat.ANSWERS_AT_END)
+        start = writer.open(num_questions=5000, master_seed=42, resume=True)
+        for number, result in manager.iter_questions(5000, 2, start=start):
+            writer.write_question(number, result)
+        writer.finish()
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        title: str,
+        output_format: OutputFormat,
+        author: str = "dev",
+        template: Optional[LaTeXTemplate] = None,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY
+    ):
+        """
+        Args:
+            output_path: File .tex kết quả
+            title: Tiêu đề tài liệu
+            output_format: Định dạng output
+            author: Tác giả
+            template: Template LaTeX (mặc định LaTeXTemplate, giống build_document)
+            checkpoint_every: Ghi checkpoint sau mỗi bao nhiêu câu
+
+        Raises:
+            ValueError: Khi tham số không hợp lệ
+        """
+        if not title.strip():
+            raise ValueError("Tiêu đề không được rỗng")
+        if output_format not in (OutputFormat.IMMEDIATE_ANSWERS, OutputFormat.ANSWERS_AT_END):
+            raise ValueError(f"Format không hỗ trợ: {output_format}")
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every phải lớn hơn 0")
+
+        self.output_path = output_path
+        self.checkpoint_path = output_path + CHECKPOINT_SUFFIX
+        self.spill_path = output_path + SPILL_SUFFIX
+        self.title = title
+        self.output_format = output_format
+        self.author = author
+        self.template = template or LaTeXTemplate()
+        self.checkpoint_every = checkpoint_every
+
+        self.state: Optional[StreamCheckpoint] = None
+        self.resumed = False
+        self._tex = None
+        self._spill = None
+        self._since_checkpoint = 0
+
+    # =============================
+    # MỞ / CHẠY TIẾP
+    # =============================
+    def open(self, num_questions: int, master_seed: Optional[int] = None, resume: bool = False) -> int:
+        """
+        Mở file để ghi (mới hoặc chạy tiếp từ checkpoint)
+
+        Args:
+            num_questions: Tổng số câu của batch
+            master_seed: Master seed của batch (cần để chạy tiếp ra đúng tài liệu cũ)
+            resume: Chạy tiếp nếu có checkpoint khớp tham số
+
+        Returns:
+            int: Số thứ tự câu tiếp theo cần sinh (1 nếu bắt đầu mới)
+
+        Raises:
+            ValueError: Khi checkpoint có sẵn thuộc về tài liệu khác
+        """
+        fresh = StreamCheckpoint(
+            title=self.title,
+            output_format=self.output_format.value,
+            num_questions=num_questions,
+            master_seed=master_seed,
+            author=self.author,
+        )
+        saved = self.load_checkpoint() if resume else None
+        if saved is not None and not saved.matches(fresh):
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_path} thuộc tài liệu khác "
+                f"(tiêu đề/format/số câu/seed không khớp), xóa file này để chạy lại từ đầu"
+            )
+
+        self.resumed = saved is not None
+        self.state = saved or fresh
+        self._since_checkpoint = 0
+
+        output_dir = os.path.dirname(os.path.abspath(self.output_path))
+        os.makedirs(output_dir, exist_ok=True)
+
+        if self.resumed:
+            self._tex = self._open_truncated(self.output_path, self.state.tex_offset)
+            self._spill = self._open_truncated(self.spill_path, self.state.spill_offset)
+        else:
+            self._tex = open(self.output_path, "wb")
+            self._spill = open(self.spill_path, "wb")
+            self._write(self._tex, self.template.create_header(self.title, self.author))
+            self._save_checkpoint()
+
+        return self.state.next_question
+
+    @staticmethod
+    def _open_truncated(path: str, offset: int):
+        # Bỏ phần ghi sau checkpoint cuối (câu đang ghi dở khi bị ngắt)
+        with open(path, "r+b") as f:
+            f.truncate(offset)
+        return open(path, "ab")
+
+    @staticmethod
+    def _write(f, text: str) -> None:
+        # File mở dạng binary để tell() rẻ (TextIOWrapper.tell rất chậm)
+        f.write(text.encode("utf-8"))
+
+    def load_checkpoint(self) -> Optional[StreamCheckpoint]:
+        """
+        Đọc checkpoint (nếu có và còn đủ file .tex/spill)
+
+        Returns:
+            Optional[StreamCheckpoint]: Checkpoint hoặc None
+        """
+        if not os.path.exists(self.checkpoint_path):
+            return None
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                state = StreamCheckpoint(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+        if not (os.path.exists(self.output_path) and os.path.exists(self.spill_path)):
+            return None
+        if os.path.getsize(self.output_path) < state.tex_offset or os.path.getsize(self.spill_path) < state.spill_offset:
+            return None
+        return state
+
+    def _save_checkpoint(self) -> None:
+        # Dữ liệu phải xuống đĩa trước khi checkpoint trỏ tới nó
+        for f in (self._tex, self._spill):
+            f.flush()
+            os.fsync(f.fileno())
+        self.state.tex_offset = self._tex.tell()
+        self.state.spill_offset = self._spill.tell()
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(vars(self.state), f, ensure_ascii=False)
+        os.replace(tmp_path, self.checkpoint_path)
+        self._since_checkpoint = 0
+
+    # =============================
+    # GHI
+    # =============================
+    def write_question(self, question_number: int, result: Any) -> None:
+        """
+        Ghi một câu hỏi ngay khi sinh xong
+
+        Args:
+            question_number: Số thứ tự câu trong batch
+            result: Câu hỏi (str với format 1, tuple (content, answer) với format 2), None nếu thất bại
+
+        Raises:
+            ValueError: Khi dữ liệu câu hỏi sai định dạng
+            RuntimeError: Khi chưa gọi open()
+        """
+        if self._tex is None:
+            raise RuntimeError("Chưa mở writer (gọi open() trước)")
+
+        if result is not None:
+            content, answer = self._split_result(result)
+            if self.state.written:
+                self._write(self._tex, QUESTION_SEPARATOR)
+            self._write(self._tex, content)
+            if answer is not None:
+                self._write(self._spill, json.dumps(answer, ensure_ascii=False) + "\n")
+            self.state.written += 1
+        else:
+            self.state.failed += 1
+
+        self.state.next_question = question_number + 1
+        self._since_checkpoint += 1
+        if self._since_checkpoint >= self.checkpoint_every:
+            self._save_checkpoint()
+
+    def write_all(self, results: Iterable[Tuple[int, Any]]) -> None:
+        """
+        Ghi lần lượt các kết quả (số câu, câu hỏi) - ví dụ từ QuestionManager.iter_questions
+
+        Args:
+            results: Iterable các cặp (số câu, câu hỏi hoặc None)
+        """
+        for question_number, result in results:
+            self.write_question(question_number, result)
+
+    def _split_result(self, result: Any) -> Tuple[str, Optional[str]]:
+        if self.output_format == OutputFormat.IMMEDIATE_ANSWERS:
+            if not isinstance(result, str):
+                raise ValueError("Với format IMMEDIATE_ANSWERS, tất cả items phải là string")
+            return result, None
+        if not (isinstance(result, tuple) and len(result) == 2):
+            raise ValueError("Với format ANSWERS_AT_END, tất cả items phải là tuple (content, answer)")
+        return result[0], result[1]
+
+    def finish(self) -> int:
+        """
+        Ghi phần đáp án (từ file spill) và footer, xóa checkpoint và spill
+
+        Returns:
+            int: Số câu hỏi đã ghi
+
+        Raises:
+            ValueError: Khi không có câu hỏi nào được ghi
+        """
+        if self._tex is None:
+            raise RuntimeError("Chưa mở writer (gọi open() trước)")
+        if not self.state.written:
+            self.close()
+            raise ValueError("Danh sách câu hỏi không được rỗng")
+
+        self._spill.close()
+        if self.output_format == OutputFormat.ANSWERS_AT_END:
+            self._write(self._tex, self.template.ANSWER_SECTION_HEADER)
+            with open(self.spill_path, "r", encoding="utf-8") as spill:
+                for idx, line in enumerate(spill, 1):
+                    self._write(self._tex, f"\n\\textbf{{Câu {idx}}}: {json.loads(line)}")
+        self._write(self._tex, self.template.DOCUMENT_FOOTER)
+        self._tex.close()
+        self._tex = self._spill = None
+
+        for path in (self.checkpoint_path, self.spill_path):
+            if os.path.exists(path):
+                os.remove(path)
+        return self.state.written
+
+    def close(self) -> None:
+        """Đóng file mà không hoàn tất (giữ checkpoint để chạy tiếp)"""
+        for f in (self._tex, self._spill):
+            if f is not None and not f.closed:
+                if self.state is not None and self._since_checkpoint:
+                    self._save_checkpoint()
+                f.close()
+        self._tex = self._spill = None
+
+    def __enter__(self) -> "StreamingDocumentWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Bị ngắt giữa chừng: các câu đã ghi xong vẫn được checkpoint
+        if self._tex is not None:
+            self.close()
@@ -0,0 +1,77 @@
+"""
+Kiểm tra generation_profiler khi sinh song song bằng thread
+
+Chạy từ 2025/base_template:
+    python -m pytest -q tests
+"""
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.insert(0, BASE_TEMPLATE_DIR)
+
+from base_optimization_question import BaseOptimizationQuestion
+from generation_profiler import QUESTION_SPAN, GenerationProfiler, active_profiler
+from question_manager import QuestionManager
+
+PHASES = (
+    "generate_parameters",
+    "calculate_answer",
+    "generate_question_text",
+    "generate_solution",
+    "generate_wrong_answers",
+)
+
+
+class SleepyQuestion(BaseOptimizationQuestion):
+    """Câu hỏi tối giản; ngủ một chút trước và trong mỗi pha để các thread đan xen nhau"""
+
+    def generate_question(self, question_number: int = 1, include_multiple_choice: bool = True, seed: Optional[int] = None):
+        # Thread khác đóng span của nó trong lúc câu này đã mở span nhưng chưa lấy phase_timer
+        time.sleep(0.002)
+        return super().generate_question(question_number, include_multiple_choice, seed)
+
+    def generate_parameters(self) -> Dict[str, Any]:
+        time.sleep(0.001)
+        return {"x": 1}
+
+    def calculate_answer(self) -> str:
+        time.sleep(0.001)
+        return "1"
+
+    def generate_wrong_answers(self) -> List[str]:
+        time.sleep(0.001)
+        return ["2", "3", "4"]
+
+    def generate_question_text(self) -> str:
+        time.sleep(0.001)
+        return "Tính $x$."
+
+    def generate_solution(self) -> str:
+        time.sleep(0.001)
+        return "$x = 1$."
+
+
+def test_thread_executor_records_every_phase_once_per_question():
+    profiler = GenerationProfiler()
+    manager = QuestionManager(
+        question_types=[SleepyQuestion],
+        workers=4,
+        master_seed=7,
+        profiler=profiler,
+        executor=QuestionManager.EXECUTOR_THREAD,
+    )
+    questions = manager.generate_questions(40, 1)
+
+    assert len(questions) == 40
+    [(generator, data)] = profiler.summary()["generators"].items()
+    assert generator.endswith("SleepyQuestion")
+    question_count = data["phases"][QUESTION_SPAN]["count"]
+    assert question_count == 40
+    for phase in PHASES:
+        assert data["phases"][phase]["count"] == question_count, phase
+    # Span đã đóng hết thì không còn profiler hoạt động trên thread gọi
+    assert active_profiler() is None
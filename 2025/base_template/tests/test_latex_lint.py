@@ -0,0 +1,74 @@
+"""
+Kiểm tra latex_lint.lint_latex trên các dạng markup ex_test hợp lệ và lỗi thường gặp
+
+Chạy từ 2025/base_template:
+    python -m pytest -q tests
+"""
+import os
+import sys
+
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.insert(0, BASE_TEMPLATE_DIR)
+
+from latex_lint import (
+    CHOICE_OPTION_COUNT,
+    CHOICE_TRUE_COUNT,
+    EMPTY_SHORT_ANSWER,
+    MISSING_SOLUTION,
+    TF_STATEMENT_COUNT,
+    UNBALANCED_BRACE,
+    UNCLOSED_MATH,
+    UNESCAPED_PERCENT,
+    lint_latex,
+)
+
+
+def codes(text: str):
+    return [issue.code for issue in lint_latex(text)]
+
+
+def exercise(body: str) -> str:
+    return "\\begin{ex}\n" + body + "\n\\loigiai{Lời giải.}\n\\end{ex}"
+
+
+def test_choice_tf_with_optional_argument():
+    assert codes(exercise("Xét các mệnh đề.\n\\choiceTFt[t]\n{*$a$}\n{$b$}\n{*$c$}\n{$d$}")) == []
+
+
+def test_choice_tf_without_optional_argument():
+    assert codes(exercise("\\choiceTFt{*a}{b}{c}{d}")) == []
+
+
+def test_choice_tf_counts_statements_after_optional_argument():
+    assert codes(exercise("\\choiceTFt[t]{a}{b}{c}")) == [TF_STATEMENT_COUNT]
+
+
+def test_choice_with_optional_argument():
+    assert codes(exercise("\\choice[2]{\\True $1$}{$2$}{$3$}{$4$}")) == []
+
+
+def test_choice_true_count():
+    assert codes(exercise("\\choice{$1$}{$2$}{$3$}{$4$}")) == [CHOICE_TRUE_COUNT]
+    assert codes(exercise("\\choice[2]{\\True $1$}{$2$}{$3$}")) == [CHOICE_OPTION_COUNT]
+
+
+def test_shortans_with_optional_argument():
+    assert codes(exercise("Tính $x$.\n\\shortans[oly]{3}")) == []
+    assert codes(exercise("Tính $x$.\n\\shortans[oly]{ }")) == [EMPTY_SHORT_ANSWER]
+
+
+def test_intervals_are_not_optional_arguments():
+    text = exercise("Hàm số đồng biến trên $[0;1)$ và \\((1;2]\\).\n\\shortans{$[0;1)$}")
+    assert codes(text) == []
+
+
+def test_escaped_percent_and_braces():
+    assert codes(exercise("Lãi suất 6\\% mỗi năm, $A = \\left\\{ 1; 2 \\right\\}$.")) == []
+
+
+def test_common_errors():
+    assert codes(exercise("Lãi suất 6% mỗi năm.")) == [UNESCAPED_PERCENT]
+    assert codes(exercise("Cho $x = 1.")) == [UNCLOSED_MATH]
+    assert codes(exercise("Cho $\\frac{1}{2$.")) == [UNBALANCED_BRACE]
+    assert codes("\\begin{ex}\nCâu hỏi.\n\\end{ex}") == [MISSING_SOLUTION]
@@ -0,0 +1,294 @@
+"""
+TikZ Figure Registry - Biên dịch mỗi hình TikZ một lần, chèn lại bằng \\includegraphics
+
+Nhiều generator chèn cùng một khối TikZ lớn vào mọi câu hỏi (TIKZ_BUILDING_3D, hình tọa độ 3D,
+bảng biến thiên tkz-tab, ...) và xelatex phải dựng lại từng bản sao. Registry:
+- Tìm các khối \\begin{tikzpicture}...\\end{tikzpicture} trong phần thân tài liệu
+- Băm nội dung hình cùng preamble rút gọn (package tikz/tkz/toán/font) thành tên file
+  tikz_figures/fig_<hash>.tex (lớp standalone) - cùng hình ở nhiều câu, nhiều tài liệu
+  trong cùng thư mục chỉ có một file
+- Biên dịch song song các hình chưa có PDF qua latex_compile_service (có cache)
+- Thay khối TikZ bằng \\includegraphics{tikz_figures/fig_<hash>.pdf}
+
+Hình biên dịch lỗi được giữ nguyên dạng TikZ. Chế độ inline (--figures inline hoặc biến môi
+trường TIKZ_FIGURES=inline) trả lại tài liệu không đổi.
+
+Dùng được cho file .tex của bất kỳ generator nào:
+  python3 tikz_figure_registry.py ../../2026/15_03/building_volume_circular_questions.tex
+  python3 tikz_figure_registry.py de.tex -o de_ext.tex --engine fake
+"""
+import argparse
+import hashlib
+import os
+import re
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# latex_compile_service nằm ở 2025/src (một bản duy nhất, dùng chung với xe_go/phuong_trinh_mat_phang)
+SRC_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+if SRC_DIR not in sys.path:
+    sys.path.append(SRC_DIR)
+
+from latex_compile_service import (
+    DEFAULT_ENGINE,
+    DEFAULT_WORKERS,
+    CompileResult,
+    LatexCompileService,
+    create_engine,
+    print_compile_result,
+)
+
+FIGURES_MODE_ENV_VAR = "TIKZ_FIGURES"
+MODE_INLINE = "inline"
+MODE_EXTERNAL = "external"
+DEFAULT_FIGURES_DIRNAME = "tikz_figures"
+HASH_LENGTH = 16
+
+FIGURE_DOCUMENT_CLASS = "\\documentclass[tikz,border=1pt]{standalone}\n"
+
+# Dòng preamble được chép sang file hình: chỉ những gì có thể ảnh hưởng tới cách vẽ
+_PREAMBLE_KEEP_PATTERN = re.compile(
+    r'^\s*\\(?:usepackage(?:\[[^\]]*\])?\{(?:[^}]*\b(?:tikz|tkz-[a-z]+|pgfplots|ams[a-z]+|fontspec|'
+    r'polyglossia|xcolor|mathrsfs|siunitx)\b[^}]*)\}|usetikzlibrary|usepgfplotslibrary|pgfplotsset|'
+    r'tikzset|setmainfont|setmainlanguage|setmathfont)'
+)
+_TIKZ_BLOCK_PATTERN = re.compile(r'\\begin\{tikzpicture\}.*?\\end\{tikzpicture\}', re.DOTALL)
+_BEGIN_DOCUMENT = "\\begin{document}"
+
+
+def figures_mode_from_env(default: str = MODE_INLINE) -> str:
+    """
+    Đọc chế độ hình từ biến môi trường TIKZ_FIGURES ('inline' hoặc 'external')
+
+    Args:
+        default: Giá trị khi biến môi trường không có hoặc không hợp lệ
+
+    Returns:
+        str: MODE_INLINE hoặc MODE_EXTERNAL
+    """
+    value = os.environ.get(FIGURES_MODE_ENV_VAR, "").strip().lower()
+    return value if value in (MODE_INLINE, MODE_EXTERNAL) else default
+
+
+def figure_preamble(document_preamble: str) -> str:
+    """
+    Rút gọn preamble của tài liệu thành preamble cho file hình standalone
+
+    Args:
+        document_preamble: Phần trước \\begin{document}
+
+    Returns:
+        str: Preamble của file hình (gồm cả \\documentclass)
+    """
+    kept = [line for line in document_preamble.splitlines() if _PREAMBLE_KEEP_PATTERN.match(line)]
+    return FIGURE_DOCUMENT_CLASS + "\n".join(kept) + "\n"
+
+
+def _is_externalizable(block: str) -> bool:
+    # Khối lồng nhau hoặc nằm trong định nghĩa macro (#1) không tách ra được
+    return block.count("\\begin{tikzpicture}") == 1 and '#' not in block and '\\label' not in block
+
+
+@dataclass
+class FigureEntry:
+    """Một hình đã đăng ký"""
+    key: str
+    tex_path: str
+    compiled: bool = False
+    failed: bool = False
+
+    @property
+    def pdf_path(self) -> str:
+        return os.path.splitext(self.tex_path)[0] + '.pdf'
+
+
+class TikzFigureRegistry:
+    """
+    Registry các hình TikZ theo hash nội dung, biên dịch mỗi hình một lần
+    """
+
+    def __init__(self, figures_dir: str, service: Optional[LatexCompileService] = None):
+        """
+        Args:
+            figures_dir: Thư mục chứa file hình (.tex/.pdf)
+            service: Service biên dịch (mặc định LatexCompileService với xelatex)
+        """
+        self.figures_dir = os.path.abspath(figures_dir)
+        self.service = service or LatexCompileService()
+        self.entries: Dict[str, FigureEntry] = {}
+        self.stats: Dict[str, int] = {'figures': 0, 'unique': 0, 'compiled': 0, 'failed': 0}
+        self.failures: List[CompileResult] = []
+
+    def register(self, preamble: str, block: str) -> FigureEntry:
+        """
+        Đăng ký một hình (ghi file .tex nếu chưa có)
+
+        Args:
+            preamble: Preamble của file hình (kết quả figure_preamble)
+            block: Khối \\begin{tikzpicture}...\\end{tikzpicture}
+
+        Returns:
+            FigureEntry: Hình tương ứng với hash nội dung
+        """
+        source = preamble + "\\begin{document}\n" + block.strip() + "\n\\end{document}\n"
+        key = hashlib.sha256(source.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+        self.stats['figures'] += 1
+        entry = self.entries.get(key)
+        if entry is not None:
+            return entry
+
+        os.makedirs(self.figures_dir, exist_ok=True)
+        tex_path = os.path.join(self.figures_dir, f"fig_{key}.tex")
+        if not os.path.exists(tex_path):
+            with open(tex_path, 'w', encoding='utf-8') as f:
+                f.write(source)
+        entry = FigureEntry(key=key, tex_path=tex_path)
+        self.entries[key] = entry
+        self.stats['unique'] += 1
+        return entry
+
+    def compile_pending(self) -> List[CompileResult]:
+        """
+        Biên dịch song song các hình chưa biên dịch
+
+        Returns:
+            List[CompileResult]: Kết quả của các hình vừa biên dịch
+        """
+        pending = [e for e in self.entries.values() if not e.compiled and not e.failed]
+        results = self.service.compile_many([e.tex_path for e in pending])
+        for entry, result in zip(pending, results):
+            if result.success:
+                entry.compiled = True
+                self.stats['compiled'] += 1
+            else:
+                entry.failed = True
+                self.stats['failed'] += 1
+                self.failures.append(result)
+        return results
+
+    def externalize_many(self, documents: List[str], document_dir: str) -> List[str]:
+        """
+        Thay các khối TikZ trong nhiều tài liệu bằng \\includegraphics (biên dịch hình một lượt)
+
+        Args:
+            documents: Nội dung các tài liệu LaTeX hoàn chỉnh
+            document_dir: Thư mục sẽ chứa các tài liệu (để tính đường dẫn tương đối tới hình)
+
+        Returns:
+            List[str]: Tài liệu đã thay thế, cùng thứ tự
+        """
+        plans = []
+        for document in documents:
+            split_at = document.find(_BEGIN_DOCUMENT)
+            if split_at < 0:
+                plans.append((document, None, []))
+                continue
+            preamble = figure_preamble(document[:split_at])
+            body = document[split_at:]
+            matches = []
+            for match in _TIKZ_BLOCK_PATTERN.finditer(body):
+                if _is_externalizable(match.group(0)):
+                    matches.append((match, self.register(preamble, match.group(0))))
+            plans.append((document, split_at, matches))
+
+        self.compile_pending()
+
+        results = []
+        for document, split_at, matches in plans:
+            if not matches:
+                results.append(document)
+                continue
+            body = document[split_at:]
+            pieces = []
+            last = 0
+            replaced = 0
+            for match, entry in matches:
+                pieces.append(body[last:match.start()])
+                if entry.compiled:
+                    relative = os.path.relpath(entry.pdf_path, os.path.abspath(document_dir)).replace(os.sep, '/')
+                    pieces.append(f"\\includegraphics{{{relative}}}")
+                    replaced += 1
+                else:
+                    pieces.append(match.group(0))
+                last = match.end()
+            pieces.append(body[last:])
+            preamble = document[:split_at]
+            if replaced and "graphicx" not in preamble:
+                preamble += "\\usepackage{graphicx}\n"
+            results.append(preamble + "".join(pieces))
+        return results
+
+    def externalize(self, document: str, document_dir: str) -> str:
+        """
+        Thay các khối TikZ trong một tài liệu bằng \\includegraphics
+
+        Args:
+            document: Nội dung tài liệu LaTeX hoàn chỉnh
+            document_dir: Thư mục sẽ chứa tài liệu
+
+        Returns:
+            str: Tài liệu đã thay thế
+        """
+        return self.externalize_many([document], document_dir)[0]
+
+
+def externalize_document(
+    document: str,
+    output_path: str,
+    mode: Optional[str] = None,
+    service: Optional[LatexCompileService] = None
+) -> str:
+    """
+    Hàm tiện ích: áp dụng chế độ hình cho tài liệu sắp ghi ra output_path
+
+    Args:
+        document: Nội dung tài liệu LaTeX
+        output_path: Đường dẫn file .tex sẽ ghi (hình nằm ở tikz_figures/ cạnh file này)
+        mode: MODE_INLINE / MODE_EXTERNAL (None = theo biến môi trường TIKZ_FIGURES)
+        service: Service biên dịch hình
+
+    Returns:
+        str: Tài liệu (không đổi nếu chế độ inline)
+    """
+    mode = mode or figures_mode_from_env()
+    if mode == MODE_INLINE:
+        return document
+    document_dir = os.path.dirname(os.path.abspath(output_path))
+    registry = TikzFigureRegistry(os.path.join(document_dir, DEFAULT_FIGURES_DIRNAME), service)
+    return registry.externalize(document, document_dir)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tách các hình TikZ thành PDF dùng chung và chèn bằng \\includegraphics")
+    parser.add_argument('file', help='File .tex cần xử lý')
+    parser.add_argument('-o', '--output', help='File .tex kết quả (mặc định: <tên>_ext.tex cùng thư mục)')
+    parser.add_argument('-j', '--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Số process TeX biên dịch hình (mặc định: {DEFAULT_WORKERS})')
+    parser.add_argument('--engine', default=DEFAULT_ENGINE,
+                        help=f"Engine TeX, 'fake' để giả lập (mặc định: {DEFAULT_ENGINE})")
+    args = parser.parse_args()
+
+    output_path = args.output or os.path.splitext(args.file)[0] + "_ext.tex"
+    with open(args.file, 'r', encoding='utf-8') as f:
+        document = f.read()
+
+    service = LatexCompileService(create_engine(args.engine), workers=args.workers)
+    document_dir = os.path.dirname(os.path.abspath(output_path))
+    registry = TikzFigureRegistry(os.path.join(document_dir, DEFAULT_FIGURES_DIRNAME), service)
+    results = registry.externalize_many([document], document_dir)
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(results[0])
+
+    for result in registry.failures:
+        print_compile_result(result)
+    stats = registry.stats
+    print(f"📋 {stats['figures']} hình, {stats['unique']} hình khác nhau, "
+          f"biên dịch {stats['compiled']}, lỗi {stats['failed']} (giữ dạng TikZ)")
+    print(f"✅ Đã ghi {output_path}")
+    sys.exit(1 if stats['failed'] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Kiểm tra vi sai: latex_pipeline_engine.format_latex_pipeline_compiled phải cho kết quả
+giống hệt latex_utils.format_latex_pipeline_manual
+
+Corpus gồm các biểu thức mẫu viết tay và các chuỗi sinh ngẫu nhiên (có seed) từ bảng token
+chạm tới mọi pattern của pipeline. Thoát với mã 1 nếu có khác biệt.
+
+Ví dụ:
+  python3 verify_latex_pipeline_engine.py
+  python3 verify_latex_pipeline_engine.py --cases 50000 --seed 7
+"""
+import argparse
+import random
+import sys
+import time
+from typing import List
+
+from latex_pipeline_engine import clear_pipeline_cache, format_latex_pipeline_compiled
+from latex_utils import format_latex_pipeline_manual
+
+DEFAULT_CASES = 20000
+DEFAULT_SEED = 2025
+MAX_TOKENS = 12
+
+HANDWRITTEN_CASES = [
+    "", " ", "0", "1", "1x^2 + 0x + 1", "3 + -2", "x + +y", "a - -b", "c + -d", "+ 2x - y",
+    "4.0 + 3.000", "2.5 + 1.0", "\\frac{x}{1}", "\\frac{0}{y}", "( \\dfrac{1}{2} )", "(2) + (x)",
+    "x^1 + y^0", "z^{1} * w^{0}", "f(x)=x^2", "g(t)=2t+1", "[1, 2]", "(a, b)", "(-\\infty; 3)",
+    "x <= 3", "y >= -1", "a != b", "x -> 0", "1, 2, ...", "2 * 3", "x   +   y", "\\sqrt{2}",
+    "0.5\\\\%", "1.000.000 đồng", "\\frc{1}{2}", "x^2 + y_i", "\\_a", "- 1x + 1y", "+ 0 + x",
+    "1.000x - 0.000", "\\band\\b", "\\bor\\b", "\\{x \\| x > 0\\}", "\\d\\\\%",
+    "S = \\dfrac{3\\sqrt{3}}{2}", "V = \\pi \\left( \\dfrac{e^{4}}{4} - \\dfrac{1}{4} \\right)",
+]
+
+TOKENS = [
+    "x", "y", "t", "a", "1", "0", "2", "3", ".", "0", "+", "-", " ", "  ", "\t", "(", ")", "[", "]",
+    ",", ";", "\\frac", "\\dfrac", "\\\\frac", "{", "}", "{1}", "{0}", "^", "_", "=", "<=", ">=",
+    "!=", "->", "...", "*", "\\", "%", "\\\\%", "đồng", "VND", "1.000.000 ", "\\s", "\\sqrt",
+    "\\band\\b", "\\bor\\b", "\\{", "\\|", "\\}", "frc", "\\\\frc\\b", "1x", "- 1", "+ 0",
+    "0.0", "1.0", "4.00", "f(x)", "\\d", "\\_", "sin", "\n",
+]
+
+
+def build_corpus(num_cases: int, seed: int) -> List[str]:
+    """Corpus = mẫu viết tay + chuỗi ngẫu nhiên ghép từ TOKENS"""
+    rng = random.Random(seed)
+    corpus = list(HANDWRITTEN_CASES)
+    for _ in range(num_cases):
+        corpus.append("".join(rng.choice(TOKENS) for _ in range(rng.randint(1, MAX_TOKENS))))
+    return corpus
+
+
+def run_safely(func, expression):
+    """Trả về ('ok', kết quả) hoặc ('error', tên exception) để so sánh cả trường hợp lỗi"""
+    try:
+        return 'ok', func(expression)
+    except Exception as e:
+        return 'error', type(e).__name__
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="So sánh engine biên dịch với pipeline thủ công")
+    parser.add_argument('--cases', type=int, default=DEFAULT_CASES,
+                        help=f'Số chuỗi ngẫu nhiên (mặc định: {DEFAULT_CASES})')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help=f'Seed sinh corpus (mặc định: {DEFAULT_SEED})')
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.cases, args.seed)
+
+    mismatches = []
+    for expression in corpus:
+        expected = run_safely(format_latex_pipeline_manual, expression)
+        actual = run_safely(format_latex_pipeline_compiled, expression)
+        if expected != actual:
+            mismatches.append((expression, expected, actual))
+
+    # Đo tốc độ (engine không dùng cache để so sánh công bằng)
+    start = time.perf_counter()
+    for expression in corpus:
+        run_safely(format_latex_pipeline_manual, expression)
+    manual_seconds = time.perf_counter() - start
+
+    clear_pipeline_cache()
+    start = time.perf_counter()
+    for expression in corpus:
+        run_safely(format_latex_pipeline_compiled, expression)
+    compiled_seconds = time.perf_counter() - start
+
+    print(f"📋 Đã so sánh {len(corpus)} biểu thức")
+    print(f"⏱️  Thủ công: {manual_seconds * 1000:.1f} ms, biên dịch: {compiled_seconds * 1000:.1f} ms "
+          f"(x{manual_seconds / max(compiled_seconds, 1e-9):.1f})")
+
+    if mismatches:
+        print(f"❌ Có {len(mismatches)} khác biệt:")
+        for expression, expected, actual in mismatches[:20]:
+            print(f"   - {expression!r}: thủ công={expected!r}, biên dịch={actual!r}")
+        sys.exit(1)
+
+    print("✅ Engine biên dịch cho kết quả giống hệt pipeline thủ công")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 Dạng nâng cao của các câu hỏi về tiệm cận trong toán học, bao gồm các hàm số có dạng phân thức với các tham số m và n.
 """
 
+import os
 import random
 import sys
 import logging
@@ -9,6 +10,14 @@ from fractions import Fraction
 import re
 import math
 
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+# Rút gọn căn dùng chung (2025/base_template/radicals.py)
+from radicals import radical_latex, split_sqrt, sqrt_latex
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -1055,25 +1064,7 @@ def generate_single_question(question_number):
             """
             
             # Bước 1: Phân tích √discriminant = k√n với n là số không có thừa số chính phương
-            def simplify_sqrt(num):
-                """Đơn giản √num thành k√n"""
-                if num == 0:
-                    return 0, 1
-                
-                k = 1
-                n = num
-                
-                # Tìm tất cả thừa số chính phương
-                i = 2
-                while i * i <= n:
-                    while n % (i * i) == 0:
-                        k *= i
-                        n //= (i * i)
-                    i += 1
-                
-                return k, n
-            
-            sqrt_coeff, sqrt_radical = simplify_sqrt(discriminant)
+            sqrt_coeff, sqrt_radical = split_sqrt(discriminant)
             
             # Bước 2: Tạo chuỗi √discriminant
             if sqrt_radical == 1:
@@ -1173,104 +1164,58 @@ def generate_all_questions(num_questions=5):
     
     return questions
 
+# Giá trị căn, π, e thường gặp -> LaTeX; tra theo giá trị làm tròn RADICAL_KEY_DIGITS chữ số
+RADICAL_TOLERANCE = 1e-10
+RADICAL_KEY_DIGITS = 9
+COMMON_RADICANDS = (2, 3, 5, 6, 7, 8, 10, 11, 12, 13, 14, 15, 17, 18, 19, 20, 24, 27, 28, 32, 45, 50, 72, 75, 98, 125)
+# (hệ số, số dưới căn, mẫu): hệ số·√(số dưới căn)/mẫu
+COMMON_RADICAL_FRACTIONS = (
+    (1, 2, 2), (1, 3, 2), (1, 3, 3), (1, 6, 3), (1, 6, 6),
+    (1, 2, 3), (1, 5, 5), (1, 10, 10), (2, 2, 3), (2, 3, 3)
+)
+COMMON_PI_MULTIPLES = (
+    (1, 1, "\\pi"), (1, 2, "\\frac{\\pi}{2}"), (1, 3, "\\frac{\\pi}{3}"), (1, 4, "\\frac{\\pi}{4}"),
+    (1, 6, "\\frac{\\pi}{6}"), (2, 1, "2\\pi"), (3, 2, "\\frac{3\\pi}{2}"), (2, 3, "\\frac{2\\pi}{3}"),
+    (3, 4, "\\frac{3\\pi}{4}"), (5, 6, "\\frac{5\\pi}{6}")
+)
+COMMON_E_MULTIPLES = (
+    (1, 1, "e"), (1, 2, "\\frac{e}{2}"), (2, 1, "2e"), (1, 3, "\\frac{e}{3}"), (3, 1, "3e")
+)
+
+
+def _build_radical_forms():
+    """Bảng {giá trị làm tròn: (giá trị, LaTeX)} dựng một lần khi import"""
+    entries = [(math.sqrt(n), sqrt_latex(n)) for n in COMMON_RADICANDS]
+    entries += [
+        (coef * math.sqrt(radicand) / den, radical_latex(coef, radicand, den, frac="\\frac"))
+        for coef, radicand, den in COMMON_RADICAL_FRACTIONS
+    ]
+    entries += [(num * math.pi / den, latex) for num, den, latex in COMMON_PI_MULTIPLES]
+    entries += [(num * math.e / den, latex) for num, den, latex in COMMON_E_MULTIPLES]
+    forms = {}
+    for value, latex in entries:
+        forms.setdefault(round(value, RADICAL_KEY_DIGITS), (value, latex))
+    return forms
+
+
+_RADICAL_FORMS = _build_radical_forms()
+
+
 def format_radical_latex(number):
     """Convert common irrational numbers to radical form in LaTeX."""
     if isinstance(number, (int, float)):
         # Handle simple integers first
         if abs(number - round(number)) < 1e-10:
             return None  # Let it be handled as integer
-            
-        # Handle common square roots
-        sqrt_values = {
-            2: "\\sqrt{2}",
-            3: "\\sqrt{3}",
-            5: "\\sqrt{5}",
-            6: "\\sqrt{6}",
-            7: "\\sqrt{7}",
-            8: "2\\sqrt{2}",
-            10: "\\sqrt{10}",
-            11: "\\sqrt{11}",
-            12: "2\\sqrt{3}",
-            13: "\\sqrt{13}",
-            14: "\\sqrt{14}",
-            15: "\\sqrt{15}",
-            17: "\\sqrt{17}",
-            18: "3\\sqrt{2}",
-            19: "\\sqrt{19}",
-            20: "2\\sqrt{5}",
-            24: "2\\sqrt{6}",
-            27: "3\\sqrt{3}",
-            28: "2\\sqrt{7}",
-            32: "4\\sqrt{2}",
-            45: "3\\sqrt{5}",
-            50: "5\\sqrt{2}",
-            72: "6\\sqrt{2}",
-            75: "5\\sqrt{3}",
-            98: "7\\sqrt{2}",
-            125: "5\\sqrt{5}"
-        }
-        
-        for val, latex in sqrt_values.items():
-            if abs(number - math.sqrt(val)) < 1e-10:
-                return latex
-            elif abs(number + math.sqrt(val)) < 1e-10:
-                return f"-{latex}"
-                
-        # Handle fractions of square roots
-        fraction_sqrt_values = [
-            (math.sqrt(2)/2, "\\frac{\\sqrt{2}}{2}"),
-            (math.sqrt(3)/2, "\\frac{\\sqrt{3}}{2}"),
-            (math.sqrt(3)/3, "\\frac{\\sqrt{3}}{3}"),
-            (math.sqrt(6)/3, "\\frac{\\sqrt{6}}{3}"),
-            (math.sqrt(6)/6, "\\frac{\\sqrt{6}}{6}"),
-            (math.sqrt(2)/3, "\\frac{\\sqrt{2}}{3}"),
-            (math.sqrt(5)/5, "\\frac{\\sqrt{5}}{5}"),
-            (math.sqrt(10)/10, "\\frac{\\sqrt{10}}{10}"),
-            (2*math.sqrt(2)/3, "\\frac{2\\sqrt{2}}{3}"),
-            (2*math.sqrt(3)/3, "\\frac{2\\sqrt{3}}{3}"),
-        ]
-        
-        for val, latex in fraction_sqrt_values:
-            if abs(number - val) < 1e-10:
-                return latex
-            elif abs(number + val) < 1e-10:
-                return f"-{latex}"
-                
-        # Handle pi-related values
-        pi_values = [
-            (math.pi, "\\pi"),
-            (math.pi/2, "\\frac{\\pi}{2}"),
-            (math.pi/3, "\\frac{\\pi}{3}"),
-            (math.pi/4, "\\frac{\\pi}{4}"),
-            (math.pi/6, "\\frac{\\pi}{6}"),
-            (2*math.pi, "2\\pi"),
-            (3*math.pi/2, "\\frac{3\\pi}{2}"),
-            (2*math.pi/3, "\\frac{2\\pi}{3}"),
-            (3*math.pi/4, "\\frac{3\\pi}{4}"),
-            (5*math.pi/6, "\\frac{5\\pi}{6}")
-        ]
-        
-        for val, latex in pi_values:
-            if abs(number - val) < 1e-10:
-                return latex
-            elif abs(number + val) < 1e-10:
-                return f"-{latex}"
-                
-        # Handle e-related values
-        e_values = [
-            (math.e, "e"),
-            (math.e/2, "\\frac{e}{2}"),
-            (2*math.e, "2e"),
-            (math.e/3, "\\frac{e}{3}"),
-            (3*math.e, "3e")
-        ]
-        
-        for val, latex in e_values:
-            if abs(number - val) < 1e-10:
-                return latex
-            elif abs(number + val) < 1e-10:
-                return f"-{latex}"
-    
+
+        # Tra bảng: giá trị trong bảng cách |number| dưới RADICAL_TOLERANCE thì làm tròn về
+        # một trong hai khóa của |number| ± RADICAL_TOLERANCE
+        magnitude = abs(number)
+        for probe in (magnitude - RADICAL_TOLERANCE, magnitude + RADICAL_TOLERANCE):
+            entry = _RADICAL_FORMS.get(round(probe, RADICAL_KEY_DIGITS))
+            if entry is not None and abs(magnitude - entry[0]) < RADICAL_TOLERANCE:
+                return entry[1] if number > 0 else f"-{entry[1]}"
+
     return None
 
 def format_number_enhanced(number):
@@ -15,6 +15,13 @@ from typing import Union
 from math import gcd
 import sympy as sp
 
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+from seed_stream import derive_question_seed
+
 """
 Các hàm tiện ích LaTeX cho hệ thống sinh câu hỏi toán tối ưu hóa
 """
@@ -790,8 +797,6 @@ def main():
                     seed = int(env_seed)
                 except Exception:
                     seed = None
-        if seed is not None:
-            random.seed(seed)
 
         # Tạo câu hỏi
         question_types = get_available_question_types()
@@ -799,9 +804,15 @@ def main():
 
         for i in range(1, num_questions + 1):
             try:
+                if seed is not None:
+                    # Seed riêng cho từng câu: câu i giống nhau dù sinh song song hay chạy tiếp giữa chừng
+                    random.seed(derive_question_seed(seed, "question_type", i))
                 question_type = random.choice(question_types)
-                # Seed một lần tổng; để đa dạng theo câu, có thể thay đổi seed dựa trên i nếu cần
-                question_instance = question_type(GeneratorConfig(seed=None))
+                question_seed = None
+                if seed is not None:
+                    question_seed = derive_question_seed(seed, question_type, i)
+                    random.seed(question_seed)
+                question_instance = question_type(GeneratorConfig(seed=question_seed))
                 if fmt == 1:
                     question = question_instance.generate_full_question(i)
                     questions_data.append(question)
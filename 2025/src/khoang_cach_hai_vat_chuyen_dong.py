@@ -1,8 +1,15 @@
 import math
+import os
 import random
 import sys
 from typing import List, Tuple
-from scipy.optimize import minimize_scalar
+
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+from kinematics import closest_approach
 
 
 # Tất cả đường chéo của hình hộp ABCD.A'B'C'D' (mỗi đường chéo một hướng)
@@ -102,18 +109,14 @@ class BoxDistanceQuestion:
     def position_N(self, t):
         return tuple(s + v * t for s, v in zip(self.start_N, self.vel_N))
 
-    def distance_function(self, t):
-        pos_M = self.position_M(t)
-        pos_N = self.position_N(t)
-        return math.sqrt(sum((a - b) ** 2 for a, b in zip(pos_M, pos_N)))
-
     def calculate_minimum_distance(self):
         t_max_M = self.dist_M / self.v_M
         t_max_N = self.dist_N / self.v_N
         t_max = min(t_max_M, t_max_N)
-        result = minimize_scalar(self.distance_function, bounds=(0, t_max), method='bounded')
-        self.t_optimal = result.x
-        self.d_min = result.fun
+        self.t_optimal, d_min_sq = closest_approach(
+            self.start_M, self.vel_M, self.start_N, self.vel_N, t_max=t_max
+        )
+        self.d_min = math.sqrt(d_min_sq)
 
     def generate_wrong_answers(self):
         correct = round(self.d_min, 1)
@@ -0,0 +1,541 @@
+"""
+LaTeX Compile Service - Biên dịch nhiều file .tex song song, có cache PDF
+
+Thay cho các lệnh subprocess.run(["xelatex", ...]) rời rạc trong từng script:
+- Pool giới hạn số process xelatex chạy cùng lúc, mỗi job có timeout riêng
+- Cache PDF theo hash nội dung của .tex cùng các file phụ thuộc cục bộ (.sty/.cls/.tex
+  được \\usepackage/\\input, ví dụ ex_test.sty, và .pdf được \\includepdf/\\includegraphics); trùng hash thì
+  chép PDF từ cache, không chạy TeX
+- Chỉ chạy lại khi các file phụ trợ (.aux, .thm, .toc, .out) thay đổi sau một lượt
+- Đọc log thành cấu trúc (lỗi kèm số dòng, cảnh báo, tham chiếu chưa định nghĩa)
+- FakeEngine thay cho xelatex để kiểm thử khi máy không cài TeX
+
+Ví dụ:
+  python3 latex_compile_service.py de1.tex de2.tex -j 4
+  python3 latex_compile_service.py solution.tex --engine fake
+"""
+import argparse
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_ENGINE = "xelatex"
+# Chế độ tương tác của TeX; None thì không truyền -interaction (TeX dùng errorstopmode)
+DEFAULT_INTERACTION = "batchmode"
+DEFAULT_WORKERS = 4
+DEFAULT_TIMEOUT = 60
+DEFAULT_MAX_PASSES = 3
+CACHE_DIR_ENV_VAR = "LATEX_COMPILE_CACHE"
+DEFAULT_CACHE_DIRNAME = ".latex_cache"
+
+# Tăng khi đổi cách tính khóa cache để bỏ các PDF cũ
+CACHE_KEY_VERSION = "1"
+
+# Các file phụ trợ quyết định có cần chạy thêm lượt hay không
+AUX_EXTENSIONS = (".aux", ".thm", ".toc", ".out")
+
+# Đuôi file được coi là phụ thuộc cục bộ của tài liệu
+DEPENDENCY_EXTENSIONS = (".sty", ".cls", ".tex")
+
+_DEPENDENCY_PATTERN = re.compile(
+    r'\\(usepackage|RequirePackage|documentclass|input|include|includepdf|includegraphics)\s*(?:\[[^\]]*\])?\s*\{([^}]+)\}'
+)
+_ERROR_PATTERN = re.compile(r'^! (.*)$')
+_ERROR_LINE_PATTERN = re.compile(r'^l\.(\d+)')
+_WARNING_PATTERN = re.compile(r'^((?:LaTeX|Package \S+|Class \S+) Warning): (.*)$')
+_UNDEFINED_REFERENCE_PATTERN = re.compile(r"Reference `([^']+)' on page \d+ undefined")
+_RERUN_PATTERN = re.compile(r'Rerun to get|Label\(s\) may have changed|Rerun LaTeX')
+
+
+# =============================
+# PHÂN TÍCH LOG
+# =============================
+@dataclass
+class LogMessage:
+    """Một lỗi hoặc cảnh báo đọc được từ file .log"""
+    kind: str  # 'error' hoặc 'warning'
+    message: str
+    line: Optional[int] = None
+
+
+@dataclass
+class LatexLog:
+    """Kết quả phân tích file .log"""
+    errors: List[LogMessage] = field(default_factory=list)
+    warnings: List[LogMessage] = field(default_factory=list)
+    undefined_references: List[str] = field(default_factory=list)
+    rerun_requested: bool = False
+
+    @property
+    def has_errors(self) -> bool:
+        return bool(self.errors)
+
+
+def parse_latex_log(text: str) -> LatexLog:
+    """
+    Phân tích nội dung file .log của TeX
+
+    Args:
+        text: Nội dung file .log
+
+    Returns:
+        LatexLog: Lỗi (kèm số dòng nguồn nếu có), cảnh báo, tham chiếu chưa định nghĩa
+    """
+    log = LatexLog()
+    lines = text.splitlines()
+    for index, raw_line in enumerate(lines):
+        line = raw_line.rstrip()
+
+        error_match = _ERROR_PATTERN.match(line)
+        if error_match:
+            source_line = None
+            # Số dòng nguồn xuất hiện ở dạng "l.<n> ..." vài dòng sau thông báo lỗi
+            for follow in lines[index + 1:index + 8]:
+                line_match = _ERROR_LINE_PATTERN.match(follow)
+                if line_match:
+                    source_line = int(line_match.group(1))
+                    break
+            log.errors.append(LogMessage('error', error_match.group(1).strip(), source_line))
+            continue
+
+        warning_match = _WARNING_PATTERN.match(line)
+        if warning_match:
+            log.warnings.append(LogMessage('warning', f"{warning_match.group(1)}: {warning_match.group(2).strip()}"))
+            reference_match = _UNDEFINED_REFERENCE_PATTERN.search(line)
+            if reference_match:
+                log.undefined_references.append(reference_match.group(1))
+
+        if _RERUN_PATTERN.search(line):
+            log.rerun_requested = True
+    return log
+
+
+# =============================
+# ENGINE
+# =============================
+class XelatexEngine:
+    """Chạy một lượt TeX thật (xelatex hoặc engine tương thích)"""
+
+    def __init__(self, command: str = DEFAULT_ENGINE, interaction: Optional[str] = DEFAULT_INTERACTION):
+        self.command = command
+        self.interaction = interaction
+
+    @property
+    def name(self) -> str:
+        return self.command
+
+    def run(self, tex_path: str, timeout: float) -> int:
+        """
+        Chạy một lượt biên dịch trong thư mục chứa file .tex
+
+        Args:
+            tex_path: Đường dẫn tuyệt đối tới file .tex
+            timeout: Thời gian tối đa (giây)
+
+        Returns:
+            int: Mã thoát của engine
+
+        Raises:
+            subprocess.TimeoutExpired: Khi quá thời gian
+            FileNotFoundError: Khi không tìm thấy engine
+        """
+        command = [self.command]
+        if self.interaction:
+            command.append(f'-interaction={self.interaction}')
+        command.extend(['-halt-on-error', os.path.basename(tex_path)])
+        result = subprocess.run(
+            command,
+            cwd=os.path.dirname(tex_path),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout
+        )
+        return result.returncode
+
+
+class FakeEngine:
+    """
+    Engine giả lập để kiểm thử khi không có TeX
+
+    Mỗi lượt ghi .log, .aux và một PDF tối thiểu giống cách xelatex để lại file:
+    - Mỗi \\label{...} sinh một dòng \\newlabel trong .aux (đánh số theo thứ tự);
+      lượt đầu .aux chưa có nên service sẽ chạy thêm lượt thứ hai
+    - \\ref tới nhãn không có trong .aux của lượt trước sinh cảnh báo "Reference ... undefined"
+    - Thiếu \\begin{document}/\\end{document} hoặc có lệnh \\fakeerror sinh lỗi "! ..." và mã thoát 1
+    """
+
+    name = "fake"
+
+    def __init__(self, delay: float = 0.0):
+        """
+        Args:
+            delay: Thời gian giả lập cho mỗi lượt (giây), dùng để thử timeout
+        """
+        self.delay = delay
+        self.runs = 0
+
+    def run(self, tex_path: str, timeout: float) -> int:
+        self.runs += 1
+        if self.delay > timeout:
+            time.sleep(timeout)
+            raise subprocess.TimeoutExpired(self.name, timeout)
+        if self.delay:
+            time.sleep(self.delay)
+
+        base, _ = os.path.splitext(tex_path)
+        with open(tex_path, 'r', encoding='utf-8') as f:
+            source = f.read()
+
+        previous_labels = set()
+        if os.path.exists(base + '.aux'):
+            with open(base + '.aux', 'r', encoding='utf-8') as f:
+                previous_labels = set(re.findall(r'\\newlabel\{([^}]+)\}', f.read()))
+
+        log_lines = [f"This is FakeTeX, input {os.path.basename(tex_path)}"]
+        errors = []
+        if '\\begin{document}' not in source or '\\end{document}' not in source:
+            errors.append(("LaTeX Error: Missing \\begin{document} or \\end{document}.", 1))
+        for match in re.finditer(r'\\fakeerror\{([^}]*)\}', source):
+            errors.append((match.group(1), source.count('\n', 0, match.start()) + 1))
+        for message, line in errors:
+            log_lines.extend([f"! {message}", "", f"l.{line} "])
+
+        labels = re.findall(r'\\label\{([^}]+)\}', source)
+        for reference in re.findall(r'\\ref\{([^}]+)\}', source):
+            if reference not in previous_labels:
+                log_lines.append(f"LaTeX Warning: Reference `{reference}' on page 1 undefined on input line 1.")
+
+        with open(base + '.aux', 'w', encoding='utf-8') as f:
+            f.write("\\relax\n")
+            for number, label in enumerate(labels, start=1):
+                f.write(f"\\newlabel{{{label}}}{{{{{number}}}{{1}}}}\n")
+        with open(base + '.log', 'w', encoding='utf-8') as f:
+            f.write("\n".join(log_lines) + "\n")
+
+        if errors:
+            return 1
+        with open(base + '.pdf', 'wb') as f:
+            f.write(b"%PDF-1.4\n% FakeTeX\n" + hashlib.sha256(source.encode('utf-8')).hexdigest().encode() + b"\n%%EOF\n")
+        return 0
+
+
+def create_engine(name: str, interaction: Optional[str] = DEFAULT_INTERACTION):
+    """
+    Tạo engine theo tên: 'fake' cho FakeEngine, còn lại là lệnh TeX (xelatex, lualatex, ...)
+
+    Args:
+        name: Tên engine
+        interaction: Chế độ -interaction của TeX (batchmode, nonstopmode...); None để không truyền
+
+    Returns:
+        Engine có phương thức run(tex_path, timeout)
+    """
+    if name == FakeEngine.name:
+        return FakeEngine()
+    return XelatexEngine(name, interaction)
+
+
+# =============================
+# KẾT QUẢ & KHÓA CACHE
+# =============================
+@dataclass
+class CompileResult:
+    """Kết quả biên dịch một file .tex"""
+    tex_path: str
+    pdf_path: str
+    success: bool
+    cached: bool = False
+    passes: int = 0
+    seconds: float = 0.0
+    log: LatexLog = field(default_factory=LatexLog)
+    error: Optional[str] = None
+
+
+def find_local_dependencies(tex_path: str) -> List[str]:
+    """
+    Tìm các file phụ thuộc cục bộ (.sty/.cls/.tex/.pdf nằm cạnh file .tex), đệ quy
+
+    Args:
+        tex_path: Đường dẫn file .tex
+
+    Returns:
+        List[str]: Đường dẫn tuyệt đối, đã sắp xếp, không gồm chính tex_path
+    """
+    root = os.path.abspath(tex_path)
+    directory = os.path.dirname(root)
+    found = set()
+    pending = [root]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(current, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+        except OSError:
+            continue
+        for command, names in _DEPENDENCY_PATTERN.findall(content):
+            for name in names.split(','):
+                name = name.strip()
+                if not name:
+                    continue
+                if command in ('usepackage', 'RequirePackage'):
+                    candidates = [name + '.sty']
+                elif command == 'documentclass':
+                    candidates = [name + '.cls']
+                elif command in ('includepdf', 'includegraphics'):
+                    candidates = [name] if name.endswith('.pdf') else [name + '.pdf']
+                else:
+                    candidates = [name] if name.endswith(DEPENDENCY_EXTENSIONS) else [name + '.tex', name]
+                for candidate in candidates:
+                    path = os.path.abspath(os.path.join(directory, candidate))
+                    if path != root and path not in found and os.path.isfile(path):
+                        found.add(path)
+                        if path.endswith(DEPENDENCY_EXTENSIONS):
+                            pending.append(path)
+                        break
+    return sorted(found)
+
+
+def compute_cache_key(tex_path: str, engine_name: str) -> str:
+    """
+    Khóa cache = hash(phiên bản khóa, engine, nội dung .tex, tên + nội dung từng file phụ thuộc)
+
+    Args:
+        tex_path: Đường dẫn file .tex
+        engine_name: Tên engine (PDF của các engine khác nhau không dùng chung)
+
+    Returns:
+        str: Chuỗi hex sha256
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{CACHE_KEY_VERSION}\x1f{engine_name}\x1f".encode('utf-8'))
+    with open(tex_path, 'rb') as f:
+        digest.update(f.read())
+    for dependency in find_local_dependencies(tex_path):
+        digest.update(b"\x1f" + os.path.basename(dependency).encode('utf-8') + b"\x1f")
+        with open(dependency, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _aux_snapshot(base: str) -> Dict[str, Optional[str]]:
+    snapshot = {}
+    for extension in AUX_EXTENSIONS:
+        path = base + extension
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                snapshot[extension] = hashlib.sha256(f.read()).hexdigest()
+        else:
+            snapshot[extension] = None
+    return snapshot
+
+
+# =============================
+# SERVICE
+# =============================
+class LatexCompileService:
+    """
+    Biên dịch file .tex qua pool giới hạn, có cache PDF theo hash nội dung
+    """
+
+    def __init__(
+        self,
+        engine=None,
+        workers: int = DEFAULT_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_passes: int = DEFAULT_MAX_PASSES,
+        cache_dir: Optional[str] = None,
+        use_cache: bool = True
+    ):
+        """
+        Args:
+            engine: Engine biên dịch (mặc định XelatexEngine)
+            workers: Số process TeX chạy cùng lúc
+            timeout: Timeout cho mỗi lượt biên dịch (giây)
+            max_passes: Số lượt tối đa cho mỗi file
+            cache_dir: Thư mục cache PDF (mặc định: biến môi trường LATEX_COMPILE_CACHE
+                       hoặc .latex_cache cạnh file .tex)
+            use_cache: False để luôn biên dịch lại
+        """
+        if workers < 1:
+            raise ValueError("workers phải >= 1")
+        if max_passes < 1:
+            raise ValueError("max_passes phải >= 1")
+        self.engine = engine if engine is not None else XelatexEngine()
+        self.workers = workers
+        self.timeout = timeout
+        self.max_passes = max_passes
+        self.cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV_VAR) or None
+        self.use_cache = use_cache
+
+    def _cache_path(self, tex_path: str, key: str) -> str:
+        directory = self.cache_dir or os.path.join(os.path.dirname(tex_path), DEFAULT_CACHE_DIRNAME)
+        return os.path.join(directory, key + '.pdf')
+
+    def compile(self, tex_path: str) -> CompileResult:
+        """
+        Biên dịch một file .tex (hoặc lấy PDF từ cache)
+
+        Args:
+            tex_path: Đường dẫn file .tex
+
+        Returns:
+            CompileResult: Kết quả, không ném exception
+        """
+        start = time.perf_counter()
+        tex_path = os.path.abspath(tex_path)
+        base, _ = os.path.splitext(tex_path)
+        pdf_path = base + '.pdf'
+        result = CompileResult(tex_path=tex_path, pdf_path=pdf_path, success=False)
+
+        if not os.path.isfile(tex_path):
+            result.error = f"File {tex_path} không tồn tại"
+            return result
+
+        cache_path = None
+        if self.use_cache:
+            cache_path = self._cache_path(tex_path, compute_cache_key(tex_path, self.engine.name))
+            if os.path.exists(cache_path):
+                shutil.copyfile(cache_path, pdf_path)
+                result.success = True
+                result.cached = True
+                result.seconds = time.perf_counter() - start
+                return result
+
+        try:
+            self._run_passes(tex_path, base, result)
+        except subprocess.TimeoutExpired:
+            result.error = f"Timeout: biên dịch quá {self.timeout}s"
+        except FileNotFoundError:
+            result.error = f"Không tìm thấy {self.engine.name}. Hãy cài đặt TeX Live"
+        except OSError as e:
+            result.error = f"Lỗi khi chạy {self.engine.name}: {e}"
+
+        if result.success and cache_path is not None:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = cache_path + f".{os.getpid()}.tmp"
+            shutil.copyfile(pdf_path, temp_path)
+            os.replace(temp_path, cache_path)
+
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _run_passes(self, tex_path: str, base: str, result: CompileResult) -> None:
+        log_path = base + '.log'
+        for _ in range(self.max_passes):
+            before = _aux_snapshot(base)
+            return_code = self.engine.run(tex_path, self.timeout)
+            result.passes += 1
+
+            if os.path.exists(log_path):
+                with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
+                    result.log = parse_latex_log(f.read())
+            else:
+                result.log = LatexLog()
+
+            if return_code != 0 or result.log.has_errors:
+                result.error = f"{self.engine.name} thoát với mã {return_code}"
+                return
+            if _aux_snapshot(base) == before and not result.log.rerun_requested:
+                break
+
+        result.success = os.path.exists(result.pdf_path)
+        if not result.success:
+            result.error = "Không tạo được file PDF"
+
+    def compile_many(self, tex_paths: Iterable[str]) -> List[CompileResult]:
+        """
+        Biên dịch nhiều file song song (tối đa self.workers process cùng lúc)
+
+        Args:
+            tex_paths: Các đường dẫn .tex
+
+        Returns:
+            List[CompileResult]: Kết quả theo đúng thứ tự đầu vào
+        """
+        paths = list(tex_paths)
+        if self.workers == 1 or len(paths) <= 1:
+            return [self.compile(path) for path in paths]
+        # Mỗi job chủ yếu chờ process con nên dùng thread là đủ
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(paths))) as executor:
+            return list(executor.map(self.compile, paths))
+
+
+def compile_tex_files(
+    tex_paths: Iterable[str],
+    engine: str = DEFAULT_ENGINE,
+    workers: int = DEFAULT_WORKERS,
+    timeout: float = DEFAULT_TIMEOUT,
+    use_cache: bool = True
+) -> List[CompileResult]:
+    """
+    Hàm tiện ích: biên dịch các file .tex với cấu hình cho trước
+
+    Args:
+        tex_paths: Các đường dẫn .tex
+        engine: Tên engine ('xelatex', 'lualatex', 'fake', ...)
+        workers: Số process chạy cùng lúc
+        timeout: Timeout mỗi lượt (giây)
+        use_cache: Dùng cache PDF hay không
+
+    Returns:
+        List[CompileResult]: Kết quả theo thứ tự đầu vào
+    """
+    service = LatexCompileService(create_engine(engine), workers=workers, timeout=timeout, use_cache=use_cache)
+    return service.compile_many(tex_paths)
+
+
+def print_compile_result(result: CompileResult, max_errors: int = 5) -> None:
+    """
+    In kết quả biên dịch dạng thu gọn
+
+    Args:
+        result: Kết quả biên dịch
+        max_errors: Số lỗi tối đa được in
+    """
+    if result.success:
+        source = "cache" if result.cached else f"{result.passes} lượt"
+        print(f"✅ {os.path.basename(result.pdf_path)} ({source}, {result.seconds:.2f}s)")
+        if result.log.undefined_references:
+            print(f"   ⚠️  Tham chiếu chưa định nghĩa: {', '.join(result.log.undefined_references)}")
+        return
+    print(f"❌ {os.path.basename(result.tex_path)}: {result.error}")
+    for message in result.log.errors[:max_errors]:
+        location = f"dòng {message.line}: " if message.line is not None else ""
+        print(f"   {location}{message.message}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Biên dịch song song các file .tex, có cache PDF")
+    parser.add_argument('files', nargs='+', help='Các file .tex cần biên dịch')
+    parser.add_argument('-j', '--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Số process TeX chạy cùng lúc (mặc định: {DEFAULT_WORKERS})')
+    parser.add_argument('--engine', default=DEFAULT_ENGINE,
+                        help=f"Engine TeX, 'fake' để giả lập (mặc định: {DEFAULT_ENGINE})")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f'Timeout mỗi lượt (giây, mặc định: {DEFAULT_TIMEOUT})')
+    parser.add_argument('--no-cache', action='store_true', help='Luôn biên dịch lại, bỏ qua cache PDF')
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        parser.error("--workers phải >= 1")
+
+    results = compile_tex_files(args.files, engine=args.engine, workers=args.workers,
+                                timeout=args.timeout, use_cache=not args.no_cache)
+    for result in results:
+        print_compile_result(result)
+
+    failed = sum(1 for r in results if not r.success)
+    print(f"📋 {len(results) - failed}/{len(results)} file thành công "
+          f"({sum(1 for r in results if r.cached)} từ cache)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
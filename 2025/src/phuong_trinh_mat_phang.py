@@ -3,9 +3,10 @@ import random
 import sys
 from typing import List, Tuple, Optional
 import sympy as sp
-import subprocess
 import os
 
+from latex_compile_service import LatexCompileService, create_engine
+
 # =============================
 # CONFIGURATION CLASS
 # =============================
@@ -32,7 +33,6 @@ class Config:
     # Generation settings
     MAX_TRIANGLE_ATTEMPTS = 10
     MAX_ERROR_DISPLAY = 5
-    LOG_LINES_TO_CHECK = 20
     
     # Progress settings
     SHOW_PROGRESS = True
@@ -62,7 +62,6 @@ GIVEN_PLANE_D_RANGE_MAX = Config.GIVEN_PLANE_D_RANGE_MAX
 MAX_TRIANGLE_ATTEMPTS = Config.MAX_TRIANGLE_ATTEMPTS
 COMPILE_TIMEOUT = Config.COMPILE_TIMEOUT
 MAX_ERROR_DISPLAY = Config.MAX_ERROR_DISPLAY
-LOG_LINES_TO_CHECK = Config.LOG_LINES_TO_CHECK
 
 
 # =============================
@@ -573,9 +572,6 @@ class PlaneGenerator:
     @staticmethod
     def compile_latex_quietly(filename: str, config: Optional[Config] = None) -> bool:
         """Biên dịch LaTeX với log thu gọn"""
-        import subprocess
-        import os
-        
         if config is None:
             config = Config()
         
@@ -592,58 +588,29 @@ class PlaneGenerator:
             print(f"❌ File {filename} không tồn tại")
             return False
         
-        try:
-            if config.SHOW_PROGRESS:
-                print(f"🔄 Đang biên dịch {filename}...")
-            
-            # Chạy LaTeX engine với batch mode
-            cmd = [config.LATEX_ENGINE]
-            if config.BATCH_MODE:
-                cmd.append('-interaction=batchmode')
-            cmd.append(filename)
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                cwd=os.getcwd(),
-                timeout=config.COMPILE_TIMEOUT
-            )
-            
-            pdf_filename = filename.replace('.tex', '.pdf')
-            
-            if result.returncode == 0 and os.path.exists(pdf_filename):
-                print(f"✅ Biên dịch thành công: {pdf_filename}")
-                return True
-            else:
-                print(f"❌ Lỗi khi biên dịch (exit code: {result.returncode})")
-                # Hiển thị vài dòng cuối của log nếu có lỗi
-                log_file = filename.replace('.tex', '.log')
-                if os.path.exists(log_file):
-                    try:
-                        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                            lines = f.readlines()
-                            print("Một số lỗi từ log:")
-                            error_count = 0
-                            for line in lines[-LOG_LINES_TO_CHECK:]:  # Kiểm tra 20 dòng cuối
-                                if any(keyword in line.lower() for keyword in ['error', '!', 'undefined']):
-                                    print(f"  {line.strip()}")
-                                    error_count += 1
-                                    if error_count >= MAX_ERROR_DISPLAY:  # Chỉ hiển thị 5 lỗi đầu tiên
-                                        break
-                    except Exception as log_error:
-                        print(f"  Không thể đọc log file: {log_error}")
-                return False
-                
-        except subprocess.TimeoutExpired:
-            print(f"❌ Timeout: Biên dịch quá lâu (>{COMPILE_TIMEOUT}s)")
-            return False
-        except FileNotFoundError:
-            print("❌ Không tìm thấy xelatex. Hãy cài đặt TeX Live")
-            return False
-        except Exception as e:
-            print(f"❌ Lỗi không mong đợi khi chạy xelatex: {e}")
-            return False
+        if config.SHOW_PROGRESS:
+            print(f"🔄 Đang biên dịch {filename}...")
+
+        # Biên dịch qua latex_compile_service: cache PDF theo hash, chạy lại khi .aux/.thm đổi,
+        # đọc lỗi từ log có cấu trúc
+        service = LatexCompileService(
+            create_engine(config.LATEX_ENGINE, 'batchmode' if config.BATCH_MODE else None),
+            workers=1,
+            timeout=config.COMPILE_TIMEOUT
+        )
+        result = service.compile(filename)
+
+        if result.success:
+            print(f"✅ Biên dịch thành công: {os.path.relpath(result.pdf_path)}")
+            return True
+
+        print(f"❌ {result.error}")
+        if result.log.errors:
+            print("Một số lỗi từ log:")
+            for message in result.log.errors[:config.MAX_ERROR_DISPLAY]:
+                location = f"l.{message.line}: " if message.line is not None else ""
+                print(f"  {location}{message.message}")
+        return False
 
 
 # =============================
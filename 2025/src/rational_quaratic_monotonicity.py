@@ -2,15 +2,25 @@
 Dạng bài toán: Tìm khoảng đồng biến, nghịch biến của hàm số
 """
 
+import os
 import random
 import sys
 import logging
 import re
 from abc import ABC, abstractmethod
+from array import array
 from fractions import Fraction
 from typing import List, Dict, Any, Union
 from math import gcd as math_gcd, sqrt, floor, log10
 
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+from distractor_engine import DistractorEngine, DistractorKind, constants, draws
+from generation_deadline import attempts
+
 # Cấu hình logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -19,9 +29,20 @@ DEFAULT_COEFF_RANGE = (-5, 5)
 DEFAULT_DOMAIN_MIN = -5
 DEFAULT_DOMAIN_MAX = 5
 MAX_ATTEMPTS = 200
+WRONG_ANSWER_DRAWS = 30
 NICE_FRACTIONS = [Fraction(1, 2), Fraction(1, 3), Fraction(2, 3), Fraction(1, 4), Fraction(3, 4),
                   Fraction(-1, 2), Fraction(-1, 3), Fraction(-2, 3), Fraction(-1, 4), Fraction(-3, 4)]
 
+# Chỉ mục hệ số hợp lệ: dựng một lần cho mỗi (function_type, coeff_range, domain), lưu ra đĩa
+# Tăng COEFF_INDEX_VERSION khi thay đổi điều kiện lọc hệ số để bỏ các file chỉ mục cũ
+COEFF_INDEX_VERSION = 1
+COEFF_INDEX_MAGIC = b"RQMI"
+COEFF_INDEX_DIR = os.environ.get(
+    "COEFF_INDEX_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".coeff_index")
+)
+COEFF_TUPLE_WIDTH = {'rational': 5, 'polynomial_3': 4, 'polynomial_4': 3}
+
 # Context configurations for different problem types
 CONTEXTS_CONFIG = [
     {
@@ -144,6 +165,78 @@ PHYSICAL_INTERPRETATIONS = {
 }
 
 
+# CHỈ MỤC HỆ SỐ HỢP LỆ
+
+class CoefficientIndex:
+    """Bảng các bộ hệ số hợp lệ, lưu phẳng trong một mảng int8 (mỗi bộ chiếm `width` phần tử).
+
+    Hỗ trợ len() và truy cập theo chỉ số nên dùng trực tiếp được với random.choice.
+    """
+
+    __slots__ = ('data', 'width')
+
+    def __init__(self, data: array, width: int):
+        self.data = data
+        self.width = width
+
+    @classmethod
+    def from_configs(cls, configs, width):
+        data = array('b')
+        for config in configs:
+            data.extend(config)
+        return cls(data, width)
+
+    def __len__(self):
+        return len(self.data) // self.width
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        start = i * self.width
+        if not 0 <= start < len(self.data):
+            raise IndexError("CoefficientIndex index out of range")
+        return tuple(self.data[start:start + self.width])
+
+    def save(self, path):
+        """Ghi chỉ mục ra file: header (magic, version, width) + mảng int8."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(COEFF_INDEX_MAGIC + bytes([COEFF_INDEX_VERSION, self.width]))
+            self.data.tofile(f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Đọc chỉ mục từ file, trả về None nếu file không tồn tại hoặc khác version."""
+        try:
+            with open(path, "rb") as f:
+                header = f.read(len(COEFF_INDEX_MAGIC) + 2)
+                if (len(header) != len(COEFF_INDEX_MAGIC) + 2
+                        or header[:len(COEFF_INDEX_MAGIC)] != COEFF_INDEX_MAGIC
+                        or header[-2] != COEFF_INDEX_VERSION):
+                    return None
+                data = array('b')
+                data.frombytes(f.read())
+        except OSError:
+            return None
+        width = header[-1]
+        if width == 0 or len(data) % width:
+            return None
+        return cls(data, width)
+
+
+# Cache trong bộ nhớ: key -> CoefficientIndex
+_COEFF_INDEX_CACHE = {}
+
+
+def coefficient_index_path(function_type, coeff_range, domain_min, domain_max):
+    """Đường dẫn file chỉ mục cho một bộ (function_type, coeff_range, domain)."""
+    name = (f"{function_type}_c{coeff_range[0]}_{coeff_range[1]}"
+            f"_d{domain_min}_{domain_max}_v{COEFF_INDEX_VERSION}.bin")
+    return os.path.join(COEFF_INDEX_DIR, name)
+
+
 # PHẦN 1: CÁC HÀM TIỆN ÍCH VÀ FORMAT LATEX
 
 # HÀM TIỆN ÍCH TOÁN HỌC
@@ -737,6 +830,7 @@ class RationalQuadraticMonotonicity(BaseOptimizationQuestion):
             coeff_range = DEFAULT_COEFF_RANGE
 
         valid_configs = []
+        nice_set = frozenset(nice_numbers)
         a_choices = [a for a in range(coeff_range[0], coeff_range[1] + 1) if a != 0]
         d_choices = [d for d in range(coeff_range[0], coeff_range[1] + 1) if d != 0]
 
@@ -748,7 +842,7 @@ class RationalQuadraticMonotonicity(BaseOptimizationQuestion):
                             critical_points, x_p = self.get_critical_points(a, b, c, d, e)
                             if not critical_points:
                                 continue
-                            if all((x in nice_numbers) for x in critical_points):
+                            if all((x in nice_set) for x in critical_points):
                                 valid_configs.append((a, b, c, d, e))
         return valid_configs
 
@@ -809,6 +903,35 @@ class RationalQuadraticMonotonicity(BaseOptimizationQuestion):
                             valid_configs.append((a, b, c))
         return valid_configs
 
+    def get_coefficient_index(self, function_type, coeff_range=None, domain_min=-5, domain_max=5):
+        """Lấy chỉ mục hệ số hợp lệ: cache bộ nhớ -> file trên đĩa -> dựng lại (và lưu).
+
+        Việc duyệt vét cạn chỉ chạy một lần cho mỗi (function_type, coeff_range, domain);
+        các câu hỏi sau chỉ còn lấy mẫu từ chỉ mục.
+        """
+        if coeff_range is None:
+            coeff_range = DEFAULT_COEFF_RANGE
+        key = (function_type, tuple(coeff_range), domain_min, domain_max)
+        index = _COEFF_INDEX_CACHE.get(key)
+        if index is not None:
+            return index
+
+        path = coefficient_index_path(function_type, coeff_range, domain_min, domain_max)
+        index = CoefficientIndex.load(path)
+        if index is None:
+            nice_numbers = self.get_nice_numbers(domain_min, domain_max)
+            configs = self.get_valid_coefficients_unified(
+                function_type, nice_numbers, coeff_range, domain_min, domain_max
+            )
+            index = CoefficientIndex.from_configs(configs, COEFF_TUPLE_WIDTH[function_type])
+            try:
+                index.save(path)
+            except OSError as e:
+                logging.warning(f"Không ghi được chỉ mục hệ số {path}: {e}")
+
+        _COEFF_INDEX_CACHE[key] = index
+        return index
+
     # Wrapper methods for backward compatibility
     def get_valid_coefficients(self, nice_numbers=None, coeff_range=None, domain_min=-5):
         return self.get_valid_coefficients_unified('rational', nice_numbers, coeff_range, domain_min, domain_min + 10)
@@ -956,17 +1079,15 @@ class RationalQuadraticMonotonicity(BaseOptimizationQuestion):
         domain_min = constraints.get("domain_min", DEFAULT_DOMAIN_MIN)
         domain_max = constraints.get("domain_max", DEFAULT_DOMAIN_MAX)
 
-        # Build nice numbers once
-        nice_numbers = self.get_nice_numbers(domain_min, domain_max)
-
+        # Lấy mẫu từ chỉ mục dựng sẵn thay vì duyệt vét cạn mỗi câu
         coeff_range = DEFAULT_COEFF_RANGE
-        valid_configs = self.get_valid_coefficients(nice_numbers, coeff_range, domain_min)
+        valid_configs = self.get_coefficient_index('rational', coeff_range, domain_min, domain_max)
         if not valid_configs:
             coeff_range = (-10, 10)
-            valid_configs = self.get_valid_coefficients(nice_numbers, coeff_range, domain_min)
+            valid_configs = self.get_coefficient_index('rational', coeff_range, domain_min, domain_max)
             if not valid_configs:
                 raise RuntimeError("Không tìm thấy bộ hệ số hợp lệ.")
-        for attempt in range(max_attempts):
+        for attempt in attempts(max_attempts):
             a, b, c, d, e = random.choice(valid_configs)
             critical_points, x_p = self.get_critical_points(a, b, c, d, e)
             if not critical_points:
@@ -1018,7 +1139,7 @@ class RationalQuadraticMonotonicity(BaseOptimizationQuestion):
         if not valid_configs:
             raise RuntimeError("Không tìm thấy bộ hệ số bậc 3 nghiệm đẹp.")
 
-        for attempt in range(max_attempts):
+        for attempt in attempts(max_attempts):
             k, param_a, param_b, C = random.choice(valid_configs)
 
             # Critical points from new form: x = a and x = -b
@@ -1102,7 +1223,7 @@ class RationalQuadraticMonotonicity(BaseOptimizationQuestion):
         valid_configs = self.get_valid_coefficients_poly4(nice_numbers, (-3, 3), domain_min, domain_max)
         if not valid_configs:
             raise RuntimeError("Không tìm thấy bộ hệ số bậc 4 nghiệm đẹp.")
-        for attempt in range(max_attempts):
+        for attempt in attempts(max_attempts):
             a, b, c = random.choice(valid_configs)
             # Với hàm s(t) = at^4 + bt^2 + c
             # v(t) = s'(t) = 4at^3 + 2bt  
@@ -1572,76 +1693,60 @@ class RationalQuadraticMonotonicity(BaseOptimizationQuestion):
         correct_intervals = increasing_intervals if monotonicity == "tăng" else decreasing_intervals
         wrong_intervals = decreasing_intervals if monotonicity == "tăng" else increasing_intervals
 
-        wrong_answers = []
-
-        # Luôn có đáp án "không có khoảng thời gian nào" làm một option
-        wrong_answers.append("không có khoảng thời gian nào")
-
-        # Đáp án sai 1: Ngược lại với đáp án đúng (lấy khoảng đầu tiên nếu có)
-        if wrong_intervals:
-            interval = wrong_intervals[0]  # Lấy khoảng đầu tiên
-            start, end = interval
-
-            # Đảm bảo khoảng nằm trong domain hợp lệ và là số nguyên
-            actual_start = max(round(start), domain_min) if start != float('-inf') else domain_min
-            actual_end = min(round(end), domain_max) if end != float('inf') else domain_max
-
-            if actual_start < actual_end and actual_start >= domain_min:
-                wrong_answers.append(f"từ {context['time_unit']} thứ {actual_start} đến {actual_end}")
-
-        # Đáp án sai 2 & 3: Khoảng sai lệch từ đáp án đúng
-        if correct_intervals:
-            interval = correct_intervals[0]  # Lấy khoảng đầu tiên
-            start, end = interval
-
-            # Sai lệch khoảng thời gian nhưng đảm bảo >= domain_min và là số nguyên
-            if start != float('-inf') and end != float('inf'):
-                wrong_start = max(round(start) + 1, domain_min)
-                wrong_end = round(end) - 1
-                if wrong_start < wrong_end and wrong_start >= domain_min:
-                    wrong_answers.append(
-                        f"từ {context['time_unit']} thứ {wrong_start} đến {wrong_end}")
-
-                # Mở rộng khoảng nhưng đảm bảo >= domain_min và là số nguyên
-                extended_start = max(round(start) - 2, domain_min)
-                extended_end = min(round(end) + 2, domain_max)
-                if extended_start < extended_end and extended_start >= domain_min:
-                    wrong_answers.append(
-                        f"từ {context['time_unit']} thứ {extended_start} đến {extended_end}")
-
-        # Đảm bảo có đủ 3 đáp án sai bằng cách tạo thêm đáp án hợp lý
-        while len(wrong_answers) < 3:
-            # Tạo đáp án sai ngẫu nhiên trong domain với số nguyên
-            if domain_min >= 0:  # Ngữ cảnh thời gian
-                # Tạo khoảng ngẫu nhiên từ 0 đến domain_max với số nguyên
-                start_options = [0, 1, 2, 3, 4, 5]
-                end_options = [domain_max // 2, domain_max - 1, domain_max, domain_max + 1, domain_max + 2]
-
-                # Lọc để đảm bảo start < end và trong domain hợp lý
-                valid_starts = [int(s) for s in start_options if s >= domain_min and s <= domain_max - 1]
-                valid_ends = [int(e) for e in end_options if e >= domain_min + 1 and e <= domain_max]
-
-                if valid_starts and valid_ends:
-                    start = random.choice(valid_starts)
-                    end = random.choice([e for e in valid_ends if e > start])
-                    candidate = f"từ {context['time_unit']} thứ {start} đến {end}"
-
-                    # Đảm bảo không trùng với các đáp án đã có
-                    if candidate not in wrong_answers and candidate != self.correct_answer:
-                        wrong_answers.append(candidate)
-                    else:
-                        # Nếu trùng, tạo khoảng khác
-                        start = random.randint(domain_min, domain_max - 1)
-                        end = random.randint(start + 1, domain_max)
-                        wrong_answers.append(f"từ {context['time_unit']} thứ {start} đến {end}")
-                else:
-                    # Fallback nếu không tạo được khoảng hợp lý
-                    wrong_answers.append(f"từ {context['time_unit']} thứ 0 đến {domain_max // 2}")
-            else:
-                # Trường hợp domain không có ràng buộc thời gian
-                wrong_answers.append(f"không có {context['time_unit']} nào")
+        time_unit = context['time_unit']
+
+        def render(answer):
+            if isinstance(answer, str):
+                return answer
+            return f"từ {time_unit} thứ {answer[0]} đến {answer[1]}"
+
+        def valid_interval(answer):
+            # Khoảng phải nằm trong domain hợp lệ, đầu < cuối
+            return isinstance(answer, str) or domain_min <= answer[0] < answer[1]
+
+        # Đáp án sai: ngược lại với đáp án đúng (lấy khoảng đầu tiên nếu có)
+        def opposite_interval(correct, rng):
+            if wrong_intervals:
+                start, end = wrong_intervals[0]
+                actual_start = max(round(start), domain_min) if start != float('-inf') else domain_min
+                actual_end = min(round(end), domain_max) if end != float('inf') else domain_max
+                yield actual_start, actual_end
+
+        # Đáp án sai: thu hẹp / mở rộng khoảng đúng (đầu mút số nguyên, >= domain_min)
+        def shifted_interval(correct, rng):
+            if correct_intervals:
+                start, end = correct_intervals[0]
+                if start != float('-inf') and end != float('inf'):
+                    yield max(round(start) + 1, domain_min), round(end) - 1
+                    yield max(round(start) - 2, domain_min), min(round(end) + 2, domain_max)
+
+        # Khoảng ngẫu nhiên trong domain (chỉ với ngữ cảnh thời gian)
+        def random_interval(rng):
+            start_options = [0, 1, 2, 3, 4, 5]
+            end_options = [domain_max // 2, domain_max - 1, domain_max, domain_max + 1, domain_max + 2]
+            valid_starts = [int(s) for s in start_options if domain_min <= s <= domain_max - 1]
+            valid_ends = [int(e) for e in end_options if domain_min + 1 <= e <= domain_max]
+            start = rng.choice(valid_starts) if valid_starts else None
+            ends = [e for e in valid_ends if start is not None and e > start]
+            if not ends:
+                return None
+            return start, rng.choice(ends)
+
+        mistakes = [
+            # Luôn có đáp án "không có khoảng thời gian nào" làm một option
+            constants("không có khoảng thời gian nào"),
+            opposite_interval,
+            shifted_interval,
+        ]
+        if domain_min >= 0:
+            mistakes += [
+                draws(random_interval, limit=WRONG_ANSWER_DRAWS),
+                constants((0, domain_max // 2)),
+            ]
+        mistakes.append(constants(f"không có {time_unit} nào"))
 
-        return wrong_answers[:3]
+        engine = DistractorEngine(DistractorKind.INTERVAL, render=render, accept=valid_interval)
+        return engine.generate(self.correct_answer, mistakes)
 
     def generate_question_text(self) -> str:
         """Sinh đề bài với ngữ cảnh thực tế đa dạng."""
@@ -1,7 +1,15 @@
+import os
 import random
 from fractions import Fraction
 import sys
 import logging
+
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+from generation_deadline import check_deadline
 #vector_equations_min_max_true_false
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -140,6 +148,7 @@ def generate_question(question_number):
     # Option a: P = |x·MA + y·MB + z·MC| = |sum|·MI khi chèn I → min = 0 tại M=I
     # Điều kiện: sum = x+y+z > 0 đảm bảo P ≥ 0 và min tồn tại
     while True:
+        check_deadline()
         A_a, B_a, C_a = generate_random_points()
         x_a, y_a, z_a = [nonzero_int() for _ in range(3)]
         if x_a + y_a + z_a > 0:
@@ -166,6 +175,7 @@ def generate_question(question_number):
     # Option b: P = x·MA² + y·MB² + z·MC² = (x+y+z)·MI² + const
     # Điều kiện: x+y+z > 0 đảm bảo paraboloid mở lên → P đạt min tại M=I
     while True:
+        check_deadline()
         A_b, B_b, C_b = generate_random_points()
         x_b, y_b, z_b = [nonzero_int() for _ in range(3)]
         if x_b + y_b + z_b > 0:
@@ -212,6 +222,7 @@ def generate_question(question_number):
     # Trọng số tỉ cự: w_A=a+c, w_B=a+b, w_C=b+c; tổng = 2(a+b+c)
     # Điều kiện: a+b+c > 0 đảm bảo cả hệ số MI² > 0 lẫn tổng trọng số > 0
     while True:
+        check_deadline()
         A_c, B_c, C_c = generate_random_points()
         a_c, b_c, c_c = [nonzero_int() for _ in range(3)]
         sum_abc = a_c + b_c + c_c
@@ -264,6 +275,7 @@ def generate_question(question_number):
     # Trọng số tỉ cự: w_A=2a+d+f, w_B=2b+d+e, w_C=2c+e+f; tổng = 2(a+b+c+d+e+f)
     # Điều kiện: a+b+c+d+e+f > 0 đảm bảo hệ số MI² > 0 và tổng trọng số > 0
     while True:
+        check_deadline()
         A_d, B_d, C_d = generate_random_points()
         a_d, b_d, c_d, d_d, e_d, f_d = [nonzero_int() for _ in range(6)]
         sum_abcdef = a_d + b_d + c_d + d_d + e_d + f_d
@@ -1,8 +1,9 @@
 import math
-import subprocess
 import random
 import sys
 
+from latex_compile_service import LatexCompileService, print_compile_result
+
 
 # Biến chứa hình vẽ TikZ
 TIKZ_FIGURE = """
@@ -396,15 +397,13 @@ def save_latex_to_file(content, filename="solution.tex"):
         f.write(content)
 
 
-# Biên dịch .tex thành .pdf bằng xelatex
+# Biên dịch .tex thành .pdf bằng xelatex (qua latex_compile_service: có cache, tự chạy lại khi .aux đổi)
 def compile_latex(filename="solution.tex"):
-    try:
-        subprocess.run(["xelatex", filename], check=True)
+    result = LatexCompileService().compile(filename)
+    if result.success:
         print("✅ Biên dịch thành công. Đã tạo file PDF.")
-    except subprocess.CalledProcessError as e:
-        print("❌ Lỗi khi biên dịch LaTeX:", e)
-    except FileNotFoundError:
-        print("❌ Không tìm thấy `xelatex`. Hãy cài TeX Live hoặc MikTeX và đảm bảo nó có trong PATH.")
+    else:
+        print_compile_result(result)
 
 
 # === Chạy toàn bộ quy trình ===
@@ -1,9 +1,19 @@
 import math
 import random
+import os
+import sys
 from typing import List, Tuple, Dict, Optional
 from fractions import Fraction
 from dataclasses import dataclass
 
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+# dot/cross dùng chung (2025/base_template/oxyz_core.py)
+from oxyz_core import cross, dot
+
 # Constants
 COORD_RANGE = (-4, 5)
 SMALL_COORD_RANGE = (-3, 4)
@@ -449,18 +459,6 @@ def are_collinear(v: Tuple[int, int, int], w: Tuple[int, int, int]) -> bool:
     return (x1 * y2 == y1 * x2) and (x1 * z2 == z1 * x2) and (y1 * z2 == z1 * y2)
 
 
-def dot(v: Tuple[int, int, int], w: Tuple[int, int, int]) -> int:
-    return v[0]*w[0] + v[1]*w[1] + v[2]*w[2]
-
-
-def cross(u: Tuple[int, int, int], v: Tuple[int, int, int]) -> Tuple[int, int, int]:
-    return (
-        u[1]*v[2] - u[2]*v[1],
-        u[2]*v[0] - u[0]*v[2],
-        u[0]*v[1] - u[1]*v[0]
-    )
-
-
 def point_plane_distance(a: int, b: int, c: int, d: int, P: Tuple[int, int, int]) -> Tuple[int, int]:
     """Calculate distance from point to plane. Returns (numerator, norm_squared) where distance = numerator/sqrt(norm_squared)"""
     numer = abs(a*P[0] + b*P[1] + c*P[2] + d)
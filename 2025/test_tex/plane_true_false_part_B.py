@@ -1,6 +1,21 @@
 import random
 import math
-from typing import List, Tuple, Dict
+import re
+import hashlib
+import json
+import os
+import sys
+from typing import Callable, List, Optional, Tuple, Dict
+
+import numpy as np
+
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+# Vector/plane helpers dùng chung (2025/base_template/oxyz_core.py)
+from oxyz_core import add, batch_cross, batch_dot, batch_norm_sq, cross, dot, scale, sub as subtract
 
 # Simple formatters
 
@@ -105,27 +120,6 @@ def format_plane_equation(a: int, b: int, c: int, d: int) -> str:
     """Legacy function for backward compatibility"""
     return format_plane_equation_with_sqrt(a, b, c, d, 0, 1)
 
-# Vector/plane helpers
-
-def cross(u: Tuple[int, int, int], v: Tuple[int, int, int]) -> Tuple[int, int, int]:
-    return (u[1]*v[2] - u[2]*v[1], u[2]*v[0] - u[0]*v[2], u[0]*v[1] - u[1]*v[0])
-
-
-def subtract(p: Tuple[int, int, int], q: Tuple[int, int, int]) -> Tuple[int, int, int]:
-    return (p[0]-q[0], p[1]-q[1], p[2]-q[2])
-
-
-def add(p: Tuple[int, int, int], q: Tuple[int, int, int]) -> Tuple[int, int, int]:
-    return (p[0]+q[0], p[1]+q[1], p[2]+q[2])
-
-
-def dot(u: Tuple[int, int, int], v: Tuple[int, int, int]) -> int:
-    return u[0]*v[0] + u[1]*v[1] + u[2]*v[2]
-
-
-def scale(v: Tuple[int, int, int], k: int) -> Tuple[int, int, int]:
-    return (k*v[0], k*v[1], k*v[2])
-
 # Propositions (Part B)
 
 # GROUP 1: Ví dụ 10 - Câu 1-2: Mặt phẳng qua điểm với VTPT
@@ -146,10 +140,13 @@ def prop_plane_point_normal() -> Dict[str, str]:
     # Tính d = -(ax₀ + by₀ + cz₀)
     d = -(n[0]*pt[0] + n[1]*pt[1] + n[2]*pt[2])
     
-    true_text = f"Phương trình mặt phẳng đi qua {format_point(pt)} và có VTPT {format_vec(n)} là \\({format_plane_equation(n[0], n[1], n[2], d)}\\)."
-    
     # False: sai dấu d hoặc sai hệ số
     wrong_d = d + random.choice([-2, -1, 1, 2])
+    return point_normal_statements(pt, n, d, wrong_d)
+
+
+def point_normal_statements(pt: Tuple[int, int, int], n: Tuple[int, int, int], d: int, wrong_d: int) -> Dict[str, str]:
+    true_text = f"Phương trình mặt phẳng đi qua {format_point(pt)} và có VTPT {format_vec(n)} là \\({format_plane_equation(n[0], n[1], n[2], d)}\\)."
     false_text = f"Phương trình mặt phẳng đi qua {format_point(pt)} và có VTPT {format_vec(n)} là \\({format_plane_equation(n[0], n[1], n[2], wrong_d)}\\)."
     
     return {"true": true_text, "false": false_text}
@@ -169,10 +166,13 @@ def prop_plane_perpendicular_axis() -> Dict[str, str]:
     axis_name, normal, coord_idx, var = random.choice(axes)
     point = random.choice(points)
     
-    true_text = f"Phương trình mặt phẳng đi qua M{format_point(point)} và vuông góc với trục {axis_name} là \\({var}-{point[coord_idx]}=0\\)."
-    
     # False: sai dấu hoặc sai hệ số
     wrong_coord = point[coord_idx] + random.choice([-2, 1, 2])
+    return perpendicular_axis_statements(axis_name, var, point, point[coord_idx], wrong_coord)
+
+
+def perpendicular_axis_statements(axis_name: str, var: str, point: Tuple[int, int, int], coord: int, wrong_coord: int) -> Dict[str, str]:
+    true_text = f"Phương trình mặt phẳng đi qua M{format_point(point)} và vuông góc với trục {axis_name} là \\({var}-{coord}=0\\)."
     false_text = f"Phương trình mặt phẳng đi qua M{format_point(point)} và vuông góc với trục {axis_name} là \\({var}-{wrong_coord}=0\\)."
     
     return {"true": true_text, "false": false_text}
@@ -192,10 +192,13 @@ def prop_plane_perpendicular_line() -> Dict[str, str]:
     # PT: AB·(x-A) = 0
     d = -(AB[0]*A[0] + AB[1]*A[1] + AB[2]*A[2])
     
-    true_text = f"Cho A{format_point(A)} và B{format_point(B)}. Phương trình mặt phẳng đi qua A và vuông góc với đường thẳng AB là \\({format_plane_equation(AB[0], AB[1], AB[2], d)}\\)."
-    
     # False: sai hệ số hoặc dấu
     wrong_d = d + random.choice([-3, 3, -6, 6])
+    return perpendicular_line_statements(A, B, AB, d, wrong_d)
+
+
+def perpendicular_line_statements(A: Tuple[int, int, int], B: Tuple[int, int, int], AB: Tuple[int, int, int], d: int, wrong_d: int) -> Dict[str, str]:
+    true_text = f"Cho A{format_point(A)} và B{format_point(B)}. Phương trình mặt phẳng đi qua A và vuông góc với đường thẳng AB là \\({format_plane_equation(AB[0], AB[1], AB[2], d)}\\)."
     false_text = f"Cho A{format_point(A)} và B{format_point(B)}. Phương trình mặt phẳng đi qua A và vuông góc với đường thẳng AB là \\({format_plane_equation(AB[0], AB[1], AB[2], wrong_d)}\\)."
     
     return {"true": true_text, "false": false_text}
@@ -242,11 +245,14 @@ def prop_plane_parallel_to_plane() -> Dict[str, str]:
     # PT song song: ax + by + cz + d = 0, qua A
     d = -(normal[0]*A[0] + normal[1]*A[1] + normal[2]*A[2])
     
-    true_text = f"Phương trình mặt phẳng qua A{format_point(A)} và song song với (Q): {format_plane_equation(a, b, c, d_orig)} là \\({format_plane_equation(normal[0], normal[1], normal[2], d)}\\)."
-    
     # False: sai dấu d
-    wrong_d = -d
-    false_text = f"Phương trình mặt phẳng qua A{format_point(A)} và song song với (Q): {format_plane_equation(a, b, c, d_orig)} là \\({format_plane_equation(normal[0], normal[1], normal[2], wrong_d)}\\)."
+    return parallel_to_plane_statements(A, (a, b, c, d_orig), d, -d)
+
+
+def parallel_to_plane_statements(A: Tuple[int, int, int], plane: Tuple[int, int, int, int], d: int, wrong_d: int) -> Dict[str, str]:
+    a, b, c, d_orig = plane
+    true_text = f"Phương trình mặt phẳng qua A{format_point(A)} và song song với (Q): {format_plane_equation(a, b, c, d_orig)} là \\({format_plane_equation(a, b, c, d)}\\)."
+    false_text = f"Phương trình mặt phẳng qua A{format_point(A)} và song song với (Q): {format_plane_equation(a, b, c, d_orig)} là \\({format_plane_equation(a, b, c, wrong_d)}\\)."
     
     return {"true": true_text, "false": false_text}
 
@@ -265,10 +271,13 @@ def prop_plane_parallel_coordinate_plane() -> Dict[str, str]:
     plane_name, var, coord_idx = random.choice(coordinate_planes)
     point = random.choice(points)
     
-    true_text = f"Phương trình mặt phẳng qua A{format_point(point)} và song song với ({plane_name}) là \\({var} - {point[coord_idx]} = 0\\)."
-    
     # False: sai dấu hoặc hệ số
     wrong_coord = point[coord_idx] + random.choice([-1, 1, 2])
+    return parallel_coordinate_plane_statements(plane_name, var, point, point[coord_idx], wrong_coord)
+
+
+def parallel_coordinate_plane_statements(plane_name: str, var: str, point: Tuple[int, int, int], coord: int, wrong_coord: int) -> Dict[str, str]:
+    true_text = f"Phương trình mặt phẳng qua A{format_point(point)} và song song với ({plane_name}) là \\({var} - {coord} = 0\\)."
     false_text = f"Phương trình mặt phẳng qua A{format_point(point)} và song song với ({plane_name}) là \\({var} - {wrong_coord} = 0\\)."
     
     return {"true": true_text, "false": false_text}
@@ -318,11 +327,16 @@ def prop_plane_direction_vectors() -> Dict[str, str]:
     n = cross(a, b)
     d = -(n[0]*M[0] + n[1]*M[1] + n[2]*M[2])
     
-    true_text = f"Mặt phẳng đi qua điểm M{format_point(M)} và có cặp véctơ chỉ phương {format_vec(a)}, {format_vec(b)} có phương trình \\({format_plane_equation(n[0], n[1], n[2], d)}\\)."
-    
     # False: sai dấu một hệ số
     wrong_n = (n[0], -n[1], n[2])
     wrong_d = -(wrong_n[0]*M[0] + wrong_n[1]*M[1] + wrong_n[2]*M[2])
+    return direction_vectors_statements(M, a, b, n, d, wrong_n, wrong_d)
+
+
+def direction_vectors_statements(
+    M: Tuple[int, int, int], a: Tuple[int, int, int], b: Tuple[int, int, int], n: Tuple[int, int, int], d: int, wrong_n: Tuple[int, int, int], wrong_d: int
+) -> Dict[str, str]:
+    true_text = f"Mặt phẳng đi qua điểm M{format_point(M)} và có cặp véctơ chỉ phương {format_vec(a)}, {format_vec(b)} có phương trình \\({format_plane_equation(n[0], n[1], n[2], d)}\\)."
     false_text = f"Mặt phẳng đi qua điểm M{format_point(M)} và có cặp véctơ chỉ phương {format_vec(a)}, {format_vec(b)} có phương trình \\({format_plane_equation(wrong_n[0], wrong_n[1], wrong_n[2], wrong_d)}\\)."
     
     return {"true": true_text, "false": false_text}
@@ -565,7 +579,11 @@ def prop_plane_from_projections_ABC() -> Dict[str, str]:
     b = M[0] * M[2] 
     c = M[0] * M[1]
     d = -M[0] * M[1] * M[2]
-    
+    return projections_ABC_statements(M, (a, b, c), d)
+
+
+def projections_ABC_statements(M: Tuple[int, int, int], n: Tuple[int, int, int], d: int) -> Dict[str, str]:
+    a, b, c = n
     true_text = f"Với điểm M{format_point(M)}, gọi A, B, C lần lượt là hình chiếu của M trên các trục tọa độ. Khi đó phương trình mặt phẳng (ABC) là \\({format_plane_equation(a, b, c, d)}\\)."
     
     # False: swap some coefficients
@@ -614,7 +632,11 @@ def prop_parallel_to_ABC_from_M() -> Dict[str, str]:
     b = M[0] * M[2]
     c = M[0] * M[1]
     d = -M[0] * M[1] * M[2]
-    
+    return parallel_to_ABC_statements(M, (a, b, c), d)
+
+
+def parallel_to_ABC_statements(M: Tuple[int, int, int], n: Tuple[int, int, int], d: int) -> Dict[str, str]:
+    a, b, c = n
     true_text = f"Cho điểm M{format_point(M)}. Gọi A, B, C lần lượt là hình chiếu của M trên các trục tọa độ. Mặt phẳng song song với (ABC) có phương trình \\({format_plane_equation(a, b, c, d)}\\)."
     
     # False: swap some coefficients
@@ -638,7 +660,11 @@ def prop_plane_orthocenter_from_projections() -> Dict[str, str]:
     k_wrong = k_correct + random.choice([-5, -3, 3, 5])
     if k_wrong <= 0:  # Đảm bảo k dương
         k_wrong = k_correct + random.choice([3, 5, 7])
-    
+    return orthocenter_projections_statements(M, k_correct, k_wrong)
+
+
+def orthocenter_projections_statements(M: Tuple[int, int, int], k_correct: int, k_wrong: int) -> Dict[str, str]:
+    a, b, c = M
     true_text = f"Mặt phẳng đi qua M{format_point(M)} và cắt các trục tọa độ tại A, B, C sao cho M là trực tâm tam giác ABC có phương trình \\({a}x + {b}y + {c}z - {k_correct} = 0\\)."
     false_text = f"Mặt phẳng đi qua M{format_point(M)} và cắt các trục tọa độ tại A, B, C sao cho M là trực tâm tam giác ABC có phương trình \\({a}x + {b}y + {c}z - {k_wrong} = 0\\)."
     
@@ -658,10 +684,14 @@ def prop_plane_centroid_from_axes() -> Dict[str, str]:
     c_coeff = x0 * y0
     d_val = 3 * x0 * y0 * z0
     
-    true_text = f"Mặt phẳng đi qua G{format_point(G)} và cắt các trục tọa độ tại A, B, C sao cho G là trọng tâm tam giác ABC có phương trình \\({format_plane_equation(a_coeff, b_coeff, c_coeff, -d_val)}\\)."
-    
     # False: sai hệ số
     wrong_d = d_val + random.choice([-6, 6, -9, 9])
+    return centroid_from_axes_statements(G, (a_coeff, b_coeff, c_coeff), d_val, wrong_d)
+
+
+def centroid_from_axes_statements(G: Tuple[int, int, int], n: Tuple[int, int, int], d_val: int, wrong_d: int) -> Dict[str, str]:
+    a_coeff, b_coeff, c_coeff = n
+    true_text = f"Mặt phẳng đi qua G{format_point(G)} và cắt các trục tọa độ tại A, B, C sao cho G là trọng tâm tam giác ABC có phương trình \\({format_plane_equation(a_coeff, b_coeff, c_coeff, -d_val)}\\)."
     false_text = f"Mặt phẳng đi qua G{format_point(G)} và cắt các trục tọa độ tại A, B, C sao cho G là trọng tâm tam giác ABC có phương trình \\({format_plane_equation(a_coeff, b_coeff, c_coeff, -wrong_d)}\\)."
     
     return {"true": true_text, "false": false_text}
@@ -756,13 +786,11 @@ def prop_plane_perpendicular_two_given_planes() -> Dict[str, str]:
         p2 = (random.randint(-3, 3), random.randint(-3, 3), random.randint(-3, 3))
         d1 = random.randint(-5, 5)
         d2 = random.randint(-5, 5)
-        desc1 = f"{p1[0]}x+{p1[1]}y+{p1[2]}z+{d1}=0"
-        desc2 = f"{p2[0]}x+{p2[1]}y+{p2[2]}z+{d2}=0"
-        plane_pairs.append(((p1, desc1), (p2, desc2)))
+        plane_pairs.append(((p1, d1), (p2, d2)))
     
     points = [(random.randint(0, 3), random.randint(0, 3), random.randint(0, 3)) for _ in range(4)]
     
-    (P1_normal, P1_desc), (P2_normal, P2_desc) = random.choice(plane_pairs)
+    (P1_normal, P1_d), (P2_normal, P2_d) = random.choice(plane_pairs)
     A = random.choice(points)
     
     # VTPT của mặt phẳng cần tìm = P1_normal × P2_normal
@@ -781,13 +809,20 @@ def prop_plane_perpendicular_two_given_planes() -> Dict[str, str]:
         n = (int(n[0]/gcd_val), int(n[1]/gcd_val), int(n[2]/gcd_val))
     
     d = -(n[0]*A[0] + n[1]*A[1] + n[2]*A[2])
-    
-    true_text = f"Cho các mặt phẳng (P\\(_1\\)): {P1_desc} và (P\\(_2\\)): {P2_desc}. Mặt phẳng đi qua điểm A{format_point(A)} và vuông góc với cả hai mặt phẳng trên có phương trình \\({format_plane_equation(n[0], n[1], n[2], d)}\\)."
+    return perpendicular_two_given_planes_statements((*P1_normal, P1_d), (*P2_normal, P2_d), A, n, d)
+
+
+def perpendicular_two_given_planes_statements(
+    plane1: Tuple[int, int, int, int], plane2: Tuple[int, int, int, int], A: Tuple[int, int, int], n: Tuple[int, int, int], d: int
+) -> Dict[str, str]:
+    desc1 = f"{plane1[0]}x+{plane1[1]}y+{plane1[2]}z+{plane1[3]}=0"
+    desc2 = f"{plane2[0]}x+{plane2[1]}y+{plane2[2]}z+{plane2[3]}=0"
+    true_text = f"Cho các mặt phẳng (P\\(_1\\)): {desc1} và (P\\(_2\\)): {desc2}. Mặt phẳng đi qua điểm A{format_point(A)} và vuông góc với cả hai mặt phẳng trên có phương trình \\({format_plane_equation(n[0], n[1], n[2], d)}\\)."
     
     # False: sai dấu một hệ số
     wrong_n = (n[0], -n[1], n[2])
     wrong_d = -(wrong_n[0]*A[0] + wrong_n[1]*A[1] + wrong_n[2]*A[2])
-    false_text = f"Cho các mặt phẳng (P\\(_1\\)): {P1_desc} và (P\\(_2\\)): {P2_desc}. Mặt phẳng đi qua điểm A{format_point(A)} và vuông góc với cả hai mặt phẳng trên có phương trình \\({format_plane_equation(wrong_n[0], wrong_n[1], wrong_n[2], wrong_d)}\\)."
+    false_text = f"Cho các mặt phẳng (P\\(_1\\)): {desc1} và (P\\(_2\\)): {desc2}. Mặt phẳng đi qua điểm A{format_point(A)} và vuông góc với cả hai mặt phẳng trên có phương trình \\({format_plane_equation(wrong_n[0], wrong_n[1], wrong_n[2], wrong_d)}\\)."
     
     return {"true": true_text, "false": false_text}
 
@@ -807,10 +842,14 @@ def prop_min_volume_plane_through_M() -> Dict[str, str]:
     c = p * q
     d = -3 * p * q * r
     
-    true_text = f"Mặt phẳng đi qua M{format_point(M)} cắt ba trục tọa độ sao cho thể tích tứ diện OABC nhỏ nhất có phương trình \\({format_plane_equation(a, b, c, d)}\\)."
-    
     # False: wrong coefficients (sai công thức)
     wrong_a = 4 * q * r  # Sai hệ số
+    return min_volume_statements(M, (a, b, c), d, wrong_a)
+
+
+def min_volume_statements(M: Tuple[int, int, int], n: Tuple[int, int, int], d: int, wrong_a: int) -> Dict[str, str]:
+    a, b, c = n
+    true_text = f"Mặt phẳng đi qua M{format_point(M)} cắt ba trục tọa độ sao cho thể tích tứ diện OABC nhỏ nhất có phương trình \\({format_plane_equation(a, b, c, d)}\\)."
     false_text = f"Mặt phẳng đi qua M{format_point(M)} cắt ba trục tọa độ sao cho thể tích tứ diện OABC nhỏ nhất có phương trình \\({format_plane_equation(wrong_a, b, c, d)}\\)."
     return {"true": true_text, "false": false_text}
 
@@ -908,10 +947,14 @@ def prop_plane_orthocenter_condition() -> Dict[str, str]:
     k = p*p + q*q + r*r
     a, b, c, d = p, q, r, -k
     
-    true_text = f"Mặt phẳng đi qua điểm M{format_point(M)} và cắt trục tọa độ Ox, Oy, Oz tại A, B, C sao cho M là trực tâm tam giác ABC có phương trình \\({format_plane_equation(a, b, c, d)}\\)."
-    
     # False: wrong constant 
     wrong_d = d + random.choice([-5, -3, 3, 5])
+    return orthocenter_condition_statements(M, d, wrong_d)
+
+
+def orthocenter_condition_statements(M: Tuple[int, int, int], d: int, wrong_d: int) -> Dict[str, str]:
+    a, b, c = M
+    true_text = f"Mặt phẳng đi qua điểm M{format_point(M)} và cắt trục tọa độ Ox, Oy, Oz tại A, B, C sao cho M là trực tâm tam giác ABC có phương trình \\({format_plane_equation(a, b, c, d)}\\)."
     false_text = f"Mặt phẳng đi qua điểm M{format_point(M)} và cắt trục tọa độ Ox, Oy, Oz tại A, B, C sao cho M là trực tâm tam giác ABC có phương trình \\({format_plane_equation(a, b, c, wrong_d)}\\)."
     
     return {"true": true_text, "false": false_text}
@@ -1411,6 +1454,11 @@ def prop_plane_contains_axis_perpendicular_given_plane() -> Dict[str, str]:
     # VTPT của mp cần tìm: axis_vec × plane_normal
     n = cross(axis_vec, plane_normal)
     
+    return contains_axis_perpendicular_statements(axis_name, (a, b, c, d), n)
+
+
+def contains_axis_perpendicular_statements(axis_name: str, plane: Tuple[int, int, int, int], n: Tuple[int, int, int]) -> Dict[str, str]:
+    a, b, c, d = plane
     # Mp chứa trục nên đi qua O(0,0,0)
     d_final = 0
     
@@ -1468,6 +1516,343 @@ PART_B_GROUPS: List[List] = [
 ]
 
 
+# =============================
+# BATCH (NUMPY)
+# =============================
+# Sinh K mệnh đề của cùng một prop trong một lần: bốc mọi số nguyên bằng NumPy thành mảng (K, 3),
+# tính VTPT, d, đáp án sai và mặt nạ hợp lệ trên cả mảng (chỉ bốc lại các hàng suy biến: VTPT bằng 0,
+# A trùng B, tọa độ 0 làm đoạn chắn, đáp án sai trùng đáp án đúng); bước duy nhất chạy theo từng
+# mệnh đề là định dạng chuỗi (dùng chung hàm *_statements với bản vô hướng nên văn bản giống hệt).
+# Bản batch lấy đúng phần hợp lệ của phân phối bản vô hướng; generate_prop_batch cũng bốc lại
+# mệnh đề vô hướng không qua được is_valid_statement, nên ngân hàng mệnh đề không có hàng suy biến.
+
+AXIS_NAMES = ("Ox", "Oy", "Oz")
+AXIS_VARS = ("x", "y", "z")
+MAX_INVALID_REDRAWS = 50
+
+# Phương trình không còn biến: "\\(0 = 0\\)", "(P): -3 = 0"
+_CONSTANT_EQUATION = re.compile(r"(?:\\\(|\$|:)\s*-?\d+ = 0")
+
+
+def is_valid_statement(statement: Dict[str, str]) -> bool:
+    """Mệnh đề dùng được: đáp án sai khác đáp án đúng và không có phương trình hằng (0 = 0)"""
+    return statement["true"] != statement["false"] and not any(
+        _CONSTANT_EQUATION.search(statement[key]) for key in ("true", "false")
+    )
+
+
+def _randint_array(rng: np.random.Generator, low: int, high: int, size) -> np.ndarray:
+    """Như random.randint (lấy cả hai đầu mút) cho cả mảng"""
+    return rng.integers(low, high + 1, size=size, dtype=np.int64)
+
+
+def _choice_array(rng: np.random.Generator, options: List[int], k: int) -> np.ndarray:
+    """Như random.choice(options) lặp k lần"""
+    return np.asarray(options, dtype=np.int64)[rng.integers(0, len(options), size=k)]
+
+
+def _nonzero_vectors(rng: np.random.Generator, k: int, bound: int) -> np.ndarray:
+    """k vector nguyên khác 0 trong [-bound, bound]^3: chỉ bốc lại các hàng bằng 0"""
+    vectors = _randint_array(rng, -bound, bound, (k, 3))
+    zero = ~vectors.any(axis=1)
+    while zero.any():
+        vectors[zero] = _randint_array(rng, -bound, bound, (int(zero.sum()), 3))
+        zero = ~vectors.any(axis=1)
+    return vectors
+
+
+def _draw_valid(
+    rng: np.random.Generator,
+    k: int,
+    draw: Callable[[np.random.Generator, int], Tuple[np.ndarray, ...]],
+    valid: Callable[..., np.ndarray]
+) -> Tuple[np.ndarray, ...]:
+    """
+    Bốc k bộ tham số bằng draw(rng, m) (mỗi mảng m hàng); chỉ bốc lại các hàng có
+    valid(*mảng) = False, như _nonzero_vectors
+    """
+    arrays = draw(rng, k)
+    bad = ~valid(*arrays)
+    while bad.any():
+        for array, redrawn in zip(arrays, draw(rng, int(bad.sum()))):
+            array[bad] = redrawn
+        bad = ~valid(*arrays)
+    return arrays
+
+
+def _flip_y_changes_plane(n: np.ndarray) -> np.ndarray:
+    # (a, -b, c) là mặt phẳng khác khi b != 0 và không phải -n (a hoặc c khác 0)
+    return (n[:, 1] != 0) & ((n[:, 0] != 0) | (n[:, 2] != 0))
+
+
+def _flip_y(n: np.ndarray) -> np.ndarray:
+    # Đáp án sai "sai dấu một hệ số": (a, -b, c)
+    return n * np.array([1, -1, 1], dtype=np.int64)
+
+
+def batch_plane_point_normal(rng: np.random.Generator, k: int) -> List[Dict[str, str]]:
+    pt = _randint_array(rng, -5, 5, (k, 3))
+    n = _nonzero_vectors(rng, k, 3)
+    d = -batch_dot(n, pt)
+    wrong_d = d + _choice_array(rng, [-2, -1, 1, 2], k)
+    return [point_normal_statements(*row) for row in zip(pt.tolist(), n.tolist(), d.tolist(), wrong_d.tolist())]
+
+
+def batch_plane_perpendicular_axis(rng: np.random.Generator, k: int) -> List[Dict[str, str]]:
+    axis = rng.integers(0, 3, size=k)
+    point = _randint_array(rng, -5, 5, (k, 3))
+    coord = point[np.arange(k), axis]
+    wrong_coord = coord + _choice_array(rng, [-2, 1, 2], k)
+    return [
+        perpendicular_axis_statements(AXIS_NAMES[i], AXIS_VARS[i], p, c, w)
+        for i, p, c, w in zip(axis.tolist(), point.tolist(), coord.tolist(), wrong_coord.tolist())
+    ]
+
+
+def batch_plane_perpendicular_line(rng: np.random.Generator, k: int) -> List[Dict[str, str]]:
+    # A != B (AB là VTPT)
+    A, B = _draw_valid(
+        rng, k,
+        lambda rng, m: (_randint_array(rng, -3, 3, (m, 3)), _randint_array(rng, -3, 3, (m, 3))),
+        lambda A, B: (A != B).any(axis=1),
+    )
+    AB = B - A
+    d = -batch_dot(AB, A)
+    wrong_d = d + _choice_array(rng, [-3, 3, -6, 6], k)
+    return [
+        perpendicular_line_statements(*row)
+        for row in zip(A.tolist(), B.tolist(), AB.tolist(), d.tolist(), wrong_d.tolist())
+    ]
+
+
+def batch_plane_parallel_to_plane(rng: np.random.Generator, k: int) -> List[Dict[str, str]]:
+    # (Q) có VTPT khác 0; d != 0 để đáp án sai -d khác đáp án đúng
+    A, plane = _draw_valid(
+        rng, k,
+        lambda rng, m: (_randint_array(rng, -3, 3, (m, 3)), _randint_array(rng, -3, 3, (m, 4))),
+        lambda A, plane: plane[:, :3].any(axis=1) & (batch_dot(plane[:, :3], A) != 0),
+    )
+    d = -batch_dot(plane[:, :3], A)
+    return [
+        parallel_to_plane_statements(a, q, dd, -dd)
+        for a, q, dd in zip(A.tolist(), plane.tolist(), d.tolist())
+    ]
+
+
+def batch_plane_parallel_coordinate_plane(rng: np.random.Generator, k: int) -> List[Dict[str, str]]:
+    # (Oxy, z), (Oyz, x), (Oxz, y) như bản vô hướng
+    plane_names = ("Oxy", "Oyz", "Oxz")
+    plane_vars = ("z", "x", "y")
+    coord_idx = np.array([2, 0, 1])
+    which = rng.integers(0, 3, size=k)
+    point = _randint_array(rng, 1, 5, (k, 3))
+    coord = point[np.arange(k), coord_idx[which]]
+    wrong_coord = coord + _choice_array(rng, [-1, 1, 2], k)
+    return [
+        parallel_coordinate_plane_statements(plane_names[i], plane_vars[i], p, c, w)
+        for i, p, c, w in zip(which.tolist(), point.tolist(), coord.tolist(), wrong_coord.tolist())
+    ]
+
+
+def batch_plane_direction_vectors(rng: np.random.Generator, k: int) -> List[Dict[str, str]]:
+    # a, b không cùng phương (n = [a, b] khác 0) và đổi dấu hệ số y cho mặt phẳng khác
+    M, a, b = _draw_valid(
+        rng, k,
+        lambda rng, m: tuple(_randint_array(rng, -3, 3, (m, 3)) for _ in range(3)),
+        lambda M, a, b: _flip_y_changes_plane(batch_cross(a, b)),
+    )
+    n = batch_cross(a, b)
+    d = -batch_dot(n, M)
+    wrong_n = _flip_y(n)
+    wrong_d = -batch_dot(wrong_n, M)
+    return [
+        direction_vectors_statements(*row)
+        for row in zip(M.tolist(), a.tolist(), b.tolist(), n.tolist(), d.tolist(), wrong_n.tolist(), wrong_d.tolist())
+    ]
+
+
+def _intercept_plane(M: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # (ABC) với A, B, C là hình chiếu của M lên các trục: (yz, xz, xy) và d = -xyz
+    x, y, z = M[:, 0], M[:, 1], M[:, 2]
+    return np.stack((y * z, x * z, x * y), axis=-1), -(x * y * z)
+
+
+def batch_plane_from_projections_ABC(rng: np.random.Generator, k: int) -> List[Dict[str, str]]:
+    # Đáp án sai đổi chỗ a, b: cần a != b, tức x != y
+    (M,) = _draw_valid(
+        rng, k,
+        lambda rng, m: (_randint_array(rng, 1, 5, (m, 3)),),
+        lambda M: M[:, 0] != M[:, 1],
+    )
+    n, d = _intercept_plane(M)
+    return [projections_ABC_statements(*row) for row in zip(M.tolist(), n.tolist(), d.tolist())]
+
+
+def batch_parallel_to_ABC_from_M(rng: np.random.Generator, k: int) -> List[Dict[str, str]]:
+    # Tọa độ của M là đoạn chắn nên khác 0; đáp án sai đổi chỗ a, c: cần a != c, tức x != z
+    (M,) = _draw_valid(
+        rng, k,
+        lambda rng, m: (_randint_array(rng, -5, 5, (m, 3)),),
+        lambda M: M.all(axis=1) & (M[:, 0] != M[:, 2]),
+    )
+    n, d = _intercept_plane(M)
+    return [parallel_to_ABC_statements(*row) for row in zip(M.tolist(), n.tolist(), d.tolist())]
+
+
+def batch_plane_orthocenter_from_projections(rng: np.random.Generator, k: int) -> List[Dict[str, str]]:
+    M = _randint_array(rng, 1, 5, (k, 3))
+    k_correct = batch_norm_sq(M)
+    k_wrong = k_correct + _choice_array(rng, [-5, -3, 3, 5], k)
+    # Đảm bảo k dương: chỉ thay các phần tử bị âm/0
+    k_wrong = np.where(k_wrong <= 0, k_correct + _choice_array(rng, [3, 5, 7], k), k_wrong)
+    return [
+        orthocenter_projections_statements(*row)
+        for row in zip(M.tolist(), k_correct.tolist(), k_wrong.tolist())
+    ]
+
+
+def batch_plane_centroid_from_axes(rng: np.random.Generator, k: int) -> List[Dict[str, str]]:
+    G = _randint_array(rng, 1, 5, (k, 3))
+    n, d = _intercept_plane(G)
+    d_val = -3 * d
+    wrong_d = d_val + _choice_array(rng, [-6, 6, -9, 9], k)
+    return [
+        centroid_from_axes_statements(*row)
+        for row in zip(G.tolist(), n.tolist(), d_val.tolist(), wrong_d.tolist())
+    ]
+
+
+def batch_plane_perpendicular_two_given_planes(rng: np.random.Generator, k: int) -> List[Dict[str, str]]:
+    # Hai mặt phẳng cắt nhau (tích có hướng khác 0) và đổi dấu hệ số y cho mặt phẳng khác
+    normal1, normal2 = _draw_valid(
+        rng, k,
+        lambda rng, m: (_randint_array(rng, -3, 3, (m, 3)), _randint_array(rng, -3, 3, (m, 3))),
+        lambda normal1, normal2: _flip_y_changes_plane(batch_cross(normal1, normal2)),
+    )
+    d1 = _randint_array(rng, -5, 5, (k, 1))
+    d2 = _randint_array(rng, -5, 5, (k, 1))
+    A = _randint_array(rng, 0, 3, (k, 3))
+    n = batch_cross(normal1, normal2)
+    n = n // np.gcd.reduce(np.abs(n), axis=1)[:, None]
+    d = -batch_dot(n, A)
+    plane1 = np.hstack((normal1, d1))
+    plane2 = np.hstack((normal2, d2))
+    return [
+        perpendicular_two_given_planes_statements(*row)
+        for row in zip(plane1.tolist(), plane2.tolist(), A.tolist(), n.tolist(), d.tolist())
+    ]
+
+
+def batch_min_volume_plane_through_M(rng: np.random.Generator, k: int) -> List[Dict[str, str]]:
+    M = _randint_array(rng, 1, 4, (k, 3))
+    n, d = _intercept_plane(M)
+    d = 3 * d
+    wrong_a = 4 * n[:, 0]
+    return [min_volume_statements(*row) for row in zip(M.tolist(), n.tolist(), d.tolist(), wrong_a.tolist())]
+
+
+def batch_plane_orthocenter_condition(rng: np.random.Generator, k: int) -> List[Dict[str, str]]:
+    M = _randint_array(rng, 1, 5, (k, 3))
+    d = -batch_norm_sq(M)
+    wrong_d = d + _choice_array(rng, [-5, -3, 3, 5], k)
+    return [orthocenter_condition_statements(*row) for row in zip(M.tolist(), d.tolist(), wrong_d.tolist())]
+
+
+def _axis_normal(axis: np.ndarray, plane: np.ndarray) -> np.ndarray:
+    # VTPT của mặt phẳng chứa trục và vuông góc với (Q): [e_trục, n_Q]
+    return batch_cross(np.eye(3, dtype=np.int64)[axis], plane[:, :3])
+
+
+def batch_plane_contains_axis_perpendicular_given_plane(rng: np.random.Generator, k: int) -> List[Dict[str, str]]:
+    # (Q) không vuông góc với trục; đáp án sai (a + 1, b, c) là mặt phẳng khác khi b hoặc c khác 0
+    plane, axis = _draw_valid(
+        rng, k,
+        lambda rng, m: (
+            np.hstack((
+                _randint_array(rng, -2, 2, (m, 2)),
+                _randint_array(rng, -3, 3, (m, 1)),
+                _randint_array(rng, -7, 7, (m, 1)),
+            )),
+            rng.integers(0, 3, size=m),
+        ),
+        lambda plane, axis: _axis_normal(axis, plane)[:, 1:].any(axis=1),
+    )
+    n = _axis_normal(axis, plane)
+    return [
+        contains_axis_perpendicular_statements(AXIS_NAMES[i], q, v)
+        for i, q, v in zip(axis.tolist(), plane.tolist(), n.tolist())
+    ]
+
+
+# prop vô hướng -> bản batch; prop không có ở đây chạy lại bản vô hướng k lần
+BATCH_PROPS: Dict[Callable[[], Dict[str, str]], Callable[[np.random.Generator, int], List[Dict[str, str]]]] = {
+    prop_plane_point_normal: batch_plane_point_normal,
+    prop_plane_perpendicular_axis: batch_plane_perpendicular_axis,
+    prop_plane_perpendicular_line: batch_plane_perpendicular_line,
+    prop_plane_parallel_to_plane: batch_plane_parallel_to_plane,
+    prop_plane_parallel_coordinate_plane: batch_plane_parallel_coordinate_plane,
+    prop_plane_direction_vectors: batch_plane_direction_vectors,
+    prop_plane_from_projections_ABC: batch_plane_from_projections_ABC,
+    prop_parallel_to_ABC_from_M: batch_parallel_to_ABC_from_M,
+    prop_plane_orthocenter_from_projections: batch_plane_orthocenter_from_projections,
+    prop_plane_centroid_from_axes: batch_plane_centroid_from_axes,
+    prop_plane_perpendicular_two_given_planes: batch_plane_perpendicular_two_given_planes,
+    prop_min_volume_plane_through_M: batch_min_volume_plane_through_M,
+    prop_plane_orthocenter_condition: batch_plane_orthocenter_condition,
+    prop_plane_contains_axis_perpendicular_given_plane: batch_plane_contains_axis_perpendicular_given_plane,
+}
+
+
+def generate_prop_batch(prop: Callable[[], Dict[str, str]], k: int, seed: Optional[int] = None) -> List[Dict[str, str]]:
+    """
+    Sinh k mệnh đề {"true", "false"} của cùng một prop
+
+    Args:
+        prop: Hàm prop_* của phần B
+        k: Số mệnh đề
+        seed: Hạt giống để lặp lại kết quả (bản batch dùng np.random.default_rng(seed),
+            bản vô hướng gọi random.seed(seed))
+
+    Returns:
+        List[Dict[str, str]]: k mệnh đề, cùng dạng với kết quả của prop()
+    """
+    batch = BATCH_PROPS.get(prop)
+    if batch is not None:
+        return batch(np.random.default_rng(seed), k)
+    if seed is not None:
+        random.seed(seed)
+    return [_valid_prop(prop) for _ in range(k)]
+
+
+def _valid_prop(prop: Callable[[], Dict[str, str]]) -> Dict[str, str]:
+    # Bản vô hướng không có mặt nạ: gọi lại prop cho đến khi mệnh đề hợp lệ
+    for _ in range(MAX_INVALID_REDRAWS):
+        statement = prop()
+        if is_valid_statement(statement):
+            return statement
+    raise ValueError(f"{prop.__name__}: không sinh được mệnh đề hợp lệ sau {MAX_INVALID_REDRAWS} lần")
+
+
+def write_statement_bank(path: str, k: int, seed: Optional[int] = None) -> int:
+    """
+    Ghi ngân hàng mệnh đề JSONL: k mệnh đề cho mỗi prop của phần B, mỗi dòng
+    {"prop": tên hàm, "true": ..., "false": ...}
+
+    Returns:
+        int: Số dòng đã ghi
+    """
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for index, prop in enumerate(g for grp in PART_B_GROUPS for g in grp):
+            prop_seed = None if seed is None else seed + index
+            for statement in generate_prop_batch(prop, k, prop_seed):
+                if not is_valid_statement(statement):
+                    raise ValueError(f"{prop.__name__}: mệnh đề suy biến {statement}")
+                f.write(json.dumps({"prop": prop.__name__, **statement}, ensure_ascii=False) + "\n")
+                written += 1
+    return written
+
+
 def generate_question(question_number: int) -> str:
     # Chọn 1 nhóm mapping trong phần B, lấy 1 mệnh đề từ nhóm đó
     selected_group = random.choice(PART_B_GROUPS)
@@ -1495,6 +1880,30 @@ def generate_question(question_number: int) -> str:
     return content
 
 
+MAX_DUPLICATE_REDRAWS = 20
+
+
+def question_fingerprint(content: str) -> str:
+    # Bỏ dòng "Câu N:" - cùng các mệnh đề là cùng một câu dù số thứ tự khác nhau
+    body = content.split("\n", 1)[1] if "\n" in content else content
+    return hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def generate_unique_questions(num_questions: int) -> List[str]:
+    """Sinh num_questions câu, bốc lại câu trùng (tra set fingerprint O(1), không so từng cặp)"""
+    seen = set()
+    questions = []
+    for i in range(num_questions):
+        for _ in range(MAX_DUPLICATE_REDRAWS + 1):
+            content = generate_question(i + 1)
+            fingerprint = question_fingerprint(content)
+            if fingerprint not in seen:
+                break
+        seen.add(fingerprint)
+        questions.append(content)
+    return questions
+
+
 def create_latex_document(questions: List[str], title: str = "Các bài toán về viết phương trình mặt phẳng - Đúng/Sai") -> str:
     latex = (
         "\\documentclass[a4paper,12pt]{article}\n"
@@ -1581,7 +1990,16 @@ def generate_all_types_questions() -> List[str]:
 
 def main():
     import sys
-    
+
+    if len(sys.argv) > 1 and sys.argv[1].lower() == "bank":
+        # Ngân hàng mệnh đề: python3 plane_true_false_part_B.py bank [k] [seed]
+        k = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+        seed = int(sys.argv[3]) if len(sys.argv) > 3 else None
+        out = "plane_true_false_part_B_bank.jsonl"
+        written = write_statement_bank(out, k, seed)
+        print(f"Generated {out} with {written} statement(s).")
+        return
+
     if len(sys.argv) > 1 and sys.argv[1].lower() == "all":
         # Generate all types
         questions = generate_all_types_questions()
@@ -1596,7 +2014,7 @@ def main():
             num_questions = int(sys.argv[1]) if len(sys.argv) > 1 else 5
         except Exception:
             num_questions = 5
-        questions = [generate_question(i+1) for i in range(num_questions)]
+        questions = generate_unique_questions(num_questions)
         title = "Các bài toán về viết phương trình mặt phẳng - Đúng/Sai"
     
     tex = create_latex_document(questions, title)
@@ -1,7 +1,17 @@
 import random
 import math
+import os
+import sys
 from typing import List, Tuple, Dict
 
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+# Vector/plane helpers dùng chung (2025/base_template/oxyz_core.py)
+from oxyz_core import add, cross, dot, scale, sub as subtract
+
 # Simple formatters
 
 def format_point(pt: Tuple[int, int, int]) -> str:
@@ -105,27 +115,6 @@ def format_plane_equation(a: int, b: int, c: int, d: int) -> str:
     """Legacy function for backward compatibility"""
     return format_plane_equation_with_sqrt(a, b, c, d, 0, 1)
 
-# Vector/plane helpers
-
-def cross(u: Tuple[int, int, int], v: Tuple[int, int, int]) -> Tuple[int, int, int]:
-    return (u[1]*v[2] - u[2]*v[1], u[2]*v[0] - u[0]*v[2], u[0]*v[1] - u[1]*v[0])
-
-
-def subtract(p: Tuple[int, int, int], q: Tuple[int, int, int]) -> Tuple[int, int, int]:
-    return (p[0]-q[0], p[1]-q[1], p[2]-q[2])
-
-
-def add(p: Tuple[int, int, int], q: Tuple[int, int, int]) -> Tuple[int, int, int]:
-    return (p[0]+q[0], p[1]+q[1], p[2]+q[2])
-
-
-def dot(u: Tuple[int, int, int], v: Tuple[int, int, int]) -> int:
-    return u[0]*v[0] + u[1]*v[1] + u[2]*v[2]
-
-
-def scale(v: Tuple[int, int, int], k: int) -> Tuple[int, int, int]:
-    return (k*v[0], k*v[1], k*v[2])
-
 # Propositions (Part B)
 
 # GROUP 1: Ví dụ 10 - Câu 1-2: Mặt phẳng qua điểm với VTPT
@@ -0,0 +1,40 @@
+"""
+Kiểm tra ngân hàng mệnh đề phần B (plane_true_false_part_B): không có hàng suy biến
+
+Chạy từ 2025/test_tex:
+    python -m pytest -q tests
+"""
+import json
+import os
+import sys
+
+TEST_TEX_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+if TEST_TEX_DIR not in sys.path:
+    sys.path.insert(0, TEST_TEX_DIR)
+
+import pytest
+
+from plane_true_false_part_B import BATCH_PROPS, generate_prop_batch, is_valid_statement, write_statement_bank
+
+
+def test_is_valid_statement():
+    assert is_valid_statement({"true": "\\(x - 1 = 0\\)", "false": "\\(x + 1 = 0\\)"})
+    assert not is_valid_statement({"true": "\\(x - 1 = 0\\)", "false": "\\(x - 1 = 0\\)"})
+    assert not is_valid_statement({"true": "(P) là \\(0 = 0\\).", "false": "\\(x = 0\\)"})
+    assert not is_valid_statement({"true": "\\(x = 0\\)", "false": "(P): -3 = 0."})
+
+
+@pytest.mark.parametrize("prop", list(BATCH_PROPS), ids=lambda prop: prop.__name__)
+def test_batch_rows_are_valid(prop):
+    rows = generate_prop_batch(prop, 5000, seed=1)
+    assert len(rows) == 5000
+    assert all(is_valid_statement(row) for row in rows)
+
+
+def test_statement_bank_has_no_degenerate_rows(tmp_path):
+    path = tmp_path / "bank.jsonl"
+    written = write_statement_bank(str(path), 200, seed=1)
+    with open(path, encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert len(rows) == written
+    assert all(is_valid_statement(row) for row in rows)
@@ -4,6 +4,13 @@ import os
 from string import Template
 from fractions import Fraction
 
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "2025", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+from distractor_engine import DistractorEngine, DistractorKind, choices, shifted
+
 # ==================== CONFIGURATION & HELPERS ====================
 
 def to_latex_num(value):
@@ -629,45 +636,37 @@ class MotorcycleQuestion:
         }
 
     def distort_and_set_props(self, sol_data):
+        # Giá trị sai: mỗi mệnh đề một mistake model, chỉ nhận số dương, khác giá trị đúng
+        engine = DistractorEngine(DistractorKind.NUMBER, accept=lambda value: value > 0)
+
         # A: Distance during reaction
-        if random.random() < 0.5:
-            self.res_a = True
+        self.res_a = random.random() < 0.5
+        if self.res_a:
             self.prop_a_val = str(sol_data['d_react'])
         else:
-            self.res_a = False
-            fake = sol_data['d_react'] + random.choice([5, -5, 10, -10])
-            self.prop_a_val = str(fake)
+            self.prop_a_val = engine.pick(sol_data['d_react'], [shifted(5, -5, 10, -10)])
         
         # B: Value of b
-        if random.random() < 0.5:
-            self.res_b = True
+        self.res_b = random.random() < 0.5
+        if self.res_b:
             self.prop_b_val = str(sol_data['b_true'])
         else:
-            self.res_b = False
             # Common mistake: using v_sign instead of v0, or using km/h value
-            fake_choices = [self.v_sign, self.v0 + 5, self.v0 - 5]
-            fake = random.choice(fake_choices)
-            self.prop_b_val = str(fake)
+            self.prop_b_val = engine.pick(sol_data['b_true'], [choices(self.v_sign, self.v0 + 5, self.v0 - 5)])
         
         # C: Time to reach sign
-        if random.random() < 0.5:
-            self.res_c = True
+        self.res_c = random.random() < 0.5
+        if self.res_c:
             self.prop_c_val = str(sol_data['t_decel_true'])
         else:
-            self.res_c = False
-            fake = sol_data['t_decel_true'] + random.choice([1, -1, 2, -2])
-            if fake <= 0:
-                fake = sol_data['t_decel_true'] + 2
-            self.prop_c_val = str(fake)
+            self.prop_c_val = engine.pick(sol_data['t_decel_true'], [shifted(1, -1, 2, -2)])
         
         # D: Distance during acceleration
-        if random.random() < 0.5:
-            self.res_d = True
+        self.res_d = random.random() < 0.5
+        if self.res_d:
             self.prop_d_val = str(sol_data['d_accel'])
         else:
-            self.res_d = False
-            fake = sol_data['d_accel'] + random.choice([4, -4, 8, -8])
-            self.prop_d_val = str(fake)
+            self.prop_d_val = engine.pick(sol_data['d_accel'], [shifted(4, -4, 8, -8)])
 
     @staticmethod
     def label_with_star(letter: str, is_true: bool) -> str:
@@ -1,9 +1,12 @@
+import math
 import os
 import random
 import sys
-import sympy as sp
+from fractions import Fraction
 from typing import Tuple
 
+from special_angle_trig import build_clean_pairs, number_latex, pi_latex
+
 
 def format_angle(a, b):
     res = ""
@@ -16,87 +19,60 @@ def format_angle(a, b):
 
     if b != 0:
         if b > 0:
-            res += " + " + sp.latex(b)
+            res += " + " + pi_latex(b)
         else:
-            res += " - " + sp.latex(-b)
+            res += " - " + pi_latex(-b)
     return res
 
 
+# Angles are multiples of pi, stored as Fractions (1/6 means pi/6)
+A_VALUES = [1, 2, 3]
+B_VALUES = [
+    Fraction(1, 6),
+    Fraction(1, 4),
+    Fraction(1, 3),
+    Fraction(1, 2),
+    Fraction(2, 3),
+    Fraction(3, 4),
+    Fraction(5, 6),
+    Fraction(1),
+    Fraction(-1, 6),
+    Fraction(-1, 4),
+    Fraction(-1, 3),
+    Fraction(-1, 2),
+    Fraction(-2, 3),
+    Fraction(-3, 4),
+    Fraction(-5, 6),
+]
+
+# (b, c) -> exact C1, C2 and phases V = atan(-C2/C1), W = atan(C1/C2) for every pair
+# whose phases are special angles (the pairs the old sympy rejection loop accepted)
+CLEAN_PAIRS = build_clean_pairs(B_VALUES)
+CLEAN_PAIR_KEYS = list(CLEAN_PAIRS)
+
+
 def generate_question(seed=None) -> Tuple[str, str, str]:
     if seed is not None:
         random.seed(seed)
 
-    x = sp.Symbol("x")
-
-    A_VALUES = [1, 2, 3]
-    B_VALUES = [
-        sp.pi / 6,
-        sp.pi / 4,
-        sp.pi / 3,
-        sp.pi / 2,
-        2 * sp.pi / 3,
-        3 * sp.pi / 4,
-        5 * sp.pi / 6,
-        sp.pi,
-        -sp.pi / 6,
-        -sp.pi / 4,
-        -sp.pi / 3,
-        -sp.pi / 2,
-        -2 * sp.pi / 3,
-        -3 * sp.pi / 4,
-        -5 * sp.pi / 6,
-    ]
-
-    while True:
-        a = random.choice(A_VALUES)
-        b = random.choice(B_VALUES)
-        c = random.choice(B_VALUES)
-
-        if b == c:
-            continue
-
-        C1 = sp.cos(b) + sp.sin(c)
-        C2 = sp.sin(b) - sp.cos(c)
-
-        R_sq = C1**2 + C2**2
-        if float(R_sq) < 1e-6:
-            continue
-
-        C1 = C1.simplify()
-        C2 = C2.simplify()
-
-        if C1 == 0:
-            V = sp.pi / 2
-        else:
-            V = sp.atan(-C2 / C1).simplify()
-
-        if C2 == 0:
-            W = sp.pi / 2
-        else:
-            W = sp.atan(C1 / C2).simplify()
-
-        if V.has(sp.atan) or W.has(sp.atan):
-            continue
-
-        break
+    a = random.choice(A_VALUES)
+    b, c = random.choice(CLEAN_PAIR_KEYS)
+    phase = CLEAN_PAIRS[(b, c)]
 
     def get_root(k):
-        return (V + k * sp.pi) / a
+        return (phase.V + k) / a
 
     def get_extremum(m):
-        return (W + m * sp.pi) / a
+        return (phase.W + m) / a
 
     def is_max(m):
-        val = (
-            C1 * sp.sin(a * get_extremum(m)) + C2 * sp.cos(a * get_extremum(m))
-        ).simplify()
-        return float(val) > 0
+        return phase.extremum_sign(m) > 0
 
     def is_min(m):
-        val = (
-            C1 * sp.sin(a * get_extremum(m)) + C2 * sp.cos(a * get_extremum(m))
-        ).simplify()
-        return float(val) < 0
+        return phase.extremum_sign(m) < 0
+
+    def radians(angle):
+        return float(angle) * math.pi
 
     # Statement a
     m_start = 0
@@ -115,56 +91,53 @@ def generate_question(seed=None) -> Tuple[str, str, str]:
         v_a = get_extremum(m_start + 2)
 
     stmt_a_text = (
-        f"Hàm số nghịch biến trên $\\left({sp.latex(u_a)}; {sp.latex(v_a)}\\right)$"
+        f"Hàm số nghịch biến trên $\\left({pi_latex(u_a)}; {pi_latex(v_a)}\\right)$"
     )
 
     # Statement b
-    b_interval_choices = [(-sp.pi, sp.pi), (0, 2 * sp.pi), (-2 * sp.pi, 2 * sp.pi)]
+    b_interval_choices = [(-1, 1), (0, 2), (-2, 2)]
     u_b, v_b = random.choice(b_interval_choices)
 
     pos_roots_b = []
     for k in range(-10, 10):
         root = get_root(k)
-        if float(root) > 0 and float(root) > float(u_b) and float(root) < float(v_b):
+        if root > 0 and root > u_b and root < v_b:
             pos_roots_b.append(root)
 
     if not pos_roots_b:
         pos_roots_b = [get_root(1)]
-        u_b, v_b = 0, 2 * sp.pi
+        u_b, v_b = 0, 2
 
-    max_root_b = max(pos_roots_b, key=lambda v: float(v))
+    max_root_b = max(pos_roots_b)
 
     b_correct = random.choice([True, False])
     if b_correct:
         ans_b = max_root_b
     else:
         if len(pos_roots_b) > 1:
-            ans_b = min(pos_roots_b, key=lambda v: float(v))
+            ans_b = min(pos_roots_b)
         else:
-            ans_b = max_root_b + sp.pi / a
+            ans_b = max_root_b + Fraction(1, a)
 
-    stmt_b_text = f"Nghiệm dương lớn nhất của phương trình $f(x) = 0$ trên khoảng $\\left({sp.latex(u_b)}; {sp.latex(v_b)}\\right)$ là ${sp.latex(ans_b)}$"
+    stmt_b_text = f"Nghiệm dương lớn nhất của phương trình $f(x) = 0$ trên khoảng $\\left({pi_latex(u_b)}; {pi_latex(v_b)}\\right)$ là ${pi_latex(ans_b)}$"
 
     # Statement c
     c_interval_choices = [
-        (0, sp.pi / 6),
-        (0, sp.pi / 4),
-        (0, sp.pi / 3),
-        (0, sp.pi / 2),
+        (0, Fraction(1, 6)),
+        (0, Fraction(1, 4)),
+        (0, Fraction(1, 3)),
+        (0, Fraction(1, 2)),
     ]
     u_c, v_c = random.choice(c_interval_choices)
 
-    vals_c = [
-        (C1 * sp.sin(a * u_c) + C2 * sp.cos(a * u_c)).simplify(),
-        (C1 * sp.sin(a * v_c) + C2 * sp.cos(a * v_c)).simplify(),
-    ]
+    vals_c = [phase.value_at(a * u_c), phase.value_at(a * v_c)]
     for m in range(-5, 5):
         ext = get_extremum(m)
-        if float(ext) >= float(u_c) and float(ext) <= float(v_c):
-            vals_c.append((C1 * sp.sin(a * ext) + C2 * sp.cos(a * ext)).simplify())
+        if ext >= u_c and ext <= v_c:
+            vals_c.append(phase.extremum_value(m))
 
-    min_val_c = min(vals_c, key=lambda v: float(v))
-    max_val_c = max(vals_c, key=lambda v: float(v))
+    min_val_c = min(vals_c, key=float)
+    max_val_c = max(vals_c, key=float)
 
     c_correct = random.choice([True, False])
     if c_correct:
@@ -175,7 +148,7 @@ def generate_question(seed=None) -> Tuple[str, str, str]:
         else:
             ans_c = min_val_c + 1
 
-    stmt_c_text = f"Giá trị nhỏ nhất của $f(x)$ trên đoạn $\\left[{sp.latex(u_c)}; {sp.latex(v_c)}\\right]$ là ${sp.latex(ans_c)}$"
+    stmt_c_text = f"Giá trị nhỏ nhất của $f(x)$ trên đoạn $\\left[{pi_latex(u_c)}; {pi_latex(v_c)}\\right]$ là ${ans_c.latex()}$"
 
     # Statement d
     u_d = 0
@@ -184,7 +157,7 @@ def generate_question(seed=None) -> Tuple[str, str, str]:
     max_count_d = 0
     for m in range(-20, 50):
         ext = get_extremum(m)
-        if float(ext) > float(u_d) and float(ext) < float(v_d) and is_max(m):
+        if radians(ext) > u_d and radians(ext) < v_d and is_max(m):
             max_count_d += 1
 
     d_correct = random.choice([True, False])
@@ -206,7 +179,7 @@ def generate_question(seed=None) -> Tuple[str, str, str]:
     max_count_e = 0
     for m in range(-20, 20):
         ext = get_extremum(m)
-        if float(ext) > float(u_e) and float(ext) < float(v_e) and is_max(m):
+        if radians(ext) > u_e and radians(ext) < v_e and is_max(m):
             max_count_e += 1
 
     e_correct = random.choice([True, False])
@@ -228,7 +201,7 @@ def generate_question(seed=None) -> Tuple[str, str, str]:
     min_count_f = 0
     for m in range(-20, 20):
         ext = get_extremum(m)
-        if float(ext) > float(u_f) and float(ext) < float(v_f) and is_min(m):
+        if radians(ext) > u_f and radians(ext) < v_f and is_min(m):
             min_count_f += 1
 
     f_correct = random.choice([True, False])
@@ -245,39 +218,39 @@ def generate_question(seed=None) -> Tuple[str, str, str]:
 
     # Statement g
     u_g = 0
-    v_g = random.choice([sp.Rational(3, 2), 2, sp.Rational(5, 2), 3])
+    v_g = random.choice([Fraction(3, 2), 2, Fraction(5, 2), 3])
 
     exts_g = []
     for m in range(-10, 20):
         ext = get_extremum(m)
-        if float(ext) > float(u_g) and float(ext) < float(v_g):
+        if radians(ext) > u_g and radians(ext) < v_g:
             exts_g.append(ext)
 
     if not exts_g:
         v_g = 5
         for m in range(-10, 20):
             ext = get_extremum(m)
-            if float(ext) > float(u_g) and float(ext) < float(v_g):
+            if radians(ext) > u_g and radians(ext) < v_g:
                 exts_g.append(ext)
 
-    max_ext_g = max(exts_g, key=lambda v: float(v))
+    max_ext_g = max(exts_g)
 
     g_correct = random.choice([True, False])
     if g_correct:
-        ans_g = float(max_ext_g)
+        ans_g = radians(max_ext_g)
     else:
         out_exts = []
         for m in range(-10, 20):
             ext = get_extremum(m)
-            if float(ext) >= float(v_g):
+            if radians(ext) >= v_g:
                 out_exts.append(ext)
         if out_exts:
-            ans_g = float(min(out_exts, key=lambda v: float(v)))
+            ans_g = radians(min(out_exts))
         else:
-            ans_g = float(max_ext_g) + float(sp.pi / a)
+            ans_g = radians(max_ext_g + Fraction(1, a))
 
     ans_g_str = f"{ans_g:.5f}..."
-    stmt_g_text = f"Nghiệm lớn nhất của phương trình $f'(x) = 0$ trên $\\left({sp.latex(u_g)}; {sp.latex(v_g)}\\right)$ xấp xỉ {ans_g_str}"
+    stmt_g_text = f"Nghiệm lớn nhất của phương trình $f'(x) = 0$ trên $\\left({number_latex(u_g)}; {number_latex(v_g)}\\right)$ xấp xỉ {ans_g_str}"
 
     pool = [
         (stmt_a_text, a_correct),
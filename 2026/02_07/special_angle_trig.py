@@ -0,0 +1,355 @@
+"""
+Exact sin/cos/atan at special angles, for ham_so_luong_giac_dung_sai.py.
+
+Angles are Fractions k meaning k*pi. Values at multiples of pi/12 lie in
+Q(sqrt2, sqrt3) and are represented by Surd (p + q*sqrt2 + r*sqrt3 + s*sqrt6
+with rational p, q, r, s), so comparisons and zero tests are exact and no CAS
+simplification is needed.
+"""
+import math
+from fractions import Fraction
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+Number = Union[int, Fraction]
+
+# Basis 1, sqrt2, sqrt3, sqrt6: index -> radicand
+_RADICANDS = (1, 2, 3, 6)
+# (i, j) -> (coefficient, index) for basis_i * basis_j
+_PRODUCT = {
+    (0, 0): (1, 0), (0, 1): (1, 1), (0, 2): (1, 2), (0, 3): (1, 3),
+    (1, 0): (1, 1), (1, 1): (2, 0), (1, 2): (1, 3), (1, 3): (2, 2),
+    (2, 0): (1, 2), (2, 1): (1, 3), (2, 2): (3, 0), (2, 3): (3, 1),
+    (3, 0): (1, 3), (3, 1): (2, 2), (3, 2): (3, 1), (3, 3): (6, 0),
+}
+
+
+def _fraction(value: Number) -> Fraction:
+    return value if type(value) is Fraction else Fraction(value)
+
+
+def _fraction_latex(value: Fraction, radical: str = "") -> str:
+    """LaTeX for |value| * radical (sign handled by the caller)."""
+    value = abs(value)
+    numerator = "" if value.numerator == 1 and radical else str(value.numerator)
+    body = f"{numerator} {radical}".strip()
+    if value.denominator == 1:
+        return body
+    return rf"\frac{{{body}}}{{{value.denominator}}}"
+
+
+class Surd:
+    """Exact element p + q*sqrt2 + r*sqrt3 + s*sqrt6 of Q(sqrt2, sqrt3)."""
+
+    __slots__ = ("coeffs", "_approx")
+
+    def __init__(self, p: Number = 0, q: Number = 0, r: Number = 0, s: Number = 0):
+        self.coeffs = (_fraction(p), _fraction(q), _fraction(r), _fraction(s))
+        self._approx = None
+
+    @classmethod
+    def _wrap(cls, other) -> "Surd":
+        return other if isinstance(other, Surd) else cls(other)
+
+    def __add__(self, other) -> "Surd":
+        other = self._wrap(other)
+        return Surd(*(a + b for a, b in zip(self.coeffs, other.coeffs)))
+
+    __radd__ = __add__
+
+    def __neg__(self) -> "Surd":
+        return Surd(*(-a for a in self.coeffs))
+
+    def __sub__(self, other) -> "Surd":
+        return self + (-self._wrap(other))
+
+    def __rsub__(self, other) -> "Surd":
+        return self._wrap(other) - self
+
+    def __mul__(self, other) -> "Surd":
+        other = self._wrap(other)
+        result = [Fraction(0)] * 4
+        for i, a in enumerate(self.coeffs):
+            if not a:
+                continue
+            for j, b in enumerate(other.coeffs):
+                if b:
+                    factor, index = _PRODUCT[(i, j)]
+                    result[index] += factor * a * b
+        return Surd(*result)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Number) -> "Surd":
+        return Surd(*(a / Fraction(other) for a in self.coeffs))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (int, Fraction)):
+            other = Surd(other)
+        if not isinstance(other, Surd):
+            return NotImplemented
+        return self.coeffs == other.coeffs
+
+    def __hash__(self) -> int:
+        return hash(self.coeffs)
+
+    def __float__(self) -> float:
+        if self._approx is None:
+            self._approx = sum(float(c) * math.sqrt(k) for c, k in zip(self.coeffs, _RADICANDS))
+        return self._approx
+
+    def __repr__(self) -> str:
+        return f"Surd{tuple(str(c) for c in self.coeffs)}"
+
+    def is_zero(self) -> bool:
+        return not any(self.coeffs)
+
+    def sign(self) -> int:
+        if self.is_zero():
+            return 0
+        # A non-zero element is at least ~1e-3 away from 0 for the small coefficients used here
+        return 1 if float(self) > 0 else -1
+
+    def rational(self) -> Optional[Fraction]:
+        """The value as a Fraction if it has no irrational part."""
+        return self.coeffs[0] if not any(self.coeffs[1:]) else None
+
+    def sqrt(self) -> Optional["Surd"]:
+        """Exact square root inside Q(sqrt2, sqrt3), or None if it is not in the field."""
+        if self.sign() < 0:
+            return None
+        if self.is_zero():
+            return Surd()
+        p = self.coeffs[0]
+        irrational = [(c, k) for c, k in zip(self.coeffs[1:], _RADICANDS[1:]) if c]
+        if not irrational:
+            return _rational_sqrt(p)
+        if len(irrational) > 1:
+            return None
+        # Denest sqrt(p + q*sqrt(m)) = sqrt((p + d)/2) + sign(q)*sqrt((p - d)/2), d^2 = p^2 - q^2*m
+        q, m = irrational[0]
+        d = _rational_sqrt(p * p - q * q * m)
+        if d is None or d.rational() is None:
+            return None
+        d = d.rational()
+        first, second = _rational_sqrt((p + d) / 2), _rational_sqrt((p - d) / 2)
+        if first is None or second is None:
+            return None
+        return first + second if q > 0 else first - second
+
+    def latex(self) -> str:
+        terms = [(c, k) for c, k in zip(self.coeffs, _RADICANDS) if c]
+        if not terms:
+            return "0"
+        parts = []
+        for index, (c, k) in enumerate(terms):
+            body = _fraction_latex(c, rf"\sqrt{{{k}}}" if k != 1 else "")
+            if index > 0:
+                parts.append(f"{'-' if c < 0 else '+'} {body}")
+            elif c < 0:
+                # Same spacing as sympy.latex: "-1" but "- \frac{1}{2}", "- \sqrt{2}"
+                parts.append(f"-{body}" if k == 1 and c.denominator == 1 else f"- {body}")
+            else:
+                parts.append(body)
+        return " ".join(parts)
+
+
+def _rational_sqrt(value: Fraction) -> Optional[Surd]:
+    """sqrt of a non-negative rational as c*sqrt(k), k in {1, 2, 3, 6}."""
+    value = Fraction(value)
+    if value < 0:
+        return None
+    for index, k in enumerate(_RADICANDS):
+        scaled = value / k
+        num, den = math.isqrt(scaled.numerator), math.isqrt(scaled.denominator)
+        if num * num == scaled.numerator and den * den == scaled.denominator:
+            coeffs = [0, 0, 0, 0]
+            coeffs[index] = Fraction(num, den)
+            return Surd(*coeffs)
+    return None
+
+
+class Radical:
+    """sign * sqrt(radicand) for a radicand whose root is not in Q(sqrt2, sqrt3)."""
+
+    __slots__ = ("sign_", "radicand")
+
+    def __init__(self, radicand: Surd, sign: int = 1):
+        self.radicand = radicand
+        self.sign_ = sign
+
+    def __neg__(self) -> "Radical":
+        return Radical(self.radicand, -self.sign_)
+
+    def __float__(self) -> float:
+        return self.sign_ * math.sqrt(float(self.radicand))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Radical):
+            return self.sign_ == other.sign_ and self.radicand == other.radicand
+        return False if isinstance(other, (Surd, int, Fraction)) else NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.sign_, self.radicand))
+
+    def latex(self) -> str:
+        body = rf"\sqrt{{{self.radicand.latex()}}}"
+        return f"- {body}" if self.sign_ < 0 else body
+
+
+ExactValue = Union[Surd, Radical]
+
+
+def exact_sqrt(value: Surd) -> ExactValue:
+    """Square root of a non-negative Surd, denested when possible."""
+    root = value.sqrt()
+    return root if root is not None else Radical(value)
+
+
+# =============================
+# TABLES (multiples of pi/12)
+# =============================
+_HALF = Fraction(1, 2)
+_QUARTER = Fraction(1, 4)
+# sin(k*pi/12) for k = 0..6
+_SIN_FIRST_QUADRANT = [
+    Surd(),
+    Surd(0, -_QUARTER, 0, _QUARTER),      # (sqrt6 - sqrt2) / 4
+    Surd(_HALF),
+    Surd(0, _HALF),
+    Surd(0, 0, _HALF),
+    Surd(0, _QUARTER, 0, _QUARTER),       # (sqrt6 + sqrt2) / 4
+    Surd(1),
+]
+
+TWELFTH = Fraction(1, 12)
+EIGHTH = Fraction(1, 8)
+
+
+def _twelfths(angle: Fraction) -> int:
+    steps = angle / TWELFTH
+    if steps.denominator != 1:
+        raise ValueError(f"{angle}*pi is not a multiple of pi/12")
+    return steps.numerator % 24
+
+
+def sin_pi(angle: Number) -> Surd:
+    """sin(angle * pi) for angle a multiple of 1/12."""
+    k = _twelfths(Fraction(angle))
+    if k <= 6:
+        return _SIN_FIRST_QUADRANT[k]
+    if k <= 12:
+        return _SIN_FIRST_QUADRANT[12 - k]
+    return -sin_pi(Fraction(k - 12, 12))
+
+
+def cos_pi(angle: Number) -> Surd:
+    """cos(angle * pi) for angle a multiple of 1/12."""
+    return sin_pi(Fraction(1, 2) - Fraction(angle))
+
+
+def _build_tan_table() -> List[Tuple[Fraction, Surd]]:
+    # tan on (-pi/2, pi/2) at multiples of pi/12 and pi/8 (tan(pi/8) = sqrt2 - 1)
+    table = {}
+    for k in range(-5, 6):
+        angle = k * TWELFTH
+        table[angle] = (sin_pi(angle), cos_pi(angle))
+    tan_eighth = Surd(-1, 1)
+    tan_three_eighths = Surd(1, 1)
+    for angle, tan_value in ((EIGHTH, tan_eighth), (3 * EIGHTH, tan_three_eighths)):
+        table[angle] = (tan_value, Surd(1))
+        table[-angle] = (-tan_value, Surd(1))
+    return sorted(table.items())
+
+
+# angle -> (y, x) with tan(angle) = y / x and x > 0
+TAN_TABLE: List[Tuple[Fraction, Tuple[Surd, Surd]]] = _build_tan_table()
+# Special angles are multiples of pi/24: index the table by 24 * angle
+_TAN_BY_24THS = {int(angle * 24): (angle, values) for angle, values in TAN_TABLE}
+
+
+def special_atan(y: Surd, x: Surd) -> Optional[Fraction]:
+    """
+    atan(y / x) as a multiple of pi in (-1/2, 1/2], or None if it is not a special angle.
+    x == 0 gives 1/2 (matching atan of an infinite slope).
+    """
+    if x.is_zero():
+        return _HALF
+    # Locate the candidate with floats, then confirm exactly: tan(angle) = y/x <=> y*cos = x*sin
+    approx = math.atan(float(y) / float(x)) / math.pi * 24
+    candidate = _TAN_BY_24THS.get(round(approx))
+    if candidate is None or abs(approx - round(approx)) > 1e-6:
+        return None
+    angle, (sin_value, cos_value) = candidate
+    return angle if y * cos_value == x * sin_value else None
+
+
+def pi_latex(angle: Number) -> str:
+    """LaTeX for angle * pi, e.g. 5/6 -> \\frac{5 \\pi}{6}."""
+    angle = Fraction(angle)
+    if angle == 0:
+        return "0"
+    body = _fraction_latex(angle, r"\pi")
+    return f"- {body}" if angle < 0 else body
+
+
+def number_latex(value: Number) -> str:
+    """LaTeX for a rational number."""
+    value = Fraction(value)
+    if value.denominator == 1:
+        return str(value.numerator)
+    body = _fraction_latex(value)
+    return f"- {body}" if value < 0 else body
+
+
+# =============================
+# f(x) = sin(ax + b) - cos(ax + c) = C1 sin(ax) + C2 cos(ax)
+# =============================
+class PhaseSum:
+    """Exact data of C1*sin(t) + C2*cos(t) for t = a*x, with special-angle phases."""
+
+    def __init__(self, b: Fraction, c: Fraction, C1: Surd, C2: Surd, V: Fraction, W: Fraction):
+        self.b, self.c = b, c
+        self.C1, self.C2 = C1, C2
+        # Roots: t = V + k*pi; extrema: t = W + m*pi
+        self.V, self.W = V, W
+        self.amplitude = exact_sqrt(C1 * C1 + C2 * C2)
+        # Sign of the value at t = W: cos(W) > 0 on (-pi/2, pi/2), f(W) = cos(W) * R^2 / C2
+        self._w_sign = C2.sign() if not C2.is_zero() else C1.sign()
+
+    def value_at(self, t: Number) -> Surd:
+        """C1*sin(t*pi) + C2*cos(t*pi) for t a multiple of 1/12."""
+        return self.C1 * sin_pi(t) + self.C2 * cos_pi(t)
+
+    def extremum_sign(self, m: int) -> int:
+        """+1 at a maximum, -1 at a minimum (t = W + m*pi)."""
+        return self._w_sign if m % 2 == 0 else -self._w_sign
+
+    def extremum_value(self, m: int) -> ExactValue:
+        return self.amplitude if self.extremum_sign(m) > 0 else -self.amplitude
+
+
+def phase_sum(b: Fraction, c: Fraction) -> Optional[PhaseSum]:
+    """PhaseSum of sin(t + b) - cos(t + c), or None if R = 0 or a phase is not special."""
+    C1 = cos_pi(b) + sin_pi(c)
+    C2 = sin_pi(b) - cos_pi(c)
+    if (C1 * C1 + C2 * C2).is_zero():
+        return None
+    V = _HALF if C1.is_zero() else special_atan(-C2, C1)
+    W = _HALF if C2.is_zero() else special_atan(C1, C2)
+    if V is None or W is None:
+        return None
+    return PhaseSum(b, c, C1, C2, V, W)
+
+
+def build_clean_pairs(angles: Iterable[Number]) -> Dict[Tuple[Fraction, Fraction], PhaseSum]:
+    """Every (b, c) with b != c from angles whose root and extremum phases are special."""
+    angles = [Fraction(angle) for angle in angles]
+    table = {}
+    for b in angles:
+        for c in angles:
+            if b == c:
+                continue
+            data = phase_sum(b, c)
+            if data is not None:
+                table[(b, c)] = data
+    return table
@@ -17,6 +17,13 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import sympy as sp
 
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "2025", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+from seed_stream import derive_question_seed
+
 # Cấu hình logging
 logging.basicConfig(level=logging.INFO)
 
@@ -568,7 +575,6 @@ def main():
                 seed = int(seed)
         
         if seed is not None:
-            random.seed(seed)
             logging.info(f"Sử dụng seed: {seed}")
         
         logging.info(f"Đang sinh {num_questions} câu hỏi nhập làn cao tốc...")
@@ -576,7 +582,12 @@ def main():
         questions_data: List[Tuple[str, str]] = []
         
         for i in range(num_questions):
-            config = GeneratorConfig(seed=seed)
+            question_seed = None
+            if seed is not None:
+                # Seed riêng cho từng câu để batch chia nhỏ/chạy tiếp vẫn khớp với chạy tuần tự
+                question_seed = derive_question_seed(seed, "HighwayMergeQuestion", i + 1)
+                random.seed(question_seed)
+            config = GeneratorConfig(seed=question_seed)
             question = HighwayMergeQuestion(config)
             question_content, correct_markers = question.generate_question_only(i + 1)
             questions_data.append((question_content, correct_markers))
@@ -5,6 +5,16 @@ import math
 from fractions import Fraction
 from typing import Tuple
 
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "2025", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+# Vec3/dist_sq dùng chung (2025/base_template/oxyz_core.py)
+from oxyz_core import Vec3, dist_sq
+# Rút gọn căn dùng chung (2025/base_template/radicals.py)
+from radicals import sqrt_latex
+
 def format_frac_tex(f: Fraction) -> str:
     """Format a Fraction as LaTeX, already simplified."""
     if f.denominator == 1:
@@ -13,39 +23,12 @@ def format_frac_tex(f: Fraction) -> str:
         return rf"-\frac{{{-f.numerator}}}{{{f.denominator}}}"
     return rf"\frac{{{f.numerator}}}{{{f.denominator}}}"
 
-def simplify_sqrt(n: int) -> str:
-    if n == 0: return "0"
-    if n < 0: return f"\\sqrt{{{n}}}"
-    outside = 1
-    inside = n
-    for i in range(math.isqrt(n), 1, -1):
-        if n % (i*i) == 0:
-            outside = i
-            inside = n // (i*i)
-            break
-    if inside == 1:
-        return str(outside)
-    if outside == 1:
-        return f"\\sqrt{{{inside}}}"
-    return f"{outside}\\sqrt{{{inside}}}"
-
-class Point3D:
+class Point3D(Vec3):
+    """Điểm tọa độ phân số; phép toán kế thừa từ Vec3 (oxyz_core)"""
+    __slots__ = ()
+
     def __init__(self, x, y, z):
-        self.x = Fraction(x)
-        self.y = Fraction(y)
-        self.z = Fraction(z)
-        
-    def __add__(self, other):
-        return Point3D(self.x + other.x, self.y + other.y, self.z + other.z)
-        
-    def __sub__(self, other):
-        return Point3D(self.x - other.x, self.y - other.y, self.z - other.z)
-        
-    def __mul__(self, scalar):
-        return Point3D(self.x * scalar, self.y * scalar, self.z * scalar)
-        
-    def __rmul__(self, scalar):
-        return self.__mul__(scalar)
+        super().__init__(Fraction(x), Fraction(y), Fraction(z))
         
     def __str__(self):
         return f"({self.x}; {self.y}; {self.z})"
@@ -53,9 +36,6 @@ class Point3D:
     def to_tex(self):
         return f"({format_frac_tex(self.x)}; {format_frac_tex(self.y)}; {format_frac_tex(self.z)})"
 
-def dist_sq(A, B):
-    return (A.x - B.x)**2 + (A.y - B.y)**2 + (A.z - B.z)**2
-
 def generate_type1(seed_val=None) -> Tuple[str, str, str]:
     if seed_val is not None:
         random.seed(seed_val)
@@ -91,8 +71,8 @@ def generate_type1(seed_val=None) -> Tuple[str, str, str]:
             if A_prime_B2 > 0:
                 break
 
-    R_tex = simplify_sqrt(R2)
-    IA_tex = simplify_sqrt(IA2.numerator)
+    R_tex = sqrt_latex(R2)
+    IA_tex = sqrt_latex(IA2.numerator)
     
     def format_term(var, val):
         if val == 0: return rf"{var}^2"
@@ -117,7 +97,7 @@ def generate_type1(seed_val=None) -> Tuple[str, str, str]:
         val_dot = f"{ans_val:.2f}"
         ans_solution = val_dot.replace('.', ',')
         ans_display = f"{ans_solution} | {val_dot}"
-    ans_sqrt_tex = simplify_sqrt(int(N_frac)) if N_frac.denominator == 1 else f"\\sqrt{{{format_frac_tex(N_frac)}}}"
+    ans_sqrt_tex = sqrt_latex(int(N_frac)) if N_frac.denominator == 1 else f"\\sqrt{{{format_frac_tex(N_frac)}}}"
 
     inv_frac_tex = format_frac_tex(Fraction(1, k**2))
     inv_ratio_tex = format_frac_tex(Fraction(1, k))
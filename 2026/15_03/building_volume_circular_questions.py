@@ -3,6 +3,8 @@ Hệ thống sinh đề toán về thể tích tòa nhà (cung tròn)
 Bài toán: Tòa nhà có thiết diện ngang là hình vuông, mặt cắt đứng chứa đường chéo đáy
 bị giới hạn bởi hai cung tròn đối xứng qua Ox.
 Công thức: y = yE - √(R² - (x-xE)²), S(x) = 2y², V = ∫₀^h 2y² dx
+Tích phân tính bằng công thức đóng (volume_quadrature.py); kiểm tra với scipy quad:
+    python building_volume_circular_questions.py --check-quadrature
 """
 
 import logging
@@ -14,7 +16,14 @@ from dataclasses import dataclass
 from string import Template
 from typing import Any, Dict, List, Optional, Tuple
 
-from scipy.integrate import quad
+import numpy as np
+
+from volume_quadrature import (
+    gauss_legendre,
+    max_relative_error,
+    volume_circular,
+    volume_circular_integrand,
+)
 
 # Cấu hình logging
 logging.basicConfig(level=logging.INFO)
@@ -132,20 +141,66 @@ def integrate_volume_circular(
     V = ∫₀^h 2y² dx với y(x) = yE - √(R² - (x-xE)²).
     Chỉ lấy phần x trong [0,h] mà radicand >= 0.
     """
-    R_sq = R * R
-
-    def y_func(x):
-        rad = R_sq - (x - xE) ** 2
-        if rad <= 0:
-            return 0.0
-        return yE - math.sqrt(rad)
-
-    def integrand(x):
-        yv = y_func(x)
-        return 2 * yv * yv
+    return volume_circular(h, xE, yE, R)
+
+
+# Sai số tương đối cho phép so với scipy quad. Gauss–Legendre bậc cố định hội tụ chậm khi
+# đầu mút gần tiếp xúc đường tròn (đạo hàm √ suy biến) nên ngưỡng lỏng hơn
+CLOSED_FORM_RTOL = 1e-9
+GAUSS_LEGENDRE_RTOL = 1e-4
+
+
+def enumerate_valid_geometries() -> List[Tuple[float, float, float, float]]:
+    """Mọi bộ (h, xE, yE, R) hợp lệ của không gian tham số (dùng để kiểm tra backend tích phân)"""
+    geometries = []
+    sqrt2 = math.sqrt(2)
+    for h in H_VALUES:
+        for L0 in L0_VALUES:
+            for Lh in LH_VALUES:
+                for a, b in ARC_DIAMETER_VALUES:
+                    yA, yD = L0 / sqrt2, Lh / sqrt2
+                    if abs(yA - yD) < 0.1:
+                        continue
+                    try:
+                        xE, yE, R = solve_circle_center(h, yA, yD, a * math.sqrt(b))
+                    except ValueError:
+                        continue
+                    if 0.001 < xE < h - 0.001:
+                        geometries.append((h, xE, yE, R))
+    return geometries
+
+
+def check_quadrature() -> bool:
+    """
+    So công thức đóng và Gauss–Legendre (cả batch) với scipy quad trên toàn bộ không gian tham số
 
-    result, _ = quad(integrand, 0, h, limit=200)
-    return result
+    Returns:
+        bool: True nếu sai số trong ngưỡng và đáp án làm tròn trùng khớp
+    """
+    from scipy.integrate import quad
+
+    # quad với ngưỡng mặc định (1.5e-8) kém chính xác hơn công thức đóng, nên siết ngưỡng
+    quad_tolerance = dict(epsabs=1e-13, epsrel=1e-13, limit=200)
+
+    h, xE, yE, R = (np.array(col) for col in zip(*enumerate_valid_geometries()))
+    closed = volume_circular(h, xE, yE, R)
+    gauss = gauss_legendre(volume_circular_integrand, 0.0, h, xE, yE, R)
+    reference = np.array([
+        quad(volume_circular_integrand, 0, hi, args=(xi, yi, ri), **quad_tolerance)[0]
+        for hi, xi, yi, ri in zip(h, xE, yE, R)
+    ])
+
+    ok = True
+    for name, values, rtol in (
+        ("công thức đóng", closed, CLOSED_FORM_RTOL),
+        ("Gauss–Legendre", gauss, GAUSS_LEGENDRE_RTOL),
+    ):
+        error = max_relative_error(values, reference)
+        same_answers = np.array_equal(np.floor(values + 0.5), np.floor(reference + 0.5))
+        print(f"{name}: {len(reference)} bộ tham số, sai số tương đối lớn nhất {error:.2e}, "
+              f"đáp án làm tròn {'khớp' if same_answers else 'KHÔNG khớp'}")
+        ok = ok and error <= rtol and same_answers
+    return ok
 
 
 # ==============================================================================
@@ -465,6 +520,9 @@ class BuildingVolumeCircularQuestion:
 
 def main():
     """Usage: python building_volume_circular_questions.py <num_questions> [seed]"""
+    if len(sys.argv) > 1 and sys.argv[1] == "--check-quadrature":
+        sys.exit(0 if check_quadrature() else 1)
+
     try:
         num_questions = int(sys.argv[1]) if len(sys.argv) > 1 else 3
         seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
@@ -0,0 +1,53 @@
+"""
+Tích phân cho mặt cắt cung tròn - công thức đóng và Gauss–Legendre vector hóa (NumPy)
+
+Thay cho scipy.integrate.quad gọi hàm Python cho từng câu:
+- volume_circular: V = ∫₀^h 2y² dx với y = yE - √(R² - (x-xE)²) có nguyên hàm đóng
+  (khai triển 2y² = 2(yE² + R² - t²) - 4yE√(R² - t²), t = x - xE)
+- gauss_legendre, max_relative_error (từ 2025/base_template/quadrature.py): Gauss–Legendre
+  bậc cố định cho tích phân không có công thức đóng, dùng để kiểm tra công thức đóng
+
+Các hàm nhận số thực hoặc mảng NumPy (cả batch bộ tham số cùng lúc).
+"""
+import os
+import sys
+
+import numpy as np
+
+# Tích phân dùng chung nằm ở 2025/base_template/quadrature.py (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "2025", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+# gauss_legendre, max_relative_error: generator import lại từ module này
+from quadrature import gauss_legendre, max_relative_error, sqrt_arc_integral
+
+
+def volume_circular(h, xE, yE, R):
+    """
+    V = ∫₀^h 2y² dx với y = yE - √(R² - (x-xE)²), y = 0 khi R² - (x-xE)² ≤ 0
+
+    Args:
+        h, xE, yE, R: Số thực hoặc mảng cùng kích thước (batch)
+
+    Returns:
+        float hoặc np.ndarray: Thể tích
+    """
+    h, xE, yE, R = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (h, xE, yE, R)))
+    # Chỉ phần x ∈ [0, h] nằm trong hình tròn có đóng góp
+    u0 = np.maximum(-xE, -R)
+    u1 = np.minimum(h - xE, R)
+    u1 = np.maximum(u0, u1)
+    volume = (
+        2 * (yE * yE + R * R) * (u1 - u0)
+        - 2 * (u1 ** 3 - u0 ** 3) / 3
+        - 4 * yE * sqrt_arc_integral(u0, u1, R)
+    )
+    return volume if volume.ndim else float(volume)
+
+
+def volume_circular_integrand(x, xE, yE, R):
+    """Hàm dưới dấu tích phân 2y² (vector hóa) - dùng với gauss_legendre và để kiểm tra"""
+    rad = R * R - (x - xE) ** 2
+    y = np.where(rad > 0, yE - np.sqrt(np.maximum(rad, 0.0)), 0.0)
+    return 2 * y * y
@@ -6,6 +6,17 @@ from string import Template
 from fractions import Fraction
 from typing import Tuple, List, Dict, Any
 
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "2025", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+# dot/cross/norm_sq/sub dùng chung (2025/base_template/oxyz_core.py)
+from oxyz_core import cross, dot, norm_sq, sub as sub_vec
+# Rút gọn căn dùng chung (2025/base_template/radicals.py)
+from radicals import radical_latex, split_sqrt, sqrt_latex
+from preset_tables import load_preset_table
+
 # ==================== CONFIGURATION & HELPERS ====================
 
 # Type aliases
@@ -13,95 +24,26 @@ Point = Tuple[float, float, float]
 Vector = Tuple[float, float, float]
 
 
-def dot(u: Vector, v: Vector) -> float:
-    """Dot product of two vectors"""
-    return u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
-
-
-def cross(u: Vector, v: Vector) -> Vector:
-    """Cross product of two vectors"""
-    return (
-        u[1] * v[2] - u[2] * v[1],
-        u[2] * v[0] - u[0] * v[2],
-        u[0] * v[1] - u[1] * v[0]
-    )
-
-
-def norm_sq(v: Vector) -> float:
-    """Squared norm of a vector"""
-    return v[0] ** 2 + v[1] ** 2 + v[2] ** 2
-
-
 def norm(v: Vector) -> float:
     """Norm of a vector"""
     return math.sqrt(norm_sq(v))
 
 
-def sub_vec(a: Point, b: Point) -> Vector:
-    """Vector from point b to point a: a - b"""
-    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
-
-
 def simplify_sqrt(n: int) -> Tuple[int, int]:
     """Simplify sqrt(n) to a*sqrt(b) where b is square-free. Returns (a, b)."""
     if n <= 0:
         return (0, 0)
-    a = 1
-    b = n
-    for p in [2, 3, 5, 7, 11, 13]:
-        while b % (p * p) == 0:
-            a *= p
-            b //= (p * p)
-    return (a, b)
+    return split_sqrt(n)
 
 
 def format_sqrt(n: int) -> str:
     """Format sqrt(n) in LaTeX, simplifying if possible."""
-    if n == 0:
-        return "0"
-    if n == 1:
-        return "1"
-    a, b = simplify_sqrt(n)
-    if b == 1:
-        return str(a)
-    if a == 1:
-        return f"\\sqrt{{{b}}}"
-    return f"{a}\\sqrt{{{b}}}"
+    return sqrt_latex(n)
 
 
 def format_frac_sqrt(num_coef: int, num_sqrt: int, denom: int) -> str:
     """Format (num_coef * sqrt(num_sqrt)) / denom in LaTeX."""
-    if num_coef == 0 or num_sqrt == 0:
-        return "0"
-        
-    from math import gcd
-    
-    # Simplify the sqrt first
-    a, b = simplify_sqrt(num_sqrt)
-    num_coef *= a
-    
-    # Simplify the fraction
-    g = gcd(abs(num_coef), denom)
-    num_coef //= g
-    denom //= g
-    
-    if denom == 1:
-        if b == 1:
-            return str(num_coef)
-        if num_coef == 1:
-            return f"\\sqrt{{{b}}}"
-        if num_coef == -1:
-            return f"-\\sqrt{{{b}}}"
-        return f"{num_coef}\\sqrt{{{b}}}"
-    
-    if b == 1:
-        return f"\\dfrac{{{num_coef}}}{{{denom}}}"
-    
-    if num_coef == 1:
-        return f"\\dfrac{{\\sqrt{{{b}}}}}{{{denom}}}"
-    if num_coef == -1:
-        return f"-\\dfrac{{\\sqrt{{{b}}}}}{{{denom}}}"
-    return f"\\dfrac{{{num_coef}\\sqrt{{{b}}}}}{{{denom}}}"
+    return radical_latex(num_coef, num_sqrt, denom)
 
 
 def format_fraction(value: float) -> str:
@@ -512,6 +454,22 @@ ALL_PRESETS = [
     PRESET_16, PRESET_17, PRESET_18, PRESET_19, PRESET_20
 ]
 
+GAME_CONTEXTS = list(dict.fromkeys(p['context'] for p in ALL_PRESETS))
+
+# Bảng preset do 2025/base_template/preset_miner.py dò (thiếu file thì dùng ALL_PRESETS)
+def _preset_from_row(row: List[int], index: int) -> Dict[str, Any]:
+    """Đổi một dòng bảng dò (a, b, c, d, Ix, Iy, Iz, R_sq, ux, uy, uz) thành preset; ngữ cảnh lấy lần lượt từ GAME_CONTEXTS"""
+    return {
+        'plane': tuple(row[0:4]),
+        'sphere_center': tuple(row[4:7]),
+        'sphere_radius_sq': row[7],
+        'direction': tuple(row[8:11]),
+        'context': GAME_CONTEXTS[index % len(GAME_CONTEXTS)],
+    }
+
+
+MINED_PRESETS = load_preset_table(__file__, "ALL_PRESETS", ALL_PRESETS, _preset_from_row)
+
 
 # ==================== TEMPLATES ====================
 
@@ -671,7 +629,7 @@ class Game3DQuestion:
 
     def generate_parameters(self):
         """Generate parameters from a random preset."""
-        self.preset = random.choice(ALL_PRESETS)
+        self.preset = random.choice(MINED_PRESETS)
         
         self.plane = self.preset['plane']
         self.sphere_center = self.preset['sphere_center']
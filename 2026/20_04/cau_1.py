@@ -5,6 +5,13 @@ import random
 from fractions import Fraction
 from typing import Tuple
 
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "2025", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+from preset_tables import load_preset_table
+
 # Each preset: (A, B, t_total, R)
 # All presets verified: integer v, t_H, t_delta, t1, t2, d_sq, P_in, P_out, T_mins
 PARAM_SETS = [
@@ -79,6 +86,13 @@ PARAM_SETS = [
     ((10, 22, -1), (-18, -6, -1), 7, 19),
 ]
 
+# Bảng preset do 2025/base_template/preset_miner.py dò (thiếu file thì dùng PARAM_SETS)
+def _param_set_from_row(row, index):
+    # Dòng: Ax, Ay, Az, Bx, By, Bz, t_total, R
+    return tuple(row[0:3]), tuple(row[3:6]), row[6], row[7]
+
+MINED_PARAM_SETS = load_preset_table(__file__, "PARAM_SETS", PARAM_SETS, _param_set_from_row)
+
 CONTEXTS = [
     {
         "object": "khinh khí cầu",
@@ -157,7 +171,7 @@ def generate_question(context_idx=None) -> Tuple[str, str, str]:
     rad_desc = context["radius_desc"]
     
     # Random chọn bộ tham số
-    A, B, t_total, R = random.choice(PARAM_SETS)
+    A, B, t_total, R = random.choice(MINED_PARAM_SETS)
     
     # Tính toán vector vận tốc
     AB = (B[0]-A[0], B[1]-A[1], B[2]-A[2])
@@ -268,6 +282,8 @@ Thay số vào biểu thức: $t_1 + 2x_M - y_M + 3z_M = {t1} + 2({P_out[0]}) -
 
     dot_pp = P_in[0]*P_out[0] + P_in[1]*P_out[1] + P_in[2]*P_out[2]
     cos_val_frac = Fraction(dot_pp, R**2)
+    # Tách ra ngoài f-string: biểu thức trong f-string không được chứa dấu \ (Python < 3.12)
+    cos_val_tex = str(cos_val_frac.numerator) if cos_val_frac.denominator == 1 else rf"\frac{{{cos_val_frac.numerator}}}{{{cos_val_frac.denominator}}}"
 
     sol_d = rf"""d) {'Đúng' if d_correct else 'Sai'}.
 
@@ -276,7 +292,7 @@ Vị trí lúc mất tín hiệu là $M({P_out[0]}; {P_out[1]}; {P_out[2]})$, t
 Góc quét không gian $\alpha = (\overrightarrow{{OP}}, \overrightarrow{{OM}})$. Ta có $\cos \alpha = \frac{{\overrightarrow{{OP}} \cdot \overrightarrow{{OM}}}}{{|\overrightarrow{{OP}}| \cdot |\overrightarrow{{OM}}|}}$
 Do $OP = OM = R = {R}$, nên $|\overrightarrow{{OP}}| \cdot |\overrightarrow{{OM}}| = {R}^2 = {R**2}$.
 $\overrightarrow{{OP}} \cdot \overrightarrow{{OM}} = ({P_in[0]})({P_out[0]}) + ({P_in[1]})({P_out[1]}) + ({P_in[2]})({P_out[2]}) = {dot_pp}$.
-Suy ra $\cos \alpha = \frac{{{dot_pp}}}{{{R**2}}} = {cos_val_frac.numerator if cos_val_frac.denominator==1 else rf"\frac{{{cos_val_frac.numerator}}}{{{cos_val_frac.denominator}}}"}$.
+Suy ra $\cos \alpha = \frac{{{dot_pp}}}{{{R**2}}} = {cos_val_tex}$.
 Vậy $\alpha \approx {angle_deg}^{{\circ}}$."""
 
     key_arr = ["Đ" if x else "S" for x in (a_correct, b_correct, c_correct, d_correct)]
@@ -0,0 +1,54 @@
+"""
+Tích phân cho phần thân giữa hồ bơi - công thức đóng và Gauss–Legendre vector hóa (NumPy)
+
+Thay cho scipy.integrate.quad gọi hàm Python cho từng câu:
+- middle_area: S = ∫_{x1}^{x2} [f(x) - g(x)] dx với f, g là hai cung tròn
+  f(x) = b3 + √(R3² - (x-a3)²), g(x) = n4 + √(R4² - (x-m4)²) có nguyên hàm đóng
+- gauss_legendre, max_relative_error (từ 2025/base_template/quadrature.py): Gauss–Legendre
+  bậc cố định cho tích phân không có công thức đóng, dùng để kiểm tra công thức đóng
+
+Các hàm nhận số thực hoặc mảng NumPy (cả batch bộ tham số cùng lúc).
+"""
+import os
+import sys
+
+import numpy as np
+
+# Tích phân dùng chung nằm ở 2025/base_template/quadrature.py (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "2025", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+# gauss_legendre, max_relative_error: generator import lại từ module này
+from quadrature import gauss_legendre, max_relative_error, sqrt_arc_integral
+
+
+def middle_area(x1, x2, a3, b3, R3, m4, n4, R4):
+    """
+    S = ∫_{x1}^{x2} [b3 + √(R3² - (x-a3)²) - n4 - √(R4² - (x-m4)²)] dx (căn âm tính là 0)
+
+    Args:
+        x1, x2: Cận tích phân
+        a3, b3, R3: Tâm và bán kính cung trên (C3)
+        m4, n4, R4: Tâm và bán kính cung dưới (C4)
+
+    Returns:
+        float hoặc np.ndarray: Diện tích
+    """
+    x1, x2, a3, b3, R3, m4, n4, R4 = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (x1, x2, a3, b3, R3, m4, n4, R4))
+    )
+    area = (
+        (b3 - n4) * (x2 - x1)
+        + sqrt_arc_integral(x1 - a3, x2 - a3, R3)
+        - sqrt_arc_integral(x1 - m4, x2 - m4, R4)
+    )
+    return area if area.ndim else float(area)
+
+
+def middle_area_integrand(x, a3, b3, R3, m4, n4, R4):
+    """Hàm dưới dấu tích phân f(x) - g(x) (vector hóa) - dùng với gauss_legendre và để kiểm tra"""
+    top = b3 + np.sqrt(np.maximum(R3 * R3 - (x - a3) ** 2, 0.0))
+    bottom = n4 + np.sqrt(np.maximum(R4 * R4 - (x - m4) ** 2, 0.0))
+    return top - bottom
+
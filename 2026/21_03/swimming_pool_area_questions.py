@@ -5,6 +5,8 @@ r"""
   được chọn ngẫu nhiên trong đúng 20 giá trị (xem hằng *_VALUES). Khoảng cách
   $I$–$HG$/$HE$ = $AB/2$, $K$–$FG$ = $CD/2$; $FG$ đồng bộ $FG = AB + d_{K,EF} - CD/2$.
 - Giá trị ghi trong ô đáp án: $\lfloor S + 1/2\rfloor$ (làm tròn đến đơn vị, nửa lên) khớp đề.
+- Tích phân phần thân giữa tính bằng công thức đóng (pool_area_quadrature.py); kiểm tra với scipy quad:
+  python swimming_pool_area_questions.py --check-quadrature
 """
 
 import logging
@@ -15,7 +17,14 @@ import sys
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
-from scipy.integrate import quad
+import numpy as np
+
+from pool_area_quadrature import (
+    gauss_legendre,
+    max_relative_error,
+    middle_area,
+    middle_area_integrand,
+)
 
 logging.basicConfig(level=logging.INFO)
 
@@ -106,13 +115,14 @@ def solve_o4_lower(
     return c1 if c1[1] < c2[1] else c2
 
 
-def build_geometry(
+def build_arcs(
     L: int, W: int, d1: int, d2: int, dist_k_ef: int, r4_sq: int
-) -> Optional[Dict[str, Any]]:
+) -> Optional[Tuple[float, float, float, float, float, float, float, float, float]]:
     """
     H(0,0), G(L,0), F(L,W), E(0,W).
     I = (d1/2, d1/2), K = (L - d2/2, W - dist_k_ef).
     Điều kiện đồng bộ: W = d1 + dist_k_ef - d2/2.
+    Trả về (x1, x2, y_d, a3, b3, R3, m4, n4, R4) hoặc None nếu không hợp lệ.
     """
     if abs(W - (d1 + dist_k_ef - d2 / 2)) > 1e-9:
         return None
@@ -151,22 +161,19 @@ def build_geometry(
         return None
     m4, n4 = o4
     R4 = math.sqrt(r4_sq)
+    return x1, x2, y_d, a3, b3, R3, m4, n4, R4
 
-    def f_top(x: float) -> float:
-        rad = R3**2 - (x - a3) ** 2
-        return b3 + math.sqrt(max(0.0, rad))
-
-    def g_bot(x: float) -> float:
-        rad = R4**2 - (x - m4) ** 2
-        return n4 + math.sqrt(max(0.0, rad))
-
-    def integrand(x: float) -> float:
-        return f_top(x) - g_bot(x)
 
-    try:
-        s_mid, _ = quad(integrand, x1, x2, limit=200)
-    except Exception:
+def build_geometry(
+    L: int, W: int, d1: int, d2: int, dist_k_ef: int, r4_sq: int
+) -> Optional[Dict[str, Any]]:
+    """Hình học đầy đủ và diện tích; None nếu bộ tham số không hợp lệ (xem build_arcs)."""
+    arcs = build_arcs(L, W, d1, d2, dist_k_ef, r4_sq)
+    if arcs is None:
         return None
+    x1, x2, y_d, a3, b3, R3, m4, n4, R4 = arcs
+
+    s_mid = middle_area(x1, x2, a3, b3, R3, m4, n4, R4)
 
     if s_mid <= 0 or not math.isfinite(s_mid):
         return None
@@ -208,6 +215,69 @@ def build_geometry(
     }
 
 
+# Sai số tương đối cho phép so với scipy quad. Gauss–Legendre bậc cố định hội tụ chậm khi
+# đầu mút gần tiếp xúc đường tròn (đạo hàm √ suy biến) nên ngưỡng lỏng hơn
+CLOSED_FORM_RTOL = 1e-9
+GAUSS_LEGENDRE_RTOL = 1e-4
+
+
+def enumerate_valid_arcs() -> List[Tuple[float, ...]]:
+    """
+    Mọi bộ (x1, x2, a3, b3, R3, m4, n4, R4, s_ngoai) của không gian tham số
+    (để kiểm tra backend tích phân)
+    """
+    arcs_list = []
+    for d1 in AB_VALUES:
+        for d2 in CD_VALUES:
+            for dist_k_ef in DIST_K_EF_VALUES:
+                W_float = d1 + dist_k_ef - d2 / 2
+                if abs(W_float - round(W_float)) > 1e-9 or int(round(W_float)) not in FG_VALUES:
+                    continue
+                W = int(round(W_float))
+                for L in HG_VALUES:
+                    for r4_sq in R4_SQ_VALUES:
+                        arcs = build_arcs(L, W, d1, d2, dist_k_ef, r4_sq)
+                        if arcs is not None:
+                            x1, x2, _, a3, b3, R3, m4, n4, R4 = arcs
+                            s_ngoai = 0.5 * math.pi * (d1 / 2) ** 2 + 0.5 * math.pi * (d2 / 2) ** 2
+                            arcs_list.append((x1, x2, a3, b3, R3, m4, n4, R4, s_ngoai))
+    return arcs_list
+
+
+def check_quadrature() -> bool:
+    """
+    So công thức đóng và Gauss–Legendre (cả batch) với scipy quad trên toàn bộ không gian tham số
+
+    Returns:
+        bool: True nếu sai số trong ngưỡng và đáp án làm tròn trùng khớp
+    """
+    from scipy.integrate import quad
+
+    # quad với ngưỡng mặc định (1.5e-8) kém chính xác hơn công thức đóng, nên siết ngưỡng
+    quad_tolerance = dict(epsabs=1e-13, epsrel=1e-13, limit=200)
+
+    x1, x2, a3, b3, R3, m4, n4, R4, s_ngoai = (np.array(col) for col in zip(*enumerate_valid_arcs()))
+    params = (a3, b3, R3, m4, n4, R4)
+    closed = middle_area(x1, x2, *params)
+    gauss = gauss_legendre(middle_area_integrand, x1, x2, *params)
+    reference = np.array([
+        quad(middle_area_integrand, row[0], row[1], args=row[2:], **quad_tolerance)[0]
+        for row in zip(x1, x2, *params)
+    ])
+
+    ok = True
+    for name, values, rtol in (
+        ("công thức đóng", closed, CLOSED_FORM_RTOL),
+        ("Gauss–Legendre", gauss, GAUSS_LEGENDRE_RTOL),
+    ):
+        error = max_relative_error(values, reference)
+        same_answers = np.array_equal(np.floor(s_ngoai + values + 0.5), np.floor(s_ngoai + reference + 0.5))
+        print(f"{name}: {len(reference)} bộ tham số, sai số tương đối lớn nhất {error:.2e}, "
+              f"đáp án làm tròn {'khớp' if same_answers else 'KHÔNG khớp'}")
+        ok = ok and error <= rtol and same_answers
+    return ok
+
+
 def try_random_params(max_attempts: int = 8000) -> Dict[str, Any]:
     for _ in range(max_attempts):
         L = random.choice(HG_VALUES)
@@ -567,6 +637,9 @@ class SwimmingPoolAreaQuestion:
 
 
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--check-quadrature":
+        sys.exit(0 if check_quadrature() else 1)
+
     try:
         num_questions = int(sys.argv[1]) if len(sys.argv) > 1 else 1
         seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
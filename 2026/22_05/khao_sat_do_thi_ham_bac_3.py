@@ -5,6 +5,39 @@ import random
 from fractions import Fraction
 from typing import Tuple
 
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "2025", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+from preset_tables import load_preset_table
+
+# Mệnh đề a: (x_1, m, n, T) với y = x^3 - 3x_1^2 x + 2x_1^3 và T = m.a + n.b
+A_PARAMS = [
+    (1, 1, 4, 13),
+    (-1, 1, -4, 14),
+    (2, 1, 1, 26),
+    (-2, 1, -1, 28),
+    (3, 2, 8, 726),
+    (-3, 2, -8, 732)
+]
+
+# Mệnh đề b: (a_2, b_2, c_2, t_0, d^2) với y = a_2 x^3 + b_2 x + c_2, g(t_0) = d^2
+B_PARAMS = [
+    (1, 1, 1, 1, 5),
+    (-1, -1, 2, 1, 5),
+    (1, 2, -1, 1, 10),
+    (-1, -2, 3, 1, 10),
+    (1, 3, 1, 1, 17),
+    (-1, -3, 3, 1, 17),
+    (1, 1, 2, 2, 20),
+    (-1, -1, -2, 2, 20)
+]
+
+# Bảng preset do 2025/base_template/preset_miner.py dò (thiếu file thì dùng danh sách trên)
+MINED_A_PARAMS = load_preset_table(__file__, "A_PARAMS", A_PARAMS)
+MINED_B_PARAMS = load_preset_table(__file__, "B_PARAMS", B_PARAMS)
+
 def format_equation(coeffs, terms):
     """Format polynomial equation from coeffs and terms."""
     res = ""
@@ -56,15 +89,7 @@ def generate_question() -> Tuple[str, str, str]:
     # Mệnh đề a
     # ---------------------------------------------------------
     # y = x^3 - 3x_1^2 x + 2x_1^3
-    a_params = [
-        (1, 1, 4, 13),
-        (-1, 1, -4, 14),
-        (2, 1, 1, 26),
-        (-2, 1, -1, 28),
-        (3, 2, 8, 726),
-        (-3, 2, -8, 732)
-    ]
-    x1, m_a, n_a, T_true = random.choice(a_params)
+    x1, m_a, n_a, T_true = random.choice(MINED_A_PARAMS)
     c_a = -3 * x1**2
     d_a = 2 * x1**3
     func_a = format_equation([1, c_a, d_a], ["x^3", "x", ""])
@@ -100,17 +125,7 @@ Vậy mệnh đề này là {sol_a_correct_str.lower()}."""
     # Mệnh đề b
     # ---------------------------------------------------------
     # y = a_2 x^3 + b_2 x + c_2
-    b_params = [
-        (1, 1, 1, 1, 2),
-        (-1, -1, 2, 1, 2),
-        (1, 2, -1, 1, 10),
-        (-1, -2, 3, 1, 10),
-        (1, 3, 1, 1, 17),
-        (-1, -3, 3, 1, 17),
-        (1, 1, 2, 2, 20),
-        (-1, -1, -2, 2, 20)
-    ]
-    a2, b2, c2, t0, d2 = random.choice(b_params)
+    a2, b2, c2, t0, d2 = random.choice(MINED_B_PARAMS)
     func_b = format_equation([a2, b2, c2], ["x^3", "x", ""])
     
     b_correct = random.choice([True, False])
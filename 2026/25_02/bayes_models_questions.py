@@ -1,8 +1,20 @@
 import os
 import random
 import logging
+import sys
 from fractions import Fraction
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "2025", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+from latex_document_builder import LaTeXTemplate, OutputFormat
+from seed_stream import derive_question_seed
+from streaming_document_writer import StreamingDocumentWriter
+# IR câu hỏi dùng chung (2025/base_template/question_ir.py)
+from question_ir import EX_TEST_FOOTER, EX_TEST_HEADER, KIND_TRUE_FALSE, TF_STYLE_LABELS, QuestionRecord, render_ex_test
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
@@ -377,7 +389,8 @@ class BayesModelsQuestion:
             "P_Abar_given_Hbar1Hbar2": P_Abar_given_Hbar1Hbar2,
         }
 
-    def generate(self, q_num: int) -> Tuple[str, str]:
+    def build_record(self, q_num: int) -> QuestionRecord:
+        """Sinh câu q_num dưới dạng QuestionRecord (4 mệnh đề đúng/sai a-d)"""
         self.generate_parameters()
         ctx = random.choice(CONTEXTS)
         v = self.compute_all()
@@ -398,7 +411,7 @@ class BayesModelsQuestion:
                     [Fraction(1, 50), Fraction(-1, 100), Fraction(1, 25), Fraction(-1, 50)],
                 )
             stmt_a_text = (
-                f"a) Xác suất để cả hai hệ thống đều nhận diện sai trạng thái là "
+                f"Xác suất để cả hai hệ thống đều nhận diện sai trạng thái là "
                 f"${format_prob(shown_a_val)}$."
             )
             sol_a_detail = (
@@ -418,7 +431,7 @@ class BayesModelsQuestion:
                     [Fraction(1, 50), Fraction(-1, 50), Fraction(-1, 25), Fraction(1, 20)],
                 )
             stmt_a_text = (
-                f"a) Xác suất để cả hai hệ thống đều nhận diện đúng trạng thái là "
+                f"Xác suất để cả hai hệ thống đều nhận diện đúng trạng thái là "
                 f"${format_prob(shown_a_val)}$."
             )
             sol_a_detail = (
@@ -429,24 +442,21 @@ class BayesModelsQuestion:
                 f"= {format_prob(correct_a_val)}$"
             )
 
-        stmt_a = ("*" if TF[0] else "") + stmt_a_text
-
         # --- b: M1 báo Abar, M2 báo A, compare ---
         # M1_higher = True khi P(M1 đúng | conflict) > P(M2 đúng | conflict)
         M1_higher = v["P_M1_right"] > v["P_M2_right"]
         if TF[1]:
             stmt_b_text = (
-                f"b) Trong trường hợp {ctx['model1_name']} {ctx['predict_neg']} và "
+                f"Trong trường hợp {ctx['model1_name']} {ctx['predict_neg']} và "
                 f"{ctx['model2_name']} {ctx['predict_pos']}, xác suất {ctx['model1_name']} "
                 f"dự báo đúng {'cao hơn' if M1_higher else 'thấp hơn'} xác suất {ctx['model2_name']} dự báo đúng."
             )
         else:
             stmt_b_text = (
-                f"b) Trong trường hợp {ctx['model1_name']} {ctx['predict_neg']} và "
+                f"Trong trường hợp {ctx['model1_name']} {ctx['predict_neg']} và "
                 f"{ctx['model2_name']} {ctx['predict_pos']}, xác suất {ctx['model1_name']} "
                 f"dự báo đúng {'thấp hơn' if M1_higher else 'cao hơn'} xác suất {ctx['model2_name']} dự báo đúng."
             )
-        stmt_b = ("*" if TF[1] else "") + stmt_b_text
 
         P_Abar_Hbar1_H2_numer = v["P_Abar"] * v["P_Hbar1_Abar"] * v["P_H2_Abar"]
         P_A_Hbar1_H2_numer = v["P_A"] * v["P_Hbar1_A"] * v["P_H2_A"]
@@ -494,7 +504,7 @@ class BayesModelsQuestion:
                     [Fraction(1, 25), Fraction(-1, 25), Fraction(1, 20), Fraction(-1, 20)],
                 )
             stmt_c_text = (
-                f"c) Xác suất để cả hai hệ thống cùng {ctx['predict_pos']} là "
+                f"Xác suất để cả hai hệ thống cùng {ctx['predict_pos']} là "
                 f"${format_prob(shown_c_val)}$."
             )
             sol_c_detail = (
@@ -514,7 +524,7 @@ class BayesModelsQuestion:
                     [Fraction(-1, 20), Fraction(1, 20), Fraction(-1, 10), Fraction(1, 25)],
                 )
             stmt_d_text = (
-                f"d) Nếu cả hai hệ thống cùng {ctx['predict_neg']} thì xác suất thực tế "
+                f"Nếu cả hai hệ thống cùng {ctx['predict_neg']} thì xác suất thực tế "
                 f"``{ctx['event_bar_name']}'' là ${format_prob(shown_d_val)}$."
             )
             
@@ -543,7 +553,7 @@ class BayesModelsQuestion:
                     [Fraction(1, 25), Fraction(-1, 25), Fraction(8, 100), Fraction(-1, 20)],
                 )
             stmt_c_text = (
-                f"c) Xác suất để cả hai hệ thống cùng {ctx['predict_neg']} là "
+                f"Xác suất để cả hai hệ thống cùng {ctx['predict_neg']} là "
                 f"${format_prob(shown_c_val)}$."
             )
             sol_c_detail = (
@@ -564,7 +574,7 @@ class BayesModelsQuestion:
                     [Fraction(-1, 10), Fraction(1, 20), Fraction(-1, 20), Fraction(1, 25)],
                 )
             stmt_d_text = (
-                f"d) Nếu cả hai hệ thống cùng {ctx['predict_pos']} thì xác suất thực tế "
+                f"Nếu cả hai hệ thống cùng {ctx['predict_pos']} thì xác suất thực tế "
                 f"``{ctx['event_name']}'' là ${format_prob(shown_d_val)}$."
             )
             
@@ -582,9 +592,6 @@ class BayesModelsQuestion:
                 f"{{{fmt_dec(v['P_H1_H2'])}}} = {m1_d1_str}$"
             )
 
-        stmt_c = ("*" if TF[2] else "") + stmt_c_text
-        stmt_d = ("*" if TF[3] else "") + stmt_d_text
-
         ans = ["Đúng" if t else "Sai" for t in TF]
 
         # --- Build question text ---
@@ -602,11 +609,7 @@ class BayesModelsQuestion:
             f"Nghĩa là, nếu thực tế ``{ctx['event_name']}'', xác suất {ctx['model2_name']} "
             f"{ctx['predict_pos']} là ${acc2_pct}$; nếu thực tế ``{ctx['event_bar_name']}'', "
             f"xác suất {ctx['model2_name']} {ctx['predict_neg']} là ${acc2_pct}$.\n\n"
-            f"Biết rằng {ctx['base_desc']} là ${base_pct}$.\n\n"
-            f"{stmt_a}\n\n"
-            f"{stmt_b}\n\n"
-            f"{stmt_c}\n\n"
-            f"{stmt_d}"
+            f"Biết rằng {ctx['base_desc']} là ${base_pct}$."
         )
 
         # --- Build solution text ---
@@ -633,48 +636,77 @@ class BayesModelsQuestion:
             f"{sol_d_detail}"
         )
 
-        final = (
-            f"\\begin{{ex}}%Câu {q_num}\n"
-            + question_text.strip()
-            + "\n\n\\loigiai{\n"
-            + solution_text.strip()
-            + "\n}\n\\end{ex}"
+        self.record = QuestionRecord(
+            number=q_num,
+            stem=question_text,
+            kind=KIND_TRUE_FALSE,
+            options=[stmt_a_text, stmt_b_text, stmt_c_text, stmt_d_text],
+            truth=TF,
+            solution=solution_text,
+            metadata={"generator": "BayesModelsQuestion", "context": CONTEXTS.index(ctx)},
         )
-        return final, ""
+        return self.record
+
+    def generate(self, q_num: int) -> Tuple[str, str]:
+        return render_ex_test(self.build_record(q_num), TF_STYLE_LABELS), ""
 
 
 # ==============================================================================
 # DOCUMENT
 # ==============================================================================
 
+DOCUMENT_HEADER = EX_TEST_HEADER
+DOCUMENT_FOOTER = EX_TEST_FOOTER
+
+
 def create_document(questions: List[Tuple[str, str]]) -> str:
     content = "\n\n".join(q for q, _ in questions)
-    return (
-        r"\documentclass[12pt,a4paper]{article}" "\n"
-        r"\usepackage{amsmath,amssymb}" "\n"
-        r"\usepackage[top=1.5cm, bottom=2cm, left=2cm, right=1.5cm]{geometry}" "\n"
-        r"\usepackage[solcolor]{ex_test}" "\n\n"
-        r"\begin{document}" "\n\n"
-        + content + "\n\n"
-        r"\end{document}" "\n"
+    return DOCUMENT_HEADER + content + DOCUMENT_FOOTER
+
+
+class ExTestTemplate(LaTeXTemplate):
+    """Header/footer ex_test cho StreamingDocumentWriter (file giống hệt create_document)"""
+    DOCUMENT_FOOTER = EX_TEST_FOOTER
+
+    @staticmethod
+    def create_header(title: str, author: str = "dev") -> str:
+        return EX_TEST_HEADER
+
+
+def write_document_streaming(out_file: str, num_q: int, seed: Optional[int] = None, resume: bool = False) -> int:
+    """Ghi từng câu ngay khi sinh xong bằng StreamingDocumentWriter (checkpoint, resume).
+
+    Kết quả giống hệt create_document (câu i chỉ phụ thuộc seed và i). Không có seed thì resume
+    dùng seed lưu trong checkpoint, còn lần chạy mới chọn ngẫu nhiên; trả về seed đã dùng.
+    """
+    writer = StreamingDocumentWriter(
+        out_file, "BayesModelsQuestion", OutputFormat.IMMEDIATE_ANSWERS, template=ExTestTemplate()
     )
+    if seed is None:
+        saved = writer.load_checkpoint() if resume else None
+        seed = saved.master_seed if saved is not None else random.randint(1, 10000)
+
+    with writer:
+        start = writer.open(num_q, seed, resume=resume)
+        if writer.resumed:
+            logging.info(f"Resuming from question {start}")
+        gen = BayesModelsQuestion()
+        for q_num in range(start, num_q + 1):
+            random.seed(derive_question_seed(seed, "BayesModelsQuestion", q_num))
+            question, _ = gen.generate(q_num)
+            writer.write_question(q_num, question)
+        writer.finish()
+    return seed
 
 
 if __name__ == "__main__":
-    import sys
-    num_q = int(sys.argv[1]) if len(sys.argv) > 1 else 3
-    seed = int(sys.argv[2]) if len(sys.argv) > 2 else random.randint(1, 10000)
-    random.seed(seed)
-    logging.info(f"Generating {num_q} questions with seed {seed}")
-
-    gen = BayesModelsQuestion()
-    qs = []
-    for i in range(num_q):
-        qs.append(gen.generate(i + 1))
-
-    latex_content = create_document(qs)
-    out_file = os.path.join(os.path.dirname(__file__), "bayes_models_questions.tex")
+    # --resume: chạy tiếp lần ghi bị ngắt (cùng số câu; không truyền seed thì lấy seed trong checkpoint)
+    resume = "--resume" in sys.argv
+    argv = [arg for arg in sys.argv[1:] if arg != "--resume"]
+    num_q = int(argv[0]) if len(argv) > 0 else 3
+    seed = int(argv[1]) if len(argv) > 1 else None
 
-    with open(out_file, "w", encoding="utf-8") as f:
-        f.write(latex_content)
+    out_file = os.path.join(os.path.dirname(__file__), "bayes_models_questions.tex")
+    seed = write_document_streaming(out_file, num_q, seed, resume)
+    logging.info(f"Generated {num_q} questions with seed {seed}")
     logging.info(f"Saved to {out_file}")
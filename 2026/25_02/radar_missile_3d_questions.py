@@ -15,6 +15,14 @@ from fractions import Fraction
 from string import Template
 from typing import Any, Dict, List, Optional, Tuple
 
+# Module dùng chung nằm ở 2025/base_template (một bản duy nhất)
+BASE_TEMPLATE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "2025", "base_template"))
+if BASE_TEMPLATE_DIR not in sys.path:
+    sys.path.append(BASE_TEMPLATE_DIR)
+
+# Rút gọn căn dùng chung (2025/base_template/radicals.py)
+from radicals import sqrt_latex
+
 # Cấu hình logging
 logging.basicConfig(level=logging.INFO)
 
@@ -109,55 +117,12 @@ def format_fraction_inline(val: Fraction) -> str:
     return f"{val.numerator}/{val.denominator}"
 
 
-def simplify_sqrt(n: int) -> Tuple[int, int]:
-    """
-    Rút gọn căn bậc 2 của số nguyên n.
-    Trả về (ngoài_căn, trong_căn) sao cho ngoài_căn * sqrt(trong_căn) = sqrt(n).
-    """
-    if n == 0:
-        return 0, 0
-    if n < 0:
-        raise ValueError("Cannot square root negative number")
-        
-    outside = 1
-    inside = n
-    d = 2
-    while d * d <= inside:
-        if inside % (d * d) == 0:
-            outside *= d
-            inside //= (d * d)
-        else:
-            d += 1
-    return outside, inside
-
-
 def format_sqrt(n_sq_numerator: int, n_sq_denominator: int = 1) -> str:
     """Chuyển đổi tử số và mẫu số của bình phương khoảng cách thành chuỗi căn thức LaTeX"""
-    num_out, num_in = simplify_sqrt(abs(n_sq_numerator))
-    den_out, den_in = simplify_sqrt(abs(n_sq_denominator))
-    
-    # Rút gọn trước
-    if num_in == 0:
-        if den_out == 1:
-            return "0"
-        return "0"
-        
-    def _format_part(out_val, in_val):
-        if in_val == 1:
-            return str(out_val)
-        if out_val == 1:
-            return f"\\sqrt{{{in_val}}}"
-        return f"{out_val}\\sqrt{{{in_val}}}"
-        
-    top_str = _format_part(num_out, num_in)
-    
-    if n_sq_denominator == 1:
-        return top_str
-        
-    bot_str = _format_part(den_out, den_in)
-    if bot_str == "1":
+    top_str = sqrt_latex(abs(n_sq_numerator))
+    bot_str = sqrt_latex(abs(n_sq_denominator))
+    if top_str == "0" or bot_str == "1":
         return top_str
-        
     return rf"\dfrac{{{top_str}}}{{{bot_str}}}"
 
 